@@ -51,6 +51,13 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
     )
 
 
+@app.on_event("shutdown")
+async def close_progress_stream():
+    """Close the shared Redis progress subscriber."""
+    from services.progress.progress_stream import close_progress_broker
+    await close_progress_broker()
+
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
@@ -33,7 +33,8 @@ async def redirect_short_link(
     Resolve a short link slug and redirect (302) to the destination URL.
 
     Public endpoint — no authentication required.
-    Increments the link's click counter on each successful redirect.
+    Slugs are served from an in-process cache; each successful redirect
+    is counted in Redis and flushed to the link's click counter in batches.
 
     Returns:
         302 redirect to the destination URL.
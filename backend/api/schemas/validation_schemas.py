@@ -82,9 +82,13 @@ class PlaywrightResult(BaseModel):
         None,
         description="Error message if failed"
     )
-    screenshot_base64: Optional[str] = Field(
+    screenshot_hash: Optional[str] = Field(
         None,
-        description="Screenshot (if captured)"
+        description="SHA-256 of the stored screenshot (if captured)"
+    )
+    screenshot_url: Optional[str] = Field(
+        None,
+        description="URL of the stored screenshot (if captured)"
     )
 
 
@@ -24,6 +24,7 @@ from api.schemas.business import (
 from services.hunter.business_service import BusinessService
 from services.hunter.business_filter_service import BusinessFilterService, QUICK_FILTERS
 from services.crm import BusinessEnrichmentService
+from services.dashboard_stats_snapshot import DashboardStatsSnapshotService, SECTION_BUSINESSES
 from models.user import AdminUser
 
 logger = logging.getLogger(__name__)
@@ -150,9 +151,14 @@ async def list_businesses(
         filters=filters if filters else None
     )
     
-    # Enrich businesses with CRM indicators
+    # Enrich businesses with CRM indicators (grouped queries for the whole page)
+    enrichment_rows = await enrichment.enrich_businesses_bulk(
+        businesses,
+        include_campaign_summary=False  # Skip for performance in lists
+    )
+    
     enriched_businesses = []
-    for business in businesses:
+    for business, enrichment_data in zip(businesses, enrichment_rows):
         # Convert to dict
         business_dict = {
             "id": business.id,
@@ -185,10 +191,6 @@ async def list_businesses(
         }
         
         # Add enrichment data
-        enrichment_data = await enrichment.enrich_business(
-            business,
-            include_campaign_summary=False  # Skip for performance in lists
-        )
         business_dict.update(enrichment_data)
         
         enriched_businesses.append(BusinessResponse(**business_dict))
@@ -207,15 +209,20 @@ async def list_businesses(
 
 @router.get("/stats", response_model=BusinessStats)
 async def get_business_stats(
+    live: bool = Query(False, description="Bypass the scheduled stats snapshot"),
     db: AsyncSession = Depends(get_db),
     current_user: AdminUser = Depends(get_current_user)
 ):
     """
     Get business statistics.
+    Served from the dashboard stats snapshot while fresh.
     Requires authentication.
     """
-    service = BusinessService(db)
-    stats = await service.get_stats()
+    stats = None
+    if not live:
+        stats = await DashboardStatsSnapshotService(db).get_section(SECTION_BUSINESSES)
+    if stats is None:
+        stats = await BusinessService(db).get_stats()
     return BusinessStats(**stats)
 
 
@@ -513,117 +520,65 @@ async def bulk_update_status(
     )
 
 
+class BulkExportRequest(BaseModel):
+    """Request model for lead export."""
+    business_ids: Optional[List[UUID]] = None
+    filters: Optional[dict] = None
+
+
 @router.post("/bulk/export")
 async def bulk_export(
-    business_ids: Optional[List[UUID]] = None,
-    format: str = Query("csv", regex="^(csv|json)$"),
+    request: Optional[BulkExportRequest] = None,
+    format: str = Query("csv", regex="^(csv|json|ndjson)$"),
     db: AsyncSession = Depends(get_db),
     current_user: AdminUser = Depends(get_current_user)
 ):
     """
-    Export businesses to CSV or JSON.
+    Export businesses to CSV, JSON or NDJSON (streamed, no row cap).
     
     If business_ids is provided, exports only those businesses.
-    Otherwise, applies current filters from session (future enhancement).
+    Otherwise exports every business matching `filters` (same syntax as
+    POST /businesses/filter), or the whole table.
     
     Formats:
     - csv: Comma-separated values
     - json: JSON array
+    - ndjson: One JSON object per line
     """
     from fastapi.responses import StreamingResponse
-    import io
-    import csv
-    import json as json_lib
+    from models.business import Business
+    from services.crm.lead_export_service import LeadExportService
     
-    service = BusinessService(db)
-    enrichment = BusinessEnrichmentService(db)
+    condition = None
+    if request and request.business_ids:
+        condition = Business.id.in_(request.business_ids)
+    elif request and request.filters:
+        try:
+            condition = BusinessFilterService(db)._build_query_filters(request.filters)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
     
-    # Get businesses
-    if business_ids:
-        businesses = []
-        for business_id in business_ids:
-            business = await service.get_business(business_id)
-            if business:
-                businesses.append(business)
-    else:
-        # Export all (limit to 1000 for safety)
-        businesses, _ = await service.list_businesses(skip=0, limit=1000)
+    exporter = LeadExportService(condition=condition)
     
     if format == "csv":
-        # Create CSV
-        output = io.StringIO()
-        writer = csv.DictWriter(output, fieldnames=[
-            "id", "name", "email", "phone", "category", "city", "state",
-            "rating", "review_count", "qualification_score",
-            "contact_status", "website_status", "has_email", "has_phone",
-            "was_contacted", "is_customer", "data_completeness",
-            "created_at"
-        ])
-        writer.writeheader()
-        
-        for business in businesses:
-            enrichment_data = await enrichment.enrich_business(
-                business,
-                include_campaign_summary=False
-            )
-            writer.writerow({
-                "id": str(business.id),
-                "name": business.name,
-                "email": business.email or "",
-                "phone": business.phone or "",
-                "category": business.category or "",
-                "city": business.city or "",
-                "state": business.state or "",
-                "rating": business.rating or "",
-                "review_count": business.review_count or 0,
-                "qualification_score": business.qualification_score or 0,
-                "contact_status": business.contact_status or "pending",
-                "website_status": business.website_status or "none",
-                "has_email": enrichment_data["has_email"],
-                "has_phone": enrichment_data["has_phone"],
-                "was_contacted": enrichment_data["was_contacted"],
-                "is_customer": enrichment_data["is_customer"],
-                "data_completeness": enrichment_data["data_completeness"],
-                "created_at": business.created_at.isoformat()
-            })
-        
-        output.seek(0)
         return StreamingResponse(
-            iter([output.getvalue()]),
+            exporter.stream_csv(),
             media_type="text/csv",
             headers={"Content-Disposition": "attachment; filename=businesses.csv"}
         )
     
-    else:  # json
-        # Create JSON
-        export_data = []
-        for business in businesses:
-            enrichment_data = await enrichment.enrich_business(
-                business,
-                include_campaign_summary=True
-            )
-            export_data.append({
-                "id": str(business.id),
-                "name": business.name,
-                "email": business.email,
-                "phone": business.phone,
-                "category": business.category,
-                "city": business.city,
-                "state": business.state,
-                "rating": float(business.rating) if business.rating else None,
-                "review_count": business.review_count,
-                "qualification_score": business.qualification_score,
-                "contact_status": business.contact_status,
-                "website_status": business.website_status,
-                **enrichment_data,
-                "created_at": business.created_at.isoformat()
-            })
-        
+    if format == "ndjson":
         return StreamingResponse(
-            iter([json_lib.dumps(export_data, indent=2)]),
-            media_type="application/json",
-            headers={"Content-Disposition": "attachment; filename=businesses.json"}
+            exporter.stream_ndjson(),
+            media_type="application/x-ndjson",
+            headers={"Content-Disposition": "attachment; filename=businesses.ndjson"}
         )
+    
+    return StreamingResponse(
+        exporter.stream_json(),
+        media_type="application/json",
+        headers={"Content-Disposition": "attachment; filename=businesses.json"}
+    )
 
 
 # ============================================
@@ -692,7 +647,8 @@ async def filter_businesses_advanced(
             sort_by=request.sort_by,
             sort_desc=request.sort_desc,
             skip=skip,
-            limit=request.page_size
+            limit=request.page_size,
+            enrich=True
         )
         
         return result
@@ -19,6 +19,7 @@ from api.schemas.coverage import (
 )
 from services.hunter.coverage_service import CoverageService
 from services.hunter.hunter_service import HunterService
+from services.dashboard_stats_snapshot import DashboardStatsSnapshotService, SECTION_COVERAGE
 from models.user import AdminUser
 
 router = APIRouter(prefix="/coverage", tags=["coverage"])
@@ -81,15 +82,20 @@ async def list_coverage(
 
 @router.get("/stats", response_model=CoverageStats)
 async def get_coverage_stats(
+    live: bool = Query(False, description="Bypass the scheduled stats snapshot"),
     db: AsyncSession = Depends(get_db),
     current_user: AdminUser = Depends(get_current_user)
 ):
     """
     Get coverage grid statistics.
+    Served from the dashboard stats snapshot while fresh.
     Requires authentication.
     """
-    service = CoverageService(db)
-    stats = await service.get_stats()
+    stats = None
+    if not live:
+        stats = await DashboardStatsSnapshotService(db).get_section(SECTION_COVERAGE)
+    if stats is None:
+        stats = await CoverageService(db).get_stats()
     return CoverageStats(**stats)
 
 
@@ -14,7 +14,6 @@ Best Practices:
 """
 
 import asyncio
-import json
 import logging
 from typing import AsyncGenerator, Optional
 from uuid import UUID
@@ -28,7 +27,7 @@ from core.database import get_db
 from api.deps import get_current_user
 from models.user import AdminUser
 from models.scrape_session import ScrapeSession
-from services.progress.redis_service import RedisService
+from services.progress.progress_stream import get_progress_broker, TERMINAL_EVENTS
 from tasks.scraping_tasks import scrape_zone_async
 
 router = APIRouter(prefix="/scrapes", tags=["scrapes"])
@@ -277,63 +276,44 @@ async def stream_scrape_progress(
         """
         Generate SSE events from Redis pub/sub.
         
+        All clients share one async Redis subscriber per process; bursts of
+        business_scraped events are coalesced per client.
+        
         Yields:
             SSE-formatted strings: "data: {json}\n\n"
         """
-        redis = RedisService.get_client()
+        broker = get_progress_broker()
         
         # Check if Redis is available
-        if not RedisService.is_available():
+        if not await broker.is_available():
             logger.warning("⚠️ Redis unavailable, SSE will not receive updates")
             yield f"event: error\ndata: {{\"error\": \"Progress tracking unavailable\"}}\n\n"
             return
         
-        pubsub = redis.pubsub()
         channel = f"scrape:progress:{session_id}"
         
         try:
-            # Subscribe to Redis channel
-            pubsub.subscribe(channel)
-            logger.info(f"📻 Subscribed to Redis channel: {channel}")
-            
-            # Send initial connection success
-            yield f"event: connected\ndata: {{\"session_id\": \"{session_id}\"}}\n\n"
-            
-            # Keep connection alive with heartbeat
-            last_ping = asyncio.get_event_loop().time()
-            
-            while True:
-                # Check for messages (non-blocking)
-                message = pubsub.get_message(ignore_subscribe_messages=True)
+            async with broker.subscribe(channel) as stream:
+                # Send initial connection success
+                yield f"event: connected\ndata: {{\"session_id\": \"{session_id}\"}}\n\n"
                 
-                if message and message['type'] == 'message':
-                    # Parse message data
-                    try:
-                        data = json.loads(message['data'])
-                        event_type = data.get('event', 'update')
-                        
-                        # Send SSE event
-                        yield f"event: {event_type}\ndata: {message['data']}\n\n"
-                        
-                        logger.debug(f"📤 SSE event sent: {event_type}")
-                        
-                        # Close connection on completion or error
-                        if event_type in ('scrape_complete', 'error'):
-                            logger.info(f"🏁 Closing SSE stream: {event_type}")
-                            break
+                while True:
+                    # Blocks until an event arrives; None means 15s of silence
+                    message = await stream.next_event(timeout=15)
                     
-                    except json.JSONDecodeError as e:
-                        logger.error(f"Failed to parse Redis message: {e}")
-                
-                else:
-                    # Send heartbeat every 15 seconds
-                    now = asyncio.get_event_loop().time()
-                    if now - last_ping > 15:
+                    if message is None:
                         yield f": heartbeat\n\n"
-                        last_ping = now
-                
-                # Sleep briefly to avoid busy loop
-                await asyncio.sleep(0.1)
+                        continue
+                    
+                    # Send SSE event
+                    yield f"event: {message.event}\ndata: {message.data}\n\n"
+                    
+                    logger.debug(f"📤 SSE event sent: {message.event}")
+                    
+                    # Close connection on completion or error
+                    if message.event in TERMINAL_EVENTS:
+                        logger.info(f"🏁 Closing SSE stream: {message.event}")
+                        break
             
         except asyncio.CancelledError:
             logger.info(f"📴 SSE client disconnected: session={session_id}")
@@ -342,14 +322,6 @@ async def stream_scrape_progress(
         except Exception as e:
             logger.error(f"❌ SSE stream error: {e}", exc_info=True)
             yield f"event: error\ndata: {{\"error\": \"{str(e)}\"}}\n\n"
-        
-        finally:
-            try:
-                pubsub.unsubscribe(channel)
-                pubsub.close()
-                logger.info(f"🔌 Redis channel unsubscribed: {channel}")
-            except Exception as e:
-                logger.error(f"Error closing pubsub: {e}")
     
     return StreamingResponse(
         event_generator(),
@@ -6,8 +6,8 @@ This is a PUBLIC endpoint that serves the actual website HTML.
 """
 from pathlib import Path
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.responses import FileResponse, HTMLResponse
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import FileResponse, HTMLResponse, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from typing import Optional
@@ -17,6 +17,7 @@ from core.config import get_settings
 from core.database import get_db
 from models.site import GeneratedSite
 from models.site_models import Site, SiteVersion
+from services.site_render_cache import RenderedPage, SiteRenderCache, get_site_render_cache
 import re
 
 router = APIRouter(tags=["generated-preview"])
@@ -70,8 +71,9 @@ async def serve_site_image(subdomain: str, filename: str) -> FileResponse:
 )
 async def view_generated_site(
     subdomain: str,
+    request: Request,
     db: AsyncSession = Depends(get_db)
-) -> HTMLResponse:
+) -> Response:
     """
     Serve site HTML content (from generated_sites OR sites table).
     
@@ -79,31 +81,74 @@ async def view_generated_site(
     1. Generated sites (from generated_sites table) - like 'marshall-campbell-co-cpas-la'
     2. Purchase preview sites (from sites table) - like 'test-cpa-site'
     
+    Rendered pages are cached by content version + ownership state, so a
+    cache hit costs one lightweight fingerprint query and no HTML rewriting.
+    Responses carry an ETag (304 on If-None-Match) and are served
+    gzip/brotli-compressed when the client accepts it.
+    
     Args:
         subdomain: Site subdomain/slug
+        request: Incoming request (conditional / encoding headers)
         db: Database session
     
     Returns:
-        HTMLResponse with complete site HTML
+        Response with complete site HTML
     """
     try:
-        # First, try generated_sites table (most common case)
-        gen_query = select(GeneratedSite).where(GeneratedSite.subdomain == subdomain)
-        gen_result = await db.execute(gen_query)
-        gen_site = gen_result.scalar_one_or_none()
+        cache = get_site_render_cache()
+        
+        # First, try generated_sites table (most common case).
+        # Fingerprint only: version + ownership in one round trip.
+        owned_exists = select(Site.id).where(
+            Site.business_id == GeneratedSite.business_id,
+            Site.status == 'owned'
+        ).exists()
+        gen_query = select(
+            GeneratedSite.id,
+            GeneratedSite.updated_at,
+            owned_exists.label("is_owned")
+        ).where(GeneratedSite.subdomain == subdomain)
+        gen_row = (await db.execute(gen_query)).first()
         
-        if gen_site:
+        if gen_row:
             # Handle generated site
-            return await _serve_generated_site(db, gen_site, subdomain)
+            cache_key = SiteRenderCache.make_key(
+                subdomain, _content_version(gen_row.id, gen_row.updated_at), gen_row.is_owned
+            )
+            page = await cache.get(cache_key)
+            if page is None:
+                gen_site = await db.get(GeneratedSite, gen_row.id)
+                complete_html = _render_generated_site(gen_site, subdomain, gen_row.is_owned)
+                if complete_html is None:
+                    return _build_unavailable_response(gen_site, subdomain)
+                page = await cache.put(cache_key, complete_html)
+            return _page_response(request, page)
         
         # If not found, try sites table (purchase preview sites)
-        site_query = select(Site).where(Site.slug == subdomain)
-        site_result = await db.execute(site_query)
-        purchase_site = site_result.scalar_one_or_none()
+        site_query = select(
+            Site.id, Site.status, Site.current_version_id, Site.updated_at
+        ).where(Site.slug == subdomain)
+        site_row = (await db.execute(site_query)).first()
         
-        if purchase_site:
+        if site_row:
             # Handle purchase preview site
-            return await _serve_purchase_site(db, purchase_site, subdomain)
+            if not site_row.current_version_id:
+                logger.warning(f"Purchase site {subdomain} has no current version")
+                return HTMLResponse(content=_build_error_page(subdomain, "Site content not available"))
+            
+            cache_key = SiteRenderCache.make_key(
+                subdomain,
+                _content_version(site_row.current_version_id, site_row.updated_at),
+                site_row.status == 'owned'
+            )
+            page = await cache.get(cache_key)
+            if page is None:
+                version = await db.get(SiteVersion, site_row.current_version_id)
+                complete_html = _render_purchase_site(version, subdomain, site_row.status)
+                if complete_html is None:
+                    return HTMLResponse(content=_build_error_page(subdomain, "Site content not available"))
+                page = await cache.put(cache_key, complete_html)
+            return _page_response(request, page)
         
         # Not found in either table
         logger.warning(f"Site not found in any table: {subdomain}")
@@ -126,36 +171,51 @@ async def view_generated_site(
 # HELPER FUNCTIONS
 # ============================================================================
 
-async def _serve_generated_site(
-    db: AsyncSession,
+def _content_version(row_id, updated_at) -> str:
+    """Cache version token: changes whenever the row is regenerated or edited."""
+    stamp = updated_at.strftime("%Y%m%d%H%M%S%f") if updated_at else "0"
+    return f"{row_id}-{stamp}"
+
+
+def _page_response(request: Request, page: RenderedPage) -> Response:
+    """Serve a rendered page with ETag revalidation and precompressed body."""
+    headers = {
+        "ETag": page.etag,
+        "Cache-Control": "public, max-age=0, must-revalidate",
+        "Vary": "Accept-Encoding",
+    }
+    
+    if_none_match = request.headers.get("if-none-match", "")
+    if page.etag in [tag.strip() for tag in if_none_match.split(",")]:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    
+    body, encoding = page.encoded(request.headers.get("accept-encoding", ""))
+    if encoding:
+        headers["Content-Encoding"] = encoding
+    return Response(content=body, media_type="text/html; charset=utf-8", headers=headers)
+
+
+def _build_unavailable_response(site: GeneratedSite, subdomain: str) -> HTMLResponse:
+    """Placeholder page for a generated site that has no HTML yet (never cached)."""
+    logger.warning(f"Site {subdomain} has no HTML content (status: {site.status})")
+    
+    if site.status == "generating":
+        return HTMLResponse(content=_build_generating_page(site.subdomain))
+    elif site.status == "failed":
+        return HTMLResponse(content=_build_error_page(subdomain, "Site generation failed"))
+    else:
+        return HTMLResponse(content=_build_error_page(subdomain, "Site content not available"))
+
+
+def _render_generated_site(
     site: GeneratedSite,
-    subdomain: str
-) -> HTMLResponse:
-    """Serve a site from generated_sites table."""
+    subdomain: str,
+    is_owned: bool
+) -> Optional[str]:
+    """Render a site from generated_sites table (None if it has no content)."""
     # Check if site has content
-    if not site.html_content:
-        logger.warning(f"Site {subdomain} has no HTML content (status: {site.status})")
-        
-        if site.status == "generating":
-            return HTMLResponse(content=_build_generating_page(site.subdomain))
-        elif site.status == "failed":
-            return HTMLResponse(content=_build_error_page(subdomain, "Site generation failed"))
-        else:
-            return HTMLResponse(content=_build_error_page(subdomain, "Site content not available"))
-    
-    # Check if this site has been purchased (check sites table by business_id)
-    is_owned = False
-    if site.business_id:
-        purchase_query = select(Site).where(
-            Site.business_id == site.business_id,
-            Site.status == 'owned'
-        )
-        purchase_result = await db.execute(purchase_query)
-        purchased_site = purchase_result.scalar_one_or_none()
-        is_owned = purchased_site is not None
-        
-        if is_owned:
-            logger.info(f"Generated site {subdomain} is owned (purchase: {purchased_site.slug})")
+    if not site or not site.html_content:
+        return None
     
     # Get HTML content
     html_content = site.html_content
@@ -188,34 +248,25 @@ async def _serve_generated_site(
         js=site.js_content
     )
     
-    logger.info(f"Serving generated site: {subdomain} (status: {site.status}, owned: {is_owned})")
-    return HTMLResponse(content=complete_html)
-
-
-async def _serve_purchase_site(
-    db: AsyncSession,
-    site: Site,
-    slug: str
-) -> HTMLResponse:
-    """Serve a site from sites table (purchase preview sites)."""
-    # Get current version
-    if not site.current_version_id:
-        logger.warning(f"Purchase site {slug} has no current version")
-        return HTMLResponse(content=_build_error_page(slug, "Site content not available"))
-    
-    version_query = select(SiteVersion).where(SiteVersion.id == site.current_version_id)
-    version_result = await db.execute(version_query)
-    version = version_result.scalar_one_or_none()
-    
+    logger.info(f"Rendered generated site: {subdomain} (status: {site.status}, owned: {is_owned})")
+    return complete_html
+
+
+def _render_purchase_site(
+    version: Optional[SiteVersion],
+    slug: str,
+    site_status: str
+) -> Optional[str]:
+    """Render a site from sites table (purchase preview sites)."""
     if not version or not version.html_content:
         logger.warning(f"Purchase site {slug} version has no HTML content")
-        return HTMLResponse(content=_build_error_page(slug, "Site content not available"))
+        return None
     
     # Get HTML content
     html_content = version.html_content
     
     # Remove claim bar if site is owned, otherwise re-inject canonical version
-    is_owned = site.status == 'owned'
+    is_owned = site_status == 'owned'
     if is_owned:
         html_content = _remove_claim_bar(html_content)
         logger.info(f"Removed claim bar from owned purchase site: {slug}")
@@ -230,8 +281,8 @@ async def _serve_purchase_site(
         js=version.js_content
     )
     
-    logger.info(f"Serving purchase site: {slug} (status: {site.status})")
-    return HTMLResponse(content=complete_html)
+    logger.info(f"Rendered purchase site: {slug} (status: {site_status})")
+    return complete_html
 
 
 def _extract_site_pricing(site) -> tuple:
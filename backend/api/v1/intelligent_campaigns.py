@@ -6,7 +6,7 @@ User selects city, Claude handles everything else:
 - Business category selection
 - Adaptive refinement
 """
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import BaseModel, Field
 from typing import Optional, List, Dict, Any
@@ -18,6 +18,7 @@ from models.user import AdminUser
 from api.v1.auth import get_current_user
 from services.hunter.hunter_service import HunterService
 from services.hunter.geo_strategy_service import GeoStrategyService
+from services.dashboard_stats_snapshot import DashboardStatsSnapshotService, SECTION_GEO_STRATEGIES
 from services.hunter.coverage_reporting_service import CoverageReportingService
 from services.draft_campaign_service import DraftCampaignService
 
@@ -466,15 +467,20 @@ async def refine_strategy(
 
 @router.get("/stats")
 async def get_strategy_stats(
+    live: bool = Query(False, description="Bypass the scheduled stats snapshot"),
     db: AsyncSession = Depends(get_db),
     current_user: AdminUser = Depends(get_current_user)
 ):
     """
     Get overall statistics about intelligent strategies.
+    Served from the dashboard stats snapshot while fresh.
     """
     try:
-        geo_strategy_service = GeoStrategyService(db)
-        stats = await geo_strategy_service.get_strategy_stats()
+        stats = None
+        if not live:
+            stats = await DashboardStatsSnapshotService(db).get_section(SECTION_GEO_STRATEGIES)
+        if stats is None:
+            stats = await GeoStrategyService(db).get_strategy_stats()
         
         return stats
         
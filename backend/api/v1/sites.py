@@ -35,6 +35,7 @@ from services.hunter.business_service import BusinessService
 from services.creative.site_service import SiteService
 from services.creative.orchestrator import CreativeOrchestrator
 from services.crm import BusinessLifecycleService
+from services.dashboard_stats_snapshot import DashboardStatsSnapshotService, SECTION_SITES
 from models.user import AdminUser
 from models.business import Business
 from models.site import GeneratedSite
@@ -327,12 +328,16 @@ async def list_sites(
 
 @router.get("/stats", response_model=SiteStats)
 async def get_site_stats(
+    live: bool = Query(False, description="Bypass the scheduled stats snapshot"),
     db: AsyncSession = Depends(get_db),
     current_user: AdminUser = Depends(get_current_user)
 ):
-    """Get site statistics."""
-    service = SiteService(db)
-    stats = await service.get_stats()
+    """Get site statistics (from the dashboard stats snapshot while fresh)."""
+    stats = None
+    if not live:
+        stats = await DashboardStatsSnapshotService(db).get_section(SECTION_SITES)
+    if stats is None:
+        stats = await SiteService(db).get_stats()
     return SiteStats(**stats)
 
 
@@ -847,7 +852,7 @@ async def remap_product_images(
 
     This is a targeted fix that costs a few hundred tokens instead of the full pipeline.
     """
-    import anthropic
+    from services.llm.gateway import get_llm_gateway
 
     result = await db.execute(select(GeneratedSite).where(GeneratedSite.id == site_id))
     site = result.scalar_one_or_none()
@@ -915,8 +920,8 @@ where the keys are the current slots used in HTML and the values are the correct
 Every slot that appears in the HTML must be present as a key. Values must be valid slot names from
 the image index above."""
 
-    client = anthropic.Anthropic()
-    response = client.messages.create(
+    response = await get_llm_gateway().create(
+        "sites.remap_product_images",
         model="claude-haiku-4-5",
         max_tokens=512,
         messages=[{"role": "user", "content": prompt}],
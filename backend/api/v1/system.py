@@ -304,3 +304,18 @@ async def get_bandwidth(
         monthly=TrafficTotals(**(raw["monthly"] or {})) if raw.get("monthly") else None,
         total=TrafficTotals(**(raw["total"] or {})) if raw.get("total") else None,
     )
+
+
+@router.get("/llm-usage")
+async def get_llm_usage(
+    current_user: AdminUser = Depends(get_current_user),
+):
+    """
+    Claude API usage per caller (calls, errors, retries, tokens, average latency).
+
+    Counters are recorded by the LLM gateway and aggregate across the API and
+    all Celery workers.
+    """
+    from services.llm.gateway import get_llm_gateway
+
+    return {"callers": await get_llm_gateway().get_metrics()}
@@ -3,6 +3,7 @@ Website validation API endpoints.
 Provides endpoints for triggering and managing website validations.
 """
 from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Query
+from fastapi.responses import FileResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
 from typing import Optional, List
@@ -15,6 +16,9 @@ from core.database import get_db
 from api.deps import get_current_user
 from models.user import AdminUser
 from models.business import Business
+from services.validation.screenshot_store import get_screenshot_store
+from services.validation.llm_verdict_cache import get_llm_verdict_cache
+from services.validation.reachability_cache import get_reachability_cache
 from tasks.validation_tasks import (
     validate_business_website,
     batch_validate_websites,
@@ -254,6 +258,30 @@ async def get_validation_stats(
     )
 
 
+@router.get("/llm-cache/stats")
+async def get_llm_verdict_cache_stats(
+    current_user: AdminUser = Depends(get_current_user)
+):
+    """
+    LLM verdict cache counters (hits, misses, stores, tokens saved).
+    
+    Counters aggregate across all validation workers.
+    """
+    return await get_llm_verdict_cache().get_stats()
+
+
+@router.get("/reachability-cache/stats")
+async def get_reachability_cache_stats(
+    current_user: AdminUser = Depends(get_current_user)
+):
+    """
+    Reachability cache counters (DNS and HTTP check hits / misses).
+    
+    Counters aggregate across the API and all workers.
+    """
+    return await get_reachability_cache().get_stats()
+
+
 @router.get("/businesses/validated")
 async def list_validated_businesses(
     status: Optional[str] = Query(None, description="Filter by validation status"),
@@ -328,3 +356,22 @@ async def list_validated_businesses(
 # Import Integer for quality score filter
 from sqlalchemy import Integer
 
+
+@router.get("/screenshots/{filename}")
+async def get_validation_screenshot(filename: str):
+    """
+    Serve a stored validation screenshot.
+    
+    Public: filenames are SHA-256 content hashes (not guessable), so they can
+    be used directly in <img> tags like generated-site images.
+    """
+    store = get_screenshot_store()
+    path = store.resolve(filename)
+    if path is None:
+        raise HTTPException(status_code=404, detail="Screenshot not found")
+    
+    return FileResponse(
+        path=str(path),
+        media_type=store.media_type(filename),
+        headers={"Cache-Control": "public, max-age=31536000, immutable"},
+    )
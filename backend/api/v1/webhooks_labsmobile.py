@@ -25,10 +25,9 @@ Date: February 2026
 """
 from fastapi import APIRouter, Request, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update
+from sqlalchemy import select
 from typing import Optional
 import logging
-from datetime import datetime
 
 from api.deps import get_db
 from models.campaign import Campaign
@@ -38,6 +37,7 @@ from services.sms.conversation_service import ConversationService
 from services.pitcher.sms_campaign_helper import SMSCampaignHelper
 from services.pitcher.email_sender import EmailSender
 from services.crm import BusinessLifecycleService
+from services.sms.status_ingest import get_sms_status_ingest, parse_labsmobile_status
 from core.config import get_settings
 
 _settings = get_settings()
@@ -46,47 +46,6 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/webhooks/labsmobile", tags=["LabsMobile Webhooks"])
 
-# LabsMobile desc → internal campaign status
-# acklevel values: "operator" (intermediate), "handset" (final), "error"
-# desc values come from the carrier's DLR (Delivery Receipt) codes.
-_STATUS_MAP: dict[str, str] = {
-    "DELIVRD": "delivered",
-    "READ":    "delivered",
-    "REJECTD": "failed",
-    "UNDELIV": "failed",
-    "EXPIRED": "failed",
-    "BLOCKED": "failed",
-    "UNKNOWN": "failed",
-}
-
-# Human-readable explanation for each delivery failure desc code.
-# Surfaced in campaign.error_message so operators know exactly why a send failed.
-_DELIVERY_FAILURE_REASONS: dict[str, str] = {
-    "REJECTD": (
-        "Message rejected by the carrier or operator — "
-        "the destination number may be on a DNC list, "
-        "the sender ID may not be allowed, or content was flagged."
-    ),
-    "UNDELIV": (
-        "Message undeliverable — the destination number may be "
-        "disconnected, out of coverage, the handset is full, "
-        "or the number does not exist."
-    ),
-    "EXPIRED": (
-        "Message expired before delivery — the handset was unreachable "
-        "for longer than the carrier TTL (usually 24–72 hours)."
-    ),
-    "BLOCKED": (
-        "Message blocked — the destination number is on a "
-        "Do-Not-Disturb or spam filter list, or the account has been "
-        "flagged for content policy violations."
-    ),
-    "UNKNOWN": (
-        "Delivery status unknown — the carrier did not return a final "
-        "delivery receipt. The message may or may not have been received."
-    ),
-}
-
 
 # ============================================================================
 # DELIVERY STATUS CALLBACKS
@@ -106,85 +65,26 @@ async def handle_sms_status_callback(
     Handle LabsMobile delivery status GET callback.
 
     LabsMobile makes a GET request to this URL with query params when a
-    message is delivered, fails, or times out.
+    message is delivered, fails, or times out. The callback is appended to
+    the SMS status stream and acknowledged; tasks.sms_sync.apply_sms_status_events
+    applies it (see services.sms.status_ingest).
 
     Endpoint: GET /api/v1/webhooks/labsmobile/status
     """
     try:
-        if not subid:
+        event = parse_labsmobile_status(subid, acklevel, status, desc, timestamp)
+        if event is None:
             logger.warning("LabsMobile status callback missing subid")
             return {"status": "ok", "message": "Missing subid"}
 
-        logger.info(
-            "LabsMobile status callback: subid=%s acklevel=%s desc=%s msisdn=%s",
-            subid, acklevel, desc, msisdn,
-        )
-
-        # Find campaign by LabsMobile subid (stored in sms_sid column)
-        result = await db.execute(
-            select(Campaign).where(Campaign.sms_sid == subid)
-        )
-        campaign = result.scalar_one_or_none()
-
-        if not campaign:
-            logger.warning("Campaign not found for LabsMobile subid: %s", subid)
-            # Return 200 to prevent LabsMobile retries
-            return {"status": "ok", "message": "Campaign not found"}
-
-        # Map LabsMobile desc to internal status
-        desc_upper = (desc or "").upper()
-        new_status = _STATUS_MAP.get(desc_upper, campaign.status)
-
-        # If acklevel is "error" and no desc provided, mark failed
-        if acklevel == "error" and not desc:
-            new_status = "failed"
-
-        update_values: dict = {
-            "status": new_status,
-            "updated_at": datetime.utcnow(),
-        }
-
-        if desc_upper == "DELIVRD" and not campaign.delivered_at:
-            update_values["delivered_at"] = datetime.utcnow()
-
-        if acklevel == "error" or new_status == "failed":
-            reason = _DELIVERY_FAILURE_REASONS.get(desc_upper)
-            if reason:
-                error_msg = f"LabsMobile Error ({desc_upper}): {reason}"
-            elif desc:
-                error_msg = f"LabsMobile delivery failed: desc={desc} acklevel={acklevel}"
-            else:
-                error_msg = f"LabsMobile delivery failed: acklevel={acklevel or 'error'}"
-            update_values["error_message"] = error_msg
-
-        await db.execute(
-            update(Campaign).where(Campaign.id == campaign.id).values(**update_values)
-        )
-        await db.commit()
+        outcome = await get_sms_status_ingest().ingest(db, event)
 
         logger.info(
-            "Updated campaign %s: %s → %s (desc=%s)",
-            campaign.id, campaign.status, new_status, desc,
+            "LabsMobile status callback: subid=%s acklevel=%s desc=%s msisdn=%s (%s)",
+            subid, acklevel, desc, msisdn, outcome,
         )
 
-        # CRM Integration
-        if campaign.business_id:
-            lifecycle_service = BusinessLifecycleService(db)
-            try:
-                if desc_upper == "DELIVRD":
-                    await lifecycle_service.mark_campaign_sent(
-                        campaign.business_id, channel="sms"
-                    )
-                elif new_status == "failed":
-                    await lifecycle_service.mark_bounced(campaign.business_id)
-                await db.commit()
-            except Exception as exc:
-                logger.error(
-                    "CRM update error for business %s: %s",
-                    campaign.business_id, exc, exc_info=True,
-                )
-
-        return {"status": "ok", "campaign_id": str(campaign.id), "new_status": new_status}
+        return {"status": "ok", "subid": subid, "result": outcome}
 
     except Exception as exc:
         logger.error("LabsMobile status callback error: %s", exc, exc_info=True)
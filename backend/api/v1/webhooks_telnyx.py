@@ -14,10 +14,9 @@ Author: WebMagic Team
 """
 from fastapi import APIRouter, Request, Depends, HTTPException, status as http_status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update
+from sqlalchemy import select
 from typing import Dict, Any
 import logging
-from datetime import datetime
 
 from api.deps import get_db
 from models.campaign import Campaign
@@ -27,6 +26,7 @@ from services.sms.conversation_service import ConversationService
 from services.pitcher.sms_campaign_helper import SMSCampaignHelper
 from services.pitcher.email_sender import EmailSender
 from services.crm import BusinessLifecycleService
+from services.sms.status_ingest import get_sms_status_ingest, parse_telnyx_status
 from core.config import get_settings
 
 _settings = get_settings()
@@ -91,17 +91,6 @@ async def _notify_admin_reply(
     except Exception as e:
         logger.error(f"Failed to send admin reply notification: {e}", exc_info=True)
 
-# Telnyx status mapping to internal status
-TELNYX_STATUS_MAP = {
-    "queued": "pending",
-    "sending": "sent",
-    "sent": "sent",
-    "delivered": "delivered",
-    "sending_failed": "failed",
-    "delivery_failed": "failed",
-    "delivery_unconfirmed": "sent",  # Carrier didn't confirm but likely delivered
-}
-
 
 # ============================================================================
 # SMS STATUS CALLBACKS
@@ -119,142 +108,39 @@ async def handle_sms_status_callback(
     - message.sent: Message accepted by carrier
     - message.finalized: Final delivery status (delivered/failed)
     
+    The callback is appended to the SMS status stream and acknowledged;
+    tasks.sms_sync.apply_sms_status_events applies it to the campaign and
+    sms_messages row (see services.sms.status_ingest).
+    
     Endpoint: POST /api/v1/webhooks/telnyx/status
     
     Returns:
-        200: Status updated successfully
+        200: Status recorded
         400: Invalid payload
-        404: Campaign not found
     """
     try:
         # Parse JSON payload from Telnyx
         json_data = await request.json()
+        event = parse_telnyx_status(json_data)
         
-        # Extract event data
-        data = json_data.get("data", {})
-        event_type = data.get("event_type", "")
-        payload = data.get("payload", {})
-        
-        # Get message details
-        message_id = payload.get("id")
-        
-        if not message_id:
+        if event is None:
             logger.warning("Telnyx callback missing message ID")
             raise HTTPException(
                 status_code=http_status.HTTP_400_BAD_REQUEST,
                 detail="Missing message ID in payload"
             )
         
-        # Get status from 'to' array
-        to_info = payload.get("to", [{}])
-        if isinstance(to_info, list) and len(to_info) > 0:
-            message_status = to_info[0].get("status", "unknown")
-        else:
-            message_status = "unknown"
+        outcome = await get_sms_status_ingest().ingest(db, event)
         
         logger.info(
-            f"Telnyx status callback: {message_id} -> {message_status} "
-            f"(event: {event_type})"
-        )
-        
-        # Find campaign by Telnyx message ID
-        # Note: We store the message ID in sms_sid column (reusing existing column)
-        result = await db.execute(
-            select(Campaign).where(Campaign.sms_sid == message_id)
+            f"Telnyx status callback: {event.message_id} -> {event.status} "
+            f"(event: {json_data.get('data', {}).get('event_type', '')}, {outcome})"
         )
-        campaign = result.scalar_one_or_none()
-        
-        if not campaign:
-            logger.warning(f"Campaign not found for Telnyx ID: {message_id}")
-            # Return 200 anyway to prevent Telnyx retries
-            return {
-                "status": "ok",
-                "message": "Campaign not found (may have been deleted)"
-            }
-        
-        # Map Telnyx status to internal status
-        new_status = TELNYX_STATUS_MAP.get(message_status, campaign.status)
-        
-        # Build update values
-        update_values = {
-            "status": new_status,
-            "updated_at": datetime.utcnow()
-        }
-        
-        # Add delivered timestamp for final delivery
-        if message_status == "delivered" and not campaign.delivered_at:
-            update_values["delivered_at"] = datetime.utcnow()
-        
-        # Extract error information if present
-        errors = payload.get("errors", [])
-        if errors:
-            error_info = errors[0]
-            error_code = error_info.get("code", "unknown")
-            error_detail = error_info.get("detail", "Unknown error")
-            update_values["error_message"] = f"Telnyx Error {error_code}: {error_detail}"
-        
-        # Extract cost if provided (Telnyx sends cost in finalized webhook)
-        cost_info = payload.get("cost", {})
-        if cost_info:
-            cost_amount = cost_info.get("amount")
-            if cost_amount:
-                try:
-                    update_values["sms_cost"] = float(cost_amount)
-                except (ValueError, TypeError):
-                    pass
-        
-        # Update campaign
-        await db.execute(
-            update(Campaign)
-            .where(Campaign.id == campaign.id)
-            .values(**update_values)
-        )
-        await db.commit()
-        
-        logger.info(
-            f"Updated campaign {campaign.id} status: "
-            f"{campaign.status} -> {new_status}"
-        )
-        
-        # CRM Integration: Update business contact status
-        if campaign.business_id and message_status in ["delivered", "sending_failed", "delivery_failed"]:
-            lifecycle_service = BusinessLifecycleService(db)
-            
-            try:
-                if message_status == "delivered":
-                    # SMS was delivered: pending → sms_sent
-                    await lifecycle_service.mark_campaign_sent(
-                        campaign.business_id,
-                        channel="sms"
-                    )
-                    logger.info(
-                        f"Updated business {campaign.business_id}: "
-                        f"contact_status=sms_sent (SMS delivered)"
-                    )
-                elif message_status in ["sending_failed", "delivery_failed"]:
-                    # SMS bounced/failed
-                    await lifecycle_service.mark_bounced(campaign.business_id)
-                    logger.info(
-                        f"Updated business {campaign.business_id}: "
-                        f"contact_status=bounced (SMS failed)"
-                    )
-                
-                await db.commit()
-            except Exception as e:
-                logger.error(
-                    f"Error updating CRM status for business {campaign.business_id}: {e}",
-                    exc_info=True
-                )
-                # Don't fail the webhook - campaign status was already updated
-        elif not campaign.business_id:
-            logger.warning(
-                f"Campaign {campaign.id} has no business_id for CRM tracking"
-            )
         
         return {
             "status": "ok",
-            "campaign_id": str(campaign.id),
-            "new_status": new_status
+            "message_id": event.message_id,
+            "result": outcome
         }
     
     except HTTPException:
@@ -4,7 +4,10 @@ Handles background task processing for WebMagic automation.
 """
 from celery import Celery
 from celery.schedules import crontab
+from celery.signals import worker_process_init, worker_process_shutdown
 from core.config import get_settings
+from core.database import celery_async_engine
+from core.worker_loop import init_worker_loop, shutdown_worker_loop
 
 settings = get_settings()
 
@@ -32,6 +35,21 @@ celery_app.conf.update(
     result_expires=3600,  # Keep results for 1 hour
 )
 
+
+@worker_process_init.connect
+def _init_worker_process(**kwargs):
+    """Give each forked worker process its own event loop and DB pool."""
+    # Never reuse connections inherited from the parent process
+    celery_async_engine.sync_engine.dispose(close=False)
+    init_worker_loop()
+
+
+@worker_process_shutdown.connect
+def _shutdown_worker_process(**kwargs):
+    """Release loop-bound resources (browser pool, DB pool) and close the loop."""
+    shutdown_worker_loop()
+
+
 # Auto-discover tasks
 celery_app.autodiscover_tasks([
     "tasks.scraping",  # Legacy scraping tasks
@@ -44,10 +62,12 @@ celery_app.autodiscover_tasks([
     "tasks.validation_tasks",  # Playwright website validation (old system)
     "tasks.validation_tasks_enhanced",  # Enhanced V2 validation with metadata
     "tasks.discovery_tasks",  # Website discovery pipeline (ScrapingDog)
+    "tasks.llm_batch_tasks",  # Offline validation/discovery via Anthropic Message Batches
     "tasks.phone_validation_tasks",  # Pre-generation phone validation (outreach_channel)
     "tasks.ticket_tasks",  # Support ticket AI processing
     "tasks.abandoned_cart_tasks",  # Abandoned cart recovery (15min window, 24h coupon)
     "tasks.activity_tasks",  # Facebook activity & contact enrichment
+    "tasks.shortener_tasks",  # Batched short-link click counting
 ])
 
 # Periodic task schedule (using SYNC tasks only)
@@ -62,11 +82,21 @@ celery_app.conf.beat_schedule = {
 
     # Phone validation now runs once when a scrape completes (scraping_tasks), not on a schedule.
 
-    # ── Stage 2: Generate sites for qualified leads every 10 minutes ─────────
+    # ── Stage 1b: Batch ScrapingDog discovery every minute ──────────────────
+    # Validation queues businesses that need a website search (queue_discovery);
+    # this hands them to discover_missing_websites_batch in groups.
+    "dispatch-pending-discoveries": {
+        "task": "tasks.discovery.dispatch_pending_discoveries",
+        "schedule": crontab(minute="*"),
+    },
+
+    # ── Stage 2: Generate sites for qualified leads every 2 minutes ──────────
     # Re-enabled: website detection pipeline is stable (ScrapingDog + LLM country check)
+    # Each run claims only what the generation workers can take (leases), so a
+    # short interval keeps the queue full without double-dispatching.
     "generate-sites": {
         "task": "tasks.generation_sync.generate_pending_sites",
-        "schedule": crontab(minute="*/10"),  # Every 10 minutes
+        "schedule": crontab(minute="*/2"),  # Every 2 minutes
     },
 
     # ── Stage 3: Auto-create campaigns for newly published sites ─────────────
@@ -93,6 +123,14 @@ celery_app.conf.beat_schedule = {
         "schedule": crontab(minute="*/5"),
     },
 
+    # ── Stage 4c: Apply buffered SMS delivery callbacks every minute ────────
+    # Telnyx / LabsMobile status webhooks append to a Redis stream; this
+    # coalesces them into batched campaign / sms_messages updates.
+    "apply-sms-status-events": {
+        "task": "tasks.sms_sync.apply_sms_status_events",
+        "schedule": crontab(minute="*"),
+    },
+
     # ── Maintenance ──────────────────────────────────────────────────────────
     "calculate-sms-stats": {
         "task": "tasks.sms_sync.calculate_sms_campaign_stats",
@@ -106,6 +144,10 @@ celery_app.conf.beat_schedule = {
         "task": "tasks.monitoring_sync.health_check",
         "schedule": crontab(minute="*/10"),
     },
+    "refresh-dashboard-stats": {
+        "task": "tasks.monitoring_sync.refresh_dashboard_stats",
+        "schedule": crontab(minute="*/5"),
+    },
 
     # Abandoned cart recovery: every 5 min; daily cleanup of old abandoned sessions
     "check-abandoned-carts": {
@@ -116,6 +158,12 @@ celery_app.conf.beat_schedule = {
         "task": "tasks.abandoned_cart_tasks.cleanup_old_abandoned_carts",
         "schedule": crontab(minute=0, hour=3),
     },
+
+    # Short-link redirects buffer clicks in Redis; write them to Postgres every minute
+    "flush-short-link-clicks": {
+        "task": "tasks.shortener_tasks.flush_short_link_clicks",
+        "schedule": crontab(minute="*"),
+    },
 }
 
 # Task routes (route tasks to dedicated queues for isolation)
@@ -131,6 +179,10 @@ celery_app.conf.task_routes = {
     
     # Queue 3: Website discovery (I/O bound, ScrapingDog + LLM)
     "tasks.discovery_tasks.*": {"queue": "discovery", "priority": 6},
+    
+    # Message Batches: the validation submitter needs the browser pool
+    "tasks.llm_batch_tasks.submit_validation_llm_batch": {"queue": "validation", "priority": 3},
+    "tasks.llm_batch_tasks.*": {"queue": "discovery", "priority": 3},
     "tasks.phone_validation_tasks.*": {"queue": "generation", "priority": 4},  # Pre-generation, run before site gen
     
     # Other queues (unchanged)
@@ -141,6 +193,7 @@ celery_app.conf.task_routes = {
     "tasks.monitoring_sync.*": {"queue": "monitoring"},
     "tasks.ticket_tasks.*": {"queue": "celery"},  # Default queue, low latency
     "tasks.abandoned_cart_tasks.*": {"queue": "celery"},
+    "tasks.shortener_tasks.*": {"queue": "celery"},
 }
 
 # Enable priority support (0-10, 10 = highest)
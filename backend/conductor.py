@@ -17,26 +17,26 @@ from models.campaign import Campaign
 from models.coverage import CoverageGrid
 from models.customer import Customer
 
-# Import tasks
+# Task bodies, awaited directly (the Celery tasks run them via run_async)
 from tasks.scraping import (
-    scrape_pending_territories,
-    qualify_new_leads,
-    cleanup_expired_cooldowns
+    scrape_pending_territories_async,
+    qualify_new_leads_async,
+    cleanup_expired_cooldowns_async
 )
 from tasks.generation import (
-    generate_pending_sites,
-    publish_completed_sites,
-    retry_failed_generations
+    generate_pending_sites_async,
+    publish_completed_sites_async,
+    retry_failed_generations_async
 )
 from tasks.campaigns import (
-    create_campaigns_for_new_sites,
-    send_pending_campaigns,
-    retry_failed_campaigns
+    create_campaigns_for_new_sites_async,
+    send_pending_campaigns_async,
+    retry_failed_campaigns_async
 )
 from tasks.monitoring import (
-    health_check,
-    cleanup_stuck_tasks,
-    generate_daily_report
+    health_check_async,
+    cleanup_stuck_tasks_async,
+    generate_daily_report_async
 )
 
 # Configure logging
@@ -138,7 +138,7 @@ class Conductor:
         try:
             # 1. Health check first
             logger.info("Running health check...")
-            health = await health_check()
+            health = await health_check_async()
             results["health_status"] = health
             
             if health.get("status") == "unhealthy":
@@ -147,52 +147,52 @@ class Conductor:
             
             # 2. Clean up stuck tasks
             logger.info("Cleaning up stuck tasks...")
-            cleanup_result = await cleanup_stuck_tasks()
+            cleanup_result = await cleanup_stuck_tasks_async()
             results["tasks_run"].append({"task": "cleanup_stuck_tasks", "result": cleanup_result})
             
             # 3. Scraping phase
             logger.info("Phase 1: SCRAPING")
             
             # Clean up expired cooldowns
-            cooldown_result = await cleanup_expired_cooldowns()
+            cooldown_result = await cleanup_expired_cooldowns_async()
             results["tasks_run"].append({"task": "cleanup_expired_cooldowns", "result": cooldown_result})
             
             # Scrape pending territories
-            scrape_result = await scrape_pending_territories()
+            scrape_result = await scrape_pending_territories_async()
             results["tasks_run"].append({"task": "scrape_pending_territories", "result": scrape_result})
             
             # Qualify new leads
-            qualify_result = await qualify_new_leads()
+            qualify_result = await qualify_new_leads_async()
             results["tasks_run"].append({"task": "qualify_new_leads", "result": qualify_result})
             
             # 4. Generation phase
             logger.info("Phase 2: SITE GENERATION")
             
             # Retry failed generations
-            retry_gen_result = await retry_failed_generations()
+            retry_gen_result = await retry_failed_generations_async()
             results["tasks_run"].append({"task": "retry_failed_generations", "result": retry_gen_result})
             
             # Generate new sites
-            gen_result = await generate_pending_sites()
+            gen_result = await generate_pending_sites_async()
             results["tasks_run"].append({"task": "generate_pending_sites", "result": gen_result})
             
             # Publish completed sites
-            publish_result = await publish_completed_sites()
+            publish_result = await publish_completed_sites_async()
             results["tasks_run"].append({"task": "publish_completed_sites", "result": publish_result})
             
             # 5. Campaign phase
             logger.info("Phase 3: EMAIL CAMPAIGNS")
             
             # Create campaigns for new sites
-            create_campaign_result = await create_campaigns_for_new_sites()
+            create_campaign_result = await create_campaigns_for_new_sites_async()
             results["tasks_run"].append({"task": "create_campaigns_for_new_sites", "result": create_campaign_result})
             
             # Retry failed campaigns
-            retry_campaign_result = await retry_failed_campaigns()
+            retry_campaign_result = await retry_failed_campaigns_async()
             results["tasks_run"].append({"task": "retry_failed_campaigns", "result": retry_campaign_result})
             
             # Send pending campaigns
-            send_result = await send_pending_campaigns()
+            send_result = await send_pending_campaigns_async()
             results["tasks_run"].append({"task": "send_pending_campaigns", "result": send_result})
             
             # 6. Get pipeline status
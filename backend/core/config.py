@@ -23,9 +23,37 @@ class Settings(BaseSettings):
     REDIS_PORT: int = 6379
     REDIS_DB: int = 0
     
+    # Public generated-site serving (rendered page cache)
+    SITE_RENDER_CACHE_SIZE: int = 256  # Rendered pages kept in memory per API process
+    SITE_RENDER_CACHE_TTL_SECONDS: int = 3600  # Lifetime of rendered pages in Redis
+    
+    # Short-link redirects (slug cache + buffered click counting)
+    SHORTLINK_CACHE_TTL_SECONDS: int = 300  # How long a resolved slug is served from memory
+    SHORTLINK_NEGATIVE_CACHE_TTL_SECONDS: int = 30  # How long an unknown/inactive slug stays cached
+    SHORTLINK_CACHE_SIZE: int = 10000  # Max slugs cached per API process
+    SHORTLINK_CACHE_CHECK_SECONDS: float = 1.0  # How often a process checks Redis for deactivated links
+    
+    # Dashboard stats cards (snapshot refreshed by the refresh_dashboard_stats beat task)
+    DASHBOARD_STATS_MAX_AGE_SECONDS: int = 900  # Serve the snapshot while younger than this; 0 = always live
+
+    # System settings cache (in-process snapshot, invalidated via a Redis version counter)
+    SYSTEM_SETTINGS_CACHE_CHECK_SECONDS: float = 1.0  # How often a process compares its snapshot version
+    SYSTEM_SETTINGS_CACHE_MAX_AGE_SECONDS: int = 60  # Hard reload interval (bounds staleness without Redis); 0 = no cache
+    
+    # Scrape progress SSE streaming
+    PROGRESS_STREAM_COALESCE_SECONDS: float = 0.5  # Min gap between business_scraped events per client
+    PROGRESS_STREAM_MAX_PENDING: int = 200  # Per-client buffered events before the oldest are dropped
+    
     # Celery
     CELERY_BROKER_URL: Optional[str] = None
     CELERY_RESULT_BACKEND: Optional[str] = None
+    CELERY_DB_POOL_SIZE: int = 2  # Async DB connections kept per worker process
+    CELERY_DB_MAX_OVERFLOW: int = 3  # Extra connections per worker process under load
+
+    # Claim-based work queues (services/work_queue.py)
+    WORK_QUEUE_DEFAULT_CAPACITY: int = 4  # Worker slots assumed for a Celery queue when no worker answers inspect
+    WORK_QUEUE_PREFETCH_FACTOR: int = 2  # Items kept leased/enqueued per worker slot
+    WORK_QUEUE_CAPACITY_CACHE_SECONDS: int = 60  # How long inspected worker capacity is reused
     
     # API Keys
     OUTSCRAPER_API_KEY: str
@@ -42,6 +70,13 @@ class Settings(BaseSettings):
     GEMINI_API_KEY: Optional[str] = None
     BREVO_API_KEY: Optional[str] = None
     SCRAPINGDOG_API_KEY: Optional[str] = None  # For Google search verification
+    SCRAPINGDOG_RATE_PER_SECOND: float = 2.0  # Shared (Redis token bucket) across all workers
+    SCRAPINGDOG_BURST: int = 4
+    DISCOVERY_QUERY_CACHE_TTL_SECONDS: int = 1209600  # 14 days; 0 disables the normalized-query cache
+    DISCOVERY_BATCH_CONCURRENCY: int = 5  # In-flight searches / LLM calls per discover_websites_batch()
+    DISCOVERY_LLM_GROUP_SIZE: int = 4  # Businesses per LLM prompt in batch discovery (1 = one prompt each)
+    DISCOVERY_BATCH_SIZE: int = 20  # Businesses per discover_missing_websites_batch task
+    DISCOVERY_DISPATCH_LIMIT: int = 200  # Queued businesses handed to batch tasks per dispatch_pending_discoveries run
     
     # Payment Providers (Recurrente - Legacy)
     RECURRENTE_PUBLIC_KEY: Optional[str] = None
@@ -91,6 +126,14 @@ class Settings(BaseSettings):
     SMS_ENABLE_COST_ALERTS: str = "true"
     SMS_ENFORCE_BUSINESS_HOURS: str = "true"
     SMS_DEFAULT_TIMEZONE: str = "America/Chicago"
+    SMS_SEND_CONCURRENCY: int = 5  # In-flight provider requests per SMS send batch
+    SMS_TELNYX_RATE_PER_SECOND: float = 1.0  # Per sending number (long-code limit)
+    SMS_LABSMOBILE_RATE_PER_SECOND: float = 10.0  # Per sending number
+    SMS_RATE_BURST: int = 5  # Token bucket capacity for SMS sends
+    SMS_OPT_OUT_INDEX_MAX_AGE_SECONDS: int = 30  # Hard reload interval for the in-process opt-out index (bounds a lost invalidation); 0 = always query the DB
+    SMS_STATUS_STREAM_MAXLEN: int = 100000  # Delivery callbacks kept in the Redis stream (approximate trim)
+    SMS_STATUS_BATCH_SIZE: int = 500  # Callbacks coalesced per batched UPDATE
+    SMS_STATUS_DEDUP_TTL_SECONDS: int = 86400  # Provider redeliveries of a callback are dropped within this window
     
     # Activity filtering — gates site generation on review/social recency
     ENABLE_FACEBOOK_ACTIVITY_CHECK: bool = True
@@ -102,10 +145,49 @@ class Settings(BaseSettings):
     ENABLE_AUTO_VALIDATION: bool = True  # Auto-validate websites after scraping
     VALIDATION_BATCH_SIZE: int = 10  # Max businesses to validate per batch
     VALIDATION_CAPTURE_SCREENSHOTS: bool = False  # Disable screenshots for performance
+    VALIDATION_NAVIGATION_PROFILE: str = "stealth"  # stealth | balanced | fast (single validations)
+    VALIDATION_BULK_NAVIGATION_PROFILE: str = "fast"  # Pooled batch runs; escalates to stealth on a block/captcha
+    VALIDATION_STATIC_TIER_ENABLED: bool = True  # Decide parked pages / clear phone+name matches from static HTML before Playwright
+    VALIDATION_STATIC_FETCH_TIMEOUT_SECONDS: int = 10
+    VALIDATION_TEXT_ONLY_EXTRACTION: bool = False  # Skip HTML serialization; content_length = text length
+    VALIDATION_SKIP_BULK_SCREENSHOTS: bool = True  # Never screenshot in batch/pooled revalidation runs
+    VALIDATION_SCREENSHOT_DIR: str = "/var/www/webmagic/screenshots"  # Content-addressed screenshot store
+    VALIDATION_SCREENSHOT_BASE_URL: Optional[str] = None  # Defaults to {API_URL}/api/{API_VERSION}/validation/screenshots
+    VALIDATION_SCREENSHOT_FORMAT: str = "webp"  # webp | jpeg
+    VALIDATION_SCREENSHOT_QUALITY: int = 70
+    VALIDATION_SCREENSHOT_THUMBNAIL_WIDTH: int = 320  # 0 = no thumbnail
     VALIDATION_TIMEOUT_MS: int = 30000  # 30 seconds per website
-    
+    VALIDATION_BROWSER_POOL_SIZE: int = 2  # Warm Chromium instances per validation worker
+    VALIDATION_CONTEXTS_PER_BROWSER: int = 3  # Concurrent pages per pooled browser
+    VALIDATION_BROWSER_MAX_PAGES: int = 50  # Recycle a pooled browser after this many pages
+
+    # Reachability cache (DNS + quick HTTP check results shared across workers)
+    REACHABILITY_DNS_TTL_SECONDS: int = 3600  # Host resolves
+    REACHABILITY_DNS_NEGATIVE_TTL_SECONDS: int = 21600  # NXDOMAIN / no address; 0 = never cache dead hosts
+    REACHABILITY_HTTP_TTL_SECONDS: int = 3600  # Quick HTTP check answers (status / content)
+    REACHABILITY_HTTP_FAILURE_TTL_SECONDS: int = 900  # Timeouts and connection errors
+    REACHABILITY_HTML_TTL_SECONDS: int = 3600  # Hunter-fetched HTML reused by the validation static tier; 0 = off
+    
+    # Hunter zone pipeline (per-business work is fanned out within a zone)
+    HUNTER_PIPELINE_WORKERS: int = 8  # Businesses processed concurrently (1 = sequential)
+    HUNTER_HTTP_CONCURRENCY: int = 10  # Concurrent quick HTTP website checks
+    HUNTER_DISCOVERY_CONCURRENCY: int = 2  # Concurrent ScrapingDog + LLM discovery calls
+    HUNTER_DISCOVERY_DELAY_SECONDS: float = 0.0  # Per-slot pause after each discovery call (ScrapingDog rate is enforced by the shared token bucket)
+    HUNTER_SAVE_BATCH_SIZE: int = 25  # Businesses per bulk upsert round trip
+
     # LLM Configuration for Website Validation
     LLM_MODEL: str = "claude-3-haiku-20240307"  # Fallback validation model (overridden by database settings)
+    LLM_VERDICT_CACHE_ENABLED: bool = True  # Reuse verdicts for identical business/page/prompt/model inputs
+    LLM_VERDICT_CACHE_TTL_SECONDS: int = 604800  # 7 days
+    LLM_PROMPT_CACHING_ENABLED: bool = True  # Send static instruction blocks with an Anthropic cache breakpoint
+    LLM_BATCH_PENDING_TTL_SECONDS: int = 259200  # Keep Message Batch context 3 days (batches finish within 24h)
+    LLM_BATCH_POLL_SECONDS: int = 300  # How often to check a submitted Message Batch for completion
+    
+    # LLM gateway (every Claude call goes through services.llm.gateway)
+    LLM_GATEWAY_MAX_CONCURRENCY_PER_MODEL: int = 8  # In-flight requests per model per process
+    LLM_GATEWAY_REQUESTS_PER_MINUTE: int = 0  # Shared per-model request budget across all processes (0 = unlimited)
+    LLM_GATEWAY_BURST: int = 10  # Requests allowed back-to-back when the budget is full
+    LLM_GATEWAY_MAX_RETRIES: int = 5  # Jittered backoff retries on 429/529/5xx/connection errors
 
     # Abandoned cart recovery
     ABANDONED_CART_WINDOW_MINUTES: int = 15  # Treat checkout as abandoned after this many minutes
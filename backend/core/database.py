@@ -6,10 +6,10 @@ Also provides synchronous support for Celery tasks.
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy import create_engine
 from sqlalchemy.orm import declarative_base, sessionmaker, Session
-from sqlalchemy.pool import NullPool
 from typing import AsyncGenerator
 from contextlib import contextmanager, asynccontextmanager
 from .config import get_settings
+from .worker_loop import on_worker_shutdown
 
 settings = get_settings()
 
@@ -37,19 +37,22 @@ AsyncSessionLocal = async_sessionmaker(
     autoflush=False,
 )
 
-# Async engine for Celery tasks — uses NullPool so that asyncpg never caches
-# connections across event loops.  Celery's run_async() creates a fresh loop
-# for each task; a pooled engine would have pending futures tied to a previous
-# (closed) loop, causing:
-#   RuntimeError: Task got Future attached to a different loop
+# Async engine for Celery tasks.  Each worker process runs every async task
+# on one persistent event loop (core.worker_loop), so asyncpg connections can
+# be pooled across tasks.  The pool is reset after fork (worker_process_init)
+# and disposed on the worker loop at shutdown.
 celery_async_engine = create_async_engine(
     settings.DATABASE_URL,
-    poolclass=NullPool,
+    pool_size=settings.CELERY_DB_POOL_SIZE,
+    max_overflow=settings.CELERY_DB_MAX_OVERFLOW,
+    pool_pre_ping=True,
+    pool_recycle=1800,
     echo=settings.DEBUG,
     connect_args={
         "statement_cache_size": 0,
     },
 )
+on_worker_shutdown(celery_async_engine.dispose)
 
 CeleryAsyncSessionLocal = async_sessionmaker(
     celery_async_engine,
@@ -121,10 +124,11 @@ async def init_db() -> None:
 @asynccontextmanager
 async def get_async_session():
     """
-    Async context manager for database sessions (e.g. in Celery tasks that run async code).
+    Async context manager for database sessions in Celery tasks that run async code
+    (worker pooled engine; run the task body with core.worker_loop.run_async).
     Use: async with get_async_session() as db: ...
     """
-    session = AsyncSessionLocal()
+    session = CeleryAsyncSessionLocal()
     try:
         yield session
         await session.commit()
@@ -137,19 +141,16 @@ async def get_async_session():
 
 def get_db_session() -> AsyncSession:
     """
-    Get a database session for async Celery tasks (DEPRECATED - use get_db_session_sync for Celery).
-    Returns a new async session that should be closed after use.
+    Get a database session for async Celery tasks.
+    Returns a new session on the worker's pooled engine; run the task body
+    with core.worker_loop.run_async so connections are reused across tasks.
     
     Usage in async Celery tasks:
-        session = get_db_session()
-        try:
-            # Use session
-            result = await session.execute(query)
-            await session.commit()
-        finally:
-            await session.close()
+        async with get_db_session() as db:
+            result = await db.execute(query)
+            await db.commit()
     """
-    return AsyncSessionLocal()
+    return CeleryAsyncSessionLocal()
 
 
 @contextmanager
@@ -0,0 +1,91 @@
+"""
+Per-process event loop for Celery workers.
+
+Celery tasks are synchronous, so async task bodies need an event loop.
+Instead of asyncio.run() per task (a new loop every time, which forces
+loop-bound resources like asyncpg connections to be rebuilt per task), each
+worker process owns ONE loop for its whole lifetime and every task runs its
+coroutine on it via run_async(). Pooled DB connections, the Playwright
+browser pool, etc. stay bound to that loop and are reused across tasks.
+
+Lifecycle (wired up in celery_app.py):
+    worker_process_init     -> init_worker_loop()
+    worker_process_shutdown -> shutdown_worker_loop()
+
+Usage in tasks:
+    from core.worker_loop import run_async
+
+    @celery_app.task
+    def my_task(business_id):
+        return run_async(_my_task_async(business_id))
+"""
+import asyncio
+import logging
+from typing import Awaitable, Callable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_shutdown_hooks: List[Callable[[], Awaitable[None]]] = []
+
+
+def init_worker_loop() -> asyncio.AbstractEventLoop:
+    """
+    Create this process's event loop.
+
+    Called right after the worker process is forked; a loop object copied
+    from the parent is discarded rather than reused.
+    """
+    global _loop
+    _loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(_loop)
+    return _loop
+
+
+def get_worker_loop() -> asyncio.AbstractEventLoop:
+    """Get the process event loop, creating it on first use (e.g. -P solo)."""
+    if _loop is None or _loop.is_closed():
+        return init_worker_loop()
+    return _loop
+
+
+def run_async(coro):
+    """
+    Run a coroutine to completion on the worker's persistent event loop.
+
+    Raises:
+        RuntimeError: if called from code already running on the loop
+            (await the coroutine instead)
+    """
+    loop = get_worker_loop()
+    if loop.is_running():
+        coro.close()
+        raise RuntimeError("run_async() called from inside the worker event loop; await instead")
+    return loop.run_until_complete(coro)
+
+
+def on_worker_shutdown(hook: Callable[[], Awaitable[None]]) -> Callable[[], Awaitable[None]]:
+    """
+    Register an async cleanup callback run on the worker loop at shutdown.
+
+    Hooks run in reverse registration order. Usable as a decorator.
+    """
+    _shutdown_hooks.append(hook)
+    return hook
+
+
+def shutdown_worker_loop() -> None:
+    """Run the shutdown hooks, then close the loop."""
+    global _loop
+    if _loop is None or _loop.is_closed():
+        return
+    try:
+        for hook in reversed(_shutdown_hooks):
+            try:
+                _loop.run_until_complete(hook())
+            except Exception as e:
+                logger.warning(f"Worker shutdown hook {getattr(hook, '__qualname__', hook)} failed: {e}")
+        _loop.run_until_complete(_loop.shutdown_asyncgens())
+    finally:
+        _loop.close()
+        _loop = None
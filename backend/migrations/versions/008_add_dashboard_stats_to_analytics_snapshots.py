@@ -0,0 +1,30 @@
+"""
+Migration 008: Add dashboard_stats JSONB snapshot to analytics_snapshots
+
+Today's row holds the precomputed dashboard stats cards (businesses,
+coverage, sites, geo_strategies), refreshed by the
+refresh_dashboard_stats beat task so the stats endpoints don't
+aggregate the large tables on every page load.
+
+Consumed by: services/dashboard_stats_snapshot.py
+"""
+from sqlalchemy import text
+
+
+async def upgrade(conn):
+    await conn.execute(text(
+        "ALTER TABLE analytics_snapshots ADD COLUMN IF NOT EXISTS dashboard_stats JSONB"
+    ))
+    await conn.execute(text(
+        "ALTER TABLE analytics_snapshots "
+        "ADD COLUMN IF NOT EXISTS dashboard_stats_refreshed_at TIMESTAMP"
+    ))
+
+
+async def downgrade(conn):
+    await conn.execute(text(
+        "ALTER TABLE analytics_snapshots DROP COLUMN IF EXISTS dashboard_stats_refreshed_at"
+    ))
+    await conn.execute(text(
+        "ALTER TABLE analytics_snapshots DROP COLUMN IF EXISTS dashboard_stats"
+    ))
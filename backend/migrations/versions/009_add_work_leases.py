@@ -0,0 +1,35 @@
+"""
+Migration 009: Add work_leases table for claim-based work queues
+
+One row per claimed work item (queue + source row id) with a lease expiry.
+Beat dispatchers claim rows with SELECT ... FOR UPDATE SKIP LOCKED and
+record the lease here, so overlapping ticks or manual triggers never
+dispatch the same row twice; expired leases make work from crashed workers
+claimable again.
+
+Consumed by: services/work_queue.py
+"""
+from sqlalchemy import text
+
+
+async def upgrade(conn):
+    await conn.execute(text("""
+        CREATE TABLE IF NOT EXISTS work_leases (
+            queue VARCHAR(64) NOT NULL,
+            item_id UUID NOT NULL,
+            owner VARCHAR(255),
+            leased_until TIMESTAMP NOT NULL,
+            claimed_at TIMESTAMP NOT NULL DEFAULT (now() AT TIME ZONE 'utc'),
+            heartbeat_at TIMESTAMP,
+            attempts INTEGER NOT NULL DEFAULT 1,
+            PRIMARY KEY (queue, item_id)
+        )
+    """))
+    await conn.execute(text(
+        "CREATE INDEX IF NOT EXISTS idx_work_leases_queue_leased_until "
+        "ON work_leases (queue, leased_until)"
+    ))
+
+
+async def downgrade(conn):
+    await conn.execute(text("DROP TABLE IF EXISTS work_leases"))
@@ -33,6 +33,7 @@ from models.website_validation import WebsiteValidation
 from models.business_filter_preset import BusinessFilterPreset
 from models.scrape_session import ScrapeSession
 from models.short_link import ShortLink
+from models.work_lease import WorkLease
 
 __all__ = [
     "BaseModel",
@@ -75,4 +76,6 @@ __all__ = [
     "ScrapeSession",
     # URL Shortener
     "ShortLink",
+    # Work queues
+    "WorkLease",
 ]
@@ -5,7 +5,7 @@ Stores daily snapshots of key performance indicators (KPIs)
 for dashboard analytics and historical reporting.
 """
 from sqlalchemy import Column, Integer, Date, DateTime, Index
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import UUID, JSONB
 from datetime import datetime, date
 import uuid
 
@@ -57,6 +57,11 @@ class AnalyticsSnapshot(Base):
     # Cost tracking
     api_costs_cents = Column(Integer, default=0, nullable=False)
     
+    # Dashboard stats cards (see services/dashboard_stats_snapshot.py),
+    # keyed by section: businesses, coverage, sites, geo_strategies
+    dashboard_stats = Column(JSONB, nullable=True)
+    dashboard_stats_refreshed_at = Column(DateTime, nullable=True)
+    
     # Timestamp
     created_at = Column(
         DateTime,
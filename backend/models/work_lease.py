@@ -0,0 +1,45 @@
+"""
+Work Lease Model - claims on rows of claim-based work queues.
+
+A row means "item_id is being processed for queue" until leased_until.
+Workers extend the lease with heartbeats while they run and delete it when
+they finish; a lease left behind by a crashed worker simply expires and the
+item becomes claimable again.
+
+Managed by: services/work_queue.py
+"""
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Index, Integer, String
+from sqlalchemy.dialects.postgresql import UUID
+
+from core.database import Base
+
+
+class WorkLease(Base):
+    """Lease on one work item (queue + source row id)."""
+
+    __tablename__ = "work_leases"
+
+    # Queue name, e.g. "generation", "sms_scheduled"
+    queue = Column(String(64), primary_key=True)
+
+    # Primary key of the source row (business, campaign, site, ...)
+    item_id = Column(UUID(as_uuid=True), primary_key=True)
+
+    # Who holds the lease: dispatcher run or worker task id
+    owner = Column(String(255), nullable=True)
+
+    leased_until = Column(DateTime, nullable=False)
+    claimed_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    heartbeat_at = Column(DateTime, nullable=True)
+
+    # Times the item has been claimed since its lease row was created
+    attempts = Column(Integer, default=1, nullable=False)
+
+    __table_args__ = (
+        Index("idx_work_leases_queue_leased_until", "queue", "leased_until"),
+    )
+
+    def __repr__(self):
+        return f"<WorkLease {self.queue}:{self.item_id} until {self.leased_until}>"
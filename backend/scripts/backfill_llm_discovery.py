@@ -7,6 +7,7 @@ or any businesses that failed to run through deep verification.
 Usage:
     python scripts/backfill_llm_discovery.py --limit 50 --dry-run
     python scripts/backfill_llm_discovery.py --batch-size 10
+    python scripts/backfill_llm_discovery.py --llm-batch --batch-size 500  # Message Batches via Celery
 """
 import asyncio
 import argparse
@@ -30,7 +31,8 @@ async def backfill_missing_websites(
     limit: int = None,
     batch_size: int = 10,
     dry_run: bool = False,
-    only_null_raw_data: bool = False
+    only_null_raw_data: bool = False,
+    llm_batch: bool = False
 ):
     """
     Backfill LLM discovery for businesses with missing websites.
@@ -40,12 +42,16 @@ async def backfill_missing_websites(
         batch_size: Number of businesses to process in parallel
         dry_run: If True, only show what would be processed
         only_null_raw_data: If True, only process businesses with NULL raw_data
+        llm_batch: If True, queue submit_discovery_llm_batch per batch (searches run
+            on a discovery worker, LLM analyses go through Anthropic Message Batches
+            and are applied by the regular discovery handlers when the batch ends)
     """
     logger.info("🚀 Starting LLM discovery backfill...")
     logger.info(f"   Limit: {limit or 'No limit'}")
     logger.info(f"   Batch size: {batch_size}")
     logger.info(f"   Dry run: {dry_run}")
     logger.info(f"   Only NULL raw_data: {only_null_raw_data}")
+    logger.info(f"   Message batches: {llm_batch}")
     
     async for db in get_db():
         try:
@@ -92,6 +98,15 @@ async def backfill_missing_websites(
                     logger.info(f"   ... and {len(businesses) - 20} more")
                 return
             
+            if llm_batch:
+                from tasks.llm_batch_tasks import submit_discovery_llm_batch
+                
+                for i in range(0, len(businesses), batch_size):
+                    batch_ids = [str(biz.id) for biz in businesses[i:i + batch_size]]
+                    task = submit_discovery_llm_batch.delay(batch_ids)
+                    logger.info(f"📦 Queued {len(batch_ids)} businesses for batch discovery (task: {task.id})")
+                return
+            
             # Initialize LLM discovery service
             llm_discovery = LLMDiscoveryService()
             
@@ -268,6 +283,11 @@ def main():
         action="store_true",
         help="Show what would be processed without making changes"
     )
+    parser.add_argument(
+        "--llm-batch",
+        action="store_true",
+        help="Queue Celery tasks that run the LLM step through Anthropic Message Batches (half price, results within 24h)"
+    )
     parser.add_argument(
         "--only-null-raw-data",
         action="store_true",
@@ -280,7 +300,8 @@ def main():
         limit=args.limit,
         batch_size=args.batch_size,
         dry_run=args.dry_run,
-        only_null_raw_data=args.only_null_raw_data
+        only_null_raw_data=args.only_null_raw_data,
+        llm_batch=args.llm_batch
     ))
 
 
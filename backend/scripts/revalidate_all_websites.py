@@ -22,6 +22,9 @@ Usage:
     
     # Limit to first 100 businesses
     python scripts/revalidate_all_websites.py --all --limit 100
+    
+    # Bulk run: LLM verdicts via Anthropic Message Batches (half price, applied when the batch ends)
+    python scripts/revalidate_all_websites.py --all --llm-batch --batch-size 200
 """
 import sys
 import os
@@ -34,6 +37,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from core.database import get_db_session_sync
 from models.business import Business
 from tasks.validation_tasks import batch_validate_websites
+from tasks.llm_batch_tasks import submit_validation_llm_batch
 from datetime import datetime
 
 
@@ -84,23 +88,25 @@ def get_businesses_to_validate(
         ]
 
 
-def queue_validations(business_ids: list[str], batch_size: int = 10):
+def queue_validations(business_ids: list[str], batch_size: int = 10, llm_batch: bool = False):
     """
     Queue validation tasks for businesses.
     
     Args:
         business_ids: List of business UUIDs
         batch_size: Number of businesses per Celery task
+        llm_batch: Submit each chunk's LLM prompts as one Message Batch
         
     Returns:
         List of queued task IDs
     """
     tasks = []
+    task_fn = submit_validation_llm_batch if llm_batch else batch_validate_websites
     
     # Queue in batches
     for i in range(0, len(business_ids), batch_size):
         batch = business_ids[i:i + batch_size]
-        task = batch_validate_websites.delay(batch)
+        task = task_fn.delay(batch)
         tasks.append({
             "batch_number": i // batch_size + 1,
             "businesses_count": len(batch),
@@ -159,6 +165,12 @@ Examples:
         help="Number of businesses per validation task (default: 10)"
     )
     
+    parser.add_argument(
+        "--llm-batch",
+        action="store_true",
+        help="Run the LLM stage through Anthropic Message Batches (half price, results within 24h)"
+    )
+    
     parser.add_argument(
         "--dry-run",
         action="store_true",
@@ -207,6 +219,7 @@ Examples:
     print(f"  - Total businesses: {len(businesses)}")
     print(f"  - Status filter: {status_filter or 'all'}")
     print(f"  - Batch size: {args.batch_size}")
+    print(f"  - LLM mode: {'message batches' if args.llm_batch else 'online'}")
     print(f"  - Estimated batches: {(len(businesses) + args.batch_size - 1) // args.batch_size}")
     
     # Show status breakdown
@@ -264,7 +277,7 @@ Examples:
     print(f"\n🚀 Queuing validation tasks...")
     
     business_ids = [b["id"] for b in businesses]
-    tasks = queue_validations(business_ids, batch_size=args.batch_size)
+    tasks = queue_validations(business_ids, batch_size=args.batch_size, llm_batch=args.llm_batch)
     
     print(f"\n✅ Successfully queued {len(tasks)} validation batches!")
     print(f"\n📊 Task Details:")
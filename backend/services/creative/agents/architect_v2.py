@@ -39,11 +39,20 @@ class ArchitectAgentV2(BaseAgent):
         business_data: Dict[str, Any],
         creative_dna: Dict[str, Any],
         design_brief: Dict[str, Any],
-        subdomain: Optional[str] = None
+        subdomain: Optional[str] = None,
+        planned_images: Optional[List[Dict[str, Any]]] = None
     ) -> Dict[str, Any]:
         """
         Generate complete website code using delimited output format.
         
+        Args:
+            subdomain: When set (and planned_images is not), images are
+                generated here before the prompt is built
+            planned_images: Image manifest from
+                ImageGenerationService.plan_images_for_site - the caller is
+                generating the images concurrently and reconciles the result
+                with apply_generated_images()
+        
         Returns:
             {
                 "html": str,
@@ -60,7 +69,9 @@ class ArchitectAgentV2(BaseAgent):
         # STEP 2: Generate images with Nano Banana BEFORE building the LLM prompt
         #         so the architect knows exactly which images are available.
         generated_images: List[Dict[str, Any]] = []
-        if subdomain:
+        if planned_images is not None:
+            generated_images = planned_images
+        elif subdomain:
             try:
                 from services.creative.image_service import ImageGenerationService
                 img_svc = ImageGenerationService()
@@ -257,6 +268,48 @@ document.addEventListener('DOMContentLoaded', () => {
         
         return website
     
+    def apply_generated_images(
+        self,
+        website: Dict[str, Any],
+        images: Optional[List[Dict[str, Any]]],
+    ) -> Dict[str, Any]:
+        """
+        Reconcile code written against a planned image manifest with the
+        images that were actually saved.
+
+        References to a slot that failed are pointed at a saved image of the
+        same kind (base or product); with nothing to fall back to, the <img>
+        tags and CSS background declarations for it are removed.
+        """
+        images = images or []
+        website["generated_images"] = images
+        failed = [img["slot"] for img in images if not img.get("saved")]
+        if not failed:
+            return website
+
+        saved = [img for img in images if img.get("saved") and img.get("filename")]
+        saved_base = [img["filename"] for img in saved if not img["slot"].startswith("product-")]
+        saved_products = [img["filename"] for img in saved if img["slot"].startswith("product-")]
+
+        html = website.get("html", "")
+        css = website.get("css", "")
+        for slot in failed:
+            missing = f"img/{slot}.jpg"
+            candidates = (saved_products + saved_base) if slot.startswith("product-") else saved_base
+            if candidates:
+                html = html.replace(missing, candidates[0])
+                css = css.replace(missing, candidates[0])
+                logger.warning(f"[architect] Image {slot} not generated — using {candidates[0]} instead")
+            else:
+                escaped = re.escape(missing)
+                html = re.sub(rf"<img\b[^>]*{escaped}[^>]*>", "", html)
+                css = re.sub(rf"background(?:-image)?\s*:[^;{{}}]*{escaped}[^;{{}}]*;?", "", css)
+                logger.warning(f"[architect] Image {slot} not generated — removed its references")
+
+        website["html"] = html
+        website["css"] = css
+        return website
+
     # ── Ecommerce layout instructions ─────────────────────────────────────────
 
     def _build_ecommerce_instructions(self, website_currency: str = "$") -> str:
@@ -3,18 +3,17 @@ Base Agent class for all AI agents.
 Handles Claude API communication, error handling, and retry logic.
 """
 from typing import Dict, Any, Optional, List, Union
-from anthropic import Anthropic, AsyncAnthropic
 from anthropic.types import Message
 import json
 import logging
 import re
 from pathlib import Path
 from datetime import datetime
-from core.config import get_settings
 from core.exceptions import ExternalAPIException
+from services.llm.gateway import get_llm_gateway, message_text
+from services.llm.prompt_cache import cached_system
 
 logger = logging.getLogger(__name__)
-settings = get_settings()
 
 
 class BaseAgent:
@@ -43,7 +42,6 @@ class BaseAgent:
         self.model = model
         self.temperature = temperature
         self.max_tokens = max_tokens
-        self.client = AsyncAnthropic(api_key=settings.ANTHROPIC_API_KEY)
         
         logger.info(
             f"Initialized {agent_name} agent with model {model}"
@@ -84,23 +82,22 @@ class BaseAgent:
             logger.debug(f"User prompt length/blocks: {prompt_len}")
 
             # Use streaming to avoid timeout limits on large max_tokens
-            async with self.client.messages.stream(
+            final_message = await get_llm_gateway().stream(
+                f"creative.{self.agent_name}",
                 model=self.model,
                 max_tokens=max_tokens or self.max_tokens,
                 temperature=temperature or self.temperature,
-                system=system_prompt,
+                system=cached_system(system_prompt),
                 messages=[
                     {
                         "role": "user",
                         "content": user_prompt
                     }
                 ]
-            ) as stream:
-                # Collect complete response from stream
-                content = await stream.get_final_text()
-                # Check why the model stopped generating
-                final_message = await stream.get_final_message()
-                stop_reason = final_message.stop_reason if final_message else None
+            )
+            content = message_text(final_message)
+            # Check why the model stopped generating
+            stop_reason = final_message.stop_reason
             
             logger.info(
                 f"[{self.agent_name}] Generation complete. "
@@ -15,13 +15,11 @@ Date: January 21, 2026
 import logging
 import json
 from typing import Dict, Any, Optional, Tuple
-from anthropic import AsyncAnthropic
 
-from core.config import get_settings
 from services.creative.agents.base import BaseAgent
+from services.llm.gateway import get_llm_gateway, message_text
 
 logger = logging.getLogger(__name__)
-settings = get_settings()
 
 
 # ============================================================================
@@ -69,7 +67,6 @@ class EditorAgent(BaseAgent):
             model="claude-sonnet-4-20250514",
             temperature=0.1  # Low temperature for precision
         )
-        self.client = AsyncAnthropic(api_key=settings.ANTHROPIC_API_KEY)
     
     # ========================================================================
     # MAIN PROCESSING METHODS
@@ -236,7 +233,8 @@ class EditorAgent(BaseAgent):
         )
         
         # Use streaming to avoid timeout limits on large max_tokens
-        async with self.client.messages.stream(
+        final_message = await get_llm_gateway().stream(
+            "creative.editor.analyze",
             model=self.model,
             max_tokens=64000,  # Max for Claude Sonnet 4.5
             temperature=self.temperature,
@@ -247,8 +245,8 @@ class EditorAgent(BaseAgent):
                     "content": user_prompt
                 }
             ]
-        ) as stream:
-            analysis_text = await stream.get_final_text()
+        )
+        analysis_text = message_text(final_message)
         
         try:
             # Try to extract JSON from response
@@ -299,7 +297,8 @@ class EditorAgent(BaseAgent):
         )
         
         # Use streaming to avoid timeout limits on large max_tokens
-        async with self.client.messages.stream(
+        final_message = await get_llm_gateway().stream(
+            "creative.editor.modify",
             model=self.model,
             max_tokens=64000,  # Max for Claude Sonnet 4.5
             temperature=self.temperature,
@@ -310,8 +309,8 @@ class EditorAgent(BaseAgent):
                     "content": user_prompt
                 }
             ]
-        ) as stream:
-            response_text = await stream.get_final_text()
+        )
+        response_text = message_text(final_message)
         
         # Parse response to extract code
         modifications = self._extract_code_from_response(response_text)
@@ -387,7 +386,8 @@ Return a JSON object with:
 Analyze and return validation result as JSON."""
 
         # Use streaming to avoid timeout limits on large max_tokens
-        async with self.client.messages.stream(
+        final_message = await get_llm_gateway().stream(
+            "creative.editor.validate",
             model=self.model,
             max_tokens=64000,  # Max for Claude Sonnet 4.5
             temperature=0.1,
@@ -398,8 +398,8 @@ Analyze and return validation result as JSON."""
                     "content": user_prompt
                 }
             ]
-        ) as stream:
-            response_text = await stream.get_final_text()
+        )
+        response_text = message_text(final_message)
         
         try:
             validation = json.loads(response_text)
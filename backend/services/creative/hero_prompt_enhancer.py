@@ -8,12 +8,9 @@ a cohesive image prompt.
 import logging
 from typing import Any, Dict, Optional
 
-from anthropic import AsyncAnthropic
-
-from core.config import get_settings
+from services.llm.gateway import get_llm_gateway
 
 logger = logging.getLogger(__name__)
-settings = get_settings()
 
 
 async def enhance_hero_prompt_with_branding(
@@ -69,8 +66,8 @@ Merge the user's vision with the brand's visual identity and industry. Produce a
 
 Output ONLY the image prompt text. No quotes, no JSON, no preamble."""
 
-    client = AsyncAnthropic(api_key=settings.ANTHROPIC_API_KEY)
-    response = await client.messages.create(
+    response = await get_llm_gateway().create(
+        "creative.hero_prompt",
         model="claude-sonnet-4-5",
         max_tokens=512,
         messages=[{"role": "user", "content": prompt}],
@@ -695,15 +695,7 @@ class ImageGenerationService:
             return []
 
         bucket = _resolve_category_key(category)
-        base_specs = _CATEGORY_PROMPTS[bucket]
-
-        # For ecommerce, append 7 product-specific image specs.
-        if website_type == "ecommerce":
-            ecommerce_bucket = _resolve_ecommerce_category_key(category)
-            product_specs = _ECOMMERCE_PRODUCT_PROMPTS[ecommerce_bucket]
-            all_specs = base_specs + product_specs
-        else:
-            all_specs = base_specs
+        all_specs = self._site_specs(category, website_type)
 
         color_hint = self._color_hint(brand_colors)
         brand_hint = self._brand_hint(creative_dna)
@@ -739,6 +731,30 @@ class ImageGenerationService:
         logger.info(f"[ImageGen] {saved}/{len(all_specs)} images saved for {subdomain}")
         return output
 
+    def plan_images_for_site(
+        self,
+        category: str,
+        website_type: str = "informational",
+    ) -> List[Dict[str, Any]]:
+        """
+        The manifest generate_images_for_site returns when every image saves.
+
+        Slots, filenames and subjects depend only on category and website type,
+        so the Architect can write HTML against this plan while the images are
+        still being generated. Returns [] when image generation is disabled.
+        """
+        if not self.api_key:
+            return []
+        return [
+            {
+                "slot": spec["slot"],
+                "filename": f"img/{spec['slot']}.jpg",
+                "saved": True,
+                "subject": spec["desc"],
+            }
+            for spec in self._site_specs(category, website_type)
+        ]
+
     async def generate_hero_image_only(
         self,
         business_name: str,
@@ -790,6 +806,15 @@ class ImageGenerationService:
 
     # ── Private helpers ───────────────────────────────────────────────────────
 
+    @staticmethod
+    def _site_specs(category: str, website_type: str) -> List[Dict[str, str]]:
+        """Image specs for a site: 3 base images, plus 7 product images for ecommerce."""
+        base_specs = _CATEGORY_PROMPTS[_resolve_category_key(category)]
+        if website_type == "ecommerce":
+            ecommerce_bucket = _resolve_ecommerce_category_key(category)
+            return base_specs + _ECOMMERCE_PRODUCT_PROMPTS[ecommerce_bucket]
+        return base_specs
+
     async def _generate_and_save(
         self,
         spec: Dict[str, str],
@@ -2,7 +2,7 @@
 Orchestrator - chains all creative agents together.
 Manages the complete website generation pipeline.
 """
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
 import logging
 import time
@@ -13,6 +13,8 @@ from services.creative.agents.concept import ConceptAgent
 from services.creative.agents.director import ArtDirectorAgent
 from services.creative.agents.architect_v2 import ArchitectAgentV2
 from services.creative.agents.interpreter import BusinessInterpreterAgent
+from services.creative.image_service import ImageGenerationService
+from services.creative.stage_graph import Stage, StageGraph
 from services.creative.prompts.loader import PromptLoader
 from services.creative.prompts.builder import PromptBuilder
 from services.system_settings_service import SystemSettingsService
@@ -20,11 +22,22 @@ from core.exceptions import GenerationException
 
 logger = logging.getLogger(__name__)
 
+# Stage name -> results key kept for existing consumers (get_generation_summary, logs)
+_LEGACY_DURATION_KEYS = {
+    "interpreter": "stage_0_duration_ms",
+    "analysis": "stage_1_duration_ms",
+    "concepts": "stage_2_duration_ms",
+    "design_brief": "stage_3_duration_ms",
+    "website": "stage_4_duration_ms",
+    "images": "images_duration_ms",
+}
+
 
 class CreativeOrchestrator:
     """
     Orchestrates the complete website generation pipeline.
-    Chains Analyst → Concept → Art Director → Architect.
+    Chains Analyst → Concept → Art Director → Architect, with image
+    generation running alongside the Architect.
     """
     
     def __init__(self, db: AsyncSession, model_override: Optional[str] = None):
@@ -59,15 +72,17 @@ class CreativeOrchestrator:
         """
         Generate complete website through multi-agent pipeline.
         
-        Workflow:
+        Workflow (stages run as a DAG, see _build_stages):
         1. Analyst: Extract insights from reviews
         2. Concept: Generate brand personality
         3. Art Director: Create design brief
-        4. Architect: Generate HTML/CSS/JS
+        4. Architect: Generate HTML/CSS/JS, while Nano Banana generates the
+           site images (when a subdomain is given)
         
         Args:
             business_data: Business information
             save_intermediate: Whether to save intermediate outputs
+            subdomain: Site subdomain; enables image generation
             
         Returns:
             Dictionary with all outputs and final website code
@@ -109,102 +124,26 @@ class CreativeOrchestrator:
         }
 
         try:
-            # Stage 0: Interpreter (manual mode only)
-            # Expands the user's free-form description into a rich structured
-            # profile that replaces review-derived insights for the downstream agents.
-            if business_data.get("is_manual"):
-                logger.info(f"[{business_name}] Stage 0: Interpreting business description...")
-                stage_start = time.time()
-
-                interpreter = BusinessInterpreterAgent(model=model)
-                hard_facts = {
-                    k: business_data.get(k)
-                    for k in ("name", "phone", "email", "address", "city", "state")
-                }
-                interpreted = await interpreter.interpret(
-                    description=business_data.get("raw_description", ""),
-                    hard_facts=hard_facts,
-                    language=business_data.get("language"),
-                )
-
-                # Merge interpreted fields into business_data so every downstream
-                # agent sees enriched data (name, category, services, etc.).
-                # Keep the original dict under "interpreted_profile" so the Analyst
-                # can use it as primary context instead of reviews.
-                business_data.update(interpreted)
-                business_data["interpreted_profile"] = interpreted
-
-                # If the interpreter resolved a real name and the placeholder was
-                # used, update business_name for logging.
-                business_name = business_data.get("name", business_name)
-
-                results["stage_0_duration_ms"] = (time.time() - stage_start) * 1000
-                logger.info(
-                    f"[{business_name}] Interpretation complete in "
-                    f"{results['stage_0_duration_ms']:.0f}ms: "
-                    f"'{interpreted.get('name')}' / {interpreted.get('category')}"
-                )
-
-            # Stage 1: Analyst
-            logger.info(f"[{business_name}] Stage 1/4: Analyzing business...")
-            stage_start = time.time()
+            graph = StageGraph(self._build_stages(business_data, model, subdomain))
+            outputs = await graph.run()
             
-            analysis = await self.analyst.analyze(business_data)
+            analysis = outputs["analysis"]
+            concepts = outputs["concepts"]
             results["analysis"] = analysis
-            results["stage_1_duration_ms"] = (time.time() - stage_start) * 1000
-            
-            logger.info(
-                f"[{business_name}] Analysis complete in {results['stage_1_duration_ms']:.0f}ms: "
-                f"{analysis.get('brand_archetype')}"
-            )
-            
-            # Stage 2: Concept
-            logger.info(f"[{business_name}] Stage 2/4: Generating brand concepts...")
-            stage_start = time.time()
-            
-            concepts = await self.concept.generate_concepts(business_data, analysis)
             results["concepts"] = concepts
             results["creative_dna"] = concepts.get("creative_dna")
-            results["stage_2_duration_ms"] = (time.time() - stage_start) * 1000
+            results["design_brief"] = outputs["design_brief"]
             
-            logger.info(
-                f"[{business_name}] Concepts complete in {results['stage_2_duration_ms']:.0f}ms: "
-                f"{concepts.get('selected_concept', {}).get('name')}"
-            )
-            
-            # Stage 3: Art Director
-            logger.info(f"[{business_name}] Stage 3/4: Creating design brief...")
-            stage_start = time.time()
-            
-            design_brief = await self.director.create_brief(
-                business_data,
-                concepts.get("creative_dna", {})
-            )
-            results["design_brief"] = design_brief
-            results["stage_3_duration_ms"] = (time.time() - stage_start) * 1000
-            
-            logger.info(
-                f"[{business_name}] Design brief complete in {results['stage_3_duration_ms']:.0f}ms: "
-                f"{design_brief.get('vibe')} vibe"
-            )
-            
-            # Stage 4: Architect
-            logger.info(f"[{business_name}] Stage 4/4: Generating website code...")
-            stage_start = time.time()
-            
-            website = await self.architect.generate_website(
-                business_data,
-                concepts.get("creative_dna", {}),
-                design_brief,
-                subdomain=subdomain,
-            )
+            website = outputs["website"]
+            if "images" in outputs:
+                website = self.architect.apply_generated_images(website, outputs["images"])
             results["website"] = website
-            results["stage_4_duration_ms"] = (time.time() - stage_start) * 1000
             
-            logger.info(
-                f"[{business_name}] Website code complete in {results['stage_4_duration_ms']:.0f}ms: "
-                f"{len(website.get('html', ''))} chars"
-            )
+            # Per-stage timeline, plus the legacy stage_N_duration_ms keys
+            results["stage_timings"] = graph.timings
+            for stage_name, key in _LEGACY_DURATION_KEYS.items():
+                if stage_name in graph.timings:
+                    results[key] = graph.timings[stage_name]["duration_ms"]
             
             # Calculate total duration
             total_duration = time.time() - start_time
@@ -213,7 +152,8 @@ class CreativeOrchestrator:
             results["status"] = "completed"
             
             logger.info(
-                f"[{business_name}] ✅ Complete generation pipeline finished in {total_duration:.1f}s"
+                f"[{business_data.get('name', business_name)}] ✅ Complete generation pipeline "
+                f"finished in {total_duration:.1f}s"
             )
             
             return results
@@ -233,6 +173,140 @@ class CreativeOrchestrator:
                 f"Website generation failed for {business_name}: {str(e)}"
             )
     
+    def _build_stages(
+        self,
+        business_data: Dict[str, Any],
+        model: str,
+        subdomain: Optional[str]
+    ) -> List[Stage]:
+        """
+        Pipeline DAG for one site.
+        
+        interpreter (manual only) → analysis → concepts → design_brief, then
+        the Architect and Nano Banana image generation run side by side: the
+        image prompts only need category, creative DNA and brand colors, and
+        the Architect writes against the planned image manifest.
+        """
+        image_service = ImageGenerationService() if subdomain else None
+        root: Tuple[str, ...] = ()
+        stages: List[Stage] = []
+        
+        def name() -> str:
+            return business_data.get("name", "Unknown")
+        
+        def planned_images() -> List[Dict[str, Any]]:
+            # After the interpreter, which may fill in the category
+            return image_service.plan_images_for_site(
+                category=business_data.get("category", ""),
+                website_type=business_data.get("website_type", "informational"),
+            )
+        
+        # Stage 0: Interpreter (manual mode only)
+        # Expands the user's free-form description into a rich structured
+        # profile that replaces review-derived insights for the downstream agents.
+        if business_data.get("is_manual"):
+            async def interpret(outputs: Dict[str, Any]) -> Dict[str, Any]:
+                logger.info(f"[{name()}] Stage 0: Interpreting business description...")
+                interpreter = BusinessInterpreterAgent(model=model)
+                hard_facts = {
+                    k: business_data.get(k)
+                    for k in ("name", "phone", "email", "address", "city", "state")
+                }
+                interpreted = await interpreter.interpret(
+                    description=business_data.get("raw_description", ""),
+                    hard_facts=hard_facts,
+                    language=business_data.get("language"),
+                )
+                # Merge interpreted fields into business_data so every downstream
+                # agent sees enriched data (name, category, services, etc.).
+                # Keep the original dict under "interpreted_profile" so the Analyst
+                # can use it as primary context instead of reviews.
+                business_data.update(interpreted)
+                business_data["interpreted_profile"] = interpreted
+                logger.info(
+                    f"[{name()}] Interpretation complete: "
+                    f"'{interpreted.get('name')}' / {interpreted.get('category')}"
+                )
+                return interpreted
+            
+            stages.append(Stage("interpreter", interpret))
+            root = ("interpreter",)
+        
+        # Stage 1: Analyst
+        async def analyze(outputs: Dict[str, Any]) -> Dict[str, Any]:
+            logger.info(f"[{name()}] Stage 1/4: Analyzing business...")
+            analysis = await self.analyst.analyze(business_data)
+            logger.info(f"[{name()}] Analysis complete: {analysis.get('brand_archetype')}")
+            return analysis
+        
+        # Stage 2: Concept
+        async def conceptualize(outputs: Dict[str, Any]) -> Dict[str, Any]:
+            logger.info(f"[{name()}] Stage 2/4: Generating brand concepts...")
+            concepts = await self.concept.generate_concepts(business_data, outputs["analysis"])
+            logger.info(
+                f"[{name()}] Concepts complete: "
+                f"{concepts.get('selected_concept', {}).get('name')}"
+            )
+            return concepts
+        
+        # Stage 3: Art Director
+        async def direct(outputs: Dict[str, Any]) -> Dict[str, Any]:
+            logger.info(f"[{name()}] Stage 3/4: Creating design brief...")
+            design_brief = await self.director.create_brief(
+                business_data,
+                outputs["concepts"].get("creative_dna", {})
+            )
+            logger.info(f"[{name()}] Design brief complete: {design_brief.get('vibe')} vibe")
+            return design_brief
+        
+        # Stage 4: Architect (against the planned image manifest when images
+        # are generated alongside)
+        async def build(outputs: Dict[str, Any]) -> Dict[str, Any]:
+            logger.info(f"[{name()}] Stage 4/4: Generating website code...")
+            website = await self.architect.generate_website(
+                business_data,
+                outputs["concepts"].get("creative_dna", {}),
+                outputs["design_brief"],
+                subdomain=subdomain,
+                planned_images=planned_images() if image_service is not None else None,
+            )
+            logger.info(f"[{name()}] Website code complete: {len(website.get('html', ''))} chars")
+            return website
+        
+        stages += [
+            Stage("analysis", analyze, depends_on=root),
+            Stage("concepts", conceptualize, depends_on=("analysis",)),
+            Stage("design_brief", direct, depends_on=("concepts",)),
+            Stage("website", build, depends_on=("design_brief",)),
+        ]
+        
+        # Nano Banana images, concurrently with the Architect
+        if image_service is not None:
+            async def generate_images(outputs: Dict[str, Any]) -> List[Dict[str, Any]]:
+                design_brief = outputs["design_brief"]
+                colors = design_brief.get("colors", design_brief.get("color_palette", {}))
+                try:
+                    return await image_service.generate_images_for_site(
+                        business_name=business_data.get("name", ""),
+                        category=business_data.get("category", ""),
+                        subdomain=subdomain,
+                        brand_colors=colors if isinstance(colors, dict) else {},
+                        creative_dna=outputs["concepts"].get("creative_dna", {}),
+                        website_type=business_data.get("website_type", "informational"),
+                    )
+                except Exception as img_err:
+                    # Image generation is best-effort — never block site creation;
+                    # report every planned slot as unsaved so the code is reconciled
+                    logger.warning(f"[{name()}] Image generation failed (non-fatal): {img_err}")
+                    return [
+                        {**img, "filename": None, "saved": False}
+                        for img in planned_images()
+                    ]
+            
+            stages.append(Stage("images", generate_images, depends_on=("design_brief",)))
+        
+        return stages
+    
     async def regenerate_stage(
         self,
         business_data: Dict[str, Any],
@@ -312,6 +386,7 @@ class CreativeOrchestrator:
                 "analysis_ms": results.get("stage_1_duration_ms"),
                 "concepts_ms": results.get("stage_2_duration_ms"),
                 "design_ms": results.get("stage_3_duration_ms"),
-                "code_ms": results.get("stage_4_duration_ms")
+                "code_ms": results.get("stage_4_duration_ms"),
+                "images_ms": results.get("images_duration_ms")
             }
         }
@@ -12,6 +12,7 @@ import logging
 from models.site import GeneratedSite
 from models.business import Business
 from core.exceptions import DatabaseException
+from services.site_render_cache import invalidate_rendered_site
 
 logger = logging.getLogger(__name__)
 
@@ -150,7 +151,10 @@ class SiteService:
             )
             await self.db.flush()
             
-            return await self.get_site(site_id)
+            site = await self.get_site(site_id)
+            if site:
+                await invalidate_rendered_site(site.subdomain)
+            return site
             
         except Exception as e:
             await self.db.rollback()
@@ -191,51 +195,35 @@ class SiteService:
                 return f"{base_slug}-{int(time.time())}"
     
     async def get_stats(self) -> Dict[str, Any]:
-        """Get site statistics."""
-        # Total sites
-        total_result = await self.db.execute(
-            select(func.count(GeneratedSite.id))
-        )
-        total = total_result.scalar()
+        """
+        Get site statistics.
+        
+        Totals and averages come from one aggregate pass (AVG skips NULLs);
+        the status breakdown is one GROUP BY.
+        """
+        totals = (await self.db.execute(
+            select(
+                func.count(GeneratedSite.id).label("total"),
+                func.count(GeneratedSite.id).filter(
+                    GeneratedSite.sold_at.isnot(None)
+                ).label("total_sold"),
+                func.avg(GeneratedSite.lighthouse_score).label("avg_lighthouse"),
+                func.avg(GeneratedSite.load_time_ms).label("avg_load_time"),
+            )
+        )).one()
         
         # By status
-        by_status = {}
         status_result = await self.db.execute(
             select(GeneratedSite.status, func.count(GeneratedSite.id))
             .group_by(GeneratedSite.status)
         )
-        for status, count in status_result:
-            by_status[status] = count
-        
-        # Live sites
-        total_live = by_status.get("live", 0)
-        
-        # Sold sites
-        sold_result = await self.db.execute(
-            select(func.count(GeneratedSite.id))
-            .where(GeneratedSite.sold_at.isnot(None))
-        )
-        total_sold = sold_result.scalar()
-        
-        # Average lighthouse score
-        lighthouse_result = await self.db.execute(
-            select(func.avg(GeneratedSite.lighthouse_score))
-            .where(GeneratedSite.lighthouse_score.isnot(None))
-        )
-        avg_lighthouse = lighthouse_result.scalar()
-        
-        # Average load time
-        load_time_result = await self.db.execute(
-            select(func.avg(GeneratedSite.load_time_ms))
-            .where(GeneratedSite.load_time_ms.isnot(None))
-        )
-        avg_load_time = load_time_result.scalar()
+        by_status = {status: count for status, count in status_result}
         
         return {
-            "total_sites": total,
+            "total_sites": totals.total,
             "by_status": by_status,
-            "avg_lighthouse_score": float(avg_lighthouse) if avg_lighthouse else None,
-            "avg_load_time_ms": float(avg_load_time) if avg_load_time else None,
-            "total_live": total_live,
-            "total_sold": total_sold
+            "avg_lighthouse_score": float(totals.avg_lighthouse) if totals.avg_lighthouse else None,
+            "avg_load_time_ms": float(totals.avg_load_time) if totals.avg_load_time else None,
+            "total_live": by_status.get("live", 0),
+            "total_sold": totals.total_sold
         }
@@ -0,0 +1,127 @@
+"""
+Dependency-driven stage scheduler for the creative pipeline.
+
+Each stage declares the stages whose output it needs; a stage starts as soon
+as those have finished, so independent stages (e.g. Nano Banana image
+generation and the Architect's code generation) run concurrently instead of
+one after another.
+
+Every stage is timed relative to the start of the run, so the orchestrator
+can report both how long a stage took and where it sat on the timeline.
+"""
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Stage:
+    """
+    One node of the pipeline.
+
+    ``run`` receives the outputs of all finished stages (keyed by stage name).
+    A non-required stage that raises yields ``None`` instead of failing the run.
+    """
+
+    name: str
+    run: Callable[[Dict[str, Any]], Awaitable[Any]]
+    depends_on: Tuple[str, ...] = ()
+    required: bool = True
+
+
+class StageGraph:
+    """
+    Runs stages as a DAG on the current event loop.
+
+    Usage:
+        graph = StageGraph([
+            Stage("analysis", analyse),
+            Stage("concepts", concept, depends_on=("analysis",)),
+            ...
+        ])
+        outputs = await graph.run()
+        graph.timings  # {"analysis": {"started_ms": 0.0, "duration_ms": 5120.4}, ...}
+    """
+
+    def __init__(self, stages: List[Stage]):
+        self.stages = self._ordered(stages)
+        self.timings: Dict[str, Dict[str, float]] = {}
+
+    @staticmethod
+    def _ordered(stages: List[Stage]) -> List[Stage]:
+        """Topological order; rejects duplicate names, unknown dependencies and cycles."""
+        by_name: Dict[str, Stage] = {}
+        for stage in stages:
+            if stage.name in by_name:
+                raise ValueError(f"Duplicate stage: {stage.name}")
+            by_name[stage.name] = stage
+        for stage in stages:
+            missing = [dep for dep in stage.depends_on if dep not in by_name]
+            if missing:
+                raise ValueError(f"Stage {stage.name} depends on unknown stage(s): {missing}")
+
+        ordered: List[Stage] = []
+        done: set = set()
+        remaining = list(stages)
+        while remaining:
+            ready = [s for s in remaining if all(dep in done for dep in s.depends_on)]
+            if not ready:
+                raise ValueError(f"Stage cycle among: {[s.name for s in remaining]}")
+            for stage in ready:
+                ordered.append(stage)
+                done.add(stage.name)
+                remaining.remove(stage)
+        return ordered
+
+    async def run(self) -> Dict[str, Any]:
+        """
+        Run every stage once its dependencies have finished.
+
+        Returns:
+            {stage_name: output}
+
+        Raises:
+            The first exception raised by a required stage (stages still
+            running are cancelled)
+        """
+        outputs: Dict[str, Any] = {}
+        tasks: Dict[str, "asyncio.Task[Any]"] = {}
+        run_start = time.perf_counter()
+        self.timings = {}
+
+        async def run_stage(stage: Stage) -> Any:
+            if stage.depends_on:
+                await asyncio.gather(*(tasks[dep] for dep in stage.depends_on))
+            started = time.perf_counter()
+            try:
+                output = await stage.run(outputs)
+            except Exception as e:
+                if stage.required:
+                    raise
+                logger.warning(f"Optional stage '{stage.name}' failed (non-fatal): {e}")
+                output = None
+            finally:
+                self.timings[stage.name] = {
+                    "started_ms": round((started - run_start) * 1000, 1),
+                    "duration_ms": round((time.perf_counter() - started) * 1000, 1),
+                }
+            outputs[stage.name] = output
+            return output
+
+        # Dependencies come first in self.stages, so their tasks already exist
+        for stage in self.stages:
+            tasks[stage.name] = asyncio.create_task(run_stage(stage), name=f"stage:{stage.name}")
+
+        try:
+            await asyncio.gather(*tasks.values())
+        except BaseException:
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+            raise
+
+        return outputs
@@ -7,9 +7,10 @@ Enriches responses with campaign history, contact indicators, and data quality m
 Author: WebMagic Team
 Date: January 22, 2026
 """
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, desc
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 from uuid import UUID
 from datetime import datetime
 
@@ -84,8 +85,36 @@ class BusinessEnrichmentService:
         Returns:
             Dictionary with all enriched fields
         """
-        # Base business data
-        enriched = {
+        enriched = self._build_indicators(business)
+        
+        # Fetch campaign summary if requested
+        if include_campaign_summary:
+            campaign_data = await self._get_campaign_summary(business.id)
+            enriched.update(campaign_data)
+        else:
+            # Default values
+            enriched.update(self._empty_campaign_summary())
+        
+        # Fetch site URL if site exists
+        if enriched["has_generated_site"]:
+            site_url = await self._get_site_url(business.id)
+            enriched["site_url"] = site_url
+        else:
+            enriched["site_url"] = None
+        
+        return enriched
+    
+    def _build_indicators(self, business: Business) -> Dict[str, Any]:
+        """
+        Compute the indicators that need no extra queries.
+        
+        Args:
+            business: Business instance
+        
+        Returns:
+            Dict of contact, site, quality and status-label fields
+        """
+        return {
             # Contact data indicators
             "has_email": business.email is not None and len(business.email) > 0,
             "has_phone": business.phone is not None and len(business.phone) > 0,
@@ -116,27 +145,14 @@ class BusinessEnrichmentService:
                 "gray"
             ),
         }
-        
-        # Fetch campaign summary if requested
-        if include_campaign_summary:
-            campaign_data = await self._get_campaign_summary(business.id)
-            enriched.update(campaign_data)
-        else:
-            # Default values
-            enriched.update({
-                "total_campaigns": 0,
-                "last_contact_date": None,
-                "last_contact_channel": None
-            })
-        
-        # Fetch site URL if site exists
-        if enriched["has_generated_site"]:
-            site_url = await self._get_site_url(business.id)
-            enriched["site_url"] = site_url
-        else:
-            enriched["site_url"] = None
-        
-        return enriched
+    
+    @staticmethod
+    def _empty_campaign_summary() -> Dict[str, Any]:
+        return {
+            "total_campaigns": 0,
+            "last_contact_date": None,
+            "last_contact_channel": None
+        }
     
     async def _get_campaign_summary(
         self,
@@ -181,6 +197,79 @@ class BusinessEnrichmentService:
                 "last_contact_channel": None
             }
     
+    async def get_campaign_summaries(
+        self,
+        business_ids: List[UUID]
+    ) -> Dict[UUID, Dict[str, Any]]:
+        """
+        Get campaign summaries for many businesses in one grouped query.
+        
+        Args:
+            business_ids: Business UUIDs
+        
+        Returns:
+            Dict of business_id -> {total_campaigns, last_contact_date,
+            last_contact_channel}; businesses without campaigns are absent
+        """
+        if not business_ids:
+            return {}
+        
+        sent = Campaign.sent_at.isnot(None)
+        result = await self.db.execute(
+            select(
+                Campaign.business_id,
+                func.count(Campaign.id),
+                func.max(Campaign.sent_at),
+                # Channels of sent campaigns, newest first
+                func.array_agg(
+                    aggregate_order_by(Campaign.channel, desc(Campaign.sent_at))
+                ).filter(sent)
+            )
+            .where(Campaign.business_id.in_(business_ids))
+            .group_by(Campaign.business_id)
+        )
+        
+        return {
+            business_id: {
+                "total_campaigns": total,
+                "last_contact_date": last_sent_at,
+                "last_contact_channel": channels[0] if channels else None
+            }
+            for business_id, total, last_sent_at, channels in result.all()
+        }
+    
+    async def get_site_urls(self, business_ids: List[UUID]) -> Dict[UUID, str]:
+        """
+        Get live site URLs for many businesses in one query.
+        
+        Args:
+            business_ids: Business UUIDs
+        
+        Returns:
+            Dict of business_id -> site URL (only businesses with a live site)
+        """
+        if not business_ids:
+            return {}
+        
+        result = await self.db.execute(
+            select(GeneratedSite.business_id, GeneratedSite.subdomain)
+            .where(GeneratedSite.business_id.in_(business_ids))
+            .where(GeneratedSite.status == "live")
+            .distinct(GeneratedSite.business_id)
+            .order_by(GeneratedSite.business_id)
+        )
+        return {
+            business_id: self._build_site_url(subdomain)
+            for business_id, subdomain in result.all()
+        }
+    
+    @staticmethod
+    def _build_site_url(subdomain: str) -> str:
+        """Build a public site URL based on settings."""
+        if hasattr(settings, 'SITES_BASE_URL'):
+            return f"{settings.SITES_BASE_URL}/{subdomain}"
+        return f"https://{subdomain}.webmagic.com"
+    
     async def _get_site_url(self, business_id: UUID) -> Optional[str]:
         """
         Get site URL for a business.
@@ -200,11 +289,7 @@ class BusinessEnrichmentService:
         subdomain = result.scalar_one_or_none()
         
         if subdomain:
-            # Build site URL based on settings
-            if hasattr(settings, 'SITES_BASE_URL'):
-                return f"{settings.SITES_BASE_URL}/{subdomain}"
-            else:
-                return f"https://{subdomain}.webmagic.com"
+            return self._build_site_url(subdomain)
         
         return None
     
@@ -251,24 +336,34 @@ class BusinessEnrichmentService:
         """
         Enrich multiple businesses (optimized for list views).
         
-        For bulk operations, campaign summaries are optional to avoid
-        N+1 query issues. Set include_campaign_summary=True if needed.
+        Campaign aggregates and site URLs are loaded for the whole page in
+        grouped queries (one each); everything else is computed in memory.
         
         Args:
             businesses: List of Business instances
             include_campaign_summary: Whether to include campaign data
         
         Returns:
-            List of enriched business dictionaries
+            List of enriched business dictionaries (same order as input)
         """
-        enriched_list = []
+        if not businesses:
+            return []
         
+        campaign_summaries = (
+            await self.get_campaign_summaries([b.id for b in businesses])
+            if include_campaign_summary else {}
+        )
+        site_urls = await self.get_site_urls(
+            [b.id for b in businesses if b.website_status != "none"]
+        )
+        
+        enriched_list = []
         for business in businesses:
-            enriched = await self.enrich_business(
-                business,
-                include_campaign_summary=include_campaign_summary
+            enriched = self._build_indicators(business)
+            enriched.update(
+                campaign_summaries.get(business.id) or self._empty_campaign_summary()
             )
+            enriched["site_url"] = site_urls.get(business.id)
             enriched_list.append(enriched)
         
         return enriched_list
-
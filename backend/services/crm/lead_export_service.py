@@ -0,0 +1,185 @@
+"""
+Lead Export Service
+
+Streams the business (lead) table as CSV, NDJSON or a JSON array without
+materialising the export in memory.
+
+- Keyset pagination on businesses.id (no OFFSET scans, no row cap)
+- Each page is enriched in bulk (grouped campaign / site URL queries)
+- Each page uses a short-lived session, so a slow download never pins a
+  pooled DB connection between pages
+"""
+import csv
+import io
+import json
+import logging
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, AsyncIterator, Dict, List, Optional
+from uuid import UUID
+
+from sqlalchemy import select
+
+from core.database import AsyncSessionLocal
+from models.business import Business
+from services.crm.business_enrichment import BusinessEnrichmentService
+
+logger = logging.getLogger(__name__)
+
+
+class LeadExportService:
+    """
+    Streaming exporter for businesses.
+
+    Usage:
+        exporter = LeadExportService(condition=Business.state == "CA")
+        return StreamingResponse(exporter.stream_csv(), media_type="text/csv")
+    """
+
+    CSV_FIELDS = [
+        "id", "name", "email", "phone", "category", "city", "state",
+        "rating", "review_count", "qualification_score",
+        "contact_status", "website_status", "has_email", "has_phone",
+        "was_contacted", "is_customer", "data_completeness",
+        "created_at"
+    ]
+
+    def __init__(self, condition=None, page_size: int = 500):
+        """
+        Args:
+            condition: Optional SQLAlchemy filter on Business
+            page_size: Rows fetched and enriched per round trip
+        """
+        self.condition = condition
+        self.page_size = page_size
+
+    async def iter_pages(
+        self,
+        include_campaign_summary: bool
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Yield pages of {"business": Business, "enrichment": dict}."""
+        last_id: Optional[UUID] = None
+        exported = 0
+
+        while True:
+            async with AsyncSessionLocal() as session:
+                query = select(Business).order_by(Business.id).limit(self.page_size)
+                if self.condition is not None:
+                    query = query.where(self.condition)
+                if last_id is not None:
+                    query = query.where(Business.id > last_id)
+
+                result = await session.execute(query)
+                businesses = list(result.scalars().all())
+                if not businesses:
+                    break
+
+                enrichment = BusinessEnrichmentService(session)
+                enriched = await enrichment.enrich_businesses_bulk(
+                    businesses,
+                    include_campaign_summary=include_campaign_summary
+                )
+                page = [
+                    {"business": business, "enrichment": enrichment_data}
+                    for business, enrichment_data in zip(businesses, enriched)
+                ]
+
+            last_id = businesses[-1].id
+            exported += len(page)
+            yield page
+
+            if len(businesses) < self.page_size:
+                break
+
+        logger.info(f"Lead export finished: {exported} businesses")
+
+    async def stream_csv(self) -> AsyncIterator[str]:
+        """Yield CSV text, one chunk per page (header first)."""
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=self.CSV_FIELDS)
+        writer.writeheader()
+        yield self._drain(buffer)
+
+        async for page in self.iter_pages(include_campaign_summary=False):
+            for row in page:
+                writer.writerow(self._csv_row(row["business"], row["enrichment"]))
+            yield self._drain(buffer)
+
+    async def stream_ndjson(self) -> AsyncIterator[str]:
+        """Yield newline-delimited JSON, one chunk per page."""
+        async for page in self.iter_pages(include_campaign_summary=True):
+            yield "".join(
+                json.dumps(self._json_row(r["business"], r["enrichment"]), default=_json_default) + "\n"
+                for r in page
+            )
+
+    async def stream_json(self) -> AsyncIterator[str]:
+        """Yield a JSON array incrementally."""
+        yield "["
+        first = True
+        async for page in self.iter_pages(include_campaign_summary=True):
+            parts = []
+            for row in page:
+                parts.append(("" if first else ",") + "\n" + json.dumps(
+                    self._json_row(row["business"], row["enrichment"]), default=_json_default
+                ))
+                first = False
+            yield "".join(parts)
+        yield "\n]\n"
+
+    @staticmethod
+    def _drain(buffer: io.StringIO) -> str:
+        chunk = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate(0)
+        return chunk
+
+    @staticmethod
+    def _csv_row(business: Business, enrichment_data: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "id": str(business.id),
+            "name": business.name,
+            "email": business.email or "",
+            "phone": business.phone or "",
+            "category": business.category or "",
+            "city": business.city or "",
+            "state": business.state or "",
+            "rating": business.rating or "",
+            "review_count": business.review_count or 0,
+            "qualification_score": business.qualification_score or 0,
+            "contact_status": business.contact_status or "pending",
+            "website_status": business.website_status or "none",
+            "has_email": enrichment_data["has_email"],
+            "has_phone": enrichment_data["has_phone"],
+            "was_contacted": enrichment_data["was_contacted"],
+            "is_customer": enrichment_data["is_customer"],
+            "data_completeness": enrichment_data["data_completeness"],
+            "created_at": business.created_at.isoformat()
+        }
+
+    @staticmethod
+    def _json_row(business: Business, enrichment_data: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "id": str(business.id),
+            "name": business.name,
+            "email": business.email,
+            "phone": business.phone,
+            "category": business.category,
+            "city": business.city,
+            "state": business.state,
+            "rating": float(business.rating) if business.rating else None,
+            "review_count": business.review_count,
+            "qualification_score": business.qualification_score,
+            "contact_status": business.contact_status,
+            "website_status": business.website_status,
+            **enrichment_data,
+            "created_at": business.created_at.isoformat()
+        }
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (Decimal, UUID)):
+        return str(value)
+    raise TypeError(f"Not JSON serializable: {type(value).__name__}")
@@ -0,0 +1,103 @@
+"""
+Dashboard stats snapshot — precomputed stats cards stored on analytics_snapshots.
+
+The businesses, coverage, sites and geo-strategy stats endpoints each
+aggregate a large table. The refresh_dashboard_stats beat task computes all
+four sections on a schedule and stores them on today's AnalyticsSnapshot row;
+the endpoints serve the latest snapshot while it is fresh and fall back to
+the live aggregates otherwise (or when called with ?live=true).
+"""
+from datetime import date, datetime, timedelta
+import logging
+from typing import Any, Dict, Optional
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.config import get_settings
+from models.analytics_snapshot import AnalyticsSnapshot
+from services.creative.site_service import SiteService
+from services.hunter.business_service import BusinessService
+from services.hunter.coverage_service import CoverageService
+from services.hunter.geo_strategy_service import GeoStrategyService
+
+logger = logging.getLogger(__name__)
+
+SECTION_BUSINESSES = "businesses"
+SECTION_COVERAGE = "coverage"
+SECTION_SITES = "sites"
+SECTION_GEO_STRATEGIES = "geo_strategies"
+
+
+class DashboardStatsSnapshotService:
+    """Compute, store and read the dashboard stats snapshot."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def compute(self) -> Dict[str, Dict[str, Any]]:
+        """Run the live aggregates for every section."""
+        return {
+            SECTION_BUSINESSES: await BusinessService(self.db).get_stats(),
+            SECTION_COVERAGE: await CoverageService(self.db).get_stats(),
+            SECTION_SITES: await SiteService(self.db).get_stats(),
+            SECTION_GEO_STRATEGIES: await GeoStrategyService(self.db).get_strategy_stats(),
+        }
+
+    async def refresh(self, snapshot_date: Optional[date] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Recompute all sections and upsert them onto the day's snapshot row.
+
+        Only dashboard_stats / dashboard_stats_refreshed_at are written; the
+        daily KPI columns are left to whatever populates them.
+        """
+        stats = await self.compute()
+        now = datetime.utcnow()
+
+        stmt = insert(AnalyticsSnapshot).values(
+            snapshot_date=snapshot_date or now.date(),
+            dashboard_stats=stats,
+            dashboard_stats_refreshed_at=now,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[AnalyticsSnapshot.snapshot_date],
+            set_={
+                "dashboard_stats": stmt.excluded.dashboard_stats,
+                "dashboard_stats_refreshed_at": stmt.excluded.dashboard_stats_refreshed_at,
+            },
+        )
+        await self.db.execute(stmt)
+        await self.db.commit()
+
+        logger.info("📊 Dashboard stats snapshot refreshed")
+        return stats
+
+    async def get_section(
+        self,
+        section: str,
+        max_age_seconds: Optional[int] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Return a section of the most recent snapshot if it is fresh enough.
+
+        Returns:
+            The stored section dict, or None if there is no fresh snapshot
+            (the caller should compute the stats live).
+        """
+        if max_age_seconds is None:
+            max_age_seconds = get_settings().DASHBOARD_STATS_MAX_AGE_SECONDS
+        if max_age_seconds <= 0:
+            return None
+
+        cutoff = datetime.utcnow() - timedelta(seconds=max_age_seconds)
+        result = await self.db.execute(
+            select(AnalyticsSnapshot.dashboard_stats)
+            .where(AnalyticsSnapshot.dashboard_stats_refreshed_at >= cutoff)
+            .order_by(AnalyticsSnapshot.dashboard_stats_refreshed_at.desc())
+            .limit(1)
+        )
+        stats = result.scalar_one_or_none()
+        if not stats:
+            return None
+        return stats.get(section)
@@ -5,7 +5,9 @@ Provides intelligent website discovery using:
 - Google Search (ScrapingDog API)
 - LLM-powered analysis and cross-referencing
 - Business data validation
+- Shared, rate-limited and cached ScrapingDog access (DiscoveryEngine)
 """
+from services.discovery.discovery_engine import DiscoveryEngine, get_discovery_engine
 from services.discovery.llm_discovery_service import LLMDiscoveryService
 
-__all__ = ["LLMDiscoveryService"]
+__all__ = ["DiscoveryEngine", "get_discovery_engine", "LLMDiscoveryService"]
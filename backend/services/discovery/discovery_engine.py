@@ -0,0 +1,191 @@
+"""
+Discovery engine - shared plumbing for ScrapingDog searches.
+
+- One pooled aiohttp session per event loop (Celery workers reuse it across
+  tasks on the worker-lifetime loop instead of opening a session per call)
+- A token-bucket rate limiter kept in Redis (services.progress.token_bucket),
+  so every worker and the hunter draw from the same ScrapingDog request budget
+- A normalized-query result cache, so repeated searches (re-discovery runs,
+  duplicate businesses) never pay for the same query twice
+
+Without Redis the limiter falls back to a per-process bucket and the cache
+is skipped.
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import re
+from typing import Any, Dict, Optional
+
+import aiohttp
+
+from core.config import get_settings
+from services.progress.redis_service import RedisService
+from services.progress.token_bucket import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+BUCKET_KEY = "discovery:scrapingdog:bucket"
+QUERY_CACHE_PREFIX = "discovery:query:"
+STATS_KEY = "discovery:query:stats"
+
+def normalize_query(query: str) -> str:
+    """Case, punctuation and whitespace-insensitive form of a search query."""
+    query = re.sub(r"[^\w\s&'-]", " ", query.lower())
+    return re.sub(r"\s+", " ", query).strip()
+
+
+class DiscoveryEngine:
+    """
+    Rate-limited, cached ScrapingDog search client.
+
+    Usage:
+        engine = get_discovery_engine()
+        data = await engine.search("Joe's Plumbing Austin", country="us")
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str],
+        base_url: str,
+        rate_per_second: float,
+        burst: int,
+        cache_ttl_seconds: int,
+        request_timeout: int = 30
+    ):
+        self.api_key = api_key
+        self.base_url = base_url
+        self.bucket = TokenBucket(BUCKET_KEY, rate_per_second, burst)
+        self.cache_ttl_seconds = cache_ttl_seconds
+        self.request_timeout = request_timeout
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Pooled session bound to the running loop (recreated if the loop changed)."""
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            if self._session is not None:
+                await self._close_stale_session(self._session, self._session_loop)
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=self.request_timeout),
+                connector=aiohttp.TCPConnector(limit=20, ttl_dns_cache=300),
+            )
+            self._session_loop = loop
+        return self._session
+
+    @staticmethod
+    async def _close_stale_session(
+        session: aiohttp.ClientSession,
+        loop: Optional[asyncio.AbstractEventLoop]
+    ) -> None:
+        """Close a session created on another loop, on that loop while it still runs."""
+        if session.closed:
+            return
+        try:
+            if loop is not None and loop.is_running():
+                asyncio.run_coroutine_threadsafe(session.close(), loop)
+            else:
+                await session.close()
+        except Exception as e:
+            # Loop already closed - its sockets went with it
+            logger.debug(f"Stale ScrapingDog session close skipped: {e}")
+
+    async def close(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._session_loop = None
+
+    async def search(self, query: str, country: str = "us", results: int = 10) -> Optional[Dict[str, Any]]:
+        """
+        Google search via ScrapingDog (cached by normalized query).
+
+        Returns:
+            ScrapingDog response JSON, or None on API/network error
+        """
+        if not self.api_key:
+            logger.error("ScrapingDog API key not configured")
+            return None
+
+        cache_key = self._cache_key(query, country, results)
+        cached = await self._cache_get(cache_key)
+        if cached is not None:
+            logger.info(f"🗂️ Discovery query cache hit: {query}")
+            return cached
+
+        await self.bucket.acquire()
+
+        params = {
+            "api_key": self.api_key,
+            "query": query,
+            "results": results,
+            "country": country.lower(),
+        }
+        try:
+            async with (await self._get_session()).get(self.base_url, params=params) as response:
+                if response.status != 200:
+                    logger.error(f"ScrapingDog API error: {response.status}")
+                    logger.error(f"Response: {await response.text()}")
+                    return None
+                data = await response.json()
+        except Exception as e:
+            logger.error(f"Error fetching search results: {type(e).__name__}: {e}")
+            return None
+
+        await self._cache_put(cache_key, data)
+        return data
+
+    @staticmethod
+    def _cache_key(query: str, country: str, results: int) -> str:
+        material = f"{normalize_query(query)}|{country.lower()}|{results}"
+        return QUERY_CACHE_PREFIX + hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    async def _cache_get(self, key: str) -> Optional[Dict[str, Any]]:
+        if self.cache_ttl_seconds <= 0:
+            return None
+        try:
+            redis = RedisService.get_async_client()
+            raw = await redis.get(key)
+            await redis.hincrby(STATS_KEY, "hits" if raw else "misses", 1)
+            return json.loads(raw) if raw else None
+        except Exception as e:
+            logger.debug(f"Discovery query cache unavailable: {e}")
+            return None
+
+    async def _cache_put(self, key: str, data: Dict[str, Any]) -> None:
+        # Empty result sets are cached too - "no results" is an answer worth keeping
+        if self.cache_ttl_seconds <= 0:
+            return
+        try:
+            await RedisService.get_async_client().set(key, json.dumps(data), ex=self.cache_ttl_seconds)
+        except Exception as e:
+            logger.debug(f"Discovery query cache write skipped: {e}")
+
+
+_engine: Optional[DiscoveryEngine] = None
+
+
+def get_discovery_engine() -> DiscoveryEngine:
+    """Get the process-wide discovery engine."""
+    global _engine
+    if _engine is None:
+        from services.hunter.google_search_service import GoogleSearchService
+
+        settings = get_settings()
+        google = GoogleSearchService()
+        _engine = DiscoveryEngine(
+            api_key=google.api_key,
+            base_url=google.base_url,
+            rate_per_second=settings.SCRAPINGDOG_RATE_PER_SECOND,
+            burst=settings.SCRAPINGDOG_BURST,
+            cache_ttl_seconds=settings.DISCOVERY_QUERY_CACHE_TTL_SECONDS,
+        )
+    return _engine
+
+
+async def close_discovery_engine() -> None:
+    """Close the pooled session (registered as a Celery worker shutdown hook)."""
+    if _engine is not None:
+        await _engine.close()
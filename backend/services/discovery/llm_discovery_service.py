@@ -5,25 +5,177 @@ Uses LLM to intelligently analyze Google Search results and cross-reference
 with business data (phone, address, name) to find the correct website.
 
 Best Practices:
+- Searches go through the shared DiscoveryEngine (pooled session, Redis
+  rate limit, normalized-query cache)
 - Saves all ScrapingDog responses for debugging and improvement
 - Uses LLM for intelligent decision-making (no hardcoded regex)
 - Provides detailed reasoning for each decision
 - Handles edge cases (franchises, aggregators, PDFs, etc.)
 """
+import asyncio
 import logging
 from typing import Optional, Dict, Any, List
 from datetime import datetime
 import json
 
-from anthropic import AsyncAnthropic
 from core.config import get_settings
 from services.hunter.google_search_service import GoogleSearchService
+from services.discovery.discovery_engine import get_discovery_engine
+from services.llm.gateway import get_llm_gateway
+from services.llm.prompt_cache import cached_system
 from services.system_settings_service import SystemSettingsService
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
 
+DISCOVERY_SYSTEM_PROMPT = """You are a business website discovery expert. Your job is to analyze Google search results and determine which URL (if any) is the official website for a specific business.
+
+You must cross-reference the business information (phone, address, name) with the search result snippets to make an accurate determination.
+
+Be cautious of:
+- Franchise/aggregator sites (e.g., nationwide franchise page instead of local business)
+- Directory listings (Yelp, BBB, etc. - these are NOT business websites)
+- Member directories (Chamber of Commerce listings)
+- Booking platforms (third-party scheduling sites)
+- PDF files
+
+Return your analysis in valid JSON format only."""
+
+# Shared by the single-business and grouped discovery prompts
+DISCOVERY_INSTRUCTIONS = """
+
+**YOUR TASK:**
+
+Analyze ALL results and:
+1. Determine which URL (if any) is the official website for this specific business location.
+2. Determine which COUNTRY this business is actually located in.
+
+**WEBSITE CROSS-REFERENCING INSTRUCTIONS:**
+
+1. **Phone Number Matching (HIGHEST PRIORITY):**
+   - Check if the business phone appears in ANY snippet
+   - Phone match = HIGH confidence this is the correct website
+
+2. **Address Matching:**
+   - Check if the full address or partial address appears in snippets
+   - Exact address match = HIGH confidence
+
+3. **Business Name Matching:**
+   - Match the business name (accounting for variations)
+   - Name alone is NOT sufficient (many businesses have similar names)
+
+4. **NEVER return these as the URL (hard exclusions):**
+   - ANY social media profile: Facebook (facebook.com), Instagram (instagram.com), Twitter/X (twitter.com, x.com), TikTok (tiktok.com), Pinterest (pinterest.com), YouTube channel pages
+   - LinkedIn company or person pages (linkedin.com)
+   - Directory sites: Yelp, BBB, YellowPages, WhitePages, MapQuest, Manta, etc.
+   - Aggregator/review platforms: TripAdvisor, Angi, HomeAdvisor, Thumbtack, Foursquare
+   - Booking platforms: OpenTable, Resy, Mindbody
+   - Lead-gen directories: Bark.com, Thumbtack, LocalRepairsNow, PlumbingServiceHub, etc.
+   - PDF files or file-storage links
+
+5. **Social Media Bio Extraction (CRITICAL):**
+   - If a search result IS a social media page (Facebook, Instagram, etc.) BUT its snippet mentions a real website URL (e.g., "abccpas.com" or "Visit us at example.com"), extract that URL as your answer instead.
+   - Look for patterns like: "example.com", "www.example.com", "Visit our website", website URLs embedded in snippets.
+   - This real website URL from the bio is the correct answer, not the social media page itself.
+
+6. **Franchise Businesses:**
+   - If it's a franchise (e.g., "Mr. Rooter of Seattle"), the local franchise page IS valid
+   - Verify by checking if phone/address in snippet matches business data
+
+**COUNTRY DETECTION INSTRUCTIONS:**
+
+Determine the actual country of this business using these signals (in priority order):
+
+1. **Phone number prefix (STRONGEST signal):**
+   - +44 or (0)XX = United Kingdom → "GB"
+   - +1 with area codes 204/226/236/249/250/289/306/343/365/403/416/418/431/437/438/450/506/514/519/548/579/581/587/604/613/639/647/672/705/709/778/780/782/807/819/825/867/873/902/905 = Canada → "CA"
+   - +1 with other area codes = United States → "US"
+   - +61 = Australia → "AU"
+   - +52 = Mexico → "MX"
+
+2. **Postal code format in snippets:**
+   - UK: letter-number patterns like "SW1A 1AA", "EC1A 1BB" → "GB"
+   - Canada: letter-number-letter patterns like "T2P 3C3", "M5V 2T6" → "CA"
+   - US: 5-digit or 5+4 digit like "90210" or "90210-1234" → "US"
+   - Australia: 4-digit like "2000", "3000" → "AU"
+
+3. **City/location mentions in snippets:**
+   - London, Manchester, Birmingham, Glasgow = "GB"
+   - Toronto, Vancouver, Calgary, Edmonton, Montreal = "CA"
+   - Sydney, Melbourne, Brisbane = "AU"
+
+4. **Domain TLD:**
+   - .co.uk, .org.uk → "GB"
+   - .ca → "CA"
+   - .com.au, .net.au → "AU"
+
+5. **Default:** If no clear signals, use the Expected Country field above.
+
+**DECISION CRITERIA:**
+
+- **Found & High Confidence (0.8-1.0):** Phone or address match in snippet, OR website URL found in social media bio
+- **Found & Medium Confidence (0.5-0.7):** Business name + city/state match, no phone/address
+- **Not Found (null):** No non-social-media, non-directory results match this specific business
+
+"""
+
+SINGLE_OUTPUT_FORMAT = """**OUTPUT FORMAT (JSON only):**
+
+{
+  "url": "https://example.com" or null,
+  "confidence": 0.95,
+  "reasoning": "Phone number (XXX) XXX-XXXX from business data matches snippet in Result #2, confirming this is the correct website",
+  "match_signals": {
+    "phone_match": true,
+    "address_match": false,
+    "name_match": true,
+    "location_match": true,
+    "result_rank": 2
+  },
+  "detected_country": "US",
+  "country_confidence": 0.9,
+  "country_signals": ["Phone +1 area code 213 is a US area code", "Address mentions Los Angeles, CA zip 90001"]
+}
+
+**IMPORTANT:** Return ONLY valid JSON. No markdown, no explanation outside the JSON.
+"""
+
+GROUP_OUTPUT_FORMAT = """**OUTPUT FORMAT (JSON only):**
+
+A JSON array with exactly one object per business, in BUSINESS_INDEX order:
+
+[
+  {
+    "business_index": 0,
+    "url": "https://example.com" or null,
+    "confidence": 0.95,
+    "reasoning": "Why this URL (or none) belongs to business 0",
+    "match_signals": {"phone_match": true, "address_match": false, "name_match": true, "location_match": true, "result_rank": 2},
+    "detected_country": "US",
+    "country_confidence": 0.9,
+    "country_signals": ["..."]
+  }
+]
+
+**IMPORTANT:** Return ONLY the JSON array. No markdown, no explanation outside the JSON.
+"""
+
+# Static system prompts (sent with a cache breakpoint); only the business and
+# its search results vary per call
+SINGLE_DISCOVERY_SYSTEM = DISCOVERY_SYSTEM_PROMPT + DISCOVERY_INSTRUCTIONS + SINGLE_OUTPUT_FORMAT
+GROUP_DISCOVERY_SYSTEM = DISCOVERY_SYSTEM_PROMPT + DISCOVERY_INSTRUCTIONS + GROUP_OUTPUT_FORMAT
+
+
+def _strip_code_fence(response_text: str) -> str:
+    """Remove a markdown code fence wrapped around a JSON answer."""
+    response_text = response_text.strip()
+    if response_text.startswith("```"):
+        lines = response_text.split("\n")
+        response_text = "\n".join(lines[1:-1])
+    return response_text
+
+
 class LLMDiscoveryService:
     """
     Service that uses LLM to analyze Google Search results and find business websites.
@@ -38,7 +190,7 @@ class LLMDiscoveryService:
     def __init__(self):
         """Initialize the LLM Discovery Service."""
         self.google_service = GoogleSearchService()
-        self.anthropic_client = AsyncAnthropic(api_key=settings.ANTHROPIC_API_KEY)
+        self.gateway = get_llm_gateway()
         self._model = None
     
     async def _get_llm_model(self) -> str:
@@ -112,37 +264,10 @@ class LLMDiscoveryService:
             country=country
         )
         
-        if not search_results:
-            logger.warning(f"❌ ScrapingDog API returned no data for {business_name}")
-            return {
-                "url": None,
-                "found": False,
-                "confidence": 0.95,
-                "reasoning": "ScrapingDog API error or returned no data",
-                "detected_country": None,
-                "country_confidence": 0.0,
-                "country_signals": [],
-                "search_results": None,
-                "query": self._build_query(business_name, city, state),
-                "llm_analysis": None,
-                "llm_model": await self._get_llm_model()
-            }
-        
-        if not search_results.get("organic_results"):
-            logger.info(f"❌ No organic search results found for {business_name}")
-            return {
-                "url": None,
-                "found": False,
-                "confidence": 0.95,
-                "reasoning": "No Google search results found",
-                "detected_country": None,
-                "country_confidence": 0.0,
-                "country_signals": [],
-                "search_results": search_results,
-                "query": self._build_query(business_name, city, state),
-                "llm_analysis": None,
-                "llm_model": await self._get_llm_model()
-            }
+        query = self._build_query(business_name, city, state)
+        early_result = await self._result_without_analysis(business_name, query, search_results)
+        if early_result is not None:
+            return early_result
         
         # Step 2: Use LLM to analyze results (includes country detection)
         logger.info(f"🤖 Analyzing {len(search_results['organic_results'])} search results with LLM...")
@@ -157,6 +282,235 @@ class LLMDiscoveryService:
             search_results=search_results["organic_results"]
         )
         
+        return await self._build_discovery_result(
+            query, search_results, llm_analysis, phone=phone, address=address, city=city
+        )
+    
+    async def discover_websites_batch(
+        self,
+        businesses: List[Dict[str, Any]],
+        concurrency: Optional[int] = None,
+        llm_group_size: int = 1
+    ) -> List[Dict[str, Any]]:
+        """
+        Discover websites for many businesses concurrently.
+        
+        Searches run in parallel (bounded by ``concurrency``) and all draw from
+        the shared ScrapingDog rate budget, so a batch never exceeds the API
+        rate no matter how many workers run one. With ``llm_group_size`` > 1,
+        businesses that have search results are analyzed several per LLM call;
+        a group whose answer can't be matched back to its businesses falls
+        back to one call per business.
+        
+        Args:
+            businesses: [{name, phone, address, city, state, country}, ...]
+            concurrency: Max searches / LLM calls in flight
+                (defaults to DISCOVERY_BATCH_CONCURRENCY)
+            llm_group_size: Businesses per LLM prompt (1 = one prompt each)
+            
+        Returns:
+            One discover_website()-shaped result per business, in input order
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency or settings.DISCOVERY_BATCH_CONCURRENCY))
+        results: List[Optional[Dict[str, Any]]] = [None] * len(businesses)
+        
+        logger.info(f"🔍 Batch discovery for {len(businesses)} businesses")
+        queries, searches = await self._search_all(businesses, semaphore)
+        pending = []  # indices that need LLM analysis
+        for index, (business, search_results) in enumerate(zip(businesses, searches)):
+            early_result = await self._result_without_analysis(
+                business["name"], queries[index], search_results
+            )
+            if early_result is not None:
+                results[index] = early_result
+            else:
+                pending.append(index)
+        
+        group_size = max(1, llm_group_size)
+        groups = [pending[i:i + group_size] for i in range(0, len(pending), group_size)]
+        
+        async def analyze(group: List[int]) -> List[Dict[str, Any]]:
+            try:
+                return await analyze_group(group)
+            except Exception as e:
+                # One failed group must not take the rest of the batch down
+                logger.error(f"Batch discovery analysis failed for {len(group)} business(es): {e}", exc_info=True)
+                return [self._failed_analysis(f"LLM analysis error: {str(e)}", e) for _ in group]
+        
+        async def analyze_group(group: List[int]) -> List[Dict[str, Any]]:
+            async with semaphore:
+                if len(group) > 1:
+                    grouped = await self._analyze_group_with_llm(
+                        [(businesses[i], searches[i]["organic_results"]) for i in group]
+                    )
+                    if grouped is not None:
+                        return grouped
+                return [
+                    await self._analyze_with_llm(
+                        business_name=businesses[i]["name"],
+                        phone=businesses[i].get("phone"),
+                        address=businesses[i].get("address"),
+                        city=businesses[i].get("city"),
+                        state=businesses[i].get("state"),
+                        country=businesses[i].get("country") or "US",
+                        search_results=searches[i]["organic_results"]
+                    )
+                    for i in group
+                ]
+        
+        analyses = await asyncio.gather(*(analyze(group) for group in groups))
+        for group, group_analyses in zip(groups, analyses):
+            for index, llm_analysis in zip(group, group_analyses):
+                business = businesses[index]
+                results[index] = await self._build_discovery_result(
+                    queries[index],
+                    searches[index],
+                    llm_analysis,
+                    phone=business.get("phone"),
+                    address=business.get("address"),
+                    city=business.get("city")
+                )
+        
+        found = sum(1 for r in results if r and r.get("found"))
+        logger.info(
+            f"✅ Batch discovery complete: {found}/{len(businesses)} websites found "
+            f"({len(groups)} LLM calls)"
+        )
+        return results
+    
+    async def prepare_offline_discovery(
+        self,
+        businesses: List[Dict[str, Any]],
+        concurrency: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Search phase of a Message Batches discovery run.
+        
+        Args:
+            businesses: [{name, phone, address, city, state, country}, ...]
+            concurrency: Max searches in flight (defaults to DISCOVERY_BATCH_CONCURRENCY)
+            
+        Returns:
+            Per business, in input order, either {"result": ...} when there is
+            nothing for the LLM to analyze, or {"query", "search_results",
+            "params"} where params are the messages.create kwargs to submit
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency or settings.DISCOVERY_BATCH_CONCURRENCY))
+        queries, searches = await self._search_all(businesses, semaphore)
+        model = await self._get_llm_model()
+        
+        prepared = []
+        for business, query, search_results in zip(businesses, queries, searches):
+            early_result = await self._result_without_analysis(business["name"], query, search_results)
+            if early_result is not None:
+                prepared.append({"result": early_result})
+                continue
+            business_context = self._business_context(
+                business["name"], business.get("phone"), business.get("address"),
+                business.get("city"), business.get("state"), business.get("country") or "US"
+            )
+            prepared.append({
+                "query": query,
+                "search_results": search_results,
+                "params": self.build_request_params(
+                    model, business_context, search_results["organic_results"]
+                ),
+            })
+        return prepared
+    
+    async def complete_offline_discovery(
+        self,
+        business: Dict[str, Any],
+        query: str,
+        search_results: Dict,
+        response_text: str,
+        tokens: int
+    ) -> Dict[str, Any]:
+        """
+        Build the discover_website() result for one Message Batches answer.
+        
+        Args:
+            business: Same dict passed to prepare_offline_discovery()
+            query: Query returned by prepare_offline_discovery()
+            search_results: Search results returned by prepare_offline_discovery()
+            response_text: Model output
+            tokens: Input + output tokens billed for the request
+        """
+        model = await self._get_llm_model()
+        llm_analysis = self.analysis_from_response(response_text, model, tokens)
+        return await self._build_discovery_result(
+            query,
+            search_results,
+            llm_analysis,
+            phone=business.get("phone"),
+            address=business.get("address"),
+            city=business.get("city")
+        )
+    
+    async def _search_all(
+        self,
+        businesses: List[Dict[str, Any]],
+        semaphore: asyncio.Semaphore
+    ) -> tuple:
+        """Run every business's search concurrently; returns (queries, searches)."""
+        async def search(business: Dict[str, Any]) -> Optional[Dict]:
+            async with semaphore:
+                try:
+                    return await self._get_search_results(
+                        business_name=business["name"],
+                        city=business.get("city"),
+                        state=business.get("state"),
+                        country=business.get("country") or "US"
+                    )
+                except Exception as e:
+                    # Reported like an empty ScrapingDog response for this business only
+                    logger.error(f"Search failed for {business['name']}: {e}", exc_info=True)
+                    return None
+        
+        searches = await asyncio.gather(*(search(b) for b in businesses))
+        queries = [self._build_query(b["name"], b.get("city"), b.get("state")) for b in businesses]
+        return queries, searches
+    
+    async def _result_without_analysis(
+        self,
+        business_name: str,
+        query: str,
+        search_results: Optional[Dict]
+    ) -> Optional[Dict[str, Any]]:
+        """Not-found result when there is nothing for the LLM to analyze, else None."""
+        if not search_results:
+            logger.warning(f"❌ ScrapingDog API returned no data for {business_name}")
+            reasoning = "ScrapingDog API error or returned no data"
+        elif not search_results.get("organic_results"):
+            logger.info(f"❌ No organic search results found for {business_name}")
+            reasoning = "No Google search results found"
+        else:
+            return None
+        
+        return {
+            "url": None,
+            "found": False,
+            "confidence": 0.95,
+            "reasoning": reasoning,
+            "detected_country": None,
+            "country_confidence": 0.0,
+            "country_signals": [],
+            "search_results": search_results,
+            "query": query,
+            "llm_analysis": None,
+            "llm_model": await self._get_llm_model()
+        }
+    
+    async def _build_discovery_result(
+        self,
+        query: str,
+        search_results: Dict,
+        llm_analysis: Dict[str, Any],
+        phone: Optional[str],
+        address: Optional[str],
+        city: Optional[str]
+    ) -> Dict[str, Any]:
+        """Assemble the discover_website() result from an LLM analysis."""
         found_url = llm_analysis.get("url")
         detected_country = llm_analysis.get("detected_country")
         
@@ -192,7 +546,7 @@ class LLMDiscoveryService:
             "country_confidence": llm_analysis.get("country_confidence", 0.0),
             "country_signals": llm_analysis.get("country_signals", []),
             "search_results": search_results,
-            "query": self._build_query(business_name, city, state),
+            "query": query,
             "llm_analysis": llm_analysis,
             "llm_model": await self._get_llm_model(),
             "social_urls": social_urls,  # {platform: url} — matched by phone/address
@@ -205,42 +559,9 @@ class LLMDiscoveryService:
         state: Optional[str],
         country: str
     ) -> Optional[Dict]:
-        """Get raw search results from ScrapingDog."""
-        if not self.google_service.api_key:
-            logger.error("ScrapingDog API key not configured")
-            return None
-        
-        # Build query
+        """Get raw search results from ScrapingDog (rate-limited, cached)."""
         query = self._build_query(business_name, city, state)
-        
-        try:
-            import aiohttp
-            
-            async with aiohttp.ClientSession() as session:
-                params = {
-                    "api_key": self.google_service.api_key,
-                    "query": query,
-                    "results": 10,
-                    "country": country.lower(),
-                }
-                
-                async with session.get(
-                    self.google_service.base_url,
-                    params=params,
-                    timeout=30
-                ) as response:
-                    if response.status != 200:
-                        logger.error(f"ScrapingDog API error: {response.status}")
-                        text = await response.text()
-                        logger.error(f"Response: {text}")
-                        return None
-                    
-                    data = await response.json()
-                    return data
-                    
-        except Exception as e:
-            logger.error(f"Error fetching search results: {type(e).__name__}: {e}")
-            return None
+        return await get_discovery_engine().search(query, country=country, results=10)
     
     def _build_query(self, business_name: str, city: Optional[str], state: Optional[str]) -> str:
         """
@@ -268,6 +589,7 @@ class LLMDiscoveryService:
         
         return " ".join(query_parts)
     
+    
     async def _analyze_with_llm(
         self,
         business_name: str,
@@ -297,8 +619,92 @@ class LLMDiscoveryService:
             Dict with url, confidence, reasoning, match_signals,
             detected_country, country_confidence, country_signals
         """
-        # Prepare business context
-        business_context = {
+        business_context = self._business_context(business_name, phone, address, city, state, country)
+        
+        try:
+            model = await self._get_llm_model()
+            response = await self.gateway.create(
+                "discovery", **self.build_request_params(model, business_context, search_results)
+            )
+            return self.analysis_from_response(
+                response.content[0].text,
+                model,
+                response.usage.input_tokens + response.usage.output_tokens
+            )
+        except Exception as e:
+            logger.error(f"LLM analysis failed: {type(e).__name__}: {e}")
+            return self._failed_analysis(f"LLM analysis error: {str(e)}", e)
+    
+    async def _analyze_group_with_llm(
+        self,
+        group: List[tuple]
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Analyze several businesses' search results in one LLM call.
+        
+        Args:
+            group: [(business dict, organic_results), ...]
+            
+        Returns:
+            One analysis per business (same order), or None if the response
+            can't be matched back (caller falls back to one call each)
+        """
+        entries = [
+            {
+                "business": self._business_context(
+                    business["name"], business.get("phone"), business.get("address"),
+                    business.get("city"), business.get("state"), business.get("country") or "US"
+                ),
+                "results": self._format_results(organic_results),
+            }
+            for business, organic_results in group
+        ]
+        prompt = self._build_group_discovery_prompt(entries)
+        
+        try:
+            model = await self._get_llm_model()
+            response = await self.gateway.create(
+                "discovery.group",
+                model=model,
+                max_tokens=min(8000, 700 * len(entries)),
+                temperature=0,
+                system=cached_system(GROUP_DISCOVERY_SYSTEM),
+                messages=[{"role": "user", "content": prompt}]
+            )
+            response_text = _strip_code_fence(response.content[0].text)
+            tokens = response.usage.input_tokens + response.usage.output_tokens
+            items = json.loads(response_text)
+            by_index = {
+                item.get("business_index"): item
+                for item in items
+                if isinstance(item, dict)
+            }
+            if set(by_index) != set(range(len(entries))):
+                raise ValueError(f"expected {len(entries)} answers, got indexes {sorted(by_index, key=str)}")
+        except Exception as e:
+            logger.warning(f"Grouped LLM discovery failed ({type(e).__name__}: {e}) - analyzing individually")
+            return None
+        
+        share = tokens // len(entries)
+        logger.info(f"LLM grouped analysis complete: {len(entries)} businesses, {tokens} tokens")
+        return [
+            {
+                **self._analysis_from_llm_json(by_index[i], model, share, response_text),
+                "llm_group_size": len(entries),
+            }
+            for i in range(len(entries))
+        ]
+    
+    @staticmethod
+    def _business_context(
+        business_name: str,
+        phone: Optional[str],
+        address: Optional[str],
+        city: Optional[str],
+        state: Optional[str],
+        country: str
+    ) -> Dict[str, Any]:
+        return {
             "name": business_name,
             "phone": phone,
             "address": address,
@@ -306,109 +712,132 @@ class LLMDiscoveryService:
             "state": state,
             "expected_country": country
         }
-        
-        # Prepare search results for LLM
-        formatted_results = []
-        for i, result in enumerate(search_results[:10], 1):
-            formatted_results.append({
+    
+    @staticmethod
+    def _format_results(search_results: List[Dict]) -> List[Dict]:
+        """Top 10 organic results in the shape the prompt expects."""
+        return [
+            {
                 "rank": i,
                 "title": result.get("title", ""),
                 "url": result.get("link", ""),
                 "snippet": result.get("snippet", ""),
                 "displayed_link": result.get("displayed_link", "")
-            })
+            }
+            for i, result in enumerate(search_results[:10], 1)
+        ]
+    
+    def build_request_params(
+        self,
+        model: str,
+        business_context: Dict[str, Any],
+        search_results: List[Dict]
+    ) -> Dict[str, Any]:
+        """
+        messages.create() kwargs for one business's discovery analysis.
         
-        # Build LLM prompt (includes country detection instructions)
-        prompt = self._build_discovery_prompt(business_context, formatted_results)
+        Shared by the online call and Message Batches submissions.
         
+        Args:
+            model: Claude model
+            business_context: Output of _business_context()
+            search_results: Organic results from ScrapingDog
+        """
+        return {
+            "model": model,
+            "max_tokens": 2000,
+            "temperature": 0,
+            "system": cached_system(SINGLE_DISCOVERY_SYSTEM),
+            "messages": [
+                {
+                    "role": "user",
+                    "content": self._build_discovery_prompt(
+                        business_context, self._format_results(search_results)
+                    )
+                }
+            ],
+        }
+    
+    def analysis_from_response(self, response_text: str, model: str, tokens: int) -> Dict[str, Any]:
+        """Parse a discovery response (online or from a batch) into an analysis dict."""
+        response_text = _strip_code_fence(response_text)
         try:
-            model = await self._get_llm_model()
-            
-            response = await self.anthropic_client.messages.create(
-                model=model,
-                max_tokens=2000,
-                temperature=0,
-                system="""You are a business website discovery expert. Your job is to analyze Google search results and determine which URL (if any) is the official website for a specific business.
-
-You must cross-reference the business information (phone, address, name) with the search result snippets to make an accurate determination.
-
-Be cautious of:
-- Franchise/aggregator sites (e.g., nationwide franchise page instead of local business)
-- Directory listings (Yelp, BBB, etc. - these are NOT business websites)
-- Member directories (Chamber of Commerce listings)
-- Booking platforms (third-party scheduling sites)
-- PDF files
-
-Return your analysis in valid JSON format only.""",
-                messages=[
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ]
-            )
-            
-            # Parse LLM response
-            response_text = response.content[0].text.strip()
-            
-            # Remove markdown code blocks if present
-            if response_text.startswith("```"):
-                lines = response_text.split("\n")
-                response_text = "\n".join(lines[1:-1])
-            
             llm_result = json.loads(response_text)
-            
-            logger.info(f"LLM analysis complete: {llm_result.get('verdict', 'unknown')}")
-            
-            return {
-                "url": llm_result.get("url"),
-                "confidence": llm_result.get("confidence", 0),
-                "reasoning": llm_result.get("reasoning", ""),
-                "match_signals": llm_result.get("match_signals", {}),
-                "detected_country": llm_result.get("detected_country"),
-                "country_confidence": llm_result.get("country_confidence", 0.0),
-                "country_signals": llm_result.get("country_signals", []),
-                "llm_model": model,
-                "llm_tokens": response.usage.input_tokens + response.usage.output_tokens,
-                "llm_raw_response": response_text
-            }
-            
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse LLM response: {e}")
             logger.error(f"Raw response: {response_text}")
-            return {
-                "url": None,
-                "confidence": 0,
-                "reasoning": f"LLM response parse error: {str(e)}",
-                "detected_country": None,
-                "country_confidence": 0.0,
-                "country_signals": [],
-                "error": str(e)
-            }
-        except Exception as e:
-            logger.error(f"LLM analysis failed: {type(e).__name__}: {e}")
-            return {
-                "url": None,
-                "confidence": 0,
-                "reasoning": f"LLM analysis error: {str(e)}",
-                "detected_country": None,
-                "country_confidence": 0.0,
-                "country_signals": [],
-                "error": str(e)
-            }
+            return self._failed_analysis(f"LLM response parse error: {str(e)}", e)
+        
+        logger.info(f"LLM analysis complete: {llm_result.get('verdict', 'unknown')}")
+        return self._analysis_from_llm_json(llm_result, model, tokens, response_text)
+    
+    @staticmethod
+    def _analysis_from_llm_json(
+        llm_result: Dict[str, Any],
+        model: str,
+        tokens: int,
+        response_text: str
+    ) -> Dict[str, Any]:
+        return {
+            "url": llm_result.get("url"),
+            "confidence": llm_result.get("confidence", 0),
+            "reasoning": llm_result.get("reasoning", ""),
+            "match_signals": llm_result.get("match_signals", {}),
+            "detected_country": llm_result.get("detected_country"),
+            "country_confidence": llm_result.get("country_confidence", 0.0),
+            "country_signals": llm_result.get("country_signals", []),
+            "llm_model": model,
+            "llm_tokens": tokens,
+            "llm_raw_response": response_text
+        }
+    
+    @staticmethod
+    def _failed_analysis(reasoning: str, error: Exception) -> Dict[str, Any]:
+        return {
+            "url": None,
+            "confidence": 0,
+            "reasoning": reasoning,
+            "detected_country": None,
+            "country_confidence": 0.0,
+            "country_signals": [],
+            "error": str(error)
+        }
     
     def _build_discovery_prompt(
         self,
         business: Dict[str, Any],
         search_results: List[Dict]
     ) -> str:
-        """Build the LLM prompt for website discovery, including country detection."""
+        """Build the per-call user prompt (instructions live in the system prompt)."""
+        prompt = (
+            "Analyze these Google search results to find the official website for this "
+            "business AND determine which country the business is located in.\n\n"
+        )
+        return prompt + self._format_business_section(business, search_results)
+    
+    def _build_group_discovery_prompt(self, entries: List[Dict[str, Any]]) -> str:
+        """
+        Build one prompt covering several businesses.
         
+        Args:
+            entries: [{"business": business_context, "results": formatted_results}, ...]
+        """
+        prompt = (
+            f"Analyze the Google search results below for {len(entries)} DIFFERENT businesses. "
+            "For EACH business independently, find its official website AND determine which "
+            "country it is located in. Never use one business's results for another.\n\n"
+        )
+        for index, entry in enumerate(entries):
+            prompt += f"\n=============== BUSINESS_INDEX {index} ===============\n"
+            prompt += self._format_business_section(entry["business"], entry["results"])
+        return prompt
+    
+    @staticmethod
+    def _format_business_section(business: Dict[str, Any], search_results: List[Dict]) -> str:
+        """Business facts followed by its formatted search results."""
         expected_country = business.get("expected_country", "US")
 
-        prompt = f"""Analyze these Google search results to find the official website for this business AND determine which country the business is located in.
-
-**BUSINESS INFORMATION:**
+        section = f"""**BUSINESS INFORMATION:**
 - Name: {business['name']}
 - Phone: {business.get('phone') or 'Not provided'}
 - Address: {business.get('address') or 'Not provided'}
@@ -421,7 +850,7 @@ Return your analysis in valid JSON format only.""",
 """
         
         for result in search_results:
-            prompt += f"""
+            section += f"""
 Result #{result['rank']}:
   Title: {result['title']}
   URL: {result['url']}
@@ -429,104 +858,7 @@ Result #{result['rank']}:
   Displayed Link: {result['displayed_link']}
 ---
 """
-        
-        prompt += """
-
-**YOUR TASK:**
-
-Analyze ALL results and:
-1. Determine which URL (if any) is the official website for this specific business location.
-2. Determine which COUNTRY this business is actually located in.
-
-**WEBSITE CROSS-REFERENCING INSTRUCTIONS:**
-
-1. **Phone Number Matching (HIGHEST PRIORITY):**
-   - Check if the business phone appears in ANY snippet
-   - Phone match = HIGH confidence this is the correct website
-
-2. **Address Matching:**
-   - Check if the full address or partial address appears in snippets
-   - Exact address match = HIGH confidence
-
-3. **Business Name Matching:**
-   - Match the business name (accounting for variations)
-   - Name alone is NOT sufficient (many businesses have similar names)
-
-4. **NEVER return these as the URL (hard exclusions):**
-   - ANY social media profile: Facebook (facebook.com), Instagram (instagram.com), Twitter/X (twitter.com, x.com), TikTok (tiktok.com), Pinterest (pinterest.com), YouTube channel pages
-   - LinkedIn company or person pages (linkedin.com)
-   - Directory sites: Yelp, BBB, YellowPages, WhitePages, MapQuest, Manta, etc.
-   - Aggregator/review platforms: TripAdvisor, Angi, HomeAdvisor, Thumbtack, Foursquare
-   - Booking platforms: OpenTable, Resy, Mindbody
-   - Lead-gen directories: Bark.com, Thumbtack, LocalRepairsNow, PlumbingServiceHub, etc.
-   - PDF files or file-storage links
-
-5. **Social Media Bio Extraction (CRITICAL):**
-   - If a search result IS a social media page (Facebook, Instagram, etc.) BUT its snippet mentions a real website URL (e.g., "abccpas.com" or "Visit us at example.com"), extract that URL as your answer instead.
-   - Look for patterns like: "example.com", "www.example.com", "Visit our website", website URLs embedded in snippets.
-   - This real website URL from the bio is the correct answer, not the social media page itself.
-
-6. **Franchise Businesses:**
-   - If it's a franchise (e.g., "Mr. Rooter of Seattle"), the local franchise page IS valid
-   - Verify by checking if phone/address in snippet matches business data
-
-**COUNTRY DETECTION INSTRUCTIONS:**
-
-Determine the actual country of this business using these signals (in priority order):
-
-1. **Phone number prefix (STRONGEST signal):**
-   - +44 or (0)XX = United Kingdom → "GB"
-   - +1 with area codes 204/226/236/249/250/289/306/343/365/403/416/418/431/437/438/450/506/514/519/548/579/581/587/604/613/639/647/672/705/709/778/780/782/807/819/825/867/873/902/905 = Canada → "CA"
-   - +1 with other area codes = United States → "US"
-   - +61 = Australia → "AU"
-   - +52 = Mexico → "MX"
-
-2. **Postal code format in snippets:**
-   - UK: letter-number patterns like "SW1A 1AA", "EC1A 1BB" → "GB"
-   - Canada: letter-number-letter patterns like "T2P 3C3", "M5V 2T6" → "CA"
-   - US: 5-digit or 5+4 digit like "90210" or "90210-1234" → "US"
-   - Australia: 4-digit like "2000", "3000" → "AU"
-
-3. **City/location mentions in snippets:**
-   - London, Manchester, Birmingham, Glasgow = "GB"
-   - Toronto, Vancouver, Calgary, Edmonton, Montreal = "CA"
-   - Sydney, Melbourne, Brisbane = "AU"
-
-4. **Domain TLD:**
-   - .co.uk, .org.uk → "GB"
-   - .ca → "CA"
-   - .com.au, .net.au → "AU"
-
-5. **Default:** If no clear signals, use the Expected Country field above.
-
-**DECISION CRITERIA:**
-
-- **Found & High Confidence (0.8-1.0):** Phone or address match in snippet, OR website URL found in social media bio
-- **Found & Medium Confidence (0.5-0.7):** Business name + city/state match, no phone/address
-- **Not Found (null):** No non-social-media, non-directory results match this specific business
-
-**OUTPUT FORMAT (JSON only):**
-
-{
-  "url": "https://example.com" or null,
-  "confidence": 0.95,
-  "reasoning": "Phone number (XXX) XXX-XXXX from business data matches snippet in Result #2, confirming this is the correct website",
-  "match_signals": {
-    "phone_match": true,
-    "address_match": false,
-    "name_match": true,
-    "location_match": true,
-    "result_rank": 2
-  },
-  "detected_country": "US",
-  "country_confidence": 0.9,
-  "country_signals": ["Phone +1 area code 213 is a US area code", "Address mentions Los Angeles, CA zip 90001"]
-}
-
-**IMPORTANT:** Return ONLY valid JSON. No markdown, no explanation outside the JSON.
-"""
-        
-        return prompt
+        return section
 
     # ----------------------------------------------------------------
     # Social URL domains we look for (platform → canonical root domain)
@@ -633,5 +965,4 @@ async def test_llm_discovery():
 
 
 if __name__ == "__main__":
-    import asyncio
     asyncio.run(test_llm_discovery())
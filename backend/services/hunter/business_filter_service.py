@@ -221,7 +221,8 @@ class BusinessFilterService:
         sort_by: str = "scraped_at",
         sort_desc: bool = True,
         skip: int = 0,
-        limit: int = 50
+        limit: int = 50,
+        enrich: bool = False
     ) -> Dict[str, Any]:
         """
         Filter businesses with advanced query building.
@@ -232,6 +233,7 @@ class BusinessFilterService:
             sort_desc: Sort descending if True
             skip: Number of records to skip (pagination)
             limit: Maximum records to return
+            enrich: Merge CRM indicators (bulk enrichment) into each row
             
         Returns:
             Dict with businesses and metadata:
@@ -277,8 +279,15 @@ class BusinessFilterService:
         pages = (total + limit - 1) // limit if limit > 0 else 1
         page = (skip // limit) + 1 if limit > 0 else 1
         
+        rows = [self._business_to_dict(b) for b in businesses]
+        if enrich and businesses:
+            from services.crm.business_enrichment import BusinessEnrichmentService
+            enriched = await BusinessEnrichmentService(self.db).enrich_businesses_bulk(businesses)
+            for row, enrichment_data in zip(rows, enriched):
+                row.update(enrichment_data)
+        
         return {
-            "businesses": [self._business_to_dict(b) for b in businesses],
+            "businesses": rows,
             "total": total,
             "page": page,
             "pages": pages,
@@ -1,14 +1,16 @@
 """
 Business service for database operations.
 """
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Set, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, delete, func, and_, or_
+from sqlalchemy import JSON, select, update, delete, func, and_, or_, null
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import IntegrityError
-from uuid import UUID
+from uuid import UUID, uuid4
 from datetime import datetime
 from slugify import slugify
 import logging
+import secrets
 
 from models.business import Business
 from core.exceptions import DatabaseException, ValidationException
@@ -16,6 +18,28 @@ from services.activity.analyzer import extract_last_review_date
 
 logger = logging.getLogger(__name__)
 
+# Scraped fields that map onto Business columns.
+# NOTE: coverage_grid_id is handled separately as a parameter
+UPSERT_FIELDS = {
+    "gmb_id", "gmb_place_id", "name", "slug",
+    "email", "phone", "website_url",
+    "address", "city", "state", "zip_code", "country", "latitude", "longitude",
+    "category", "subcategory", "rating", "review_count",
+    "reviews_summary", "review_highlight", "brand_archetype",
+    "photos_urls", "logo_url",
+    "website_status", "contact_status", "qualification_score",
+    "website_validation_status", "website_validated_at",
+    "creative_dna", "scraped_at",
+    "raw_data",
+    # Operational status from Outscraper
+    "business_status", "operational",
+    # Activity signal columns
+    "last_review_date", "last_facebook_post_date",
+}
+
+# Columns written when a row is created but never overwritten by an upsert
+INSERT_ONLY_FIELDS = {"slug", "coverage_grid_id", "scraped_at", "created_at"}
+
 
 class BusinessService:
     """Service for business/lead management."""
@@ -111,7 +135,8 @@ class BusinessService:
         """
         Create or update a business record (idempotent).
         
-        Looks up by gmb_id first, creates if not found, updates if found.
+        Single-row wrapper around bulk_upsert_businesses: one gmb_id lookup
+        plus one INSERT ... ON CONFLICT (gmb_id) DO UPDATE.
         
         Args:
             data: Business data dictionary
@@ -126,90 +151,331 @@ class BusinessService:
             qualification_reasons: List of qualification reason strings (not stored)
             
         Returns:
-            Business instance or None if creation failed
+            Business instance (with ``_is_new`` set) or None if the write failed
         """
         try:
-            # Extract gmb_id for lookup
-            gmb_id = data.get("gmb_id") or data.get("cid")
+            businesses = await self.bulk_upsert_businesses(
+                [data],
+                coverage_grid_id=coverage_grid_id,
+                lead_scores=[lead_score]
+            )
+            return businesses[0]
+        except Exception as e:
+            logger.error(f"Error in create_or_update_business: {str(e)}")
+            import traceback
+            logger.error(traceback.format_exc())
+            return None
+    
+    async def bulk_upsert_businesses(
+        self,
+        businesses_data: List[Dict[str, Any]],
+        coverage_grid_id: Optional[UUID] = None,
+        lead_scores: Optional[List[Optional[float]]] = None
+    ) -> List[Optional[Business]]:
+        """
+        Create or update many scraped businesses in a few round trips.
+        
+        Resolves every gmb_id with one SELECT, skips rows whose values are
+        unchanged, and writes the rest with a single
+        ``INSERT ... ON CONFLICT (gmb_id) DO UPDATE ... RETURNING`` per chunk.
+        Update semantics match update_business: only non-None fields are
+        overwritten (COALESCE against the stored value), and slug /
+        coverage_grid_id / scraped_at are set on insert only.
+        
+        If a chunk fails (a slug collision, an over-long value, ...) it is
+        rolled back to its savepoint and those rows are retried one by one,
+        so one bad row never costs the rest of the batch.
+        
+        Args:
+            businesses_data: Business data dictionaries (scraper format)
+            coverage_grid_id: Coverage grid ID linked to newly created rows
+            lead_scores: Optional qualification score per row (same order)
             
-            # Try to find existing business
-            existing = None
+        Returns:
+            List aligned with ``businesses_data``; each Business has ``_is_new``
+            set, and entries are None for rows that could not be written.
+        """
+        if not businesses_data:
+            return []
+        lead_scores = lead_scores or [None] * len(businesses_data)
+        
+        prepared = [
+            self._prepare_business_data(data, score)
+            for data, score in zip(businesses_data, lead_scores)
+        ]
+        existing_by_gmb = await self._get_businesses_by_gmb_ids(
+            [gmb_id for gmb_id, _ in prepared if gmb_id]
+        )
+        
+        results: List[Optional[Business]] = [None] * len(prepared)
+        to_write: List[int] = []
+        seen_gmb_ids = set()
+        for idx, (gmb_id, business_data) in enumerate(prepared):
+            existing = existing_by_gmb.get(gmb_id) if gmb_id else None
+            if gmb_id and gmb_id in seen_gmb_ids:
+                # Duplicate within the batch — ON CONFLICT can't touch the same
+                # row twice in one statement, so let the per-row path merge it.
+                continue
             if gmb_id:
-                existing = await self.get_business_by_gmb_id(str(gmb_id))
-            
-            # Only pass fields that exist in the Business model
-            # NOTE: coverage_grid_id is handled separately as a parameter
-            valid_fields = {
-                "gmb_id", "gmb_place_id", "name", "slug",
-                "email", "phone", "website_url",
-                "address", "city", "state", "zip_code", "country", "latitude", "longitude",
-                "category", "subcategory", "rating", "review_count",
-                "reviews_summary", "review_highlight", "brand_archetype",
-                "photos_urls", "logo_url",
-                "website_status", "contact_status", "qualification_score",
-                "website_validation_status", "website_validated_at",
-                "creative_dna", "scraped_at",
-                "raw_data",
-                # Operational status from Outscraper
-                "business_status", "operational",
-                # Activity signal columns
-                "last_review_date", "last_facebook_post_date",
-            }
-
-            # ── Derive last_review_date from normalised reviews_data ─────────
-            # reviews_data is a transient field (not a DB column) that the
-            # scraper attaches to each business dict before saving.  We extract
-            # the most-recent date here and store it in the dedicated column so
-            # it is queryable without unpacking raw_data JSON every time.
-            reviews_list = data.get("reviews_data") or []
-            if not reviews_list:
-                # Fall back to raw_data if the normalised list wasn't attached
-                raw = data.get("raw_data") or {}
-                reviews_list = raw.get("reviews_data") or []
+                seen_gmb_ids.add(gmb_id)
+            if existing is not None and not self._has_changes(existing, business_data):
+                existing._is_new = False
+                results[idx] = existing
+                continue
+            to_write.append(idx)
+        
+        slugs = await self._assign_slugs([
+            prepared[idx][1] for idx in to_write
+            if not existing_by_gmb.get(prepared[idx][0])
+        ])
+        
+        now = datetime.utcnow()
+        rows: List[Dict[str, Any]] = []
+        new_ids = set()
+        for idx in to_write:
+            gmb_id, business_data = prepared[idx]
+            existing = existing_by_gmb.get(gmb_id) if gmb_id else None
+            row = dict(business_data)
+            if existing is not None:
+                row.update(id=existing.id, slug=existing.slug, created_at=existing.created_at)
+            else:
+                row.update(
+                    id=uuid4(),
+                    slug=slugs.pop(0),
+                    coverage_grid_id=coverage_grid_id,
+                    scraped_at=business_data.get("scraped_at") or now,
+                    created_at=now
+                )
+                new_ids.add(row["id"])
+            row["updated_at"] = now
+            rows.append(row)
+        
+        # Chunk to stay well below the driver's bind-parameter limit
+        columns = set().union(*(row.keys() for row in rows)) if rows else set()
+        chunk_size = max(1, 30000 // max(len(columns), 1))
+        written: Dict[UUID, Business] = {}
+        for offset in range(0, len(rows), chunk_size):
+            chunk = rows[offset:offset + chunk_size]
+            try:
+                async with self.db.begin_nested():
+                    written.update(await self._execute_upsert(chunk, columns, new_ids))
+            except Exception as e:
+                logger.warning(
+                    f"Bulk upsert chunk of {len(chunk)} failed, "
+                    f"retrying row by row: {str(e)[:200]}"
+                )
+        
+        for idx, row in zip(to_write, rows):
+            business = written.get(row["id"])
+            if business is None and row["id"] in new_ids and row.get("gmb_id"):
+                # Inserted concurrently by another worker — ON CONFLICT updated
+                # their row, which RETURNING reports under its own id.
+                business = next(
+                    (b for b in written.values() if b.gmb_id == row["gmb_id"]), None
+                )
+            if business is not None:
+                business._is_new = business.id in new_ids
+                results[idx] = business
+        
+        # Anything not written in bulk (in-batch duplicates, failed chunks)
+        for idx, (gmb_id, business_data) in enumerate(prepared):
+            if results[idx] is None:
+                results[idx] = await self._upsert_single(
+                    gmb_id, business_data, coverage_grid_id
+                )
+        
+        created = sum(1 for b in results if b is not None and b._is_new)
+        logger.info(
+            f"Bulk upserted {len(businesses_data)} businesses: {created} created, "
+            f"{len(rows)} written, {len(prepared) - len(to_write)} unchanged or merged"
+        )
+        return results
+    
+    def _prepare_business_data(
+        self,
+        data: Dict[str, Any],
+        lead_score: Optional[float] = None
+    ) -> Tuple[Optional[str], Dict[str, Any]]:
+        """
+        Map a scraped business dict onto Business columns.
+        
+        Returns:
+            Tuple of (gmb_id used for lookup, filtered column values)
+        """
+        # Extract gmb_id for lookup
+        gmb_id = data.get("gmb_id") or data.get("cid")
+        
+        # ── Derive last_review_date from normalised reviews_data ─────────
+        # reviews_data is a transient field (not a DB column) that the
+        # scraper attaches to each business dict before saving.  We extract
+        # the most-recent date here and store it in the dedicated column so
+        # it is queryable without unpacking raw_data JSON every time.
+        reviews_list = data.get("reviews_data") or []
+        if not reviews_list:
+            # Fall back to raw_data if the normalised list wasn't attached
+            raw = data.get("raw_data") or {}
+            reviews_list = raw.get("reviews_data") or []
 
-            derived_last_review = extract_last_review_date(reviews_list)
-            if derived_last_review is not None:
-                data = {**data, "last_review_date": derived_last_review}
+        derived_last_review = extract_last_review_date(reviews_list)
+        if derived_last_review is not None:
+            data = {**data, "last_review_date": derived_last_review}
 
-            # Filter business data to only valid fields
-            # IMPORTANT: raw_data should ALWAYS be saved, even if it's a dict (don't check None)
-            business_data = {}
-            for k, v in data.items():
-                if k not in valid_fields:
-                    continue
-                # Always save raw_data regardless of value
-                if k == "raw_data":
-                    business_data[k] = v
-                    logger.info(f"Saving raw_data: {type(v)}, keys: {list(v.keys()) if isinstance(v, dict) else 'N/A'}")
-                # For other fields, skip if None
-                elif v is not None:
-                    business_data[k] = v
+        # Filter business data to only valid fields
+        # IMPORTANT: raw_data should ALWAYS be saved, even if it's a dict (don't check None)
+        business_data = {}
+        for k, v in data.items():
+            if k not in UPSERT_FIELDS:
+                continue
+            # Always save raw_data regardless of value
+            if k == "raw_data":
+                business_data[k] = v
+            # For other fields, skip if None
+            elif v is not None:
+                business_data[k] = v
 
-            # Add qualification score if provided
-            if lead_score is not None:
-                business_data["qualification_score"] = int(lead_score)
-            
+        # Add qualification score if provided
+        if lead_score is not None:
+            business_data["qualification_score"] = int(lead_score)
+        
+        if gmb_id:
+            business_data["gmb_id"] = str(gmb_id)
+        
+        return (str(gmb_id) if gmb_id else None), business_data
+    
+    async def _get_businesses_by_gmb_ids(self, gmb_ids: List[str]) -> Dict[str, Business]:
+        """Resolve many gmb_ids in one query."""
+        if not gmb_ids:
+            return {}
+        result = await self.db.execute(
+            select(Business).where(Business.gmb_id.in_(set(gmb_ids)))
+        )
+        return {b.gmb_id: b for b in result.scalars().all()}
+    
+    @staticmethod
+    def _has_changes(existing: Business, business_data: Dict[str, Any]) -> bool:
+        """True if any provided field differs from the stored row."""
+        for key, value in business_data.items():
+            if key in ("gmb_id", "slug"):
+                continue
+            if value is None and key != "raw_data":
+                continue
+            if getattr(existing, key, None) != value:
+                return True
+        return False
+    
+    async def _assign_slugs(self, businesses_data: List[Dict[str, Any]]) -> List[str]:
+        """
+        Generate slugs for new rows, disambiguating against the DB and the batch.
+        
+        One query checks all candidate slugs; collisions get a short suffix.
+        """
+        candidates = [
+            data.get("slug") or self._generate_unique_slug(
+                data.get("name", ""),
+                data.get("city", ""),
+                data.get("state", "")
+            )
+            for data in businesses_data
+        ]
+        if not candidates:
+            return []
+        
+        result = await self.db.execute(
+            select(Business.slug).where(Business.slug.in_(set(candidates)))
+        )
+        taken = set(result.scalars().all())
+        
+        slugs = []
+        for slug in candidates:
+            unique = slug
+            while unique in taken:
+                unique = f"{slug[:45]}-{secrets.token_hex(2)}"
+            taken.add(unique)
+            slugs.append(unique)
+        return slugs
+    
+    async def _execute_upsert(
+        self,
+        rows: List[Dict[str, Any]],
+        columns: Set[str],
+        new_ids: Set[UUID]
+    ) -> Dict[UUID, Business]:
+        """Run one INSERT ... ON CONFLICT (gmb_id) DO UPDATE ... RETURNING."""
+        table = Business.__table__
+        stmt = pg_insert(Business).values(self._build_values(rows, columns, new_ids))
+        update_columns = columns - INSERT_ONLY_FIELDS - {"id", "gmb_id"}
+        set_ = {
+            col: func.coalesce(stmt.excluded[col], table.c[col])
+            for col in update_columns
+            if col != "updated_at"
+        }
+        set_["updated_at"] = stmt.excluded.updated_at
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c.gmb_id],
+            set_=set_
+        ).returning(Business)
+        
+        result = await self.db.scalars(
+            stmt,
+            execution_options={"populate_existing": True}
+        )
+        return {b.id: b for b in result.all()}
+    
+    @staticmethod
+    def _build_values(
+        rows: List[Dict[str, Any]],
+        columns: Set[str],
+        new_ids: Set[UUID]
+    ) -> List[Dict[str, Any]]:
+        """
+        Normalise rows for a multi-row VALUES clause (identical keys required).
+        
+        Missing values on existing rows become NULL, which the upsert's COALESCE
+        turns into "keep the stored value"; new rows get the column's scalar
+        default, as an ORM insert would. JSON columns get an explicit SQL NULL:
+        a bound None would be stored as JSON 'null', which COALESCE keeps.
+        """
+        table = Business.__table__
+        json_columns = {col for col in columns if isinstance(table.c[col].type, JSON)}
+        values = []
+        for row in rows:
+            value = {col: row.get(col) for col in columns}
+            if row["id"] in new_ids:
+                for col in columns - row.keys():
+                    default = table.c[col].default
+                    if default is not None and default.is_scalar:
+                        value[col] = default.arg
+            for col in json_columns:
+                if value[col] is None:
+                    value[col] = null()
+            values.append(value)
+        return values
+    
+    async def _upsert_single(
+        self,
+        gmb_id: Optional[str],
+        business_data: Dict[str, Any],
+        coverage_grid_id: Optional[UUID]
+    ) -> Optional[Business]:
+        """Per-row fallback: lookup, then update_business or create_business."""
+        try:
+            existing = await self.get_business_by_gmb_id(gmb_id) if gmb_id else None
             if existing:
-                # Update existing business with new data
                 logger.info(f"Updating existing business: {existing.name} ({existing.id})")
-                updated = await self.update_business(existing.id, business_data)
+                updated = await self.update_business(existing.id, dict(business_data))
                 if updated:
                     updated._is_new = False
                 return updated
-            else:
-                # Create new business with coverage_grid_id link
-                business = await self.create_business(
-                    business_data, 
-                    coverage_grid_id=coverage_grid_id
-                )
-                if business:
-                    business._is_new = True
-                return business
-                
+            
+            business = await self.create_business(
+                dict(business_data),
+                coverage_grid_id=coverage_grid_id
+            )
+            if business:
+                business._is_new = True
+            return business
         except Exception as e:
-            logger.error(f"Error in create_or_update_business: {str(e)}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.error(f"Error upserting business {gmb_id}: {str(e)}")
             return None
     
     async def list_businesses(
@@ -301,6 +567,10 @@ class BusinessService:
         Bulk create businesses (optimized for scraping).
         Skips duplicates based on gmb_id.
         
+        Existing gmb_ids are resolved in one query and new rows are written with
+        ``INSERT ... ON CONFLICT (gmb_id) DO NOTHING RETURNING``, so rows created
+        concurrently by another worker are skipped rather than failing the batch.
+        
         Args:
             businesses_data: List of business dictionaries
             coverage_grid_id: Associated coverage grid ID
@@ -308,96 +578,100 @@ class BusinessService:
         Returns:
             List of created Business instances
         """
-        created = []
-        skipped = 0
+        existing_by_gmb = await self._get_businesses_by_gmb_ids(
+            [str(b["gmb_id"]) for b in businesses_data if b.get("gmb_id")]
+        )
         
+        to_create = []
+        seen_gmb_ids = set()
         for business_data in businesses_data:
+            gmb_id = business_data.get("gmb_id")
+            if gmb_id:
+                if str(gmb_id) in existing_by_gmb or str(gmb_id) in seen_gmb_ids:
+                    logger.debug(f"Skipping duplicate business: {gmb_id}")
+                    continue
+                seen_gmb_ids.add(str(gmb_id))
+            to_create.append(business_data)
+        skipped = len(businesses_data) - len(to_create)
+        
+        slugs = await self._assign_slugs(to_create)
+        now = datetime.utcnow()
+        rows = [
+            {
+                **business_data,
+                "id": uuid4(),
+                "slug": slug,
+                "coverage_grid_id": coverage_grid_id,
+                "scraped_at": now,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for business_data, slug in zip(to_create, slugs)
+        ]
+        
+        created: List[Business] = []
+        if rows:
             try:
-                # Check if already exists by gmb_id
-                gmb_id = business_data.get("gmb_id")
-                if gmb_id:
-                    existing = await self.get_business_by_gmb_id(gmb_id)
-                    if existing:
-                        logger.debug(f"Skipping duplicate business: {gmb_id}")
-                        skipped += 1
-                        continue
-                
-                # Create business
-                business = await self.create_business(
-                    business_data,
-                    coverage_grid_id=coverage_grid_id
-                )
-                created.append(business)
-                
+                async with self.db.begin_nested():
+                    columns = set().union(*(row.keys() for row in rows))
+                    new_ids = {row["id"] for row in rows}
+                    result = await self.db.scalars(
+                        pg_insert(Business)
+                        .values(self._build_values(rows, columns, new_ids))
+                        .on_conflict_do_nothing(index_elements=[Business.__table__.c.gmb_id])
+                        .returning(Business)
+                    )
+                    created = list(result.all())
             except Exception as e:
-                logger.warning(f"Failed to create business: {str(e)}")
-                continue
+                logger.warning(f"Failed to bulk create businesses: {str(e)}")
         
+        skipped += len(rows) - len(created)
         logger.info(f"Bulk created {len(created)} businesses, skipped {skipped} duplicates")
         return created
     
     async def get_stats(self) -> Dict[str, Any]:
-        """Get business statistics."""
-        # Total leads
-        total_result = await self.db.execute(select(func.count(Business.id)))
-        total = total_result.scalar()
+        """
+        Get business statistics.
         
-        # With email
-        with_email_result = await self.db.execute(
-            select(func.count(Business.id)).where(Business.email.isnot(None))
-        )
-        with_email = with_email_result.scalar()
-        
-        # Without website
-        no_website_result = await self.db.execute(
-            select(func.count(Business.id)).where(
-                or_(
-                    Business.website_url.is_(None),
-                    Business.website_url == ""
-                )
+        Scalar counts come from one FILTER aggregate pass; status and
+        category breakdowns are one GROUP BY each.
+        """
+        count = func.count(Business.id)
+        totals = (await self.db.execute(
+            select(
+                count.label("total"),
+                count.filter(Business.email.isnot(None)).label("with_email"),
+                count.filter(
+                    or_(Business.website_url.is_(None), Business.website_url == "")
+                ).label("no_website"),
+                count.filter(Business.rating >= 4.0).label("high_rating"),
+                count.filter(Business.qualification_score > 0).label("qualified"),
             )
-        )
-        no_website = no_website_result.scalar()
-        
-        # High rating (4.0+)
-        high_rating_result = await self.db.execute(
-            select(func.count(Business.id)).where(Business.rating >= 4.0)
-        )
-        high_rating = high_rating_result.scalar()
-        
-        # Qualified (score > 0)
-        qualified_result = await self.db.execute(
-            select(func.count(Business.id)).where(Business.qualification_score > 0)
-        )
-        qualified = qualified_result.scalar()
+        )).one()
         
         # By status
-        by_status = {}
         status_result = await self.db.execute(
-            select(Business.website_status, func.count(Business.id))
+            select(Business.website_status, count)
             .group_by(Business.website_status)
         )
-        for status, count in status_result:
-            by_status[status] = count
+        by_status = {status: n for status, n in status_result}
         
         # By category (top 10)
-        by_category = {}
         category_result = await self.db.execute(
-            select(Business.category, func.count(Business.id))
+            select(Business.category, count)
             .where(Business.category.isnot(None))
             .group_by(Business.category)
-            .order_by(func.count(Business.id).desc())
+            .order_by(count.desc())
             .limit(10)
         )
-        for category, count in category_result:
-            by_category[category] = count
+        by_category = {category: n for category, n in category_result}
         
         return {
-            "total_leads": total,
-            "qualified_leads": qualified,
-            "with_email": with_email,
-            "without_website": no_website,
-            "high_rating": high_rating,
+            "total_leads": totals.total,
+            "qualified_leads": totals.qualified,
+            "with_email": totals.with_email,
+            "without_website": totals.no_website,
+            "high_rating": totals.high_rating,
             "by_status": by_status,
             "by_category": by_category
         }
@@ -329,30 +329,26 @@ class CoverageService:
         return True
     
     async def get_stats(self) -> Dict[str, Any]:
-        """Get coverage statistics."""
-        # Total territories
-        total_result = await self.db.execute(
-            select(func.count(CoverageGrid.id))
-        )
-        total = total_result.scalar()
-        
-        # By status
-        by_status = {}
-        status_result = await self.db.execute(
-            select(CoverageGrid.status, func.count(CoverageGrid.id))
-            .group_by(CoverageGrid.status)
-        )
-        for status, count in status_result:
-            by_status[status] = count
+        """
+        Get coverage statistics.
         
-        # Total leads and qualified
-        metrics_result = await self.db.execute(
+        Totals, per-status counts and lead sums come from one FILTER
+        aggregate pass; state and industry breakdowns are one GROUP BY each.
+        """
+        count = func.count(CoverageGrid.id)
+        totals = (await self.db.execute(
             select(
-                func.sum(CoverageGrid.lead_count),
-                func.sum(CoverageGrid.qualified_count)
+                count.label("total"),
+                count.filter(CoverageGrid.status == "pending").label("pending"),
+                count.filter(CoverageGrid.status == "in_progress").label("in_progress"),
+                count.filter(CoverageGrid.status == "completed").label("completed"),
+                count.filter(CoverageGrid.status == "cooldown").label("cooldown"),
+                func.sum(CoverageGrid.lead_count).label("total_leads"),
+                func.sum(CoverageGrid.qualified_count).label("total_qualified"),
             )
-        )
-        total_leads, total_qualified = metrics_result.first()
+        )).one()
+        total_leads = totals.total_leads
+        total_qualified = totals.total_qualified
         
         # Average qualification rate
         avg_qual_rate = 0
@@ -360,33 +356,29 @@ class CoverageService:
             avg_qual_rate = (total_qualified / total_leads) * 100
         
         # By state (top 10)
-        by_state = {}
         state_result = await self.db.execute(
-            select(CoverageGrid.state, func.count(CoverageGrid.id))
+            select(CoverageGrid.state, count)
             .group_by(CoverageGrid.state)
-            .order_by(func.count(CoverageGrid.id).desc())
+            .order_by(count.desc())
             .limit(10)
         )
-        for state, count in state_result:
-            by_state[state] = count
+        by_state = {state: n for state, n in state_result}
         
         # By industry (top 10)
-        by_industry = {}
         industry_result = await self.db.execute(
-            select(CoverageGrid.industry, func.count(CoverageGrid.id))
+            select(CoverageGrid.industry, count)
             .group_by(CoverageGrid.industry)
-            .order_by(func.count(CoverageGrid.id).desc())
+            .order_by(count.desc())
             .limit(10)
         )
-        for industry, count in industry_result:
-            by_industry[industry] = count
+        by_industry = {industry: n for industry, n in industry_result}
         
         return {
-            "total_territories": total,
-            "pending": by_status.get("pending", 0),
-            "in_progress": by_status.get("in_progress", 0),
-            "completed": by_status.get("completed", 0),
-            "cooldown": by_status.get("cooldown", 0),
+            "total_territories": totals.total,
+            "pending": totals.pending,
+            "in_progress": totals.in_progress,
+            "completed": totals.completed,
+            "cooldown": totals.cooldown,
             "total_leads": total_leads or 0,
             "total_qualified": total_qualified or 0,
             "avg_qualification_rate": avg_qual_rate,
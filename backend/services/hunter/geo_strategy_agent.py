@@ -7,13 +7,11 @@ to create optimized search zone strategies for maximum business discovery effici
 from typing import Dict, Any, List, Optional
 import json
 import logging
-from anthropic import AsyncAnthropic
 
-from core.config import get_settings
 from core.exceptions import ExternalAPIException
+from services.llm.gateway import get_llm_gateway, message_text
 
 logger = logging.getLogger(__name__)
-settings = get_settings()
 
 
 class GeoStrategyAgent:
@@ -35,7 +33,6 @@ class GeoStrategyAgent:
             model: Claude model to use for strategy generation
         """
         self.model = model
-        self.client = AsyncAnthropic(api_key=settings.ANTHROPIC_API_KEY)
         logger.info(f"Initialized GeoStrategyAgent with model {model}")
     
     async def generate_strategy(
@@ -77,7 +74,8 @@ class GeoStrategyAgent:
         try:
             # Call Claude
             # Use streaming to avoid timeout limits on large max_tokens
-            async with self.client.messages.stream(
+            final_message = await get_llm_gateway().stream(
+                "hunter.geo_strategy",
                 model=self.model,
                 max_tokens=64000,  # Max for Claude Sonnet 4.5
                 temperature=0.7,
@@ -85,8 +83,8 @@ class GeoStrategyAgent:
                 messages=[
                     {"role": "user", "content": user_prompt}
                 ]
-            ) as stream:
-                response_text = await stream.get_final_text()
+            )
+            response_text = message_text(final_message)
             
             # Parse JSON response
             strategy = self._parse_strategy_response(response_text)
@@ -144,7 +142,8 @@ class GeoStrategyAgent:
         
         try:
             # Use streaming to avoid timeout limits on large max_tokens
-            async with self.client.messages.stream(
+            final_message = await get_llm_gateway().stream(
+                "hunter.geo_refinement",
                 model=self.model,
                 max_tokens=64000,  # Max for Claude Sonnet 4.5
                 temperature=0.7,
@@ -152,8 +151,8 @@ class GeoStrategyAgent:
                 messages=[
                     {"role": "user", "content": user_prompt}
                 ]
-            ) as stream:
-                response_text = await stream.get_final_text()
+            )
+            response_text = message_text(final_message)
             
             refinements = self._parse_refinement_response(response_text)
             
@@ -5,7 +5,7 @@ Handles strategy creation, retrieval, execution tracking, and adaptive refinemen
 """
 from typing import Optional, Dict, Any, List
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, or_, desc
+from sqlalchemy import select, and_, or_, desc, func, distinct, tuple_
 from datetime import datetime
 import logging
 
@@ -326,38 +326,46 @@ class GeoStrategyService:
         """
         Get overall statistics about geo-strategies.
         
+        Computed in a single aggregate query instead of loading every
+        strategy row.
+        
         Returns:
             Dictionary with stats
         """
-        # Count strategies by status
-        stmt = select(GeoStrategy)
-        result = await self.db.execute(stmt)
-        strategies = result.scalars().all()
+        count = func.count(GeoStrategy.id)
+        has_accuracy = GeoStrategy.performance_data.has_key("strategy_accuracy")
+        row = (await self.db.execute(
+            select(
+                count.label("total"),
+                count.filter(GeoStrategy.is_active == "active").label("active"),
+                count.filter(GeoStrategy.is_active == "completed").label("completed"),
+                count.filter(GeoStrategy.is_active == "superseded").label("superseded"),
+                func.coalesce(func.sum(GeoStrategy.total_zones), 0).label("total_zones"),
+                func.coalesce(func.sum(GeoStrategy.zones_completed), 0).label("zones_completed"),
+                func.coalesce(func.sum(GeoStrategy.businesses_found), 0).label("businesses_found"),
+                func.count(distinct(tuple_(GeoStrategy.city, GeoStrategy.state))).label("cities"),
+                func.count(distinct(GeoStrategy.category)).label("categories"),
+                func.avg(
+                    GeoStrategy.performance_data["strategy_accuracy"].as_float()
+                ).filter(has_accuracy).label("avg_accuracy"),
+            )
+        )).one()
         
         stats = {
-            "total_strategies": len(strategies),
-            "active": sum(1 for s in strategies if s.is_active == "active"),
-            "completed": sum(1 for s in strategies if s.is_active == "completed"),
-            "superseded": sum(1 for s in strategies if s.is_active == "superseded"),
-            "total_zones": sum(s.total_zones for s in strategies),
-            "zones_completed": sum(s.zones_completed for s in strategies),
-            "businesses_found": sum(s.businesses_found for s in strategies),
-            "cities_covered": len(set((s.city, s.state) for s in strategies)),
-            "categories_covered": len(set(s.category for s in strategies))
+            "total_strategies": row.total,
+            "active": row.active,
+            "completed": row.completed,
+            "superseded": row.superseded,
+            "total_zones": int(row.total_zones),
+            "zones_completed": int(row.zones_completed),
+            "businesses_found": int(row.businesses_found),
+            "cities_covered": row.cities,
+            "categories_covered": row.categories
         }
         
-        # Calculate average accuracy for completed strategies
-        completed_with_accuracy = [
-            s for s in strategies
-            if s.performance_data and "strategy_accuracy" in s.performance_data
-        ]
-        
-        if completed_with_accuracy:
-            avg_accuracy = sum(
-                s.performance_data["strategy_accuracy"]
-                for s in completed_with_accuracy
-            ) / len(completed_with_accuracy)
-            stats["avg_strategy_accuracy"] = round(avg_accuracy, 1)
+        # Average accuracy for strategies that recorded one
+        if row.avg_accuracy is not None:
+            stats["avg_strategy_accuracy"] = round(float(row.avg_accuracy), 1)
         
         return stats
     
@@ -17,6 +17,7 @@ from services.hunter.data_quality_service import DataQualityService
 # Simple HTTP-based validation for initial filtering
 from services.hunter.website_validator import WebsiteValidator
 from services.hunter.website_generation_queue_service import WebsiteGenerationQueueService
+from services.hunter.zone_pipeline import PipelineLimits, ZonePipeline
 # Deep verification with ScrapingDog + LLM
 from services.discovery.llm_discovery_service import LLMDiscoveryService
 # Progress tracking for real-time updates
@@ -81,7 +82,8 @@ class HunterService:
         center_lon: Optional[float] = None,
         force_new_strategy: bool = False,
         zone_id: Optional[str] = None,
-        scrape_session_id: Optional[str] = None
+        scrape_session_id: Optional[str] = None,
+        pipeline_workers: Optional[int] = None
     ) -> Dict[str, Any]:
         """
         Scrape a city using Claude-generated intelligent zone placement strategy.
@@ -101,6 +103,9 @@ class HunterService:
             center_lon: City center longitude (will geocode if not provided)
             force_new_strategy: Generate new strategy even if one exists
             zone_id: Specific zone to scrape (if None, scrapes next unscraped zone)
+            scrape_session_id: Session ID used for SSE progress events
+            pipeline_workers: Businesses processed concurrently within the zone
+                (defaults to HUNTER_PIPELINE_WORKERS; 1 = sequential)
             
         Returns:
             Dictionary with results:
@@ -208,6 +213,7 @@ class HunterService:
             logger.info(f"Coverage grid {'created' if created else 'found'}: {coverage_id}")
             
             # Process and save ALL leads (we're paying for the Outscraper call!)
+            settings = get_settings()
             total_saved = 0
             new_businesses = 0
             businesses_with_valid_websites = 0
@@ -223,14 +229,102 @@ class HunterService:
             # Initialize deep verification service (ScrapingDog + LLM)
             llm_discovery = LLMDiscoveryService()
             
-            # Rate limiting for ScrapingDog (1 request per second to avoid throttling)
-            scrapingdog_delay = 1.0  # seconds between ScrapingDog requests
+            # Bounded-concurrency pipeline: enrichment stages fan out across
+            # workers, DB saves are batched and serialised on the shared session.
+            pipeline = ZonePipeline(PipelineLimits.from_settings(pipeline_workers))
+            logger.info(
+                f"Zone pipeline: {pipeline.limits.workers} workers, "
+                f"{pipeline.limits.http_concurrency} HTTP, "
+                f"{pipeline.limits.discovery_concurrency} discovery"
+            )
             
-            # Simple HTTP validator for initial filtering
-            async with WebsiteValidator() as website_validator:
-                for idx, biz_data in enumerate(raw_businesses):
+            def record_saved(biz_data: Dict[str, Any], business) -> None:
+                nonlocal total_saved, new_businesses, businesses_with_valid_websites
+                nonlocal businesses_needing_websites, businesses_verified_by_llm
+                
+                if business:
+                    total_saved += 1
+                    if hasattr(business, '_is_new') and business._is_new:
+                        new_businesses += 1
+                    
+                    # Track website metrics
+                    if business.website_validation_status == "pending":
+                        businesses_to_validate.append(str(business.id))
+                        businesses_with_valid_websites += 1
+                        if biz_data.get("verified"):
+                            businesses_verified_by_llm += 1
+                            logger.info(f"  └─ 💾 SAVED {business.name} - LLM verified website → Playwright queue")
+                        else:
+                            logger.info(f"  └─ 💾 SAVED {business.name} - Has website → Playwright queue")
+                    elif business.website_validation_status in ["missing", "confirmed_missing"]:
+                        businesses_needing_websites += 1
+                        if business.website_validation_status == "confirmed_missing":
+                            businesses_verified_by_llm += 1
+                            logger.info(f"  └─ 💾 SAVED {business.name} - LLM confirmed: No website exists ✓")
+                        else:
+                            logger.info(f"  └─ 💾 SAVED {business.name} - No website found")
+                    else:
+                        businesses_with_valid_websites += 1
+                        logger.info(f"  └─ 💾 SAVED {business.name} - Website status: {business.website_validation_status}")
+                    
+                    # Publish validation progress event
+                    if self.progress_publisher:
+                        try:
+                            status = (
+                                "valid" if business.website_validation_status == "pending"
+                                else "no_website"
+                            )
+                            self.progress_publisher.publish_validation_complete(
+                                session_id=publish_id,
+                                business_id=str(business.id),
+                                status=status,
+                                validated_count=total_saved,
+                                total_count=len(raw_businesses)
+                            )
+                        except Exception as e:
+                            logger.warning(f"Failed to publish validation progress: {e}")
+                else:
+                    logger.warning(f"  └─ ⚠️  Failed to save business {biz_data.get('name')}")
+
+                # Track businesses that need Facebook activity enrichment:
+                # only when the feature is enabled and the business has a
+                # Facebook URL in its raw_data but no date yet.
+                if business and settings.ENABLE_FACEBOOK_ACTIVITY_CHECK:
+                    fb_url = extract_facebook_url_from_raw(
+                        business.raw_data or {}
+                    )
+                    if fb_url and business.last_facebook_post_date is None:
+                        businesses_for_facebook_check.append(str(business.id))
+            
+            # Analysed businesses waiting to be written: (biz_data, lead score)
+            pending_saves: List[tuple] = []
+            
+            async def flush_saves() -> None:
+                # One session → one writer at a time. Each micro-batch is a single
+                # gmb_id lookup plus one INSERT ... ON CONFLICT round trip.
+                async with pipeline.db_lock:
+                    batch = pending_saves[:]
+                    pending_saves.clear()
+                    if not batch:
+                        return
+                    try:
+                        async with pipeline.timings.track("save"):
+                            saved = await self.business_service.bulk_upsert_businesses(
+                                [biz_data for biz_data, _ in batch],
+                                coverage_grid_id=coverage_id,
+                                lead_scores=[score for _, score in batch]
+                            )
+                    except Exception as e:
+                        logger.error(f"  └─ ❌ Failed to save {len(batch)} businesses: {e}", exc_info=True)
+                        saved = [None] * len(batch)
+                    for (biz_data, _), business in zip(batch, saved):
+                        record_saved(biz_data, business)
+            
+            async def process_business(idx: int, biz_data: Dict[str, Any]) -> None:
+                async with pipeline.workers:
                     business_name = biz_data.get('name', 'Unknown')
-                    logger.info(f"🔍 [{idx+1}/{len(raw_businesses)}] Processing: {business_name}")
+                    position = pipeline.next_position()
+                    logger.info(f"🔍 [{position}/{len(raw_businesses)}] Processing: {business_name}")
                     
                     # Publish progress event (real-time updates for frontend)
                     if self.progress_publisher:
@@ -239,260 +333,49 @@ class HunterService:
                                 session_id=publish_id,
                                 business_id=biz_data.get("place_id") or f"idx_{idx}",
                                 business_name=business_name,
-                                current=idx + 1,
+                                current=position,
                                 total=len(raw_businesses)
                             )
                         except Exception as e:
                             logger.warning(f"Failed to publish progress event: {e}")
                     
                     try:
-                        # **ENHANCED: Use data quality service for comprehensive analysis**
-                        
-                        # 1. Geo-validation (ensure business is in correct region)
-                        logger.debug(f"  ├─ Running geo-validation...")
-                        # NOTE: biz_data already has "raw_data" key from scraper (line 303 in scraper.py)
-                        is_valid_geo, geo_reasons = data_quality_service.validate_geo_targeting(
-                            business=biz_data,
-                            target_country=country,
-                            target_state=state
+                        qualification_result = await self._analyze_scraped_business(
+                            biz_data=biz_data,
+                            city=city,
+                            state=state,
+                            country=country,
+                            data_quality_service=data_quality_service,
+                            website_validator=website_validator,
+                            llm_discovery=llm_discovery,
+                            pipeline=pipeline
                         )
-                        if not is_valid_geo:
-                            logger.warning(f"  └─ ❌ Geo-validation FAILED: {', '.join(geo_reasons)}")
-                            continue  # Skip businesses outside target region
-                        logger.debug(f"  ├─ ✅ Geo-validation PASSED")
-                        
-                        # 2. Multi-tier website detection
-                        logger.debug(f"  ├─ Running multi-tier website detection...")
-                        try:
-                            website_detection = data_quality_service.detect_website(biz_data)
-                            logger.debug(f"  │  └─ Result: type={website_detection.get('website_type')}, has_website={website_detection.get('has_website')}, url={website_detection.get('website_url')}")
-                            biz_data["website_type"] = website_detection.get("website_type", "none")
-                            biz_data["website_confidence"] = website_detection.get("confidence", 0.0)
-                        except Exception as e:
-                            logger.error(f"  │  └─ ❌ Website detection ERROR: {e}", exc_info=True)
-                            biz_data["website_type"] = "none"
-                            biz_data["website_confidence"] = 0.0
-                            website_detection = {"has_website": False, "website_url": None}
-                        
-                        # 3. Quality scoring (for analytics only, NOT for generation decisions)
-                        logger.debug(f"  ├─ Running quality scoring...")
-                        try:
-                            quality_analysis = data_quality_service.calculate_quality_score(biz_data)
-                            logger.debug(f"  │  └─ Score: {quality_analysis['score']}, Verified: {quality_analysis['verified']}, Operational: {quality_analysis['operational']}")
-                            biz_data["quality_score"] = quality_analysis["score"]
-                            biz_data["verified"] = quality_analysis["verified"]
-                            biz_data["operational"] = quality_analysis["operational"]
-                        except Exception as e:
-                            logger.error(f"  │  └─ ❌ Quality scoring ERROR: {e}", exc_info=True)
-                            biz_data["quality_score"] = 0.0
-                            biz_data["verified"] = False
-                            biz_data["operational"] = True
-                            quality_analysis = {"score": 0.0, "verified": False, "operational": True}
-                        
-                        # 4. HTTP validation for websites (quick check only)
-                        logger.debug(f"  ├─ Checking website URL...")
-                        website_url = website_detection.get("website_url") or biz_data.get("website_url")
-                        logger.debug(f"  │  └─ URL from detection: {website_detection.get('website_url')}, from biz_data: {biz_data.get('website_url')}")
-                        
-                        if website_url:
-                            logger.info(f"  ├─ 🌐 Quick HTTP check: {website_url}")
-                            try:
-                                simple_validation = await website_validator.validate_url(website_url)
-                                logger.debug(f"  │  └─ HTTP result: valid={simple_validation.is_valid}, accessible={simple_validation.is_accessible}, real_website={simple_validation.is_real_website}, status={simple_validation.status_code}")
-                                
-                                if simple_validation.is_valid or simple_validation.is_real_website:
-                                    # HTTP check passed - keep URL and queue for Playwright
-                                    biz_data["website_validation_status"] = "pending"
-                                    biz_data["website_url"] = website_url
-                                    logger.info(f"  │  └─ ✅ HTTP PASS → Will validate with Playwright")
-                                else:
-                                    # HTTP check failed - DON'T clear URL, mark for deep verification
-                                    biz_data["website_validation_status"] = "needs_verification"
-                                    biz_data["website_url"] = website_url  # Keep URL for ScrapingDog+LLM check
-                                    logger.info(f"  │  └─ ⚠️ HTTP FAIL → Will verify with ScrapingDog+LLM")
-                            except Exception as e:
-                                logger.error(f"  │  └─ ❌ HTTP check ERROR: {e}")
-                                biz_data["website_validation_status"] = "needs_verification"
-                                biz_data["website_url"] = website_url  # Keep URL
-                        else:
-                            # No URL found - will search with ScrapingDog
-                            biz_data["website_validation_status"] = "missing"
-                            logger.info(f"  ├─ 🚫 No website URL → Will search with ScrapingDog")
-                        
-                        # 5. DEEP VERIFICATION with ScrapingDog + LLM (CRITICAL FIX)
-                        # Run for: missing URLs OR failed HTTP validation
-                        if biz_data["website_validation_status"] in ["missing", "needs_verification"]:
-                            logger.info(f"  ├─ 🔍 Running DEEP VERIFICATION (ScrapingDog + LLM)...")
-                            
-                            try:
-                                # Use the llm_discovery service already initialized above
-                                discovery_result = await llm_discovery.discover_website(
-                                    business_name=biz_data["name"],
-                                    phone=biz_data.get("phone"),
-                                    address=biz_data.get("address"),
-                                    city=city,
-                                    state=state,
-                                    country=country
-                                )
-                                
-                                if discovery_result.get("found") and discovery_result.get("url"):
-                                    verified_url = discovery_result["url"]
-                                    confidence = discovery_result.get("confidence", 0)
-                                    
-                                    logger.info(
-                                        f"  │  └─ ✅ LLM VERIFIED: {verified_url} "
-                                        f"(confidence: {confidence:.0%})"
-                                    )
-                                    
-                                    # Update business data with verified website
-                                    biz_data["website_url"] = verified_url
-                                    biz_data["website_validation_status"] = "pending"  # Queue for Playwright
-                                    biz_data["verified"] = True
-                                    biz_data["discovered_urls"] = [verified_url]
-                                    
-                                    # Store ALL discovery data (ScrapingDog results + LLM analysis)
-                                    if not biz_data.get("raw_data"):
-                                        biz_data["raw_data"] = {}
-                                    biz_data["raw_data"]["llm_discovery"] = {
-                                        "url": verified_url,
-                                        "confidence": confidence,
-                                        "reasoning": discovery_result.get("reasoning"),
-                                        "verified_at": datetime.utcnow().isoformat(),
-                                        "method": "scrapingdog_llm",
-                                        "query": discovery_result.get("query"),
-                                        "llm_model": discovery_result.get("llm_model"),
-                                        # Store complete ScrapingDog search results
-                                        "scrapingdog_results": discovery_result.get("search_results"),
-                                        # Store LLM analysis details
-                                        "llm_analysis": discovery_result.get("llm_analysis")
-                                    }
-                                else:
-                                    logger.info(
-                                        f"  │  └─ ❌ LLM: No website found - "
-                                        f"{discovery_result.get('reasoning', 'Unknown')}"
-                                    )
-                                    
-                                    # Confirmed no website by deep search
-                                    biz_data["website_url"] = None
-                                    biz_data["website_validation_status"] = "confirmed_missing"
-                                    biz_data["verified"] = True  # Verified as having NO website
-                                    
-                                    # Store discovery data even when no website found (for debugging)
-                                    if not biz_data.get("raw_data"):
-                                        biz_data["raw_data"] = {}
-                                    biz_data["raw_data"]["llm_discovery"] = {
-                                        "url": None,
-                                        "confidence": discovery_result.get("confidence", 0.95),
-                                        "reasoning": discovery_result.get("reasoning"),
-                                        "verified_at": datetime.utcnow().isoformat(),
-                                        "method": "scrapingdog_llm",
-                                        "query": discovery_result.get("query"),
-                                        "llm_model": discovery_result.get("llm_model"),
-                                        "scrapingdog_results": discovery_result.get("search_results"),
-                                        "llm_analysis": discovery_result.get("llm_analysis")
-                                    }
-                                    
-                            except Exception as e:
-                                logger.error(f"  │  └─ ❌ Deep verification ERROR: {e}", exc_info=True)
-                                # If deep verification fails, fall back to original status
-                                if biz_data["website_validation_status"] == "needs_verification":
-                                    # Keep the Outscraper URL but mark as unverified
-                                    biz_data["website_validation_status"] = "pending"
-                                    biz_data["verified"] = False
-                                else:
-                                    # No URL and verification failed
-                                    biz_data["website_validation_status"] = "missing"
-                                    biz_data["verified"] = False
-                        
-                        # 6. Lead qualification
-                        logger.debug(f"  ├─ Running lead qualification...")
-                        qualification_result = self.qualifier.qualify(biz_data)
-                        score = qualification_result["score"]
-                        reasons = qualification_result["reasons"]
-                        logger.debug(f"  │  └─ Lead score: {score}, Reasons: {reasons}")
+                        if qualification_result is None:
+                            return  # Skip businesses outside target region
                         
                         # **SAVE ALL BUSINESSES** (we paid for them!)
-                        logger.debug(f"  ├─ Saving to database...")
                         logger.debug(f"  │  └─ Final biz_data: website_url={biz_data.get('website_url')}, validation_status={biz_data.get('website_validation_status')}, verified={biz_data.get('verified')}")
-                        business = await self.business_service.create_or_update_business(
-                            data=biz_data,
-                            source="outscraper_gmaps",
-                            coverage_grid_id=coverage_id,
-                            discovery_city=city,
-                            discovery_state=state,
-                            discovery_zone_id=zone_id,
-                            discovery_zone_lat=zone_lat,
-                            discovery_zone_lon=zone_lon,
-                            lead_score=score,
-                            qualification_reasons=reasons
-                        )
-                        
-                        if business:
-                            total_saved += 1
-                            if hasattr(business, '_is_new') and business._is_new:
-                                new_businesses += 1
-                            
-                            # Track website metrics
-                            if business.website_validation_status == "pending":
-                                businesses_to_validate.append(str(business.id))
-                                businesses_with_valid_websites += 1
-                                if biz_data.get("verified"):
-                                    businesses_verified_by_llm += 1
-                                    logger.info(f"  └─ 💾 SAVED - LLM verified website → Playwright queue")
-                                else:
-                                    logger.info(f"  └─ 💾 SAVED - Has website → Playwright queue")
-                            elif business.website_validation_status in ["missing", "confirmed_missing"]:
-                                businesses_needing_websites += 1
-                                if business.website_validation_status == "confirmed_missing":
-                                    businesses_verified_by_llm += 1
-                                    logger.info(f"  └─ 💾 SAVED - LLM confirmed: No website exists ✓")
-                                else:
-                                    logger.info(f"  └─ 💾 SAVED - No website found")
-                            else:
-                                businesses_with_valid_websites += 1
-                                logger.info(f"  └─ 💾 SAVED - Website status: {business.website_validation_status}")
-                            
-                            # Publish validation progress event
-                            if self.progress_publisher:
-                                try:
-                                    status = (
-                                        "valid" if business.website_validation_status == "pending"
-                                        else "no_website"
-                                    )
-                                    self.progress_publisher.publish_validation_complete(
-                                        session_id=publish_id,
-                                        business_id=str(business.id),
-                                        status=status,
-                                        validated_count=total_saved,
-                                        total_count=len(raw_businesses)
-                                    )
-                                except Exception as e:
-                                    logger.warning(f"Failed to publish validation progress: {e}")
-                        else:
-                            logger.warning(f"  └─ ⚠️  Failed to save business")
-
-                        # Track businesses that need Facebook activity enrichment:
-                        # only when the feature is enabled and the business has a
-                        # Facebook URL in its raw_data but no date yet.
-                        if business and settings.ENABLE_FACEBOOK_ACTIVITY_CHECK:
-                            fb_url = extract_facebook_url_from_raw(
-                                business.raw_data or {}
-                            )
-                            if fb_url and business.last_facebook_post_date is None:
-                                businesses_for_facebook_check.append(str(business.id))
-
-                        # Rate limiting for ScrapingDog (if we ran deep verification)
-                        if biz_data.get("verified") or biz_data["website_validation_status"] == "confirmed_missing":
-                            logger.debug(f"  └─ ⏱️  Rate limit: waiting {scrapingdog_delay}s...")
-                            await asyncio.sleep(scrapingdog_delay)
-                        
+                        pending_saves.append((biz_data, qualification_result["score"]))
                     except Exception as e:
                         logger.error(f"  └─ ❌ CRITICAL ERROR processing {business_name}: {e}", exc_info=True)
-                        continue
+                        return
+                
+                if len(pending_saves) >= pipeline.limits.save_batch_size:
+                    await flush_saves()
+            
+            # Simple HTTP validator for initial filtering (one session shared by all workers)
+            async with WebsiteValidator() as website_validator:
+                await asyncio.gather(*(
+                    process_business(idx, biz_data)
+                    for idx, biz_data in enumerate(raw_businesses)
+                ))
+            await flush_saves()
+            
+            stage_timings = pipeline.timings.to_dict()
+            logger.info(f"Zone {zone_id} pipeline timings: {stage_timings}")
             
             # **Queue Playwright validation for businesses with websites**
             if businesses_to_validate:
-                settings = get_settings()
                 if settings.ENABLE_AUTO_VALIDATION:
                     logger.info(f"Queuing {len(businesses_to_validate)} businesses for V2 validation pipeline")
                     try:
@@ -541,6 +424,7 @@ class HunterService:
                 "verified_by_llm": businesses_verified_by_llm,
                 "queued_for_playwright": len(businesses_to_validate),
                 "verification_rate": f"{(businesses_verified_by_llm / total_saved * 100):.1f}%" if total_saved > 0 else "0%",
+                "stage_timings": stage_timings,
                 "timestamp": datetime.utcnow().isoformat()
             }
             
@@ -619,7 +503,8 @@ class HunterService:
                     "needing_websites": businesses_needing_websites,
                     "verified_by_llm": businesses_verified_by_llm,
                     "queued_for_playwright": len(businesses_to_validate),
-                    "queued_for_generation": len(businesses_needing_generation)
+                    "queued_for_generation": len(businesses_needing_generation),
+                    "stage_timings": stage_timings
                 },
                 "progress": {
                     "total_zones": strategy.total_zones,
@@ -636,6 +521,203 @@ class HunterService:
             logger.error(f"Error scraping zone {zone_id}: {e}")
             raise ExternalAPIException(f"Failed to scrape zone: {str(e)}")
     
+    async def _analyze_scraped_business(
+        self,
+        biz_data: Dict[str, Any],
+        city: str,
+        state: str,
+        country: str,
+        data_quality_service: DataQualityService,
+        website_validator: WebsiteValidator,
+        llm_discovery: LLMDiscoveryService,
+        pipeline: ZonePipeline
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Run the pre-save stages for one scraped business, mutating ``biz_data``.
+        
+        Safe to run concurrently for many businesses: it never touches the DB
+        session, and network calls are bounded by the pipeline's semaphores.
+        
+        Returns:
+            Qualification result ({"score", "reasons", ...}), or None if the
+            business failed geo-validation and should not be saved.
+        """
+        timings = pipeline.timings
+        
+        # **ENHANCED: Use data quality service for comprehensive analysis**
+        
+        # 1. Geo-validation (ensure business is in correct region)
+        logger.debug(f"  ├─ Running geo-validation...")
+        # NOTE: biz_data already has "raw_data" key from scraper (line 303 in scraper.py)
+        async with timings.track("geo_validation"):
+            is_valid_geo, geo_reasons = data_quality_service.validate_geo_targeting(
+                business=biz_data,
+                target_country=country,
+                target_state=state
+            )
+        if not is_valid_geo:
+            logger.warning(f"  └─ ❌ Geo-validation FAILED: {', '.join(geo_reasons)}")
+            return None
+        logger.debug(f"  ├─ ✅ Geo-validation PASSED")
+        
+        # 2. Multi-tier website detection
+        logger.debug(f"  ├─ Running multi-tier website detection...")
+        try:
+            async with timings.track("website_detection"):
+                website_detection = data_quality_service.detect_website(biz_data)
+            logger.debug(f"  │  └─ Result: type={website_detection.get('website_type')}, has_website={website_detection.get('has_website')}, url={website_detection.get('website_url')}")
+            biz_data["website_type"] = website_detection.get("website_type", "none")
+            biz_data["website_confidence"] = website_detection.get("confidence", 0.0)
+        except Exception as e:
+            logger.error(f"  │  └─ ❌ Website detection ERROR: {e}", exc_info=True)
+            biz_data["website_type"] = "none"
+            biz_data["website_confidence"] = 0.0
+            website_detection = {"has_website": False, "website_url": None}
+        
+        # 3. Quality scoring (for analytics only, NOT for generation decisions)
+        logger.debug(f"  ├─ Running quality scoring...")
+        try:
+            async with timings.track("quality_scoring"):
+                quality_analysis = data_quality_service.calculate_quality_score(biz_data)
+            logger.debug(f"  │  └─ Score: {quality_analysis['score']}, Verified: {quality_analysis['verified']}, Operational: {quality_analysis['operational']}")
+            biz_data["quality_score"] = quality_analysis["score"]
+            biz_data["verified"] = quality_analysis["verified"]
+            biz_data["operational"] = quality_analysis["operational"]
+        except Exception as e:
+            logger.error(f"  │  └─ ❌ Quality scoring ERROR: {e}", exc_info=True)
+            biz_data["quality_score"] = 0.0
+            biz_data["verified"] = False
+            biz_data["operational"] = True
+        
+        # 4. HTTP validation for websites (quick check only)
+        logger.debug(f"  ├─ Checking website URL...")
+        website_url = website_detection.get("website_url") or biz_data.get("website_url")
+        logger.debug(f"  │  └─ URL from detection: {website_detection.get('website_url')}, from biz_data: {biz_data.get('website_url')}")
+        
+        if website_url:
+            logger.info(f"  ├─ 🌐 Quick HTTP check: {website_url}")
+            try:
+                async with pipeline.http:
+                    async with timings.track("http_check"):
+                        simple_validation = await website_validator.validate_url(website_url)
+                logger.debug(f"  │  └─ HTTP result: valid={simple_validation.is_valid}, accessible={simple_validation.is_accessible}, real_website={simple_validation.is_real_website}, status={simple_validation.status_code}")
+                
+                if simple_validation.is_valid or simple_validation.is_real_website:
+                    # HTTP check passed - keep URL and queue for Playwright
+                    biz_data["website_validation_status"] = "pending"
+                    biz_data["website_url"] = website_url
+                    logger.info(f"  │  └─ ✅ HTTP PASS → Will validate with Playwright")
+                else:
+                    # HTTP check failed - DON'T clear URL, mark for deep verification
+                    biz_data["website_validation_status"] = "needs_verification"
+                    biz_data["website_url"] = website_url  # Keep URL for ScrapingDog+LLM check
+                    logger.info(f"  │  └─ ⚠️ HTTP FAIL → Will verify with ScrapingDog+LLM")
+            except Exception as e:
+                logger.error(f"  │  └─ ❌ HTTP check ERROR: {e}")
+                biz_data["website_validation_status"] = "needs_verification"
+                biz_data["website_url"] = website_url  # Keep URL
+        else:
+            # No URL found - will search with ScrapingDog
+            biz_data["website_validation_status"] = "missing"
+            logger.info(f"  ├─ 🚫 No website URL → Will search with ScrapingDog")
+        
+        # 5. DEEP VERIFICATION with ScrapingDog + LLM (CRITICAL FIX)
+        # Run for: missing URLs OR failed HTTP validation
+        if biz_data["website_validation_status"] in ["missing", "needs_verification"]:
+            logger.info(f"  ├─ 🔍 Running DEEP VERIFICATION (ScrapingDog + LLM)...")
+            
+            try:
+                async with pipeline.discovery:
+                    async with timings.track("discovery"):
+                        discovery_result = await llm_discovery.discover_website(
+                            business_name=biz_data["name"],
+                            phone=biz_data.get("phone"),
+                            address=biz_data.get("address"),
+                            city=city,
+                            state=state,
+                            country=country
+                        )
+                    # Rate limiting for ScrapingDog: each discovery slot pauses
+                    # before taking the next business (replaces the serial 1s sleep).
+                    if pipeline.limits.discovery_delay:
+                        await asyncio.sleep(pipeline.limits.discovery_delay)
+                
+                if discovery_result.get("found") and discovery_result.get("url"):
+                    verified_url = discovery_result["url"]
+                    confidence = discovery_result.get("confidence", 0)
+                    
+                    logger.info(
+                        f"  │  └─ ✅ LLM VERIFIED: {verified_url} "
+                        f"(confidence: {confidence:.0%})"
+                    )
+                    
+                    # Update business data with verified website
+                    biz_data["website_url"] = verified_url
+                    biz_data["website_validation_status"] = "pending"  # Queue for Playwright
+                    biz_data["verified"] = True
+                    biz_data["discovered_urls"] = [verified_url]
+                    
+                    # Store ALL discovery data (ScrapingDog results + LLM analysis)
+                    if not biz_data.get("raw_data"):
+                        biz_data["raw_data"] = {}
+                    biz_data["raw_data"]["llm_discovery"] = {
+                        "url": verified_url,
+                        "confidence": confidence,
+                        "reasoning": discovery_result.get("reasoning"),
+                        "verified_at": datetime.utcnow().isoformat(),
+                        "method": "scrapingdog_llm",
+                        "query": discovery_result.get("query"),
+                        "llm_model": discovery_result.get("llm_model"),
+                        # Store complete ScrapingDog search results
+                        "scrapingdog_results": discovery_result.get("search_results"),
+                        # Store LLM analysis details
+                        "llm_analysis": discovery_result.get("llm_analysis")
+                    }
+                else:
+                    logger.info(
+                        f"  │  └─ ❌ LLM: No website found - "
+                        f"{discovery_result.get('reasoning', 'Unknown')}"
+                    )
+                    
+                    # Confirmed no website by deep search
+                    biz_data["website_url"] = None
+                    biz_data["website_validation_status"] = "confirmed_missing"
+                    biz_data["verified"] = True  # Verified as having NO website
+                    
+                    # Store discovery data even when no website found (for debugging)
+                    if not biz_data.get("raw_data"):
+                        biz_data["raw_data"] = {}
+                    biz_data["raw_data"]["llm_discovery"] = {
+                        "url": None,
+                        "confidence": discovery_result.get("confidence", 0.95),
+                        "reasoning": discovery_result.get("reasoning"),
+                        "verified_at": datetime.utcnow().isoformat(),
+                        "method": "scrapingdog_llm",
+                        "query": discovery_result.get("query"),
+                        "llm_model": discovery_result.get("llm_model"),
+                        "scrapingdog_results": discovery_result.get("search_results"),
+                        "llm_analysis": discovery_result.get("llm_analysis")
+                    }
+                    
+            except Exception as e:
+                logger.error(f"  │  └─ ❌ Deep verification ERROR: {e}", exc_info=True)
+                # If deep verification fails, fall back to original status
+                if biz_data["website_validation_status"] == "needs_verification":
+                    # Keep the Outscraper URL but mark as unverified
+                    biz_data["website_validation_status"] = "pending"
+                    biz_data["verified"] = False
+                else:
+                    # No URL and verification failed
+                    biz_data["website_validation_status"] = "missing"
+                    biz_data["verified"] = False
+        
+        # 6. Lead qualification
+        logger.debug(f"  ├─ Running lead qualification...")
+        async with timings.track("qualification"):
+            qualification_result = self.qualifier.qualify(biz_data)
+        logger.debug(f"  │  └─ Lead score: {qualification_result['score']}, Reasons: {qualification_result['reasons']}")
+        return qualification_result
+    
     async def scrape_all_zones_for_strategy(
         self,
         strategy_id: str,
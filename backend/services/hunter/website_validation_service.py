@@ -16,9 +16,13 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from models.business import Business
 from models.website_validation import WebsiteValidation
+from services.validation.reachability_cache import get_reachability_cache
 
 logger = logging.getLogger(__name__)
 
+# Reachability cache namespace for accessibility (HEAD) results
+HTTP_CACHE_NAMESPACE = "accessibility"
+
 
 @dataclass
 class ValidationResult:
@@ -98,6 +102,7 @@ class WebsiteValidationService:
         self.db = db
         self.timeout = timeout
         self.session: Optional[aiohttp.ClientSession] = None
+        self.reachability = get_reachability_cache()
     
     async def __aenter__(self):
         """Async context manager entry - create HTTP session."""
@@ -242,18 +247,43 @@ class WebsiteValidationService:
         """
         Check if URL is accessible via HTTP HEAD request.
         
+        Results are shared through the reachability cache; hosts known not
+        to resolve are reported without a request.
+        
         Args:
             url: URL to check
             
         Returns:
             Dict with accessible, status_code, response_time_ms, error, accessibility
         """
-        start_time = datetime.utcnow()
-        
         # Ensure URL has protocol
         if not url.startswith(('http://', 'https://')):
             url = 'https://' + url
         
+        # Shared result of an earlier check of this URL (any worker)
+        cached = await self.reachability.get_http(HTTP_CACHE_NAMESPACE, url)
+        if cached is not None:
+            return cached
+        
+        # Known-dead host (NXDOMAIN) - no request needed
+        if await self.reachability.resolves(url) is False:
+            return {
+                'accessible': False,
+                'error': 'dns_not_found',
+                'accessibility': 'inaccessible'
+            }
+        
+        result = await self._head_request(url)
+        if result.get('error') != 'unknown_error':
+            await self.reachability.put_http(
+                HTTP_CACHE_NAMESPACE, url, result, failed='status_code' not in result
+            )
+        return result
+    
+    async def _head_request(self, url: str) -> Dict[str, Any]:
+        """HEAD the URL and classify the response (never raises)."""
+        start_time = datetime.utcnow()
+        
         try:
             # Try HEAD request first (faster, doesn't download content)
             async with self.session.head(url, allow_redirects=True, ssl=False) as response:
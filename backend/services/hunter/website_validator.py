@@ -17,12 +17,17 @@ from typing import Optional, Dict, Any, List
 from urllib.parse import urlparse
 import re
 
+from services.validation.reachability_cache import get_reachability_cache
+
 logger = logging.getLogger(__name__)
 
 # Timeout for HTTP requests (seconds)
 # Increased to 30s to accommodate slow-loading legitimate business websites
 REQUEST_TIMEOUT = 30
 
+# Reachability cache namespace for this validator's fetch results
+HTTP_CACHE_NAMESPACE = "hunter"
+
 # Non-website domains (social media, directories, etc.)
 NON_WEBSITE_DOMAINS = {
     "facebook.com",
@@ -100,6 +105,7 @@ class WebsiteValidator:
     def __init__(self, timeout: int = REQUEST_TIMEOUT):
         self.timeout = timeout
         self.session: Optional[aiohttp.ClientSession] = None
+        self.reachability = get_reachability_cache()
     
     async def __aenter__(self):
         """Async context manager entry."""
@@ -233,98 +239,49 @@ class WebsiteValidator:
                     error_message="Social media or directory listing, not a real website"
                 )
             
-            # Try to fetch the URL
             if not self.session:
                 raise RuntimeError("WebsiteValidator must be used as async context manager")
             
-            async with self.session.get(
-                normalized_url,
-                allow_redirects=True,
-                ssl=False  # Don't verify SSL to avoid certificate errors
-            ) as response:
-                status_code = response.status
-                final_url = str(response.url)
-                
-                # Check if accessible (2xx status code)
-                is_accessible = 200 <= status_code < 300
-                
-                # IMPORTANT: 403/429 often means anti-bot protection, not a broken site
-                # These businesses likely HAVE websites, they're just protected
-                if not is_accessible:
-                    # 403 Forbidden or 429 Too Many Requests = Protected website (likely valid)
-                    if status_code in [403, 429]:
-                        return WebsiteValidationResult(
-                            url=normalized_url,
-                            is_valid=True,  # Assume valid - just protected
-                            is_accessible=False,
-                            status_code=status_code,
-                            final_url=final_url,
-                            error_message=f"Protected by anti-bot (HTTP {status_code}) - likely valid website"
-                        )
-                    # 404 Not Found or other errors = Actually broken
-                    else:
-                        return WebsiteValidationResult(
-                            url=normalized_url,
-                            is_valid=False,
-                            is_accessible=False,
-                            status_code=status_code,
-                            final_url=final_url,
-                            error_message=f"HTTP {status_code}"
-                        )
-                
-                # Get content
-                html = await response.text()
-                
-                # Check if final URL is social media (after redirects)
-                if self._is_social_media_or_directory(final_url):
-                    return WebsiteValidationResult(
-                        url=normalized_url,
-                        is_valid=False,
-                        is_accessible=True,
-                        is_real_website=False,
-                        status_code=status_code,
-                        final_url=final_url,
-                        error_message="Redirects to social media or directory"
-                    )
-                
-                # Check for meaningful content
-                has_content = self._has_meaningful_content(html)
-                
-                # Everything checks out - this is a valid website
-                if has_content:
-                    return WebsiteValidationResult(
-                        url=normalized_url,
-                        is_valid=True,
-                        is_accessible=True,
-                        is_real_website=True,
-                        has_content=True,
-                        status_code=status_code,
-                        final_url=final_url
-                    )
-                else:
-                    return WebsiteValidationResult(
-                        url=normalized_url,
-                        is_valid=False,
-                        is_accessible=True,
-                        is_real_website=True,
-                        has_content=False,
-                        status_code=status_code,
-                        final_url=final_url,
-                        error_message="Insufficient content (possible placeholder/parked domain)"
-                    )
+            # Shared result of an earlier check of this URL (any worker)
+            cached = await self.reachability.get_http(HTTP_CACHE_NAMESPACE, normalized_url)
+            if cached is not None:
+                return WebsiteValidationResult(**cached)
+            
+            # Known-dead host (NXDOMAIN) - don't wait on a connection error
+            if await self.reachability.resolves(normalized_url) is False:
+                return WebsiteValidationResult(
+                    url=normalized_url,
+                    is_valid=False,
+                    error_message="Domain does not resolve"
+                )
+            
+            # Try to fetch the URL
+            result = await self._fetch(normalized_url)
+            await self.reachability.put_http(
+                HTTP_CACHE_NAMESPACE, normalized_url, result.to_dict(), failed=False
+            )
+            return result
         
         except asyncio.TimeoutError:
-            return WebsiteValidationResult(
+            result = WebsiteValidationResult(
                 url=url,
                 is_valid=False,
                 error_message=f"Timeout after {self.timeout}s"
             )
+            await self.reachability.put_http(
+                HTTP_CACHE_NAMESPACE, normalized_url, result.to_dict(), failed=True
+            )
+            return result
         except aiohttp.ClientError as e:
-            return WebsiteValidationResult(
+            result = WebsiteValidationResult(
                 url=url,
                 is_valid=False,
                 error_message=f"Connection error: {str(e)}"
             )
+            await self.reachability.put_http(
+                HTTP_CACHE_NAMESPACE, normalized_url, result.to_dict(), failed=True
+            )
+            return result
         except Exception as e:
             logger.error(f"Unexpected error validating {url}: {str(e)}")
             return WebsiteValidationResult(
@@ -333,6 +290,89 @@ class WebsiteValidator:
                 error_message=f"Validation error: {str(e)}"
             )
     
+    async def _fetch(self, normalized_url: str) -> WebsiteValidationResult:
+        """GET the URL and judge the response (raises on timeout / connection errors)."""
+        async with self.session.get(
+            normalized_url,
+            allow_redirects=True,
+            ssl=False  # Don't verify SSL to avoid certificate errors
+        ) as response:
+            status_code = response.status
+            final_url = str(response.url)
+            
+            # Check if accessible (2xx status code)
+            is_accessible = 200 <= status_code < 300
+            
+            # IMPORTANT: 403/429 often means anti-bot protection, not a broken site
+            # These businesses likely HAVE websites, they're just protected
+            if not is_accessible:
+                # 403 Forbidden or 429 Too Many Requests = Protected website (likely valid)
+                if status_code in [403, 429]:
+                    return WebsiteValidationResult(
+                        url=normalized_url,
+                        is_valid=True,  # Assume valid - just protected
+                        is_accessible=False,
+                        status_code=status_code,
+                        final_url=final_url,
+                        error_message=f"Protected by anti-bot (HTTP {status_code}) - likely valid website"
+                    )
+                # 404 Not Found or other errors = Actually broken
+                else:
+                    return WebsiteValidationResult(
+                        url=normalized_url,
+                        is_valid=False,
+                        is_accessible=False,
+                        status_code=status_code,
+                        final_url=final_url,
+                        error_message=f"HTTP {status_code}"
+                    )
+            
+            # Get content
+            html = await response.text()
+            
+            # Check if final URL is social media (after redirects)
+            if self._is_social_media_or_directory(final_url):
+                return WebsiteValidationResult(
+                    url=normalized_url,
+                    is_valid=False,
+                    is_accessible=True,
+                    is_real_website=False,
+                    status_code=status_code,
+                    final_url=final_url,
+                    error_message="Redirects to social media or directory"
+                )
+            
+            # Check for meaningful content
+            has_content = self._has_meaningful_content(html)
+            
+            # Everything checks out - this is a valid website
+            if has_content:
+                # Let the validation static tier reuse this page instead of
+                # re-fetching it; keyed by the host that actually served it
+                if "html" in response.headers.get("Content-Type", "").lower():
+                    await self.reachability.put_html(final_url, html)
+                
+                return WebsiteValidationResult(
+                    url=normalized_url,
+                    is_valid=True,
+                    is_accessible=True,
+                    is_real_website=True,
+                    has_content=True,
+                    status_code=status_code,
+                    final_url=final_url
+                )
+            else:
+                return WebsiteValidationResult(
+                    url=normalized_url,
+                    is_valid=False,
+                    is_accessible=True,
+                    is_real_website=True,
+                    has_content=False,
+                    status_code=status_code,
+                    final_url=final_url,
+                    error_message="Insufficient content (possible placeholder/parked domain)"
+                )
+    
     async def validate_batch(
         self,
         urls: List[str],
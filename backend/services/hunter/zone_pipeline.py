@@ -0,0 +1,102 @@
+"""
+Concurrency primitives for the per-business zone pipeline.
+
+HunterService fans out the per-business work of a scraped zone (geo checks,
+HTTP validation, ScrapingDog + LLM discovery, qualification) across a bounded
+number of workers. Network-bound stages get their own limits so a burst of
+quick HTTP checks can't starve the (rate-limited) discovery calls, and every
+stage is timed so the zone summary shows where the wall-clock time went.
+
+Database writes are NOT parallelised: a single AsyncSession can't run
+concurrent statements, so analysed businesses are buffered and written in
+micro-batches (BusinessService.bulk_upsert_businesses) behind ``db_lock``.
+"""
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Dict, Any, Optional
+
+from core.config import get_settings
+
+
+@dataclass
+class PipelineLimits:
+    """Concurrency budget for one zone pipeline run."""
+
+    workers: int = 8
+    http_concurrency: int = 10
+    discovery_concurrency: int = 2
+    discovery_delay: float = 1.0
+    save_batch_size: int = 25
+
+    @classmethod
+    def from_settings(cls, workers: Optional[int] = None) -> "PipelineLimits":
+        """Build limits from application settings (``workers`` overrides)."""
+        settings = get_settings()
+        return cls(
+            workers=max(1, workers or settings.HUNTER_PIPELINE_WORKERS),
+            http_concurrency=max(1, settings.HUNTER_HTTP_CONCURRENCY),
+            discovery_concurrency=max(1, settings.HUNTER_DISCOVERY_CONCURRENCY),
+            discovery_delay=max(0.0, settings.HUNTER_DISCOVERY_DELAY_SECONDS),
+            save_batch_size=max(1, settings.HUNTER_SAVE_BATCH_SIZE),
+        )
+
+
+class StageTimings:
+    """
+    Accumulates wall-clock time spent in each pipeline stage.
+
+    Times are summed across workers, so with concurrency the per-stage totals
+    can exceed the zone's elapsed time — that ratio is the speed-up.
+    """
+
+    def __init__(self):
+        self._totals: Dict[str, float] = {}
+        self._counts: Dict[str, int] = {}
+        self._started = time.perf_counter()
+
+    def record(self, stage: str, seconds: float) -> None:
+        self._totals[stage] = self._totals.get(stage, 0.0) + seconds
+        self._counts[stage] = self._counts.get(stage, 0) + 1
+
+    @asynccontextmanager
+    async def track(self, stage: str):
+        """Time the enclosed block and add it to ``stage``."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - start)
+
+    def to_dict(self) -> Dict[str, Any]:
+        stages = {
+            stage: {
+                "count": self._counts[stage],
+                "total_s": round(total, 3),
+                "avg_ms": round(total / self._counts[stage] * 1000, 1),
+            }
+            for stage, total in self._totals.items()
+        }
+        return {
+            "elapsed_s": round(time.perf_counter() - self._started, 3),
+            "stages": stages,
+        }
+
+
+class ZonePipeline:
+    """Shared semaphores and lock for one zone's concurrent business processing."""
+
+    def __init__(self, limits: PipelineLimits):
+        self.limits = limits
+        self.workers = asyncio.Semaphore(limits.workers)
+        self.http = asyncio.Semaphore(limits.http_concurrency)
+        self.discovery = asyncio.Semaphore(limits.discovery_concurrency)
+        self.db_lock = asyncio.Lock()
+        self.timings = StageTimings()
+        self._started = 0
+
+    def next_position(self) -> int:
+        """1-based position of the business that just started (for progress events)."""
+        self._started += 1
+        return self._started
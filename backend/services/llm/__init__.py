@@ -0,0 +1,14 @@
+"""
+Shared Claude API plumbing.
+
+Provides the LLM gateway every Claude call goes through, prompt-caching
+helpers and an offline Message Batches client.
+"""
+from services.llm.gateway import LLMGateway, get_llm_gateway, message_text
+from services.llm.prompt_cache import cached_system
+from services.llm.message_batches import BatchItemResult, MessageBatchClient
+
+__all__ = [
+    "LLMGateway", "get_llm_gateway", "message_text",
+    "cached_system", "BatchItemResult", "MessageBatchClient",
+]
@@ -0,0 +1,260 @@
+"""
+LLM gateway - the single path to the Claude Messages API.
+
+- One pooled AsyncAnthropic client per event loop, shared by every caller
+  in the process (the SDK's own retries are off; the gateway owns them)
+- A per-model concurrency cap inside the process
+- A per-model token bucket in Redis, so the API and all Celery workers draw
+  from one request budget and bursts queue instead of hitting 429s
+- Jittered exponential backoff on 429 / 529 / 5xx / connection errors,
+  honouring retry-after
+- Latency and token counters per caller, aggregated in Redis
+
+Usage:
+    gateway = get_llm_gateway()
+    message = await gateway.create("validation", model=..., max_tokens=..., messages=[...])
+    message = await gateway.stream("creative.architect", **params)  # long generations
+    text = message_text(message)
+"""
+import asyncio
+import logging
+import random
+import time
+import weakref
+from typing import Any, Dict, Optional
+
+from anthropic import APIConnectionError, APIStatusError, AsyncAnthropic
+from anthropic.types import Message
+
+from core.config import get_settings
+from services.progress.token_bucket import TokenBucket
+from services.progress.redis_service import RedisService
+
+logger = logging.getLogger(__name__)
+
+BUCKET_KEY_PREFIX = "llm:bucket:"
+METRICS_KEY_PREFIX = "llm:metrics:"
+CALLERS_KEY = "llm:metrics:callers"
+
+# Status codes worth retrying: rate limited, overloaded, transient server errors
+_RETRYABLE_STATUS = {408, 429, 500, 502, 503, 504, 529}
+
+
+def message_text(message: Message) -> str:
+    """Concatenated text blocks of a response (like stream.get_final_text())."""
+    return "".join(block.text for block in message.content if block.type == "text")
+
+
+class LLMGateway:
+    """
+    Rate-limited, retrying Claude client with per-caller accounting.
+
+    ``caller`` is a short dotted tag (e.g. "validation", "creative.architect")
+    used for metrics and logs only.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        max_concurrency_per_model: int = 8,
+        requests_per_minute: int = 0,
+        burst: int = 10,
+        max_retries: int = 5,
+        retry_base_seconds: float = 1.0,
+        retry_max_seconds: float = 60.0
+    ):
+        """
+        Args:
+            api_key: Anthropic API key
+            max_concurrency_per_model: In-flight requests per model in this process
+            requests_per_minute: Shared request budget per model (0 = no shared limit)
+            burst: Requests allowed at once when the budget is full
+            max_retries: Retries for retryable errors before giving up
+            retry_base_seconds: First backoff delay (doubles each retry)
+            retry_max_seconds: Backoff ceiling
+        """
+        self.api_key = api_key
+        self.max_concurrency_per_model = max(1, max_concurrency_per_model)
+        self.requests_per_minute = requests_per_minute
+        self.burst = burst
+        self.max_retries = max_retries
+        self.retry_base_seconds = retry_base_seconds
+        self.retry_max_seconds = retry_max_seconds
+        self._clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncAnthropic]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Semaphore]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._buckets: Dict[str, TokenBucket] = {}
+
+    def client(self) -> AsyncAnthropic:
+        """Pooled client bound to the running loop."""
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None:
+            client = AsyncAnthropic(api_key=self.api_key, max_retries=0)
+            self._clients[loop] = client
+        return client
+
+    async def create(self, caller: str, **params: Any) -> Message:
+        """messages.create() through the gateway."""
+        return await self._call(caller, params, stream=False)
+
+    async def stream(self, caller: str, **params: Any) -> Message:
+        """
+        messages.stream() through the gateway, returning the final message.
+
+        Streaming avoids the SDK's non-streaming timeout guard for large
+        max_tokens; a retry restarts the whole stream.
+        """
+        return await self._call(caller, params, stream=True)
+
+    async def _call(self, caller: str, params: Dict[str, Any], stream: bool) -> Message:
+        model = params.get("model", "unknown")
+        attempt = 0
+        while True:
+            async with self._semaphore(model):
+                bucket = self._bucket(model)
+                if bucket is not None:
+                    await bucket.acquire()
+                started = time.monotonic()
+                try:
+                    message = await self._send(params, stream)
+                except Exception as e:
+                    latency_ms = int((time.monotonic() - started) * 1000)
+                    if not self._is_retryable(e) or attempt >= self.max_retries:
+                        await self._record(caller, latency_ms, None, error=True, retries=attempt)
+                        raise
+                    delay = self._backoff_seconds(attempt, e)
+                    error_name = type(e).__name__
+                else:
+                    latency_ms = int((time.monotonic() - started) * 1000)
+                    await self._record(caller, latency_ms, message, error=False, retries=attempt)
+                    logger.debug(
+                        f"🤖 [{caller}] {model} {latency_ms}ms "
+                        f"in={message.usage.input_tokens} out={message.usage.output_tokens}"
+                    )
+                    return message
+
+            # Back off outside the semaphore so waiting calls don't hold a slot
+            attempt += 1
+            logger.warning(
+                f"⏳ [{caller}] {error_name} from {model} - "
+                f"retry {attempt}/{self.max_retries} in {delay:.1f}s"
+            )
+            await asyncio.sleep(delay)
+
+    async def _send(self, params: Dict[str, Any], stream: bool) -> Message:
+        client = self.client()
+        if not stream:
+            return await client.messages.create(**params)
+        async with client.messages.stream(**params) as response_stream:
+            return await response_stream.get_final_message()
+
+    def _semaphore(self, model: str) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        semaphores = self._semaphores.setdefault(loop, {})
+        if model not in semaphores:
+            semaphores[model] = asyncio.Semaphore(self.max_concurrency_per_model)
+        return semaphores[model]
+
+    def _bucket(self, model: str) -> Optional[TokenBucket]:
+        if self.requests_per_minute <= 0:
+            return None
+        if model not in self._buckets:
+            self._buckets[model] = TokenBucket(
+                BUCKET_KEY_PREFIX + model, self.requests_per_minute / 60.0, self.burst
+            )
+        return self._buckets[model]
+
+    @staticmethod
+    def _is_retryable(error: Exception) -> bool:
+        if isinstance(error, APIStatusError):
+            return error.status_code in _RETRYABLE_STATUS
+        return isinstance(error, APIConnectionError)
+
+    def _backoff_seconds(self, attempt: int, error: Exception) -> float:
+        delay = min(self.retry_max_seconds, self.retry_base_seconds * (2 ** attempt))
+        delay *= random.uniform(0.5, 1.0)
+        if isinstance(error, APIStatusError):
+            try:
+                delay = max(delay, float(error.response.headers.get("retry-after", 0)))
+            except (TypeError, ValueError):
+                pass
+        return delay
+
+    # ── Metrics (Redis) ─────────────────────────────────────────
+
+    async def _record(
+        self,
+        caller: str,
+        latency_ms: int,
+        message: Optional[Message],
+        error: bool,
+        retries: int
+    ) -> None:
+        try:
+            redis = RedisService.get_async_client()
+            key = METRICS_KEY_PREFIX + caller
+            async with redis.pipeline(transaction=False) as pipe:
+                pipe.sadd(CALLERS_KEY, caller)
+                pipe.hincrby(key, "calls", 1)
+                pipe.hincrby(key, "latency_ms", latency_ms)
+                if retries:
+                    pipe.hincrby(key, "retries", retries)
+                if error:
+                    pipe.hincrby(key, "errors", 1)
+                if message is not None:
+                    usage = message.usage
+                    pipe.hincrby(key, "input_tokens", usage.input_tokens)
+                    pipe.hincrby(key, "output_tokens", usage.output_tokens)
+                    pipe.hincrby(key, "cache_read_tokens", usage.cache_read_input_tokens or 0)
+                    pipe.hincrby(key, "cache_write_tokens", usage.cache_creation_input_tokens or 0)
+                await pipe.execute()
+        except Exception as e:
+            logger.debug(f"LLM metrics write skipped: {e}")
+
+    async def get_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns:
+            {caller: {"calls", "errors", "retries", "input_tokens", "output_tokens",
+                      "cache_read_tokens", "cache_write_tokens", "avg_latency_ms"}}
+        """
+        metrics: Dict[str, Dict[str, Any]] = {}
+        try:
+            redis = RedisService.get_async_client()
+            for caller in sorted(await redis.smembers(CALLERS_KEY)):
+                counters = await redis.hgetall(METRICS_KEY_PREFIX + caller) or {}
+                calls = int(counters.get("calls", 0))
+                metrics[caller] = {
+                    field: int(counters.get(field, 0))
+                    for field in (
+                        "calls", "errors", "retries", "input_tokens", "output_tokens",
+                        "cache_read_tokens", "cache_write_tokens",
+                    )
+                }
+                metrics[caller]["avg_latency_ms"] = (
+                    int(counters.get("latency_ms", 0)) // calls if calls else 0
+                )
+        except Exception as e:
+            logger.debug(f"LLM metrics unavailable: {e}")
+        return metrics
+
+
+_gateway: Optional[LLMGateway] = None
+
+
+def get_llm_gateway() -> LLMGateway:
+    """Get the process-wide LLM gateway."""
+    global _gateway
+    if _gateway is None:
+        settings = get_settings()
+        _gateway = LLMGateway(
+            api_key=settings.ANTHROPIC_API_KEY,
+            max_concurrency_per_model=settings.LLM_GATEWAY_MAX_CONCURRENCY_PER_MODEL,
+            requests_per_minute=settings.LLM_GATEWAY_REQUESTS_PER_MINUTE,
+            burst=settings.LLM_GATEWAY_BURST,
+            max_retries=settings.LLM_GATEWAY_MAX_RETRIES,
+        )
+    return _gateway
@@ -0,0 +1,153 @@
+"""
+Message Batches client for offline LLM runs.
+
+Bulk re-validation and discovery backfills don't need an answer within
+seconds. Submitting them through the Message Batches API halves the token
+price and avoids per-minute rate limits; results usually arrive within the
+hour (at most 24h).
+
+Flow:
+    client = MessageBatchClient()
+    batch_id = await client.submit(requests)              # [{"custom_id", "params"}]
+    client.save_pending(batch_id, "validation", context)  # what to apply later
+    ...
+    if await client.is_ended(batch_id):
+        async for item in client.iter_results(batch_id):
+            ...
+
+Per-request context is kept in Redis until the batch has been applied.
+"""
+import json
+import logging
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from anthropic import AsyncAnthropic
+
+from core.config import get_settings
+from services.progress.redis_service import RedisService
+
+logger = logging.getLogger(__name__)
+
+PENDING_KEY_PREFIX = "llmbatch:pending:"
+
+# API limit per batch
+MAX_REQUESTS_PER_BATCH = 10000
+
+
+@dataclass
+class BatchItemResult:
+    """Outcome of one request in a Message Batch."""
+    custom_id: str
+    text: Optional[str] = None
+    input_tokens: int = 0
+    output_tokens: int = 0
+    error: Optional[str] = None
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None and self.text is not None
+
+    @property
+    def total_tokens(self) -> int:
+        return self.input_tokens + self.output_tokens
+
+
+class MessageBatchClient:
+    """Thin wrapper over client.messages.batches plus pending-context storage."""
+
+    def __init__(self, client: Optional[AsyncAnthropic] = None):
+        settings = get_settings()
+        self.client = client or AsyncAnthropic(api_key=settings.ANTHROPIC_API_KEY)
+        self.pending_ttl_seconds = settings.LLM_BATCH_PENDING_TTL_SECONDS
+
+    async def submit(self, requests: List[Dict[str, Any]]) -> str:
+        """
+        Create a Message Batch.
+
+        Args:
+            requests: [{"custom_id": str, "params": messages.create kwargs}, ...]
+
+        Returns:
+            Batch ID
+        """
+        if not requests:
+            raise ValueError("Cannot submit an empty message batch")
+        if len(requests) > MAX_REQUESTS_PER_BATCH:
+            raise ValueError(
+                f"Message batch too large ({len(requests)} > {MAX_REQUESTS_PER_BATCH}); split it"
+            )
+        batch = await self.client.messages.batches.create(requests=requests)
+        logger.info(f"📦 Submitted message batch {batch.id} ({len(requests)} requests)")
+        return batch.id
+
+    async def status(self, batch_id: str) -> Tuple[str, Dict[str, int]]:
+        """
+        Returns:
+            (processing_status, request_counts) - status is in_progress | canceling | ended
+        """
+        batch = await self.client.messages.batches.retrieve(batch_id)
+        counts = batch.request_counts
+        return batch.processing_status, {
+            "processing": counts.processing,
+            "succeeded": counts.succeeded,
+            "errored": counts.errored,
+            "canceled": counts.canceled,
+            "expired": counts.expired,
+        }
+
+    async def is_ended(self, batch_id: str) -> bool:
+        processing_status, counts = await self.status(batch_id)
+        logger.info(f"Message batch {batch_id}: {processing_status} {counts}")
+        return processing_status == "ended"
+
+    async def iter_results(self, batch_id: str) -> AsyncIterator[BatchItemResult]:
+        """Yield one BatchItemResult per request (any order)."""
+        async for entry in await self.client.messages.batches.results(batch_id):
+            result = entry.result
+            if result.type == "succeeded":
+                message = result.message
+                yield BatchItemResult(
+                    custom_id=entry.custom_id,
+                    text=message.content[0].text if message.content else "",
+                    input_tokens=message.usage.input_tokens,
+                    output_tokens=message.usage.output_tokens,
+                )
+            elif result.type == "errored":
+                yield BatchItemResult(custom_id=entry.custom_id, error=str(result.error))
+            else:
+                # canceled / expired
+                yield BatchItemResult(custom_id=entry.custom_id, error=result.type)
+
+    # ── Pending context (Redis) ─────────────────────────────────
+
+    def save_pending(self, batch_id: str, kind: str, items: Dict[str, Any]) -> None:
+        """
+        Store what is needed to apply the batch's results later.
+
+        Args:
+            batch_id: Message batch ID
+            kind: Consumer name (e.g. "validation", "discovery")
+            items: custom_id -> JSON-serialisable context
+
+        Raises:
+            RuntimeError: If Redis is unavailable (results could never be applied)
+        """
+        redis = RedisService.get_client()
+        if not RedisService.is_available():
+            raise RuntimeError("Redis unavailable - cannot track message batch context")
+        redis.set(
+            PENDING_KEY_PREFIX + batch_id,
+            json.dumps({"kind": kind, "items": items}, default=str),
+            ex=self.pending_ttl_seconds,
+        )
+
+    @staticmethod
+    def load_pending(batch_id: str) -> Optional[Dict[str, Any]]:
+        """Returns {"kind", "items"} or None if unknown/expired."""
+        raw = RedisService.get_client().get(PENDING_KEY_PREFIX + batch_id)
+        return json.loads(raw) if raw else None
+
+    @staticmethod
+    def clear_pending(batch_id: str) -> None:
+        RedisService.get_client().delete(PENDING_KEY_PREFIX + batch_id)
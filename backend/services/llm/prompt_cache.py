@@ -0,0 +1,24 @@
+"""
+Prompt caching helpers.
+
+Long, static instruction blocks are sent as the system prompt with a
+cache_control breakpoint, so repeated calls read them from Anthropic's
+prompt cache instead of paying full input price on every request. Only the
+per-call data (business, page content, search results) goes in the user
+message.
+"""
+from typing import Any, Dict, List, Union
+
+from core.config import get_settings
+
+
+def cached_system(text: str) -> Union[str, List[Dict[str, Any]]]:
+    """
+    System prompt with a cache breakpoint at its end.
+
+    Returns the plain string when LLM_PROMPT_CACHING_ENABLED is off. Prompts
+    shorter than the model's minimum cacheable length are simply not cached.
+    """
+    if not get_settings().LLM_PROMPT_CACHING_ENABLED:
+        return text
+    return [{"type": "text", "text": text, "cache_control": {"type": "ephemeral"}}]
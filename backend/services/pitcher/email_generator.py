@@ -4,13 +4,11 @@ Creates personalized cold emails for website pitches.
 """
 from typing import Dict, Any, Optional
 import logging
-from anthropic import AsyncAnthropic
 
-from core.config import get_settings
 from core.exceptions import GenerationException
+from services.llm.gateway import get_llm_gateway, message_text
 
 logger = logging.getLogger(__name__)
-settings = get_settings()
 
 
 class EmailGenerator:
@@ -20,7 +18,6 @@ class EmailGenerator:
     """
     
     def __init__(self):
-        self.client = AsyncAnthropic(api_key=settings.ANTHROPIC_API_KEY)
         self.model = "claude-3-5-sonnet-20241022"
     
     async def generate_email(
@@ -57,14 +54,15 @@ class EmailGenerator:
         try:
             # Generate email
             # Use streaming to avoid timeout limits on large max_tokens
-            async with self.client.messages.stream(
+            final_message = await get_llm_gateway().stream(
+                "pitcher.email",
                 model=self.model,
                 max_tokens=64000,  # Max for Claude Sonnet 4.5
                 temperature=0.7,
                 system=system_prompt,
                 messages=[{"role": "user", "content": user_prompt}]
-            ) as stream:
-                content = await stream.get_final_text()
+            )
+            content = message_text(final_message)
             
             # Parse response
             email = self._parse_email_response(content)
@@ -0,0 +1,329 @@
+"""
+Batch SMS send engine.
+
+Sends a batch of SMS campaigns concurrently instead of one at a time:
+
+1. Preload the batch's businesses (for the recipient timezone) in one query
+   and check opt-outs in bulk against the in-process opt-out index
+2. Group campaigns by timezone and evaluate the send window once per group;
+   groups outside their window are deferred without touching the provider
+3. Claim the sendable campaigns by moving them from pending/scheduled to
+   "sending" in one UPDATE ... RETURNING (so neither a crash mid-batch nor
+   a concurrent send of the same campaign can lead to a second send), then
+   send only the claimed ones with bounded concurrency over the
+   shared pooled httpx client, each send waiting on a per-provider/number
+   token bucket shared through Redis
+4. Record each result as its send returns (the sms_sid must be in the
+   database before the delivery callbacks for it are applied), then the
+   compliance failures and CRM updates in one batch
+
+Compliance matches SMSCampaignHelper.send_sms_campaign: opted-out numbers
+fail, and the TCPA quiet hours (plus the preferred windows when
+preferred_only) gate sending.
+"""
+import asyncio
+import logging
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.config import get_settings
+from core.exceptions import ExternalAPIException, ValidationError
+from models.business import Business
+from models.campaign import Campaign
+from models.sms_message import SMSMessage
+from services.crm import BusinessLifecycleService
+from services.pitcher.campaign_service import _get_business_timezone
+from services.progress.token_bucket import TokenBucket
+from services.sms import SMSComplianceService, SMSSender
+
+logger = logging.getLogger(__name__)
+
+BUCKET_KEY_PREFIX = "sms:bucket:"
+
+_buckets: Dict[str, TokenBucket] = {}
+
+
+def _provider_bucket(sender: SMSSender) -> TokenBucket:
+    """Token bucket for the sender's provider and sending number."""
+    settings = get_settings()
+    provider = sender.provider_name.lower()
+    number = getattr(sender.provider, "from_phone", "") or "default"
+    key = f"{BUCKET_KEY_PREFIX}{provider}:{number}"
+    if key not in _buckets:
+        rate = (
+            settings.SMS_TELNYX_RATE_PER_SECOND if provider == "telnyx"
+            else settings.SMS_LABSMOBILE_RATE_PER_SECOND
+        )
+        _buckets[key] = TokenBucket(key, rate, settings.SMS_RATE_BURST)
+    return _buckets[key]
+
+
+class SMSSendEngine:
+    """
+    Concurrent, rate-limited sender for a batch of SMS campaigns.
+
+    Usage:
+        results = await SMSSendEngine(db).send_batch(campaigns, preferred_only=True)
+    """
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        sms_sender: Optional[SMSSender] = None,
+        concurrency: Optional[int] = None
+    ):
+        self.db = db
+        self._sms_sender = sms_sender
+        self.concurrency = max(1, concurrency or get_settings().SMS_SEND_CONCURRENCY)
+        self.compliance = SMSComplianceService(db)
+
+    @property
+    def sms_sender(self) -> SMSSender:
+        if self._sms_sender is None:
+            self._sms_sender = SMSSender()
+        return self._sms_sender
+
+    async def send_batch(self, campaigns: List[Campaign], preferred_only: bool = False) -> Dict[str, Any]:
+        """
+        Send SMS campaigns (status pending/scheduled; others are reported failed
+        and left untouched).
+
+        Args:
+            campaigns:      Campaigns loaded by the caller
+            preferred_only: Autopilot - also require a preferred engagement window
+
+        Returns:
+            {"checked", "sent", "skipped", "failed", "errors": [{"campaign_id", "error"}]}
+        """
+        results: Dict[str, Any] = {"checked": len(campaigns), "sent": 0, "skipped": 0, "failed": 0, "errors": []}
+        if not campaigns:
+            return results
+
+        rejected: List[Tuple[Campaign, str]] = []  # Reported only; the campaign is left as is
+        failures: List[Tuple[Campaign, str]] = []
+        candidates: List[Tuple[Campaign, str]] = []  # (campaign, E.164 phone)
+        for campaign in campaigns:
+            if campaign.channel != "sms" or campaign.status not in ("pending", "scheduled"):
+                rejected.append((campaign, f"Campaign already sent or invalid status: {campaign.status}"))
+                continue
+            try:
+                candidates.append((campaign, self.compliance.normalize_phone(campaign.recipient_phone or "")))
+            except ValidationError as e:
+                failures.append((campaign, f"Compliance check failed: {e}"))
+
+        timezones = await self._load_timezones([c.business_id for c, _ in candidates if c.business_id])
+        not_opted_out = set(await self.compliance.filter_sendable([phone for _, phone in candidates]))
+
+        # Window checks once per timezone, not per recipient
+        by_timezone: Dict[str, List[Tuple[Campaign, str]]] = defaultdict(list)
+        for campaign, phone in candidates:
+            if phone not in not_opted_out:
+                failures.append((campaign, "Compliance check failed: Recipient has opted out"))
+                continue
+            by_timezone[timezones.get(campaign.business_id, _get_business_timezone(None))].append((campaign, phone))
+
+        sendable: List[Tuple[Campaign, str]] = []
+        for timezone_str, group in by_timezone.items():
+            reason = self._window_block(timezone_str, preferred_only)
+            if reason:
+                # Left pending/scheduled; a later run retries
+                results["skipped"] += len(group)
+                logger.info(f"Deferred {len(group)} SMS campaign(s) in {timezone_str}: {reason}")
+                continue
+            sendable.extend(group)
+
+        if sendable:
+            self.sms_sender  # Fail on a misconfigured provider before claiming anything
+            # Claim only rows still pending/scheduled in the database: a
+            # concurrent send of the same campaign gets it first or not at all
+            claimed = set(
+                (
+                    await self.db.execute(
+                        update(Campaign)
+                        .where(
+                            Campaign.id.in_([c.id for c, _ in sendable]),
+                            Campaign.status.in_(("pending", "scheduled")),
+                        )
+                        .values(status="sending", updated_at=datetime.utcnow())
+                        .returning(Campaign.id)
+                        .execution_options(synchronize_session=False)
+                    )
+                ).scalars().all()
+            )
+            await self.db.commit()
+            for campaign, _ in sendable:
+                if campaign.id not in claimed:
+                    rejected.append((campaign, "Campaign already claimed by another send"))
+            sendable = [(c, phone) for c, phone in sendable if c.id in claimed]
+
+        outcomes = await self._send_all(sendable)
+        await self._record(outcomes, failures)
+
+        for campaign, outcome in outcomes:
+            if isinstance(outcome, dict):
+                results["sent"] += 1
+            else:
+                failures.append((campaign, outcome))
+        for campaign, error in rejected + failures:
+            results["failed"] += 1
+            results["errors"].append({"campaign_id": str(campaign.id), "error": error})
+
+        logger.info(
+            f"📱 SMS batch: sent={results['sent']} skipped={results['skipped']} "
+            f"failed={results['failed']} (of {results['checked']})"
+        )
+        return results
+
+    # ── Preloading ──────────────────────────────────────────────
+
+    async def _load_timezones(self, business_ids: List[Any]) -> Dict[Any, str]:
+        if not business_ids:
+            return {}
+        rows = await self.db.execute(
+            select(Business.id, Business.state).where(Business.id.in_(set(business_ids)))
+        )
+        return {row.id: _get_business_timezone(row.state) for row in rows}
+
+    def _window_block(self, timezone_str: str, preferred_only: bool) -> Optional[str]:
+        if not self.compliance.is_business_hours(timezone_str):
+            return "Outside business hours (9 AM – 9 PM local time)"
+        if preferred_only and not self.compliance.is_preferred_window(timezone_str):
+            return "Outside preferred send window (1–5 PM, 7–9 PM, or 10 AM–12 PM local)"
+        return None
+
+    # ── Sending ─────────────────────────────────────────────────
+
+    async def _send_all(self, sendable: List[Tuple[Campaign, str]]) -> List[Tuple[Campaign, Any]]:
+        """
+        Send concurrently, recording each outcome (result dict or error
+        string) as soon as its provider call returns, so a campaign's sms_sid
+        is committed before its delivery callbacks are applied. The sends
+        overlap; the writes take turns on the session.
+        """
+        if not sendable:
+            return []
+        settings = get_settings()
+        sender = self.sms_sender
+        bucket = _provider_bucket(sender)
+        callback_url = (
+            f"{settings.API_URL}{sender.provider.webhook_status_path}"
+            if settings.API_URL
+            else None
+        )
+        semaphore = asyncio.Semaphore(self.concurrency)
+        write_lock = asyncio.Lock()
+
+        async def send_one(campaign: Campaign, phone: str) -> Tuple[Campaign, Any]:
+            async with semaphore:
+                await bucket.acquire()
+                outcome = await self._send(sender, campaign, phone, callback_url)
+            async with write_lock:
+                await self._record_outcome(campaign, outcome)
+            return campaign, outcome
+
+        return await asyncio.gather(*(send_one(campaign, phone) for campaign, phone in sendable))
+
+    @staticmethod
+    async def _send(sender: SMSSender, campaign: Campaign, phone: str, callback_url: Optional[str]) -> Any:
+        """Provider call only. Returns the result dict or an error string."""
+        try:
+            result = await sender.send(
+                to_phone=phone,
+                body=campaign.sms_body,
+                status_callback=callback_url
+            )
+        except ExternalAPIException as e:
+            logger.error(f"SMS send failed for campaign {campaign.id}: {e}")
+            return str(e)
+        except Exception as e:
+            logger.error(f"SMS campaign {campaign.id} failed: {e}", exc_info=True)
+            return f"Unexpected error: {e}"
+        # Without a message_id the delivery webhook can never be matched
+        if not result.get("message_id"):
+            return (
+                "Provider returned no message_id despite a 2xx response — "
+                "cannot track delivery status"
+            )
+        return result
+
+    # ── Recording ───────────────────────────────────────────────
+
+    async def _record_outcome(self, campaign: Campaign, outcome: Any) -> None:
+        """Write one send's result to the campaign (and sms_messages) and commit."""
+        now = datetime.utcnow()
+        try:
+            if isinstance(outcome, dict):
+                segments = outcome.get("segments") if outcome.get("segments") is not None else 1
+                values = {
+                    "id": campaign.id,
+                    "status": "sent",
+                    "sent_at": now,
+                    "sms_provider": outcome.get("provider"),
+                    "sms_sid": outcome["message_id"],
+                    "sms_segments": segments,
+                    "sms_cost": outcome.get("cost"),  # None is fine; webhook fills it in
+                    "updated_at": now,
+                }
+                outbound = SMSMessage.create_outbound(
+                    to_phone=campaign.recipient_phone,
+                    from_phone=outcome.get("from") or "",
+                    body=campaign.sms_body,
+                    campaign_id=campaign.id,
+                    business_id=campaign.business_id,
+                    telnyx_message_id=outcome["message_id"]
+                )
+                outbound.status = "sent"
+                outbound.segments = segments
+                outbound.cost = outcome.get("cost")
+                self.db.add(outbound)
+            else:
+                values = self._failure_values(campaign, outcome, now, count_retry=True)
+            await self.db.execute(update(Campaign), [values])
+            await self.db.commit()
+        except Exception as e:
+            # The campaign stays "sending" (never re-sent); the rest of the batch is still recorded
+            await self.db.rollback()
+            logger.error(f"Failed to record SMS outcome for campaign {campaign.id}: {e}", exc_info=True)
+
+    async def _record(
+        self,
+        outcomes: List[Tuple[Campaign, Any]],
+        failures: List[Tuple[Campaign, str]]
+    ) -> None:
+        """Record the compliance failures and update the CRM for the sent campaigns."""
+        now = datetime.utcnow()
+
+        # Compliance failures (opt-out, invalid number) are not send attempts
+        if failures:
+            await self.db.execute(
+                update(Campaign),
+                [self._failure_values(campaign, error, now, count_retry=False) for campaign, error in failures]
+            )
+            await self.db.commit()
+
+        # CRM: pending → sms_sent (delivered / failed arrive via the status webhook)
+        sent_business_ids = [
+            campaign.business_id
+            for campaign, outcome in outcomes
+            if isinstance(outcome, dict) and campaign.business_id
+        ]
+        if sent_business_ids:
+            lifecycle_service = BusinessLifecycleService(self.db)
+            try:
+                for business_id in sent_business_ids:
+                    await lifecycle_service.mark_campaign_sent(business_id, channel="sms")
+                await self.db.commit()
+            except Exception as e:
+                await self.db.rollback()
+                logger.error(f"Error updating CRM status after SMS batch: {e}", exc_info=True)
+
+    @staticmethod
+    def _failure_values(campaign: Campaign, error: str, now: datetime, count_retry: bool) -> Dict[str, Any]:
+        values = {"id": campaign.id, "status": "failed", "error_message": error, "updated_at": now}
+        if count_retry:
+            values["retry_count"] = (campaign.retry_count or 0) + 1
+        return values
@@ -13,6 +13,7 @@ Architecture:
 Author: WebMagic Team
 Date: January 21, 2026
 """
+import asyncio
 import logging
 import os
 import secrets
@@ -453,7 +454,10 @@ class DomainService:
         bare = domain.removeprefix("www.")
 
         # ── Phase 1: Ownership record ────────────────────────────────────────
-        ownership_ok, ownership_info = DomainService._check_ownership_record(
+        # dnspython lookups block - run them off the event loop. Results are
+        # deliberately not cached: customers re-check while DNS propagates.
+        ownership_ok, ownership_info = await asyncio.to_thread(
+            DomainService._check_ownership_record,
             domain=domain,
             token=token,
             method=method,
@@ -468,7 +472,8 @@ class DomainService:
             }
 
         # ── Phase 2: A record must point to our server ───────────────────────
-        a_ok, a_info = DomainService._check_a_record(
+        a_ok, a_info = await asyncio.to_thread(
+            DomainService._check_a_record,
             bare_domain=bare,
             expected_ip=SERVER_IP,
             resolver=dns.resolver,
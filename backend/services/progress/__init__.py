@@ -6,5 +6,6 @@ Provides Redis-based real-time progress publishing for scraping operations.
 
 from .redis_service import RedisService
 from .progress_publisher import ProgressPublisher
+from .progress_stream import ProgressStreamBroker, get_progress_broker
 
-__all__ = ["RedisService", "ProgressPublisher"]
+__all__ = ["RedisService", "ProgressPublisher", "ProgressStreamBroker", "get_progress_broker"]
@@ -0,0 +1,265 @@
+"""
+Async Progress Stream (Redis pub/sub -> SSE fan-out).
+
+Purpose:
+    Deliver scrape progress events published by ProgressPublisher to
+    Server-Sent Event clients without polling the event loop.
+
+Best Practices:
+    - One shared redis.asyncio pub/sub connection per API process; every SSE
+      client on a channel shares a single Redis SUBSCRIBE
+    - Blocking listen() instead of get_message() polling
+    - Per-client backpressure: pending business_scraped events are coalesced
+      into the newest one and emitted at most every COALESCE seconds, so a
+      large scrape never floods a browser or builds an unbounded backlog
+"""
+
+import asyncio
+import json
+import logging
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, Optional, Set
+
+from core.config import get_settings
+from .redis_service import RedisService
+
+logger = logging.getLogger(__name__)
+
+# Snapshot-style events: only the latest pending one matters to a client
+COALESCED_EVENTS = frozenset({"business_scraped"})
+
+# Events after which the stream is finished
+TERMINAL_EVENTS = frozenset({"scrape_complete", "error"})
+
+
+@dataclass
+class ProgressEvent:
+    """One event ready to be written to an SSE client."""
+    event: str
+    payload: Dict[str, Any]
+    coalesced: int = 0
+
+    @property
+    def data(self) -> str:
+        """JSON body for the SSE ``data:`` line."""
+        if self.coalesced:
+            return json.dumps({**self.payload, "coalesced": self.coalesced})
+        return json.dumps(self.payload)
+
+
+class ProgressSubscription:
+    """
+    Per-client buffer for one channel.
+
+    Filled by the shared reader, drained by the client's SSE generator.
+    """
+
+    def __init__(self, channel: str, coalesce_seconds: float, max_pending: int):
+        self.channel = channel
+        self.coalesce_seconds = coalesce_seconds
+        self.max_pending = max_pending
+        self.dropped = 0
+        self._pending: Deque[ProgressEvent] = deque()
+        self._ready = asyncio.Event()
+        self._last_coalesced_at = 0.0
+
+    def push(self, event: ProgressEvent) -> None:
+        """Queue an event, merging it into a pending event of the same kind."""
+        if event.event in COALESCED_EVENTS:
+            for pending in self._pending:
+                if pending.event == event.event:
+                    # Keep ordering relative to newer events: drop the stale
+                    # snapshot and append the fresh one at the end.
+                    self._pending.remove(pending)
+                    event.coalesced = pending.coalesced + 1
+                    break
+
+        if len(self._pending) >= self.max_pending:
+            self._drop_oldest()
+        self._pending.append(event)
+        self._ready.set()
+
+    def _drop_oldest(self) -> None:
+        for pending in self._pending:
+            if pending.event not in TERMINAL_EVENTS:
+                self._pending.remove(pending)
+                self.dropped += 1
+                return
+
+    async def next_event(self, timeout: float) -> Optional[ProgressEvent]:
+        """
+        Wait for the next event.
+
+        Returns:
+            The next event, or None if nothing arrived within ``timeout``
+            (caller sends a heartbeat)
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+
+        while True:
+            if self._pending:
+                head = self._pending[0]
+                if head.event in COALESCED_EVENTS:
+                    wait = self._last_coalesced_at + self.coalesce_seconds - loop.time()
+                    if wait > 0:
+                        # Let further snapshots merge into this one
+                        await asyncio.sleep(wait)
+                        continue
+                    self._last_coalesced_at = loop.time()
+                return self._pending.popleft()
+
+            self._ready.clear()
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return None
+            try:
+                await asyncio.wait_for(self._ready.wait(), timeout=remaining)
+            except asyncio.TimeoutError:
+                return None
+
+
+class ProgressStreamBroker:
+    """
+    Shared Redis subscriber multiplexing many SSE clients (per process).
+
+    Usage:
+        broker = get_progress_broker()
+        async with broker.subscribe("scrape:progress:<id>") as stream:
+            event = await stream.next_event(timeout=15)
+    """
+
+    def __init__(self):
+        settings = get_settings()
+        self.coalesce_seconds = settings.PROGRESS_STREAM_COALESCE_SECONDS
+        self.max_pending = settings.PROGRESS_STREAM_MAX_PENDING
+        self._client = None
+        self._pubsub = None
+        self._reader: Optional[asyncio.Task] = None
+        self._subscribers: Dict[str, Set[ProgressSubscription]] = {}
+        self._lock = asyncio.Lock()
+        self._available = False
+
+    async def is_available(self) -> bool:
+        """Check (once successfully) that Redis is reachable."""
+        if self._available:
+            return True
+        try:
+            self._ensure_client()
+            await self._client.ping()
+            self._available = True
+        except Exception as e:
+            logger.warning(f"⚠️ Redis unavailable for progress streaming: {e}")
+        return self._available
+
+    @asynccontextmanager
+    async def subscribe(self, channel: str):
+        """Register an SSE client on ``channel`` for the duration of the block."""
+        subscription = ProgressSubscription(channel, self.coalesce_seconds, self.max_pending)
+
+        async with self._lock:
+            self._ensure_client()
+            subscribers = self._subscribers.setdefault(channel, set())
+            if not subscribers:
+                await self._pubsub.subscribe(channel)
+                logger.info(f"📻 Subscribed to Redis channel: {channel}")
+            subscribers.add(subscription)
+            if self._reader is None or self._reader.done():
+                self._reader = asyncio.create_task(self._read_loop())
+
+        try:
+            yield subscription
+        finally:
+            async with self._lock:
+                subscribers = self._subscribers.get(channel)
+                if subscribers is not None:
+                    subscribers.discard(subscription)
+                    if not subscribers:
+                        del self._subscribers[channel]
+                        try:
+                            await self._pubsub.unsubscribe(channel)
+                            logger.info(f"🔌 Redis channel unsubscribed: {channel}")
+                        except Exception as e:
+                            logger.error(f"Error unsubscribing {channel}: {e}")
+            if subscription.dropped:
+                logger.warning(
+                    f"SSE client on {channel} dropped {subscription.dropped} events (slow consumer)"
+                )
+
+    async def close(self) -> None:
+        """Stop the reader and close the Redis connection."""
+        if self._reader is not None:
+            self._reader.cancel()
+            try:
+                await self._reader
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._reader = None
+        if self._pubsub is not None:
+            try:
+                await self._pubsub.close()
+            except Exception as e:
+                logger.error(f"Error closing pubsub: {e}")
+        if self._client is not None:
+            try:
+                await self._client.close()
+            except Exception as e:
+                logger.error(f"Error closing async Redis client: {e}")
+        self._client = None
+        self._pubsub = None
+        self._subscribers.clear()
+        self._available = False
+
+    def _ensure_client(self) -> None:
+        if self._client is None:
+            self._client = RedisService.create_async_client()
+            self._pubsub = self._client.pubsub(ignore_subscribe_messages=True)
+
+    async def _read_loop(self) -> None:
+        """Blocking listen() on the shared connection; runs while anything is subscribed."""
+        while self._subscribers:
+            try:
+                async for message in self._pubsub.listen():
+                    if message and message.get("type") == "message":
+                        self._dispatch(message["channel"], message["data"])
+                return  # no channels left
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"❌ Progress subscriber error, reconnecting: {e}")
+                await asyncio.sleep(1.0)
+
+    def _dispatch(self, channel: str, raw: str) -> None:
+        subscribers = self._subscribers.get(channel)
+        if not subscribers:
+            return
+        try:
+            payload = json.loads(raw)
+        except json.JSONDecodeError as e:
+            logger.error(f"Failed to parse Redis message: {e}")
+            return
+
+        event_type = payload.get("event", "update")
+        for subscription in subscribers:
+            subscription.push(ProgressEvent(event=event_type, payload=payload))
+
+
+_broker: Optional[ProgressStreamBroker] = None
+
+
+def get_progress_broker() -> ProgressStreamBroker:
+    """Get the process-wide progress stream broker."""
+    global _broker
+    if _broker is None:
+        _broker = ProgressStreamBroker()
+    return _broker
+
+
+async def close_progress_broker() -> None:
+    """Close the process-wide broker (application shutdown)."""
+    global _broker
+    if _broker is not None:
+        await _broker.close()
+        _broker = None
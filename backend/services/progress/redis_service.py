@@ -15,6 +15,7 @@ Best Practices:
 import logging
 from typing import Optional
 from redis import Redis, ConnectionPool
+from redis import asyncio as aioredis
 from redis.exceptions import ConnectionError, TimeoutError
 
 from core.config import get_settings
@@ -37,6 +38,7 @@ class RedisService:
     _instance: Optional[Redis] = None
     _pool: Optional[ConnectionPool] = None
     _is_available: bool = False
+    _async_instance: Optional["aioredis.Redis"] = None
     
     @classmethod
     def get_client(cls) -> Redis:
@@ -90,6 +92,52 @@ class RedisService:
             cls._instance = _DummyRedis()
             cls._is_available = False
     
+    @classmethod
+    def get_async_client(cls) -> "aioredis.Redis":
+        """
+        Get the shared asyncio Redis client for request-path commands.
+        
+        Use from async code (API handlers) instead of the sync client so
+        Redis round trips don't block the event loop.
+        
+        Returns:
+            redis.asyncio client with a 5s command timeout
+        """
+        if cls._async_instance is None:
+            cls._async_instance = cls.create_async_client(socket_timeout=5)
+        return cls._async_instance
+    
+    @classmethod
+    def create_async_client(
+        cls,
+        decode_responses: bool = True,
+        socket_timeout: Optional[float] = None
+    ) -> "aioredis.Redis":
+        """
+        Create an asyncio Redis client.
+        
+        By default no socket timeout is set so a long-lived pub/sub
+        ``listen()`` can block indefinitely; idle connections are kept
+        alive by health checks.
+        
+        Args:
+            decode_responses: Return str instead of bytes
+            socket_timeout: Per-command timeout (None = wait forever)
+        
+        Returns:
+            redis.asyncio client (caller owns and closes it)
+        """
+        settings = get_settings()
+        return aioredis.Redis(
+            host=getattr(settings, 'REDIS_HOST', 'localhost'),
+            port=getattr(settings, 'REDIS_PORT', 6379),
+            db=getattr(settings, 'REDIS_DB', 0),
+            decode_responses=decode_responses,
+            socket_timeout=socket_timeout,
+            socket_connect_timeout=5,
+            health_check_interval=30
+        )
+    
     @classmethod
     def is_available(cls) -> bool:
         """
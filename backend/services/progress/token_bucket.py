@@ -0,0 +1,89 @@
+"""
+Token-bucket rate limiter shared through Redis.
+
+Every process that builds a TokenBucket with the same key draws from one
+budget (ScrapingDog searches, Claude requests). Without Redis each process
+falls back to its own in-memory bucket.
+"""
+import asyncio
+import logging
+import time
+
+from services.progress.redis_service import RedisService
+
+logger = logging.getLogger(__name__)
+
+# Atomically refill the bucket and take one token.
+# Returns 0 when a token was taken, otherwise the milliseconds to wait.
+_TOKEN_BUCKET_LUA = """
+local key = KEYS[1]
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local state = redis.call('HMGET', key, 'tokens', 'ts')
+local tokens = tonumber(state[1])
+local ts = tonumber(state[2])
+if tokens == nil then
+  tokens = capacity
+  ts = now
+end
+tokens = math.min(capacity, tokens + (now - ts) / 1000.0 * rate)
+local wait = 0
+if tokens >= 1 then
+  tokens = tokens - 1
+else
+  wait = math.ceil((1 - tokens) / rate * 1000)
+end
+redis.call('HSET', key, 'tokens', tokens, 'ts', now)
+redis.call('PEXPIRE', key, math.ceil(capacity / rate * 1000) + 1000)
+return wait
+"""
+
+
+class TokenBucket:
+    """
+    Token bucket shared through Redis (falls back to an in-process bucket).
+
+    Usage:
+        await bucket.acquire()  # waits until a request may be sent
+    """
+
+    def __init__(self, key: str, rate_per_second: float, capacity: int):
+        self.key = key
+        self.rate = max(rate_per_second, 0.01)
+        self.capacity = max(capacity, 1)
+        self._script = None
+        self._local_tokens = float(self.capacity)
+        self._local_ts = time.monotonic()
+        self._local_lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        while True:
+            wait_ms = await self._try_take()
+            if wait_ms <= 0:
+                return
+            await asyncio.sleep(wait_ms / 1000)
+
+    async def _try_take(self) -> int:
+        try:
+            if self._script is None:
+                self._script = RedisService.get_async_client().register_script(_TOKEN_BUCKET_LUA)
+            return int(await self._script(
+                keys=[self.key],
+                args=[self.rate, self.capacity, int(time.time() * 1000)],
+            ))
+        except Exception as e:
+            logger.debug(f"Shared rate limiter unavailable, using local bucket: {e}")
+            return await self._try_take_local()
+
+    async def _try_take_local(self) -> int:
+        async with self._local_lock:
+            now = time.monotonic()
+            self._local_tokens = min(
+                self.capacity, self._local_tokens + (now - self._local_ts) * self.rate
+            )
+            self._local_ts = now
+            if self._local_tokens >= 1:
+                self._local_tokens -= 1
+                return 0
+            return int((1 - self._local_tokens) / self.rate * 1000) + 1
@@ -0,0 +1,222 @@
+"""
+Short link redirect hot path - slug cache and buffered click counting.
+
+After an SMS blast thousands of recipients hit GET /r/{slug} within minutes.
+Instead of a SELECT + UPDATE + COMMIT per redirect:
+
+- slug -> destination is cached in-process with a TTL; unknown/inactive
+  slugs are negatively cached for a shorter TTL. Deactivating a link INCRs a
+  version counter in Redis, and every process compares it with the version
+  its entries were cached under at most once every
+  SHORTLINK_CACHE_CHECK_SECONDS, dropping its entries when it changed
+- clicks are counted in Redis (HINCRBY) and flushed to short_links in one
+  batched UPDATE by the periodic ``flush_short_link_clicks`` task
+
+If Redis is unavailable the caller falls back to the direct DB increment.
+"""
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Dict, Optional, Tuple
+from uuid import UUID
+import logging
+import time
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from core.config import get_settings
+from services.progress.redis_service import RedisService
+
+logger = logging.getLogger(__name__)
+
+# Redis hashes: link_id -> pending click count / last click (ISO timestamp)
+CLICKS_KEY = "shortlink:clicks"
+LAST_CLICK_KEY = "shortlink:last_click"
+# Snapshot being flushed (renamed atomically so new clicks keep accumulating)
+_FLUSHING_SUFFIX = ":flushing"
+# Bumped whenever a link stops resolving; processes drop their entries on change
+VERSION_KEY = "shortlink:redirect:version"
+
+
+@dataclass(frozen=True)
+class ResolvedLink:
+    """The subset of a short link needed to redirect."""
+    link_id: UUID
+    destination_url: str
+    expires_at: Optional[datetime] = None
+
+    @property
+    def is_expired(self) -> bool:
+        if self.expires_at is None:
+            return False
+        return datetime.utcnow() >= self.expires_at.replace(tzinfo=None)
+
+
+class ShortLinkRedirectCache:
+    """In-process TTL cache of slug -> ResolvedLink (None = negative entry)."""
+
+    def __init__(
+        self,
+        ttl_seconds: int = 300,
+        negative_ttl_seconds: int = 30,
+        max_entries: int = 10000,
+        check_interval_seconds: float = 1.0
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self.max_entries = max_entries
+        self.check_interval_seconds = check_interval_seconds
+        self._entries: "OrderedDict[str, Tuple[float, Optional[ResolvedLink]]]" = OrderedDict()
+        self._version: Optional[str] = None
+        self._checked_at = 0.0
+
+    async def refresh(self) -> None:
+        """Drop every entry if a link was invalidated in any process since the last check."""
+        now = time.monotonic()
+        if now - self._checked_at < self.check_interval_seconds:
+            return
+        self._checked_at = now
+        try:
+            version = await RedisService.get_async_client().get(VERSION_KEY)
+        except Exception as e:
+            # Without Redis, entries expire on their TTL
+            logger.debug("Redirect cache version check unavailable: %s", e)
+            return
+        if version != self._version:
+            self._entries.clear()
+            self._version = version
+
+    def get(self, slug: str) -> Tuple[bool, Optional[ResolvedLink]]:
+        """
+        Returns:
+            (hit, link) - link is None for a cached miss
+        """
+        entry = self._entries.get(slug)
+        if entry is None:
+            return False, None
+        expires, link = entry
+        if time.monotonic() >= expires:
+            del self._entries[slug]
+            return False, None
+        return True, link
+
+    def put(self, slug: str, link: Optional[ResolvedLink]) -> None:
+        ttl = self.ttl_seconds if link is not None else self.negative_ttl_seconds
+        self._entries[slug] = (time.monotonic() + ttl, link)
+        self._entries.move_to_end(slug)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, slug: str) -> None:
+        self._entries.pop(slug, None)
+
+    async def invalidate_link(self, link_id: UUID) -> None:
+        """Drop a link's entry here and signal every other process (after deactivation)."""
+        for slug, (_, link) in list(self._entries.items()):
+            if link is not None and link.link_id == link_id:
+                del self._entries[slug]
+        try:
+            await RedisService.get_async_client().incr(VERSION_KEY)
+        except Exception as e:
+            logger.warning(
+                "⚠️ Redirect cache version bump failed, other processes drop the link within "
+                "SHORTLINK_CACHE_TTL_SECONDS: %s", e
+            )
+
+
+_cache: Optional[ShortLinkRedirectCache] = None
+
+
+def get_redirect_cache() -> ShortLinkRedirectCache:
+    """Get the process-wide redirect cache."""
+    global _cache
+    if _cache is None:
+        settings = get_settings()
+        _cache = ShortLinkRedirectCache(
+            ttl_seconds=settings.SHORTLINK_CACHE_TTL_SECONDS,
+            negative_ttl_seconds=settings.SHORTLINK_NEGATIVE_CACHE_TTL_SECONDS,
+            max_entries=settings.SHORTLINK_CACHE_SIZE,
+            check_interval_seconds=settings.SHORTLINK_CACHE_CHECK_SECONDS,
+        )
+    return _cache
+
+
+async def record_click(link_id: UUID) -> bool:
+    """
+    Count a click in Redis for the next batched flush.
+
+    Returns:
+        False if Redis is unavailable (caller should count directly in the DB)
+    """
+    try:
+        redis = RedisService.get_async_client()
+        async with redis.pipeline(transaction=False) as pipe:
+            pipe.hincrby(CLICKS_KEY, str(link_id), 1)
+            pipe.hset(LAST_CLICK_KEY, str(link_id), datetime.now(timezone.utc).isoformat())
+            await pipe.execute()
+        return True
+    except Exception as e:
+        logger.warning("Buffered click counting unavailable, writing directly: %s", e)
+        return False
+
+
+def flush_click_counts(db: Session) -> int:
+    """
+    Apply buffered click counts to short_links in one UPDATE (sync, for Celery).
+
+    The pending hashes are renamed to a snapshot first, so clicks arriving
+    during the flush accumulate in fresh hashes. A snapshot left behind by a
+    failed flush is applied on the next run.
+
+    Returns:
+        Number of links updated
+    """
+    redis = RedisService.get_client()
+    if not RedisService.is_available():
+        return 0
+
+    clicks_snapshot = CLICKS_KEY + _FLUSHING_SUFFIX
+    last_snapshot = LAST_CLICK_KEY + _FLUSHING_SUFFIX
+
+    if not redis.exists(clicks_snapshot):
+        if not redis.exists(CLICKS_KEY):
+            return 0
+        pipe = redis.pipeline(transaction=True)
+        pipe.rename(CLICKS_KEY, clicks_snapshot)
+        pipe.rename(LAST_CLICK_KEY, last_snapshot)
+        try:
+            pipe.execute()
+        except Exception as e:
+            # LAST_CLICK_KEY may be missing if it expired/was deleted; counts still flush
+            logger.debug("Click snapshot rename: %s", e)
+
+    counts: Dict[str, str] = redis.hgetall(clicks_snapshot) or {}
+    last_clicks: Dict[str, str] = redis.hgetall(last_snapshot) or {}
+    if not counts:
+        redis.delete(clicks_snapshot, last_snapshot)
+        return 0
+
+    params = {}
+    values_sql = []
+    for i, (link_id, count) in enumerate(counts.items()):
+        values_sql.append(f"(CAST(:id{i} AS uuid), CAST(:n{i} AS integer), CAST(:t{i} AS timestamptz))")
+        params[f"id{i}"] = link_id
+        params[f"n{i}"] = int(count)
+        params[f"t{i}"] = last_clicks.get(link_id) or datetime.now(timezone.utc).isoformat()
+
+    db.execute(
+        text(f"""
+            UPDATE short_links AS sl
+            SET click_count = sl.click_count + v.clicks,
+                last_clicked_at = GREATEST(COALESCE(sl.last_clicked_at, v.last_click), v.last_click)
+            FROM (VALUES {", ".join(values_sql)}) AS v(id, clicks, last_click)
+            WHERE sl.id = v.id
+        """),
+        params,
+    )
+    db.commit()
+    redis.delete(clicks_snapshot, last_snapshot)
+
+    logger.info("Flushed %d buffered click counts for %d short links", sum(map(int, counts.values())), len(counts))
+    return len(counts)
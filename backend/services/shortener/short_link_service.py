@@ -14,6 +14,7 @@ from sqlalchemy import select, update, func, desc
 
 from models.short_link import ShortLink
 from services.shortener.slug_generator import generate_slug
+from services.shortener.redirect_cache import ResolvedLink, get_redirect_cache, record_click
 from services.system_settings_service import SystemSettingsService
 
 logger = logging.getLogger(__name__)
@@ -162,6 +163,7 @@ class ShortLinkService:
         )
         db.add(short_link)
         await db.flush()  # Get the ID without committing (caller controls transaction)
+        get_redirect_cache().invalidate(slug)  # drop a cached "unknown slug" entry
 
         short_url = ShortLinkService._build_short_url(
             slug, config["domain"], config["protocol"]
@@ -220,31 +222,51 @@ class ShortLinkService:
         """
         Resolve a slug to its destination URL.
 
-        Increments click_count and updates last_clicked_at atomically.
+        Served from the in-process redirect cache when possible (unknown
+        slugs are negatively cached). Clicks are buffered in Redis and
+        flushed to click_count / last_clicked_at in batches; without Redis
+        the counter is incremented directly.
         Returns None if the slug is not found, inactive, or expired.
         """
-        result = await db.execute(
-            select(ShortLink).where(ShortLink.slug == slug)
-        )
-        link = result.scalar_one_or_none()
+        cache = get_redirect_cache()
+        await cache.refresh()
+        hit, link = cache.get(slug)
+
+        if not hit:
+            result = await db.execute(
+                select(
+                    ShortLink.id,
+                    ShortLink.destination_url,
+                    ShortLink.is_active,
+                    ShortLink.expires_at,
+                ).where(ShortLink.slug == slug)
+            )
+            row = result.first()
+            link = None
+            if row is not None and row.is_active:
+                link = ResolvedLink(row.id, row.destination_url, row.expires_at)
+            elif row is not None:
+                logger.debug("Link %s is not resolvable (inactive)", slug)
+            cache.put(slug, link)
 
         if link is None:
             return None
 
-        if not link.is_resolvable:
-            logger.debug("Link %s is not resolvable (active=%s, expired=%s)", slug, link.is_active, link.is_expired)
+        if link.is_expired:
+            logger.debug("Link %s is not resolvable (expired)", slug)
             return None
 
-        # Increment click count atomically
-        await db.execute(
-            update(ShortLink)
-            .where(ShortLink.id == link.id)
-            .values(
-                click_count=ShortLink.click_count + 1,
-                last_clicked_at=datetime.utcnow(),
+        if not await record_click(link.link_id):
+            # Redis unavailable - increment click count atomically in the DB
+            await db.execute(
+                update(ShortLink)
+                .where(ShortLink.id == link.link_id)
+                .values(
+                    click_count=ShortLink.click_count + 1,
+                    last_clicked_at=datetime.utcnow(),
+                )
             )
-        )
-        await db.commit()
+            await db.commit()
 
         return link.destination_url
 
@@ -257,6 +279,7 @@ class ShortLinkService:
             .values(is_active=False, updated_at=datetime.utcnow())
         )
         await db.commit()
+        await get_redirect_cache().invalidate_link(link_id)
         return result.rowcount > 0
 
     @staticmethod
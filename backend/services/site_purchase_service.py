@@ -30,6 +30,7 @@ from services.payments.recurrente_client import RecurrenteClient
 from services.customer_auth_service import CustomerAuthService
 from services.site_service import get_site_service
 from services.crm import LeadService, BusinessLifecycleService
+from services.site_render_cache import invalidate_rendered_site
 from core.config import get_settings
 from core.exceptions import NotFoundError, ValidationError
 
@@ -443,6 +444,9 @@ class SitePurchaseService:
         await db.commit()
         await db.refresh(site)
         
+        # Owned sites are served without the claim bar
+        await invalidate_rendered_site(site.slug)
+        
         # CRM Integration: Update business lifecycle status
         if site.business_id:
             lifecycle_service = BusinessLifecycleService(db)
@@ -0,0 +1,183 @@
+"""
+Rendered-page cache for public generated-site serving.
+
+Serving a generated site means stripping/re-injecting the claim bar, adding
+the <base> tag and inlining CSS/JS into the full HTML document. The output
+only depends on the site's content version and ownership state, so it is
+rendered once and reused:
+
+- Tier 1: in-process LRU (per API worker)
+- Tier 2: Redis, shared by all API workers (gzip/brotli bodies, TTL)
+
+Keys are ``{subdomain}:{version}:{owned}``, so a regenerated/edited site
+(new ``updated_at``) or a purchase (ownership flips) naturally misses.
+``invalidate_rendered_site`` additionally drops every cached variant of a
+subdomain eagerly. Each entry carries a strong ETag and precompressed bodies.
+"""
+import asyncio
+import gzip
+import hashlib
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+
+from core.config import get_settings
+from services.progress.redis_service import RedisService
+
+try:
+    import brotli
+except ImportError:  # optional - gzip only
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+_REDIS_PREFIX = "site_render"
+
+
+@dataclass
+class RenderedPage:
+    """One rendered HTML document with precompressed variants."""
+    body: bytes
+    etag: str
+    gzip_body: bytes
+    br_body: Optional[bytes] = None
+
+    @classmethod
+    def from_html(cls, html: str) -> "RenderedPage":
+        body = html.encode("utf-8")
+        return cls(
+            body=body,
+            etag=f'"{hashlib.sha256(body).hexdigest()[:32]}"',
+            gzip_body=gzip.compress(body, compresslevel=6),
+            br_body=brotli.compress(body, quality=9) if brotli else None,
+        )
+
+    def encoded(self, accept_encoding: str) -> tuple[bytes, Optional[str]]:
+        """Pick the best body for the client's Accept-Encoding."""
+        accepted = {
+            part.split(";")[0].strip().lower()
+            for part in (accept_encoding or "").split(",")
+        }
+        if self.br_body is not None and "br" in accepted:
+            return self.br_body, "br"
+        if "gzip" in accepted:
+            return self.gzip_body, "gzip"
+        return self.body, None
+
+
+class SiteRenderCache:
+    """Two-tier (memory + Redis) cache of rendered site pages."""
+
+    def __init__(self, max_entries: int = 256, ttl_seconds: int = 3600):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, RenderedPage]" = OrderedDict()
+        self._redis = None
+        self._redis_failed = False
+
+    @staticmethod
+    def make_key(subdomain: str, version: str, is_owned: bool) -> str:
+        return f"{subdomain}:{version}:{int(is_owned)}"
+
+    async def get(self, key: str) -> Optional[RenderedPage]:
+        """Look up a rendered page (memory first, then Redis)."""
+        page = self._entries.get(key)
+        if page is not None:
+            self._entries.move_to_end(key)
+            return page
+
+        redis = self._get_redis()
+        if redis is None:
+            return None
+        try:
+            fields = await redis.hgetall(f"{_REDIS_PREFIX}:{key}")
+        except Exception as e:
+            logger.warning(f"Render cache Redis read failed: {e}")
+            return None
+        if not fields or b"gz" not in fields:
+            return None
+
+        gzip_body = fields[b"gz"]
+        page = RenderedPage(
+            body=gzip.decompress(gzip_body),
+            etag=fields[b"etag"].decode(),
+            gzip_body=gzip_body,
+            br_body=fields.get(b"br"),
+        )
+        self._remember(key, page)
+        return page
+
+    async def put(self, key: str, html: str) -> RenderedPage:
+        """Compress and store a freshly rendered page in both tiers."""
+        page = await asyncio.to_thread(RenderedPage.from_html, html)
+        self._remember(key, page)
+
+        redis = self._get_redis()
+        if redis is not None:
+            mapping = {"gz": page.gzip_body, "etag": page.etag}
+            if page.br_body is not None:
+                mapping["br"] = page.br_body
+            redis_key = f"{_REDIS_PREFIX}:{key}"
+            try:
+                async with redis.pipeline(transaction=False) as pipe:
+                    pipe.hset(redis_key, mapping=mapping)
+                    pipe.expire(redis_key, self.ttl_seconds)
+                    await pipe.execute()
+            except Exception as e:
+                logger.warning(f"Render cache Redis write failed: {e}")
+        return page
+
+    async def invalidate(self, subdomain: str) -> None:
+        """Drop every cached variant of a subdomain."""
+        prefix = f"{subdomain}:"
+        for key in [k for k in self._entries if k.startswith(prefix)]:
+            del self._entries[key]
+
+        redis = self._get_redis()
+        if redis is None:
+            return
+        try:
+            keys = [k async for k in redis.scan_iter(match=f"{_REDIS_PREFIX}:{prefix}*", count=100)]
+            if keys:
+                await redis.delete(*keys)
+        except Exception as e:
+            logger.warning(f"Render cache invalidation failed for {subdomain}: {e}")
+
+    def _remember(self, key: str, page: RenderedPage) -> None:
+        self._entries[key] = page
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _get_redis(self):
+        if self._redis is None and not self._redis_failed:
+            try:
+                self._redis = RedisService.create_async_client(
+                    decode_responses=False, socket_timeout=2
+                )
+            except Exception as e:
+                logger.warning(f"Render cache running without Redis: {e}")
+                self._redis_failed = True
+        return self._redis
+
+
+_cache: Optional[SiteRenderCache] = None
+
+
+def get_site_render_cache() -> SiteRenderCache:
+    """Get the process-wide rendered-page cache."""
+    global _cache
+    if _cache is None:
+        settings = get_settings()
+        _cache = SiteRenderCache(
+            max_entries=settings.SITE_RENDER_CACHE_SIZE,
+            ttl_seconds=settings.SITE_RENDER_CACHE_TTL_SECONDS,
+        )
+    return _cache
+
+
+async def invalidate_rendered_site(subdomain: Optional[str]) -> None:
+    """Invalidate cached renders after a site is regenerated, edited or purchased."""
+    if subdomain:
+        await get_site_render_cache().invalidate(subdomain)
@@ -12,7 +12,7 @@ Author: WebMagic Team
 Date: January 21, 2026
 """
 import logging
-from typing import Optional, Tuple
+from typing import Iterable, List, Optional, Tuple
 from datetime import datetime, time, timedelta
 from uuid import UUID
 import pytz
@@ -21,6 +21,7 @@ from sqlalchemy import select
 
 from models.sms_opt_out import SMSOptOut
 from core.exceptions import ValidationError
+from services.sms.opt_out_index import get_opt_out_index
 
 logger = logging.getLogger(__name__)
 
@@ -73,19 +74,33 @@ class SMSComplianceService:
         Returns:
             True if opted out, False if allowed to send
         """
-        phone_number = self._normalize_phone(phone_number)
+        phone_number = self.normalize_phone(phone_number)
         
-        result = await self.db.execute(
-            select(SMSOptOut).where(SMSOptOut.phone_number == phone_number)
-        )
-        opt_out = result.scalar_one_or_none()
-        
-        if opt_out:
-            logger.info(f"Phone {phone_number} is opted out (source: {opt_out.source})")
+        if await get_opt_out_index().opted_out(self.db, [phone_number]):
+            logger.info(f"Phone {phone_number} is opted out")
             return True
         
         return False
     
+    async def filter_sendable(self, phone_numbers: Iterable[str]) -> List[str]:
+        """
+        Bulk opt-out check for batch campaign preparation.
+        
+        Args:
+            phone_numbers: Phones in E.164 format
+        
+        Returns:
+            The numbers (normalized, input order) that have not opted out
+        
+        Raises:
+            ValidationError: If any phone format is invalid
+        """
+        normalized = [self.normalize_phone(phone) for phone in phone_numbers]
+        opted_out = await get_opt_out_index().opted_out(self.db, normalized)
+        if opted_out:
+            logger.info(f"Filtered {len(opted_out)} opted-out number(s) from batch")
+        return [phone for phone in normalized if phone not in opted_out]
+    
     async def check_can_send(
         self,
         phone_number: str,
@@ -107,14 +122,14 @@ class SMSComplianceService:
         Returns:
             Tuple of (can_send, reason_if_not)
         """
-        phone_number = self._normalize_phone(phone_number)
+        phone_number = self.normalize_phone(phone_number)
 
         # Check 1: Opted out?
         if await self.is_opted_out(phone_number):
             return (False, "Recipient has opted out")
 
         # Check 2: TCPA quiet hours (9 AM – 9 PM local)
-        if not self._is_business_hours(timezone_str):
+        if not self.is_business_hours(timezone_str):
             return (False, "Outside business hours (9 AM – 9 PM local time)")
 
         # Check 3 (autopilot only): must be inside a preferred engagement window
@@ -146,15 +161,18 @@ class SMSComplianceService:
         Returns:
             SMSOptOut instance
         """
-        phone_number = self._normalize_phone(phone_number)
+        phone_number = self.normalize_phone(phone_number)
         
         # Check if already opted out
         existing = await self.db.execute(
             select(SMSOptOut).where(SMSOptOut.phone_number == phone_number)
         )
-        if existing.scalar_one_or_none():
+        existing_opt_out = existing.scalar_one_or_none()
+        if existing_opt_out:
             logger.info(f"Phone {phone_number} already opted out")
-            return existing.scalar_one()
+            # Re-signal: the first attempt may have committed but failed to signal
+            await get_opt_out_index().invalidate()
+            return existing_opt_out
         
         # Create opt-out record
         opt_out = SMSOptOut(
@@ -168,6 +186,7 @@ class SMSComplianceService:
         self.db.add(opt_out)
         await self.db.commit()
         await self.db.refresh(opt_out)
+        await get_opt_out_index().invalidate()
         
         logger.info(f"Added opt-out: {phone_number} (source: {source})")
         return opt_out
@@ -185,7 +204,7 @@ class SMSComplianceService:
         Returns:
             True if removed, False if not found
         """
-        phone_number = self._normalize_phone(phone_number)
+        phone_number = self.normalize_phone(phone_number)
         
         result = await self.db.execute(
             select(SMSOptOut).where(SMSOptOut.phone_number == phone_number)
@@ -197,6 +216,7 @@ class SMSComplianceService:
         
         await self.db.delete(opt_out)
         await self.db.commit()
+        await get_opt_out_index().invalidate(required=False)
         
         logger.warning(
             f"Removed opt-out for {phone_number} - ensure explicit re-consent was obtained!"
@@ -248,7 +268,7 @@ class SMSComplianceService:
             Tuple of (action_taken, is_opt_out)
             action_taken: "opt_out", "reply", or "none"
         """
-        phone_number = self._normalize_phone(phone_number)
+        phone_number = self.normalize_phone(phone_number)
         
         # Check if it's a STOP request
         if self.is_stop_keyword(reply_message):
@@ -269,7 +289,7 @@ class SMSComplianceService:
     # BUSINESS HOURS
     # ========================================================================
     
-    def _is_business_hours(self, timezone_str: str = "America/Chicago") -> bool:
+    def is_business_hours(self, timezone_str: str = "America/Chicago") -> bool:
         """
         Check if current time is within business hours (9 AM - 9 PM local time).
         
@@ -381,7 +401,7 @@ class SMSComplianceService:
     # UTILITIES
     # ========================================================================
     
-    def _normalize_phone(self, phone_number: str) -> str:
+    def normalize_phone(self, phone_number: str) -> str:
         """
         Normalize phone number to E.164 format.
         
@@ -421,7 +441,7 @@ class SMSComplianceService:
             True if valid
         """
         try:
-            self._normalize_phone(phone_number)
+            self.normalize_phone(phone_number)
             return True
         except ValidationError:
             return False
@@ -26,6 +26,7 @@ import httpx
 
 from core.config import get_settings
 from core.exceptions import ExternalAPIException
+from services.sms.sms_sender import shared_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -136,13 +137,12 @@ class LabsMobileSMSProvider:
         logger.info("Sending SMS via LabsMobile to %s (%d chars)", to_phone, len(body))
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    LABSMOBILE_SEND_URL,
-                    json=payload,
-                    auth=(self.username, self.token),
-                    headers={"Content-Type": "application/json"},
-                )
+            response = await shared_http_client().post(
+                LABSMOBILE_SEND_URL,
+                json=payload,
+                auth=(self.username, self.token),
+                headers={"Content-Type": "application/json"},
+            )
 
             data = response.json()
             self._raise_for_error(response.status_code, data, to_phone)
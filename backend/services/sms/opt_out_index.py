@@ -0,0 +1,160 @@
+"""
+Per-process index of opted-out phone numbers.
+
+Every compliance check used to query sms_opt_outs for a single number, once
+per campaign created and again per send. The opt-out list is small and
+changes rarely, so each process keeps the full set of normalized E.164
+numbers in memory and answers most checks without touching the database.
+
+Compliance stays exact:
+
+- A number missing from the index is only reported as sendable when the
+  index is current. Writers replace a token in Redis after committing, and
+  every lookup compares it with the token the index was loaded under (one
+  Redis GET per lookup or batch), reloading on mismatch. Without Redis every
+  lookup goes to the database. A writer that cannot replace the token
+  retries and then raises (re-adding the opt-out signals again), and every
+  index is reloaded after SMS_OPT_OUT_INDEX_MAX_AGE_SECONDS regardless, which
+  bounds how long a lost signal can go unnoticed.
+- A number found in the index is confirmed against the database, so a
+  removal made elsewhere is honored immediately.
+"""
+import asyncio
+import logging
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import FrozenSet, Iterable, Optional, Set, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.config import get_settings
+from models.sms_opt_out import SMSOptOut
+from services.progress.redis_service import RedisService
+
+logger = logging.getLogger(__name__)
+
+VERSION_KEY = "sms:opt_outs:version"
+
+SIGNAL_ATTEMPTS = 3
+
+
+@dataclass
+class OptOutSnapshot:
+    """Opted-out numbers, as of one load."""
+    numbers: FrozenSet[str] = field(default_factory=frozenset)
+    version: Optional[str] = None
+    loaded_at: float = 0.0
+
+
+class OptOutIndex:
+    """
+    In-memory opt-out set with Redis token invalidation.
+
+    Usage:
+        opted_out = await get_opt_out_index().opted_out(db, ["+12345678900", ...])
+        ...
+        await get_opt_out_index().invalidate()  # after committing an opt-out change
+    """
+
+    def __init__(self, max_age_seconds: float = 30.0):
+        self.max_age_seconds = max_age_seconds
+        self._snapshot: Optional[OptOutSnapshot] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_age_seconds > 0
+
+    async def opted_out(self, db: AsyncSession, numbers: Iterable[str]) -> Set[str]:
+        """
+        Which of ``numbers`` (normalized E.164) are on the opt-out list.
+
+        Exact: index hits are confirmed in the database, and misses are only
+        trusted when the index is verified current.
+        """
+        numbers = set(numbers)
+        if not numbers:
+            return set()
+
+        snapshot = await self._current(db)
+        candidates = numbers if snapshot is None else numbers & snapshot.numbers
+        if not candidates:
+            return set()
+
+        result = await db.execute(
+            select(SMSOptOut.phone_number).where(SMSOptOut.phone_number.in_(candidates))
+        )
+        return set(result.scalars().all())
+
+    async def invalidate(self, required: bool = True) -> None:
+        """
+        Drop this process's index and signal every other process.
+
+        Args:
+            required: Raise if the signal cannot be sent. Needed after adding
+                an opt-out (other indexes would keep missing it); a removal
+                only leaves stale hits, which lookups confirm in the database.
+        """
+        self._snapshot = None
+        for attempt in range(1, SIGNAL_ATTEMPTS + 1):
+            try:
+                await RedisService.get_async_client().set(VERSION_KEY, uuid.uuid4().hex)
+                return
+            except Exception as e:
+                if attempt < SIGNAL_ATTEMPTS:
+                    await asyncio.sleep(0.1 * attempt)
+                    continue
+                if required:
+                    logger.error(f"❌ Opt-out index signal failed after {attempt} attempts: {e}")
+                    raise
+                logger.warning(f"⚠️ Opt-out index signal failed, other processes refresh within max age: {e}")
+
+    async def _current(self, db: AsyncSession) -> Optional[OptOutSnapshot]:
+        """The index if it can be verified current, else None (use the database)."""
+        if not self.enabled:
+            return None
+        available, version = await self._remote_version()
+        if not available:
+            return None
+        snapshot = self._snapshot
+        if (
+            snapshot is not None
+            and snapshot.version == version
+            and time.monotonic() - snapshot.loaded_at < self.max_age_seconds
+        ):
+            return snapshot
+        return await self._load(db, version)
+
+    async def _load(self, db: AsyncSession, version: Optional[str]) -> OptOutSnapshot:
+        # The token was read before the SELECT: a write that lands during it
+        # replaces the token again, and the next lookup reloads
+        result = await db.execute(select(SMSOptOut.phone_number))
+        snapshot = OptOutSnapshot(
+            numbers=frozenset(result.scalars().all()),
+            version=version,
+            loaded_at=time.monotonic(),
+        )
+        self._snapshot = snapshot
+        logger.debug(f"Loaded opt-out index: {len(snapshot.numbers)} number(s)")
+        return snapshot
+
+    @staticmethod
+    async def _remote_version() -> Tuple[bool, Optional[str]]:
+        """Returns (redis_available, version)."""
+        try:
+            return True, await RedisService.get_async_client().get(VERSION_KEY)
+        except Exception as e:
+            logger.debug(f"Opt-out index version check unavailable: {e}")
+            return False, None
+
+
+_index: Optional[OptOutIndex] = None
+
+
+def get_opt_out_index() -> OptOutIndex:
+    """Get the process-wide opt-out index."""
+    global _index
+    if _index is None:
+        _index = OptOutIndex(max_age_seconds=get_settings().SMS_OPT_OUT_INDEX_MAX_AGE_SECONDS)
+    return _index
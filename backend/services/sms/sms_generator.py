@@ -9,10 +9,10 @@ Date: January 21, 2026
 """
 from typing import Dict, Any, Optional
 import logging
-from anthropic import AsyncAnthropic
 
 from core.config import get_settings
 from core.text_utils import title_case
+from services.llm.gateway import get_llm_gateway, message_text
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
@@ -49,7 +49,6 @@ class SMSGenerator:
                 "Set ANTHROPIC_API_KEY in .env"
             )
         
-        self.client = AsyncAnthropic(api_key=settings.ANTHROPIC_API_KEY)
         self.model = "claude-3-5-sonnet-20241022"
         logger.info("SMS generator initialized")
     
@@ -97,13 +96,14 @@ class SMSGenerator:
         # Generate SMS via Claude
         try:
             # Use streaming to avoid timeout limits on large max_tokens
-            async with self.client.messages.stream(
+            final_message = await get_llm_gateway().stream(
+                "sms.generator",
                 model=self.model,
                 max_tokens=64000,  # Max for Claude Sonnet 4.5
                 temperature=0.7,
                 messages=[{"role": "user", "content": prompt}]
-            ) as stream:
-                sms_body = (await stream.get_final_text()).strip()
+            )
+            sms_body = message_text(final_message).strip()
             
             # Remove quotes if Claude added them
             sms_body = sms_body.strip('"').strip("'")
@@ -12,6 +12,7 @@ from typing import Optional, Dict, Any
 from abc import ABC, abstractmethod
 import logging
 import asyncio
+import weakref
 import httpx
 
 from core.config import get_settings
@@ -23,6 +24,25 @@ settings = get_settings()
 # Telnyx API configuration (kept for backward compatibility / rollback)
 TELNYX_API_URL = "https://api.telnyx.com/v2/messages"
 
+# One pooled client per event loop, shared by every provider call in the
+# process, so concurrent sends reuse keep-alive connections
+_http_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def shared_http_client() -> httpx.AsyncClient:
+    """Pooled httpx client bound to the running loop (30s timeout)."""
+    loop = asyncio.get_running_loop()
+    client = _http_clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            timeout=30.0,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+        )
+        _http_clients[loop] = client
+    return client
+
 
 class SMSProvider(ABC):
     """
@@ -137,65 +157,64 @@ class TelnyxSMSProvider(SMSProvider):
             
             logger.info(f"Sending SMS to {to_phone} (length: {len(body)} chars)")
             
-            # Send request using httpx (async)
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    TELNYX_API_URL,
-                    headers=headers,
-                    json=payload
-                )
-                
-                data = response.json()
-                
-                # Check for errors
-                if response.status_code not in (200, 201, 202):
-                    error_detail = data.get("errors", [{}])[0]
-                    error_code = error_detail.get("code", "unknown")
-                    error_msg = error_detail.get("detail", str(data))
-                    
-                    logger.error(
-                        f"Telnyx API error {response.status_code}: {error_msg}"
-                    )
-                    raise ExternalAPIException(
-                        f"Telnyx error {error_code}: {error_msg}"
-                    )
-                
-                # Parse successful response
-                message_data = data.get("data", {})
-                message_id = message_data.get("id")
-                
-                # Telnyx returns parts count instead of segments
-                parts = message_data.get("parts", 1)
-                
-                # Get initial status from 'to' array
-                to_info = message_data.get("to", [{}])
-                if isinstance(to_info, list) and len(to_info) > 0:
-                    initial_status = to_info[0].get("status", "queued")
-                else:
-                    initial_status = "queued"
-                
-                # Prepare response (cost comes via webhook, not initial response)
-                result = {
-                    "provider": "telnyx",
-                    "message_id": message_id,
-                    "status": initial_status,
-                    "to": to_phone,
-                    "from": from_phone or self.from_phone,
-                    "body": body,
-                    "segments": parts,
-                    "cost": None,  # Telnyx sends cost in webhook
-                    "cost_unit": "USD",
-                    "sent_at": message_data.get("created_at"),
-                    "error_code": None,
-                    "error_message": None
-                }
+            # Send request over the shared pooled client
+            response = await shared_http_client().post(
+                TELNYX_API_URL,
+                headers=headers,
+                json=payload
+            )
+            
+            data = response.json()
+            
+            # Check for errors
+            if response.status_code not in (200, 201, 202):
+                error_detail = data.get("errors", [{}])[0]
+                error_code = error_detail.get("code", "unknown")
+                error_msg = error_detail.get("detail", str(data))
                 
-                logger.info(
-                    f"SMS sent successfully: {message_id} "
-                    f"(parts: {parts}, status: {initial_status})"
+                logger.error(
+                    f"Telnyx API error {response.status_code}: {error_msg}"
                 )
-                
-                return result
+                raise ExternalAPIException(
+                    f"Telnyx error {error_code}: {error_msg}"
+                )
+            
+            # Parse successful response
+            message_data = data.get("data", {})
+            message_id = message_data.get("id")
+            
+            # Telnyx returns parts count instead of segments
+            parts = message_data.get("parts", 1)
+            
+            # Get initial status from 'to' array
+            to_info = message_data.get("to", [{}])
+            if isinstance(to_info, list) and len(to_info) > 0:
+                initial_status = to_info[0].get("status", "queued")
+            else:
+                initial_status = "queued"
+            
+            # Prepare response (cost comes via webhook, not initial response)
+            result = {
+                "provider": "telnyx",
+                "message_id": message_id,
+                "status": initial_status,
+                "to": to_phone,
+                "from": from_phone or self.from_phone,
+                "body": body,
+                "segments": parts,
+                "cost": None,  # Telnyx sends cost in webhook
+                "cost_unit": "USD",
+                "sent_at": message_data.get("created_at"),
+                "error_code": None,
+                "error_message": None
+            }
+            
+            logger.info(
+                f"SMS sent successfully: {message_id} "
+                f"(parts: {parts}, status: {initial_status})"
+            )
+            
+            return result
         
         except httpx.TimeoutException:
             error_msg = f"Telnyx API timeout sending SMS to {to_phone}"
@@ -0,0 +1,495 @@
+"""
+SMS delivery-status ingestion.
+
+Delivery receipts arrive in bursts (several per message right after a
+campaign send). The webhooks only parse the callback and append it to a
+Redis stream, then return 200. A Celery consumer
+(tasks.sms_sync.apply_sms_status_events) reads the stream in batches,
+coalesces the events per provider message id and applies them to campaigns
+and sms_messages with batched UPDATEs.
+
+Idempotency:
+- A provider redelivering the same callback is dropped at ingest (dedup key
+  per callback for SMS_STATUS_DEDUP_TTL_SECONDS)
+- Applying is monotonic: a status only moves forward
+  (pending → sent → delivered/failed), delivered_at is set once and cost is
+  overwritten with the same value, so re-applying a batch after a consumer
+  crash (unacked stream entries) changes nothing
+- CRM side effects fire only when a campaign actually transitions
+
+Without Redis the event is applied inline in the request, as before.
+"""
+import hashlib
+import json
+import logging
+import os
+import socket
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.config import get_settings
+from models.campaign import Campaign
+from models.sms_message import SMSMessage
+from services.crm import BusinessLifecycleService
+from services.progress.redis_service import RedisService
+
+logger = logging.getLogger(__name__)
+
+STREAM_KEY = "sms:status:events"
+CONSUMER_GROUP = "sms-status-appliers"
+DEDUP_KEY_PREFIX = "sms:status:seen:"
+
+# Unacked entries idle this long belong to a dead consumer and are re-read
+_RECLAIM_IDLE_MS = 5 * 60 * 1000
+
+# Telnyx status mapping to internal status
+TELNYX_STATUS_MAP = {
+    "queued": "pending",
+    "sending": "sent",
+    "sent": "sent",
+    "delivered": "delivered",
+    "sending_failed": "failed",
+    "delivery_failed": "failed",
+    "delivery_unconfirmed": "sent",  # Carrier didn't confirm but likely delivered
+}
+
+# LabsMobile desc → internal campaign status
+# acklevel values: "operator" (intermediate), "handset" (final), "error"
+# desc values come from the carrier's DLR (Delivery Receipt) codes.
+LABSMOBILE_STATUS_MAP: Dict[str, str] = {
+    "DELIVRD": "delivered",
+    "READ":    "delivered",
+    "REJECTD": "failed",
+    "UNDELIV": "failed",
+    "EXPIRED": "failed",
+    "BLOCKED": "failed",
+    "UNKNOWN": "failed",
+}
+
+# Human-readable explanation for each delivery failure desc code.
+# Surfaced in campaign.error_message so operators know exactly why a send failed.
+LABSMOBILE_FAILURE_REASONS: Dict[str, str] = {
+    "REJECTD": (
+        "Message rejected by the carrier or operator — "
+        "the destination number may be on a DNC list, "
+        "the sender ID may not be allowed, or content was flagged."
+    ),
+    "UNDELIV": (
+        "Message undeliverable — the destination number may be "
+        "disconnected, out of coverage, the handset is full, "
+        "or the number does not exist."
+    ),
+    "EXPIRED": (
+        "Message expired before delivery — the handset was unreachable "
+        "for longer than the carrier TTL (usually 24–72 hours)."
+    ),
+    "BLOCKED": (
+        "Message blocked — the destination number is on a "
+        "Do-Not-Disturb or spam filter list, or the account has been "
+        "flagged for content policy violations."
+    ),
+    "UNKNOWN": (
+        "Delivery status unknown — the carrier did not return a final "
+        "delivery receipt. The message may or may not have been received."
+    ),
+}
+
+# Order of delivery statuses; a status never moves backwards. Statuses not
+# listed (replied, opted_out, ...) are never overwritten by a receipt.
+_STATUS_RANK = {
+    "draft": 0,
+    "scheduled": 0,
+    "pending": 0,
+    "queued": 0,
+    "sending": 0,
+    "sent": 1,
+    "delivered": 2,
+    "failed": 2,
+}
+_UNRANKED = 3
+
+
+@dataclass
+class StatusEvent:
+    """One delivery callback, normalized."""
+    provider: str
+    event_key: str
+    message_id: str
+    status: Optional[str]  # Internal status; None = no status information
+    delivered: bool
+    cost: Optional[float]
+    error_code: Optional[str]
+    error_message: Optional[str]
+    received_at: float  # Unix time the webhook received it
+
+
+def _digest(*parts: Any) -> str:
+    return hashlib.sha256(json.dumps(parts, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def parse_telnyx_status(body: Dict[str, Any]) -> Optional[StatusEvent]:
+    """
+    Normalize a Telnyx message.sent / message.finalized webhook.
+
+    Returns:
+        None if the payload has no message id
+    """
+    data = body.get("data", {}) or {}
+    payload = data.get("payload", {}) or {}
+    message_id = payload.get("id")
+    if not message_id:
+        return None
+
+    to_info = payload.get("to", [{}])
+    if isinstance(to_info, list) and len(to_info) > 0:
+        raw_status = (to_info[0] or {}).get("status", "unknown")
+    else:
+        raw_status = "unknown"
+
+    error_code = error_message = None
+    errors = payload.get("errors", [])
+    if errors:
+        error_info = errors[0]
+        error_code = str(error_info.get("code", "unknown"))
+        error_message = f"Telnyx Error {error_code}: {error_info.get('detail', 'Unknown error')}"
+
+    # Telnyx sends cost in the finalized webhook
+    cost = None
+    cost_amount = (payload.get("cost") or {}).get("amount")
+    if cost_amount:
+        try:
+            cost = float(cost_amount)
+        except (ValueError, TypeError):
+            pass
+
+    return StatusEvent(
+        provider="telnyx",
+        # data.id identifies the webhook event; redeliveries reuse it
+        event_key=str(data.get("id") or _digest(body)),
+        message_id=str(message_id),
+        status=TELNYX_STATUS_MAP.get(raw_status),
+        delivered=raw_status == "delivered",
+        cost=cost,
+        error_code=error_code,
+        error_message=error_message,
+        received_at=time.time(),
+    )
+
+
+def parse_labsmobile_status(
+    subid: Optional[str],
+    acklevel: Optional[str],
+    status: Optional[str],
+    desc: Optional[str],
+    timestamp: Optional[str]
+) -> Optional[StatusEvent]:
+    """
+    Normalize a LabsMobile delivery GET callback.
+
+    Returns:
+        None if the callback has no subid
+    """
+    if not subid:
+        return None
+
+    desc_upper = (desc or "").upper()
+    new_status = LABSMOBILE_STATUS_MAP.get(desc_upper)
+    # If acklevel is "error" and no desc provided, mark failed
+    if acklevel == "error" and not desc:
+        new_status = "failed"
+
+    error_message = None
+    if acklevel == "error" or new_status == "failed":
+        reason = LABSMOBILE_FAILURE_REASONS.get(desc_upper)
+        if reason:
+            error_message = f"LabsMobile Error ({desc_upper}): {reason}"
+        elif desc:
+            error_message = f"LabsMobile delivery failed: desc={desc} acklevel={acklevel}"
+        else:
+            error_message = f"LabsMobile delivery failed: acklevel={acklevel or 'error'}"
+
+    return StatusEvent(
+        provider="labsmobile",
+        event_key=_digest(subid, acklevel, status, desc, timestamp),
+        message_id=subid,
+        status=new_status,
+        delivered=desc_upper == "DELIVRD",
+        cost=None,
+        error_code=(desc_upper or None) if error_message else None,
+        error_message=error_message,
+        received_at=time.time(),
+    )
+
+
+@dataclass
+class _Coalesced:
+    """Net effect of every event for one message id."""
+    status: Optional[str] = None
+    delivered_at: Optional[float] = None
+    cost: Optional[float] = None
+    error_code: Optional[str] = None
+    error_message: Optional[str] = None
+
+
+def _rank(status: Optional[str]) -> int:
+    return _STATUS_RANK.get(status, _UNRANKED) if status else -1
+
+
+def coalesce(events: Iterable[StatusEvent]) -> Dict[str, _Coalesced]:
+    """Fold events (in arrival order) into one update per message id."""
+    folded: Dict[str, _Coalesced] = {}
+    for event in events:
+        state = folded.setdefault(event.message_id, _Coalesced())
+        if event.status and _rank(event.status) >= _rank(state.status):
+            state.status = event.status
+        if event.delivered and state.delivered_at is None:
+            state.delivered_at = event.received_at
+        if event.cost is not None:
+            state.cost = event.cost
+        if event.error_message:
+            state.error_code = event.error_code
+            state.error_message = event.error_message
+    return folded
+
+
+class SMSStatusIngest:
+    """
+    Redis-stream buffer between delivery webhooks and the database.
+
+    Usage (webhook):
+        event = parse_telnyx_status(body)
+        await get_sms_status_ingest().ingest(db, event)
+
+    Usage (Celery consumer):
+        stats = await get_sms_status_ingest().consume()
+    """
+
+    def __init__(self, stream_maxlen: int = 100000, batch_size: int = 500, dedup_ttl_seconds: int = 86400):
+        self.stream_maxlen = stream_maxlen
+        self.batch_size = batch_size
+        self.dedup_ttl_seconds = dedup_ttl_seconds
+        self.consumer_name = f"{socket.gethostname()}:{os.getpid()}"
+        self._group_ready = False
+
+    # ── Ingest (API) ────────────────────────────────────────────
+
+    async def ingest(self, db: AsyncSession, event: StatusEvent) -> str:
+        """
+        Durably record one callback.
+
+        Returns:
+            "queued", "duplicate", or "applied" (Redis unavailable - applied inline)
+        """
+        try:
+            redis = RedisService.get_async_client()
+            first_seen = await redis.set(
+                f"{DEDUP_KEY_PREFIX}{event.provider}:{event.event_key}",
+                "1",
+                nx=True,
+                ex=self.dedup_ttl_seconds,
+            )
+            if not first_seen:
+                return "duplicate"
+            await redis.xadd(
+                STREAM_KEY,
+                {"event": json.dumps(asdict(event))},
+                maxlen=self.stream_maxlen,
+                approximate=True,
+            )
+            return "queued"
+        except Exception as e:
+            logger.warning(f"⚠️ SMS status stream unavailable, applying inline: {e}")
+            await apply_status_events(db, [event])
+            return "applied"
+
+    # ── Consume (Celery) ────────────────────────────────────────
+
+    async def consume(self, session_factory, max_batches: int = 20) -> Dict[str, int]:
+        """
+        Apply buffered callbacks until the stream is drained (or max_batches).
+
+        Entries are acked only after their batch has been committed, so a
+        crash leaves them pending and they are re-read (and re-applied
+        idempotently) by the next run.
+
+        Args:
+            session_factory: Async session factory (CeleryAsyncSessionLocal)
+        """
+        redis = RedisService.get_async_client()
+        await self._ensure_group(redis)
+
+        totals = {"events": 0, "messages": 0, "campaigns_updated": 0, "sms_messages_updated": 0}
+
+        # Entries a dead consumer read but never acked
+        reclaimed = await redis.xautoclaim(
+            STREAM_KEY, CONSUMER_GROUP, self.consumer_name,
+            min_idle_time=_RECLAIM_IDLE_MS, start_id="0-0", count=self.batch_size,
+        )
+        pending_entries = reclaimed[1] if reclaimed else []
+
+        for _ in range(max_batches):
+            if pending_entries:
+                entries, pending_entries = pending_entries, []
+            else:
+                response = await redis.xreadgroup(
+                    CONSUMER_GROUP, self.consumer_name, {STREAM_KEY: ">"}, count=self.batch_size
+                )
+                entries = response[0][1] if response else []
+            if not entries:
+                break
+
+            events: List[StatusEvent] = []
+            for entry_id, fields in entries:
+                try:
+                    events.append(StatusEvent(**json.loads((fields or {})["event"])))
+                except (KeyError, TypeError, ValueError) as e:
+                    logger.error(f"Dropping malformed SMS status entry {entry_id}: {e}")
+
+            if events:
+                async with session_factory() as db:
+                    applied = await apply_status_events(db, events)
+                for key, value in applied.items():
+                    totals[key] += value
+            totals["events"] += len(events)
+            await redis.xack(STREAM_KEY, CONSUMER_GROUP, *[entry_id for entry_id, _ in entries])
+
+        return totals
+
+    async def _ensure_group(self, redis) -> None:
+        if self._group_ready:
+            return
+        try:
+            await redis.xgroup_create(STREAM_KEY, CONSUMER_GROUP, id="0", mkstream=True)
+        except Exception as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+        self._group_ready = True
+
+
+async def apply_status_events(db: AsyncSession, events: List[StatusEvent]) -> Dict[str, int]:
+    """
+    Coalesce events per message id and apply them with batched UPDATEs.
+
+    Commits the session. Idempotent: re-applying the same events is a no-op.
+
+    Returns:
+        {"messages", "campaigns_updated", "sms_messages_updated"}
+    """
+    folded = coalesce(events)
+    if not folded:
+        return {"messages": 0, "campaigns_updated": 0, "sms_messages_updated": 0}
+    message_ids = list(folded)
+    now = datetime.utcnow()
+
+    # Row locks serialize concurrent appliers touching the same campaigns
+    campaign_rows = (
+        await db.execute(
+            select(Campaign.id, Campaign.sms_sid, Campaign.status, Campaign.business_id, Campaign.delivered_at)
+            .where(Campaign.sms_sid.in_(message_ids))
+            .with_for_update()
+        )
+    ).all()
+
+    campaign_updates: List[Dict[str, Any]] = []
+    transitions: List[tuple] = []  # (business_id, new_status)
+    for row in campaign_rows:
+        state = folded[row.sms_sid]
+        values: Dict[str, Any] = {}
+        if state.status and _rank(state.status) > _rank(row.status):
+            values["status"] = state.status
+            if state.status in ("delivered", "failed") and row.business_id:
+                transitions.append((row.business_id, state.status))
+        if state.delivered_at is not None and row.delivered_at is None:
+            values["delivered_at"] = datetime.utcfromtimestamp(state.delivered_at)
+        if state.cost is not None:
+            values["sms_cost"] = state.cost
+        if state.error_message:
+            values["error_message"] = state.error_message
+        if values:
+            values["id"] = row.id
+            values["updated_at"] = now
+            campaign_updates.append(values)
+
+    message_rows = (
+        await db.execute(
+            select(SMSMessage.id, SMSMessage.telnyx_message_id, SMSMessage.status, SMSMessage.delivered_at)
+            .where(
+                SMSMessage.telnyx_message_id.in_(message_ids),
+                SMSMessage.direction == "outbound",
+            )
+            .with_for_update()
+        )
+    ).all()
+
+    message_updates: List[Dict[str, Any]] = []
+    for row in message_rows:
+        state = folded[row.telnyx_message_id]
+        values = {}
+        if state.status and _rank(state.status) > _rank(row.status):
+            values["status"] = state.status
+        if state.delivered_at is not None and row.delivered_at is None:
+            values["delivered_at"] = datetime.fromtimestamp(state.delivered_at, tz=timezone.utc)
+        if state.cost is not None:
+            values["cost"] = state.cost
+        if state.error_message:
+            values["error_code"] = (state.error_code or "")[:50] or None
+            values["error_message"] = state.error_message
+        if values:
+            values["id"] = row.id
+            message_updates.append(values)
+
+    # ORM bulk UPDATE by primary key: one executemany per column set
+    if campaign_updates:
+        await db.execute(update(Campaign), campaign_updates)
+    if message_updates:
+        await db.execute(update(SMSMessage), message_updates)
+    await db.commit()
+
+    unmatched = len(message_ids) - len({row.sms_sid for row in campaign_rows})
+    if unmatched:
+        logger.debug(f"{unmatched} SMS status message id(s) matched no campaign")
+
+    # CRM: only on actual transitions, so redelivered receipts don't re-fire
+    if transitions:
+        lifecycle_service = BusinessLifecycleService(db)
+        for business_id, new_status in transitions:
+            try:
+                if new_status == "delivered":
+                    await lifecycle_service.mark_campaign_sent(business_id, channel="sms")
+                else:
+                    await lifecycle_service.mark_bounced(business_id)
+                await db.commit()
+            except Exception as e:
+                await db.rollback()
+                logger.error(f"CRM update error for business {business_id}: {e}", exc_info=True)
+
+    logger.info(
+        f"📨 Applied {len(events)} SMS status event(s) for {len(folded)} message(s): "
+        f"{len(campaign_updates)} campaign(s), {len(message_updates)} sms_message(s) updated"
+    )
+    return {
+        "messages": len(folded),
+        "campaigns_updated": len(campaign_updates),
+        "sms_messages_updated": len(message_updates),
+    }
+
+
+_ingest: Optional[SMSStatusIngest] = None
+
+
+def get_sms_status_ingest() -> SMSStatusIngest:
+    """Get the process-wide SMS status ingest."""
+    global _ingest
+    if _ingest is None:
+        settings = get_settings()
+        _ingest = SMSStatusIngest(
+            stream_maxlen=settings.SMS_STATUS_STREAM_MAXLEN,
+            batch_size=settings.SMS_STATUS_BATCH_SIZE,
+            dedup_ttl_seconds=settings.SMS_STATUS_DEDUP_TTL_SECONDS,
+        )
+    return _ingest
@@ -32,17 +32,15 @@ from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
-from anthropic import AsyncAnthropic
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from core.config import get_settings
 from core.html_utils import strip_claim_bar, strip_claim_bar_css
 from models.site_models import Site, SiteVersion
 from models.support_ticket import SupportTicket
+from services.llm.gateway import get_llm_gateway
 
 logger = logging.getLogger(__name__)
-settings = get_settings()
 
 
 class SiteEditProcessor:
@@ -51,7 +49,7 @@ class SiteEditProcessor:
     MODEL = "claude-sonnet-4-5"
 
     def __init__(self) -> None:
-        self._client = AsyncAnthropic(api_key=settings.ANTHROPIC_API_KEY)
+        self._gateway = get_llm_gateway()
 
     # ── Public entry point ─────────────────────────────────────────────────
 
@@ -428,7 +426,8 @@ Rules:
 - Include a "change_index" on every operation so Stage 3 can log which change it came from.
 """
         try:
-            response = await self._client.messages.create(
+            response = await self._gateway.create(
+                "support.site_edit.plan",
                 model=self.MODEL,
                 max_tokens=4096,
                 temperature=0.1,
@@ -648,7 +647,8 @@ RULES:
 Return ONLY the updated HTML section:"""
 
         try:
-            response = await self._client.messages.create(
+            response = await self._gateway.create(
+                "support.site_edit.apply",
                 model=self.MODEL,
                 max_tokens=8000,
                 temperature=0.1,
@@ -16,9 +16,9 @@ from models.support_ticket import SupportTicket, TicketMessage, TicketTemplate
 from models.site_models import CustomerUser, Site, SiteVersion, CustomerSiteOwnership
 from core.exceptions import NotFoundError, ValidationError, ForbiddenError
 from core.html_utils import strip_claim_bar, strip_claim_bar_css
-from anthropic import AsyncAnthropic
 from core.config import get_settings
 from services.emails.email_service import get_email_service
+from services.llm.gateway import get_llm_gateway, message_text
 from services.system_settings_service import SystemSettingsService
 
 logger = logging.getLogger(__name__)
@@ -223,7 +223,6 @@ class TicketService:
         """
         try:
             import json
-            ai_client = AsyncAnthropic(api_key=settings.ANTHROPIC_API_KEY)
             
             # Build prompt for AI
             prompt = f"""You are a customer support AI assistant. Analyze the following support ticket and provide:
@@ -255,7 +254,8 @@ Respond in JSON format:
             
             # Get AI response
             # Use streaming to avoid timeout limits on large max_tokens
-            async with ai_client.messages.stream(
+            final_message = await get_llm_gateway().stream(
+                "support.ticket_ai",
                 model="claude-sonnet-4-5",
                 max_tokens=64000,  # Max for Claude Sonnet 4.5
                 temperature=0.3,
@@ -263,8 +263,8 @@ Respond in JSON format:
                 messages=[
                     {"role": "user", "content": prompt}
                 ]
-            ) as stream:
-                response_text = await stream.get_final_text()
+            )
+            response_text = message_text(final_message)
             
             # Parse AI response
             try:
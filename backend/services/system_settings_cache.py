@@ -0,0 +1,133 @@
+"""
+Read-through cache for the system_settings table.
+
+Settings are read on hot paths (short-link creation reads five, every beat
+task checks autopilot, generation and validation read the AI config) but
+change only when an admin saves the settings page. Each process keeps one
+snapshot of the whole table, loaded with a single SELECT, and serves reads
+from memory.
+
+Invalidation is a version counter in Redis: writers INCR it after commit,
+and readers compare it with their snapshot's version at most once every
+SYSTEM_SETTINGS_CACHE_CHECK_SECONDS, so a change reaches every API and
+worker process within about a second. A snapshot is never served past
+SYSTEM_SETTINGS_CACHE_MAX_AGE_SECONDS, which bounds staleness when Redis
+is unavailable.
+"""
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.config import get_settings
+from models.system_settings import SystemSetting
+from services.progress.redis_service import RedisService
+
+logger = logging.getLogger(__name__)
+
+VERSION_KEY = "system_settings:version"
+
+
+@dataclass
+class SettingsSnapshot:
+    """Every setting's typed value, as of one load."""
+    values: Dict[str, Any] = field(default_factory=dict)
+    categories: Dict[str, str] = field(default_factory=dict)
+    version: Optional[str] = None
+    loaded_at: float = 0.0
+
+    def by_category(self, category: str) -> Dict[str, Any]:
+        return {
+            key: self.values[key]
+            for key, key_category in self.categories.items()
+            if key_category == category
+        }
+
+
+class SystemSettingsCache:
+    """
+    Per-process settings snapshot with Redis version invalidation.
+
+    Usage:
+        snapshot = await get_system_settings_cache().snapshot(db)
+        value = snapshot.values.get("llm_model", default)
+        ...
+        await get_system_settings_cache().invalidate()  # after committing a change
+    """
+
+    def __init__(self, check_interval_seconds: float = 1.0, max_age_seconds: float = 60.0):
+        self.check_interval_seconds = check_interval_seconds
+        self.max_age_seconds = max_age_seconds
+        self._snapshot: Optional[SettingsSnapshot] = None
+        self._checked_at = 0.0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_age_seconds > 0
+
+    async def snapshot(self, db: AsyncSession) -> SettingsSnapshot:
+        """Current settings, reloading from the database when stale."""
+        now = time.monotonic()
+        snapshot = self._snapshot
+        if snapshot is not None and now - snapshot.loaded_at < self.max_age_seconds:
+            if now - self._checked_at < self.check_interval_seconds:
+                return snapshot
+            available, version = await self._remote_version()
+            self._checked_at = now
+            # Without Redis, keep serving until max age
+            if not available or version == snapshot.version:
+                return snapshot
+        return await self._load(db)
+
+    async def invalidate(self) -> None:
+        """Drop this process's snapshot and signal every other process."""
+        self._snapshot = None
+        try:
+            await RedisService.get_async_client().incr(VERSION_KEY)
+        except Exception as e:
+            logger.warning(f"⚠️ Settings version bump failed, other processes refresh within max age: {e}")
+
+    async def _load(self, db: AsyncSession) -> SettingsSnapshot:
+        # Read the version first: a write that lands during the SELECT bumps
+        # it again, and the next check reloads
+        _, version = await self._remote_version()
+        result = await db.execute(select(SystemSetting))
+        snapshot = SettingsSnapshot(version=version, loaded_at=time.monotonic())
+        for setting in result.scalars().all():
+            try:
+                snapshot.values[setting.key] = setting.get_typed_value()
+            except (TypeError, ValueError) as e:
+                logger.warning(f"Setting {setting.key} has an invalid {setting.value_type} value: {e}")
+                snapshot.values[setting.key] = setting.value
+            snapshot.categories[setting.key] = setting.category
+        self._snapshot = snapshot
+        self._checked_at = snapshot.loaded_at
+        logger.debug(f"Loaded {len(snapshot.values)} system settings (version {version})")
+        return snapshot
+
+    @staticmethod
+    async def _remote_version() -> Tuple[bool, Optional[str]]:
+        """Returns (redis_available, version)."""
+        try:
+            return True, await RedisService.get_async_client().get(VERSION_KEY)
+        except Exception as e:
+            logger.debug(f"Settings version check unavailable: {e}")
+            return False, None
+
+
+_cache: Optional[SystemSettingsCache] = None
+
+
+def get_system_settings_cache() -> SystemSettingsCache:
+    """Get the process-wide settings cache."""
+    global _cache
+    if _cache is None:
+        settings = get_settings()
+        _cache = SystemSettingsCache(
+            check_interval_seconds=settings.SYSTEM_SETTINGS_CACHE_CHECK_SECONDS,
+            max_age_seconds=settings.SYSTEM_SETTINGS_CACHE_MAX_AGE_SECONDS,
+        )
+    return _cache
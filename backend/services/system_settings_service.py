@@ -1,10 +1,15 @@
 """
 System Settings Service - Manages runtime configuration.
+
+Reads are served from an in-process snapshot (services.system_settings_cache);
+set_setting() invalidates it in every process.
 """
 from typing import Dict, Any, Optional, List
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from models.system_settings import SystemSetting
+from services.system_settings_cache import get_system_settings_cache
+import copy
 import logging
 import json
 
@@ -116,7 +121,14 @@ class SystemSettingsService:
     
     @staticmethod
     async def get_setting(db: AsyncSession, key: str, default: Any = None) -> Any:
-        """Get a setting value with type conversion."""
+        """Get a setting value with type conversion (served from the settings cache)."""
+        cache = get_system_settings_cache()
+        if cache.enabled:
+            snapshot = await cache.snapshot(db)
+            if key in snapshot.values:
+                return copy.deepcopy(snapshot.values[key])
+            return default
+        
         result = await db.execute(
             select(SystemSetting).where(SystemSetting.key == key)
         )
@@ -129,6 +141,11 @@ class SystemSettingsService:
     @staticmethod
     async def get_settings_by_category(db: AsyncSession, category: str) -> Dict[str, Any]:
         """Get all settings for a category."""
+        cache = get_system_settings_cache()
+        if cache.enabled:
+            snapshot = await cache.snapshot(db)
+            return copy.deepcopy(snapshot.by_category(category))
+        
         result = await db.execute(
             select(SystemSetting).where(SystemSetting.category == category)
         )
@@ -181,6 +198,7 @@ class SystemSettingsService:
         
         await db.commit()
         await db.refresh(setting)
+        await get_system_settings_cache().invalidate()
         return setting
     
     @staticmethod
@@ -380,4 +398,5 @@ class SystemSettingsService:
                 logger.info(f"Created setting: {setting_data['key']}")
         
         await db.commit()
+        await get_system_settings_cache().invalidate()
         logger.info("AI defaults seeded successfully")
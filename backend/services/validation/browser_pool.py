@@ -0,0 +1,208 @@
+"""
+Worker-lifetime Playwright browser pool.
+
+Launching Chromium dominates the cost of validating a single URL, so
+validation workers keep a small pool of warm browsers and hand out a fresh
+stealth context + page per validation instead of launching a browser per task.
+
+Pool layout: N browsers × M concurrent contexts each. A browser is recycled
+(closed and relaunched) once it has served K pages or when it crashes /
+disconnects; recycling waits until the browser has no borrowed pages.
+
+The pool is bound to the event loop it was started on. Celery validation
+tasks run on a persistent per-process loop, so the pool lives for the whole
+worker process and is closed on ``worker_process_shutdown``.
+
+Usage:
+    pool = await get_browser_pool()
+    async with pool.page() as page:
+        await page.goto(url)
+"""
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import Optional, List
+
+from playwright.async_api import async_playwright, Browser, Page
+
+from core.config import get_settings
+from .stealth_config import launch_stealth_browser, create_stealth_context
+
+logger = logging.getLogger(__name__)
+
+
+class _PooledBrowser:
+    """One pooled Chromium instance and its bookkeeping."""
+
+    def __init__(self, index: int, max_contexts: int):
+        self.index = index
+        self.browser: Optional[Browser] = None
+        self.slots = asyncio.Semaphore(max_contexts)
+        self.active = 0
+        self.pages_served = 0
+        self.needs_recycle = False
+        self.lock = asyncio.Lock()
+
+    @property
+    def healthy(self) -> bool:
+        return (
+            self.browser is not None
+            and self.browser.is_connected()
+            and not self.needs_recycle
+        )
+
+
+class BrowserPool:
+    """
+    Pool of warm stealth browsers shared by all validations in a process.
+
+    Args:
+        browsers: Number of Chromium instances (N)
+        contexts_per_browser: Concurrent contexts per browser (M)
+        max_pages_per_browser: Recycle a browser after this many pages (K)
+    """
+
+    def __init__(
+        self,
+        browsers: int = 2,
+        contexts_per_browser: int = 3,
+        max_pages_per_browser: int = 50
+    ):
+        self.max_pages_per_browser = max_pages_per_browser
+        self.capacity = browsers * contexts_per_browser
+        self._browsers: List[_PooledBrowser] = [
+            _PooledBrowser(i, contexts_per_browser) for i in range(browsers)
+        ]
+        self._capacity = asyncio.Semaphore(self.capacity)
+        self._playwright = None
+        self._start_lock = asyncio.Lock()
+        self._next = 0
+        self._closed = False
+
+    async def start(self) -> "BrowserPool":
+        """Start Playwright (browsers are launched lazily on first borrow)."""
+        async with self._start_lock:
+            if self._playwright is None:
+                self._playwright = await async_playwright().start()
+                logger.info(
+                    f"Browser pool started: {len(self._browsers)} browsers, "
+                    f"recycle after {self.max_pages_per_browser} pages"
+                )
+        return self
+
+    async def close(self) -> None:
+        """Close every browser and stop Playwright."""
+        self._closed = True
+        for pooled in self._browsers:
+            await self._close_browser(pooled)
+        if self._playwright is not None:
+            try:
+                await self._playwright.stop()
+            except Exception as e:
+                logger.warning(f"Error stopping Playwright: {e}")
+            self._playwright = None
+        logger.info("Browser pool closed")
+
+    @asynccontextmanager
+    async def page(self):
+        """
+        Borrow a page in a fresh stealth context.
+
+        The context is closed on return. If the browser crashed while the page
+        was borrowed it is flagged and relaunched on the next borrow.
+        """
+        if self._closed:
+            raise RuntimeError("Browser pool is closed")
+        await self.start()
+
+        async with self._capacity:
+            pooled = self._pick_browser()
+            pooled.active += 1  # reserve now so concurrent borrowers spread out
+            context = None
+            browser = None
+            try:
+                async with pooled.slots:
+                    browser = await self._ensure_browser(pooled)
+                    try:
+                        context = await create_stealth_context(browser)
+                        page: Page = await context.new_page()
+                        yield page
+                    except Exception:
+                        if not browser.is_connected():
+                            logger.warning(f"Pooled browser #{pooled.index} crashed; scheduling recycle")
+                            pooled.needs_recycle = True
+                        raise
+                    finally:
+                        if context is not None:
+                            try:
+                                await context.close()
+                            except Exception as e:
+                                logger.debug(f"Error closing pooled context: {e}")
+                        pooled.pages_served += 1
+                        if pooled.pages_served >= self.max_pages_per_browser:
+                            pooled.needs_recycle = True
+            finally:
+                pooled.active -= 1
+
+    def _pick_browser(self) -> _PooledBrowser:
+        """Least-busy browser, round-robin on ties (one with a free slot exists)."""
+        count = len(self._browsers)
+        order = [self._browsers[(self._next + i) % count] for i in range(count)]
+        self._next = (self._next + 1) % count
+        return min(order, key=lambda b: b.active)
+
+    async def _ensure_browser(self, pooled: _PooledBrowser) -> Browser:
+        """Return a healthy browser for this slot, (re)launching if needed."""
+        async with pooled.lock:
+            if pooled.healthy:
+                return pooled.browser
+
+            # Recycle only once the browser is idle (the caller holds one
+            # reservation); other borrowers keep using the old instance until
+            # then, unless it is dead.
+            if pooled.browser is not None and pooled.browser.is_connected() and pooled.active > 1:
+                return pooled.browser
+
+            await self._close_browser(pooled)
+            pooled.browser = await launch_stealth_browser(self._playwright)
+            pooled.pages_served = 0
+            pooled.needs_recycle = False
+            logger.info(f"Launched pooled browser #{pooled.index}")
+            return pooled.browser
+
+    async def _close_browser(self, pooled: _PooledBrowser) -> None:
+        if pooled.browser is None:
+            return
+        try:
+            await pooled.browser.close()
+        except Exception as e:
+            logger.debug(f"Error closing pooled browser #{pooled.index}: {e}")
+        pooled.browser = None
+
+
+_pool: Optional[BrowserPool] = None
+
+
+async def get_browser_pool() -> BrowserPool:
+    """
+    Get the process-wide browser pool (created on first use).
+
+    Must be called from the same event loop for the lifetime of the pool.
+    """
+    global _pool
+    if _pool is None or _pool._closed:
+        settings = get_settings()
+        _pool = BrowserPool(
+            browsers=settings.VALIDATION_BROWSER_POOL_SIZE,
+            contexts_per_browser=settings.VALIDATION_CONTEXTS_PER_BROWSER,
+            max_pages_per_browser=settings.VALIDATION_BROWSER_MAX_PAGES
+        )
+    return await _pool.start()
+
+
+async def close_browser_pool() -> None:
+    """Close the process-wide pool if one was started."""
+    global _pool
+    if _pool is not None:
+        await _pool.close()
+        _pool = None
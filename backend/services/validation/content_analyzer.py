@@ -39,24 +39,86 @@ class ContentAnalyzer:
         'thursday', 'friday', 'saturday', 'sunday', 'am', 'pm'
     ]
     
-    async def analyze_page(self, page: Page) -> Dict[str, Any]:
+    # Everything analyze_page needs from the DOM, collected in ONE
+    # page.evaluate round trip (title, meta description, visible text,
+    # click-to-call numbers, image/form presence, social links, HTML size).
+    EXTRACTION_SCRIPT = """
+        (options) => {
+            const body = document.body;
+            const meta = document.querySelector('meta[name="description"]');
+
+            // Phone numbers that never appear in innerText:
+            //   <a href="tel:+12063600078">Call Us</a>
+            //   <div data-phone="(206) 360-0078">
+            //   <button aria-label="Call (206) 360-0078">
+            const telValues = [];
+            document.querySelectorAll('a[href^="tel:"]').forEach(el => {
+                const raw = el.href.replace(/^tel:/i, '').trim();
+                if (raw) telValues.push(raw);
+            });
+            ['data-phone', 'data-tel', 'data-number', 'data-mobile'].forEach(attr => {
+                document.querySelectorAll('[' + attr + ']').forEach(el => {
+                    const val = el.getAttribute(attr);
+                    if (val) telValues.push(val);
+                });
+            });
+            document.querySelectorAll('[aria-label]').forEach(el => {
+                const label = el.getAttribute('aria-label') || '';
+                if (/\\d{3}[\\s.\\-]?\\d{3}[\\s.\\-]?\\d{4}/.test(label)) {
+                    telValues.push(label);
+                }
+            });
+
+            const socialDomains = ['facebook.com', 'twitter.com', 'instagram.com',
+                                   'linkedin.com', 'youtube.com', 'tiktok.com'];
+            const socialLinks = [...new Set(
+                Array.from(document.querySelectorAll('a[href]'))
+                    .map(a => a.href)
+                    .filter(href => socialDomains.some(domain => href.includes(domain)))
+            )];
+
+            // HTML size is measured in the page; the markup itself is never
+            // shipped back (and skipped entirely in text-only mode)
+            let htmlLength = null;
+            if (!options.textOnly) {
+                const doctype = document.doctype ? new XMLSerializer().serializeToString(document.doctype) : '';
+                htmlLength = doctype.length + document.documentElement.outerHTML.length;
+            }
+
+            return {
+                title: document.title || null,
+                metaDescription: meta ? meta.content : null,
+                text: body ? body.innerText : '',
+                telValues: telValues,
+                imageCount: document.images.length,
+                formCount: document.forms.length,
+                socialLinks: socialLinks.slice(0, 10),
+                htmlLength: htmlLength,
+            };
+        }
+    """
+    
+    async def analyze_page(self, page: Page, text_only: bool = False) -> Dict[str, Any]:
         """
         Analyze a web page and extract business information.
         
+        All DOM signals are read with a single injected script (one IPC round
+        trip); the rest of the analysis runs in Python on the returned text.
+        
         Args:
             page: Playwright page object
+            text_only: Skip serializing the HTML; content_length then reports
+                the visible text length instead of the markup size
             
         Returns:
             Dictionary containing extracted information
         """
         try:
-            # Extract basic page info
-            title = await self._get_title(page)
-            meta_description = await self._get_meta_description(page)
+            dom = await page.evaluate(self.EXTRACTION_SCRIPT, {"textOnly": text_only})
             
-            # Get page content
-            content_html = await page.content()
-            content_text = await self._get_text_content(page)
+            title = dom.get("title")
+            meta_description = dom.get("metaDescription")
+            content_text = dom.get("text") or ""
 
             # Extract phone numbers from two sources and merge:
             # 1. Visible text (innerText) — standard regex patterns
@@ -64,7 +126,7 @@ class ContentAnalyzer:
             #    these are NOT in innerText but are the most reliable source on
             #    modern small-business sites that use click-to-call links.
             text_phones = self._extract_phones(content_text)
-            tel_phones = await self._extract_tel_href_phones(page)
+            tel_phones = self._normalize_tel_values(dom.get("telValues") or [])
             phones = list(dict.fromkeys(text_phones + tel_phones))  # deduplicate, preserve order
 
             # Extract contact information
@@ -74,15 +136,18 @@ class ContentAnalyzer:
             
             # Analyze content quality
             word_count = len(content_text.split())
-            has_images = await self._has_images(page)
-            has_forms = await self._has_forms(page)
+            has_images = (dom.get("imageCount") or 0) > 0
+            has_forms = (dom.get("formCount") or 0) > 0
             
-            # Check for social media links
-            social_links = await self._extract_social_links(page)
+            # Social media links
+            social_links = dom.get("socialLinks") or []
             
             # Detect if it's a real business site vs placeholder
             is_placeholder = self._is_placeholder_site(title, content_text)
             
+            html_length = dom.get("htmlLength")
+            content_length = html_length if html_length is not None else len(content_text)
+            
             return {
                 "title": title,
                 "meta_description": meta_description,
@@ -94,7 +159,7 @@ class ContentAnalyzer:
                 "has_hours": has_hours,
                 "has_contact_info": len(phones) > 0 or len(emails) > 0 or has_address,
                 "word_count": word_count,
-                "content_length": len(content_html),
+                "content_length": content_length,
                 "content_preview": content_text[:500] if content_text else None,
                 "has_images": has_images,
                 "has_forms": has_forms,
@@ -135,81 +200,11 @@ class ContentAnalyzer:
                 "error": str(e)
             }
     
-    async def _get_title(self, page: Page) -> Optional[str]:
-        """Extract page title."""
-        try:
-            return await page.title()
-        except Exception:
-            return None
-    
-    async def _get_meta_description(self, page: Page) -> Optional[str]:
-        """Extract meta description."""
-        try:
-            return await page.evaluate("""
-                () => {
-                    const meta = document.querySelector('meta[name="description"]');
-                    return meta ? meta.content : null;
-                }
-            """)
-        except Exception:
-            return None
-    
-    async def _get_text_content(self, page: Page) -> str:
-        """Extract visible text content."""
-        try:
-            return await page.evaluate('document.body.innerText')
-        except Exception:
-            return ""
-
-    async def _extract_tel_href_phones(self, page: Page) -> List[str]:
+    def _normalize_tel_values(self, raw_numbers: List[str]) -> List[str]:
         """
-        Extract phone numbers from tel: href links and data-* attributes.
-
-        Many small-business sites render click-to-call buttons as:
-            <a href="tel:+12063600078">Call Us</a>
-        or store the number in a data attribute:
-            <div data-phone="(206) 360-0078">
-        These never appear in document.body.innerText, causing our regex
-        extraction to miss them entirely.
-
-        We also check aria-label attributes for patterns like
-        'aria-label="Call (206) 360-0078"'.
+        Normalize phone values collected from tel: links, data-* and
+        aria-label attributes by the extraction script.
         """
-        try:
-            raw_numbers: List[str] = await page.evaluate("""
-                () => {
-                    const numbers = [];
-
-                    // 1. tel: href links
-                    document.querySelectorAll('a[href^="tel:"]').forEach(el => {
-                        const raw = el.href.replace(/^tel:/i, '').trim();
-                        if (raw) numbers.push(raw);
-                    });
-
-                    // 2. data-phone / data-tel / data-number attributes
-                    const dataAttrs = ['data-phone', 'data-tel', 'data-number', 'data-mobile'];
-                    dataAttrs.forEach(attr => {
-                        document.querySelectorAll('[' + attr + ']').forEach(el => {
-                            const val = el.getAttribute(attr);
-                            if (val) numbers.push(val);
-                        });
-                    });
-
-                    // 3. aria-label containing phone-like strings on links/buttons
-                    document.querySelectorAll('[aria-label]').forEach(el => {
-                        const label = el.getAttribute('aria-label') || '';
-                        if (/\\d{3}[\\s.\\-]?\\d{3}[\\s.\\-]?\\d{4}/.test(label)) {
-                            numbers.push(label);
-                        }
-                    });
-
-                    return numbers;
-                }
-            """)
-        except Exception as e:
-            logger.debug(f"tel: href extraction failed (non-critical): {e}")
-            return []
-
         # Run the same regex patterns over each raw value to normalize them
         found: List[str] = []
         for raw in raw_numbers:
@@ -274,40 +269,6 @@ class ContentAnalyzer:
         # Require at least 3 matches (e.g., "hours", "monday", "am")
         return keyword_matches >= 3
     
-    async def _has_images(self, page: Page) -> bool:
-        """Check if page has images."""
-        try:
-            image_count = await page.evaluate('document.querySelectorAll("img").length')
-            return image_count > 0
-        except Exception:
-            return False
-    
-    async def _has_forms(self, page: Page) -> bool:
-        """Check if page has forms (contact forms)."""
-        try:
-            form_count = await page.evaluate('document.querySelectorAll("form").length')
-            return form_count > 0
-        except Exception:
-            return False
-    
-    async def _extract_social_links(self, page: Page) -> List[str]:
-        """Extract social media links."""
-        try:
-            links = await page.evaluate("""
-                () => {
-                    const socialDomains = ['facebook.com', 'twitter.com', 'instagram.com', 
-                                          'linkedin.com', 'youtube.com', 'tiktok.com'];
-                    const links = Array.from(document.querySelectorAll('a[href]'));
-                    const socialLinks = links
-                        .map(a => a.href)
-                        .filter(href => socialDomains.some(domain => href.includes(domain)));
-                    return [...new Set(socialLinks)];  // Deduplicate
-                }
-            """)
-            return links[:10]  # Limit to 10
-        except Exception:
-            return []
-    
     def _is_placeholder_site(self, title: Optional[str], content: str) -> bool:
         """
         Detect if site is a placeholder/coming soon page.
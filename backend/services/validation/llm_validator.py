@@ -18,8 +18,10 @@ import logging
 import json
 import re
 from typing import Dict, Any, Optional
-from anthropic import AsyncAnthropic
 from core.config import get_settings
+from services.llm.gateway import get_llm_gateway
+from services.llm.prompt_cache import cached_system
+from services.validation.llm_verdict_cache import get_llm_verdict_cache, prompt_version
 
 logger = logging.getLogger(__name__)
 
@@ -32,20 +34,8 @@ class LLMWebsiteValidator:
     by analyzing website content against business information.
     """
     
-    # Master prompt template
-    VALIDATION_PROMPT = """You are an expert website validation specialist. Your job is to determine if a website truly belongs to a specific business.
-
-BUSINESS INFORMATION:
-- Name: {business_name}
-- Phone: {business_phone}
-- Email: {business_email}
-- Address: {business_address}
-- City: {business_city}, State: {business_state}
-- Country: {business_country}
-- Business Categories (from Google My Business): {gmb_categories}
-- GMB Description: {gmb_description}
-- Known Social Media Pages (confirmed by phone/address match): {known_social_urls}
-- Discovery phone confirmed in search snippet: {discovery_phone_match}
+    # Static instructions - sent as a cached system prompt
+    VALIDATION_SYSTEM_PROMPT = """You are an expert website validation specialist. Your job is to determine if a website truly belongs to a specific business.
 
 IMPORTANT NOTE ON PHONE MATCHING:
 If "Discovery phone confirmed in search snippet" is True, the URL being validated was
@@ -63,18 +53,6 @@ A phone number match or address match is FAR stronger evidence than name similar
 If the phone or address matches, accept a name variation as valid — do not reject solely
 because the business name on the site differs from the GMB name.
 
-WEBSITE INFORMATION:
-- URL: {website_url}
-- Final URL (after redirects): {final_url}
-- Title: {website_title}
-- Meta Description: {website_description}
-- Phones found: {website_phones}
-- Emails found: {website_emails}
-- Has address: {has_address}
-- Has business hours: {has_hours}
-- Content preview (first 500 chars): {content_preview}
-- Word count: {word_count}
-
 INVALID WEBSITE TYPES (mark as "missing" - business needs a real website):
 
 1. MEMBER DIRECTORIES & LISTINGS:
@@ -138,22 +116,22 @@ Also determine which country this business is located in, using signals from the
 
 VALIDATION DECISION:
 Respond ONLY with valid JSON in this exact format:
-{{
+{
   "verdict": "valid" | "invalid" | "missing",
   "confidence": 0.0-1.0,
   "reasoning": "Concise explanation of your decision (2-3 sentences)",
   "recommendation": "keep_url" | "clear_url_and_mark_missing" | "mark_invalid_keep_url",
-  "match_signals": {{
+  "match_signals": {
     "phone_match": true/false,
     "address_match": true/false,
     "name_match": true/false,
     "is_directory": true/false,
     "is_aggregator": true/false
-  }},
+  },
   "detected_country": "US" | "GB" | "CA" | "AU" | null,
   "country_confidence": 0.0-1.0,
   "country_signals": ["list of signals used to determine country"]
-}}
+}
 
 VERDICT DEFINITIONS:
 - "valid": This IS the business's actual website (even if low quality)
@@ -165,22 +143,48 @@ EXAMPLES:
 Example 1 - Member Directory:
 Business: DX Plumbing, Canton, OH
 URL: business.cantonchamber.org/member/dx-plumbing
-Result: {{"verdict": "missing", "confidence": 0.95, "reasoning": "This is a Canton Chamber of Commerce member directory listing, not the business's actual website. The business needs its own domain.", "recommendation": "clear_url_and_mark_missing", "match_signals": {{"phone_match": false, "address_match": false, "name_match": true, "is_directory": true, "is_aggregator": false}}, "detected_country": "US", "country_confidence": 0.7, "country_signals": ["Canton, OH is in the United States"]}}
+Result: {"verdict": "missing", "confidence": 0.95, "reasoning": "This is a Canton Chamber of Commerce member directory listing, not the business's actual website. The business needs its own domain.", "recommendation": "clear_url_and_mark_missing", "match_signals": {"phone_match": false, "address_match": false, "name_match": true, "is_directory": true, "is_aggregator": false}, "detected_country": "US", "country_confidence": 0.7, "country_signals": ["Canton, OH is in the United States"]}
 
 Example 2 - MapQuest Aggregator:
 Business: Brian's Plumbing, Kansas
 URL: mapquest.com/us/kansas/brians-plumbing-456601382
-Result: {{"verdict": "missing", "confidence": 1.0, "reasoning": "MapQuest business listing page, not the company's website. This is an aggregator directory.", "recommendation": "clear_url_and_mark_missing", "match_signals": {{"phone_match": false, "address_match": false, "name_match": true, "is_directory": false, "is_aggregator": true}}, "detected_country": "US", "country_confidence": 0.9, "country_signals": ["Kansas is a US state", "URL path contains /us/"]}}
+Result: {"verdict": "missing", "confidence": 1.0, "reasoning": "MapQuest business listing page, not the company's website. This is an aggregator directory.", "recommendation": "clear_url_and_mark_missing", "match_signals": {"phone_match": false, "address_match": false, "name_match": true, "is_directory": false, "is_aggregator": true}, "detected_country": "US", "country_confidence": 0.9, "country_signals": ["Kansas is a US state", "URL path contains /us/"]}
 
 Example 3 - Valid Website with Phone Match:
 Business: Ray Miller Plumbing, Phone: (555) 123-4567
 URL: raymillerplumbinginc.com, Phones found: ["555-123-4567"]
-Result: {{"verdict": "valid", "confidence": 0.98, "reasoning": "Business name matches title, phone number matches exactly. This is clearly their official website.", "recommendation": "keep_url", "match_signals": {{"phone_match": true, "address_match": false, "name_match": true, "is_directory": false, "is_aggregator": false}}, "detected_country": "US", "country_confidence": 0.85, "country_signals": ["Phone area code 555 is a US number"]}}
+Result: {"verdict": "valid", "confidence": 0.98, "reasoning": "Business name matches title, phone number matches exactly. This is clearly their official website.", "recommendation": "keep_url", "match_signals": {"phone_match": true, "address_match": false, "name_match": true, "is_directory": false, "is_aggregator": false}, "detected_country": "US", "country_confidence": 0.85, "country_signals": ["Phone area code 555 is a US number"]}
 
 Example 4 - UK Business (wrong country):
 Business: London Plumbers, Phone: +44 20 7946 0123
 URL: londonplumbers.co.uk, Phones found: ["+44 20 7946 0123"]
-Result: {{"verdict": "valid", "confidence": 0.95, "reasoning": "Business name matches, UK phone number matches exactly.", "recommendation": "keep_url", "match_signals": {{"phone_match": true, "address_match": false, "name_match": true, "is_directory": false, "is_aggregator": false}}, "detected_country": "GB", "country_confidence": 0.99, "country_signals": ["+44 prefix indicates UK", ".co.uk TLD confirms UK"]}}
+Result: {"verdict": "valid", "confidence": 0.95, "reasoning": "Business name matches, UK phone number matches exactly.", "recommendation": "keep_url", "match_signals": {"phone_match": true, "address_match": false, "name_match": true, "is_directory": false, "is_aggregator": false}, "detected_country": "GB", "country_confidence": 0.99, "country_signals": ["+44 prefix indicates UK", ".co.uk TLD confirms UK"]}
+"""
+
+    # Per-call data (business + extracted website content)
+    VALIDATION_PROMPT = """BUSINESS INFORMATION:
+- Name: {business_name}
+- Phone: {business_phone}
+- Email: {business_email}
+- Address: {business_address}
+- City: {business_city}, State: {business_state}
+- Country: {business_country}
+- Business Categories (from Google My Business): {gmb_categories}
+- GMB Description: {gmb_description}
+- Known Social Media Pages (confirmed by phone/address match): {known_social_urls}
+- Discovery phone confirmed in search snippet: {discovery_phone_match}
+
+WEBSITE INFORMATION:
+- URL: {website_url}
+- Final URL (after redirects): {final_url}
+- Title: {website_title}
+- Meta Description: {website_description}
+- Phones found: {website_phones}
+- Emails found: {website_emails}
+- Has address: {has_address}
+- Has business hours: {has_hours}
+- Content preview (first 500 chars): {content_preview}
+- Word count: {word_count}
 
 Now analyze the provided business and website information above and return your validation decision."""
 
@@ -199,7 +203,8 @@ Now analyze the provided business and website information above and return your
         if not self.api_key:
             raise ValueError("ANTHROPIC_API_KEY not configured")
         
-        self.client = AsyncAnthropic(api_key=self.api_key)
+        self.gateway = get_llm_gateway()
+        self.verdict_cache = get_llm_verdict_cache()
         
         logger.info(f"LLM Validator initialized with model: {self.model}")
     
@@ -223,38 +228,33 @@ Now analyze the provided business and website information above and return your
                 "recommendation": str,
                 "match_signals": dict,
                 "llm_model": str,
-                "llm_tokens": int
+                "llm_tokens": int,
+                "llm_cache_hit": bool
             }
         """
         try:
-            # Format prompt with business and website data
-            prompt = self._format_prompt(business, website_data)
+            # Identical (business, page, prompt, model) inputs reuse the cached verdict
+            cache_key = self.cache_key(business, website_data)
+            cached = await self.get_cached_verdict(cache_key)
+            if cached is not None:
+                logger.info(
+                    f"LLM verdict (cached): {cached['verdict']} for "
+                    f"{business.get('name')} - {website_data.get('url')}"
+                )
+                return cached
             
             logger.info(f"LLM validation for: {business.get('name')} - {website_data.get('url')}")
             
-            # Call Claude
-            response = await self.client.messages.create(
-                model=self.model,
-                max_tokens=1000,
-                temperature=0,  # Deterministic for validation
-                messages=[
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ]
+            # Call Claude (static instructions come from the prompt cache)
+            response = await self.gateway.create(
+                "validation", **self.build_request_params(business, website_data)
             )
             
-            # Extract response
-            response_text = response.content[0].text
-            
-            # Parse JSON response
-            result = self._parse_llm_response(response_text)
-            
-            # Add metadata
-            result["llm_model"] = self.model
-            result["llm_tokens"] = response.usage.input_tokens + response.usage.output_tokens
-            result["llm_raw_response"] = response_text
+            result = await self.result_from_response(
+                cache_key,
+                response.content[0].text,
+                response.usage.input_tokens + response.usage.output_tokens
+            )
             
             logger.info(
                 f"LLM verdict: {result['verdict']} "
@@ -278,6 +278,70 @@ Now analyze the provided business and website information above and return your
                 f"LLM validation error: {str(e)}"
             )
     
+    def cache_key(self, business: Dict[str, Any], website_data: Dict[str, Any]) -> str:
+        """Verdict cache key for this validator's model and prompt version."""
+        return self.verdict_cache.make_key(
+            business,
+            website_data,
+            self.model,
+            prompt_version(self.VALIDATION_SYSTEM_PROMPT + self.VALIDATION_PROMPT)
+        )
+    
+    async def get_cached_verdict(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Cached verdict marked as a hit (tokens counted as saved), or None."""
+        cached = await self.verdict_cache.get(cache_key)
+        if cached is None:
+            return None
+        await self.verdict_cache.record_tokens_saved(cached.get("llm_tokens", 0))
+        cached["llm_tokens"] = 0
+        cached["llm_cache_hit"] = True
+        return cached
+    
+    def build_request_params(
+        self,
+        business: Dict[str, Any],
+        website_data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        messages.create() kwargs for one validation.
+        
+        Shared by the online call and Message Batches submissions.
+        """
+        return {
+            "model": self.model,
+            "max_tokens": 1000,
+            "temperature": 0,  # Deterministic for validation
+            "system": cached_system(self.VALIDATION_SYSTEM_PROMPT),
+            "messages": [
+                {
+                    "role": "user",
+                    "content": self._format_prompt(business, website_data)
+                }
+            ],
+        }
+    
+    async def result_from_response(
+        self,
+        cache_key: str,
+        response_text: str,
+        tokens: int
+    ) -> Dict[str, Any]:
+        """
+        Parse a response (online or from a batch), add metadata and cache it.
+        
+        Raises:
+            json.JSONDecodeError / ValueError: If the response is not a valid verdict
+        """
+        result = self._parse_llm_response(response_text)
+        
+        # Add metadata
+        result["llm_model"] = self.model
+        result["llm_tokens"] = tokens
+        result["llm_raw_response"] = response_text
+        await self.verdict_cache.put(cache_key, result)
+        result["llm_cache_hit"] = False
+        return result
+    
     def _format_prompt(
         self,
         business: Dict[str, Any],
@@ -367,6 +431,10 @@ Now analyze the provided business and website information above and return your
         
         return result
     
+    def failed_result(self, reason: str) -> Dict[str, Any]:
+        """Error verdict for a call that produced no usable response."""
+        return self._fallback_result("error", reason)
+    
     def _fallback_result(self, verdict: str, reason: str) -> Dict[str, Any]:
         """Return a fallback result when LLM validation fails."""
         return {
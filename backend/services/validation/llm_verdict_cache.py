@@ -0,0 +1,205 @@
+"""
+LLM verdict cache - deduplicates identical website validation prompts.
+
+Franchise locations, directory pages, shared site builders and revalidation
+runs send the same (business, page) pair to Claude over and over. Verdicts
+are cached in Redis under a key derived from:
+
+- normalized business identity (name, phone digits, address, GMB context)
+- normalized final URL
+- fingerprint of the extracted page content (title, phones, emails, preview)
+- prompt version (hash of the prompt template) and model
+
+Entries expire after LLM_VERDICT_CACHE_TTL_SECONDS. Hit/miss counters are
+kept in Redis so they aggregate across workers. If Redis is unavailable the
+cache is bypassed and every validation calls the API as before.
+"""
+import hashlib
+import json
+import logging
+import re
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+
+from core.config import get_settings
+from services.progress.redis_service import RedisService
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "llmverdict:"
+STATS_KEY = "llmverdict:stats"
+
+# Fallback/error results are never cached
+_CACHEABLE_VERDICTS = {"valid", "invalid", "missing"}
+
+
+def prompt_version(template: str) -> str:
+    """Short hash of a prompt template; changes whenever the prompt is edited."""
+    return hashlib.sha256(template.encode("utf-8")).hexdigest()[:12]
+
+
+def _norm_text(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, (list, tuple)):
+        return "|".join(sorted(_norm_text(v) for v in value))
+    if isinstance(value, dict):
+        return "|".join(f"{k}={_norm_text(v)}" for k, v in sorted(value.items()))
+    return re.sub(r"\s+", " ", str(value)).strip().lower()
+
+
+def _norm_phone(value: Any) -> str:
+    return re.sub(r"\D", "", str(value or ""))[-10:]
+
+
+def _norm_url(url: Optional[str]) -> str:
+    if not url:
+        return ""
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    path = parts.path.rstrip("/") or "/"
+    query = f"?{parts.query}" if parts.query else ""
+    return f"{host}{path}{query}"
+
+
+def business_identity(business: Dict[str, Any]) -> Dict[str, str]:
+    """Every business field the validation prompt reads, normalized."""
+    return {
+        "name": _norm_text(business.get("name")),
+        "phone": _norm_phone(business.get("phone")),
+        "email": _norm_text(business.get("email")),
+        "address": _norm_text(business.get("address")),
+        "city": _norm_text(business.get("city")),
+        "state": _norm_text(business.get("state")),
+        "country": _norm_text(business.get("country") or "US"),
+        "gmb_categories": _norm_text(business.get("gmb_categories")),
+        "gmb_description": _norm_text(str(business.get("gmb_description") or "")[:300]),
+        "known_social_urls": _norm_text(business.get("known_social_urls")),
+        "discovery_phone_match": str(bool(business.get("discovery_phone_match"))),
+    }
+
+
+def content_fingerprint(website_data: Dict[str, Any]) -> str:
+    """Hash of the extracted page fields that go into the prompt."""
+    payload = {
+        "title": _norm_text(website_data.get("title")),
+        "meta_description": _norm_text(website_data.get("meta_description")),
+        "phones": sorted({_norm_phone(p) for p in website_data.get("phones", [])}),
+        "emails": _norm_text(website_data.get("emails", [])),
+        "has_address": bool(website_data.get("has_address")),
+        "has_hours": bool(website_data.get("has_hours")),
+        "content_preview": _norm_text((website_data.get("content_preview") or "")[:500]),
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+class LLMVerdictCache:
+    """
+    Redis-backed cache of LLM validation verdicts.
+
+    Usage:
+        cache = get_llm_verdict_cache()
+        key = cache.make_key(business, website_data, model, version)
+        cached = await cache.get(key)
+        ...
+        await cache.put(key, result)
+    """
+
+    def __init__(self, ttl_seconds: int = 7 * 86400, enabled: bool = True):
+        self.ttl_seconds = ttl_seconds
+        self.enabled = enabled
+
+    def make_key(
+        self,
+        business: Dict[str, Any],
+        website_data: Dict[str, Any],
+        model: str,
+        version: str
+    ) -> str:
+        material = json.dumps(
+            {
+                "business": business_identity(business),
+                "final_url": _norm_url(website_data.get("final_url") or website_data.get("url")),
+                "content": content_fingerprint(website_data),
+                "prompt_version": version,
+                "model": model,
+            },
+            sort_keys=True,
+        )
+        return KEY_PREFIX + hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached verdict (and count a hit or miss), or None."""
+        if not self.enabled:
+            return None
+        try:
+            redis = RedisService.get_async_client()
+            raw = await redis.get(key)
+            await redis.hincrby(STATS_KEY, "hits" if raw else "misses", 1)
+        except Exception as e:
+            logger.debug(f"LLM verdict cache unavailable: {e}")
+            return None
+        return json.loads(raw) if raw else None
+
+    async def put(self, key: str, result: Dict[str, Any]) -> None:
+        """Store a verdict; error/fallback results are skipped."""
+        if not self.enabled or result.get("verdict") not in _CACHEABLE_VERDICTS:
+            return
+        if result.get("llm_model") == "fallback":
+            return
+        try:
+            redis = RedisService.get_async_client()
+            async with redis.pipeline(transaction=False) as pipe:
+                pipe.set(key, json.dumps(result, default=str), ex=self.ttl_seconds)
+                pipe.hincrby(STATS_KEY, "stores", 1)
+                await pipe.execute()
+        except Exception as e:
+            logger.debug(f"LLM verdict cache write skipped: {e}")
+
+    async def record_tokens_saved(self, tokens: int) -> None:
+        """Add the original call's token count to the tokens_saved counter."""
+        try:
+            await RedisService.get_async_client().hincrby(STATS_KEY, "tokens_saved", int(tokens or 0))
+        except Exception:
+            pass
+
+    async def get_stats(self) -> Dict[str, Any]:
+        """
+        Returns:
+            {"enabled", "ttl_seconds", "hits", "misses", "stores",
+             "tokens_saved", "hit_rate"}
+        """
+        counters: Dict[str, Any] = {}
+        try:
+            counters = await RedisService.get_async_client().hgetall(STATS_KEY) or {}
+        except Exception as e:
+            logger.debug(f"LLM verdict cache stats unavailable: {e}")
+
+        hits = int(counters.get("hits", 0))
+        misses = int(counters.get("misses", 0))
+        return {
+            "enabled": self.enabled,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": hits,
+            "misses": misses,
+            "stores": int(counters.get("stores", 0)),
+            "tokens_saved": int(counters.get("tokens_saved", 0)),
+            "hit_rate": round(hits / (hits + misses), 4) if hits + misses else 0.0,
+        }
+
+
+_cache: Optional[LLMVerdictCache] = None
+
+
+def get_llm_verdict_cache() -> LLMVerdictCache:
+    """Get the process-wide verdict cache."""
+    global _cache
+    if _cache is None:
+        settings = get_settings()
+        _cache = LLMVerdictCache(
+            ttl_seconds=settings.LLM_VERDICT_CACHE_TTL_SECONDS,
+            enabled=settings.LLM_VERDICT_CACHE_ENABLED,
+        )
+    return _cache
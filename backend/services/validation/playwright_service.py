@@ -3,13 +3,27 @@ Core Playwright validation service.
 Orchestrates browser automation, content extraction, and screenshot capture.
 """
 import asyncio
-from typing import Optional, Dict, Any
+from contextlib import asynccontextmanager
+from typing import Optional, Dict, Any, TYPE_CHECKING
 from datetime import datetime
 from playwright.async_api import async_playwright, Browser, BrowserContext, Page, Error as PlaywrightError
 import logging
 
-from .stealth_config import create_stealth_browser, human_like_navigation, wait_for_stable_page
+from core.config import get_settings
+from .stealth_config import (
+    NavigationProfile,
+    create_stealth_browser,
+    detect_block,
+    human_like_navigation,
+    navigate_with_profile,
+    stop_blocking_resources,
+    wait_for_stable_page,
+)
 from .content_analyzer import ContentAnalyzer
+from .screenshot_store import ScreenshotStore, StoredScreenshot, get_screenshot_store
+
+if TYPE_CHECKING:
+    from .browser_pool import BrowserPool
 
 logger = logging.getLogger(__name__)
 
@@ -22,22 +36,43 @@ class PlaywrightValidationService:
     - Anti-bot detection avoidance
     - Human-like navigation behavior
     - Content extraction and analysis
-    - Screenshot capture
+    - Screenshot capture (stored content-addressed; results carry only the URL)
     - Error handling and retry logic
     
     Usage:
         async with PlaywrightValidationService() as validator:
             result = await validator.validate_website("https://example.com")
+    
+    With a shared BrowserPool no browser is launched here; each validation
+    borrows a page from the pool's warm browsers instead:
+        async with PlaywrightValidationService(pool=pool) as validator:
+            ...
     """
     
-    def __init__(self):
+    def __init__(
+        self,
+        pool: Optional["BrowserPool"] = None,
+        screenshot_store: Optional[ScreenshotStore] = None,
+        text_only_extraction: Optional[bool] = None,
+        navigation_profile: Optional[str] = None
+    ):
         self.browser: Optional[Browser] = None
         self.context: Optional[BrowserContext] = None
         self.playwright = None
+        self.pool = pool
+        self.screenshot_store = screenshot_store
+        if text_only_extraction is None:
+            text_only_extraction = get_settings().VALIDATION_TEXT_ONLY_EXTRACTION
+        self.text_only_extraction = text_only_extraction
+        self.navigation_profile = NavigationProfile.parse(
+            navigation_profile or get_settings().VALIDATION_NAVIGATION_PROFILE
+        )
         self.content_analyzer = ContentAnalyzer()
     
     async def __aenter__(self):
-        """Context manager entry - initialize browser."""
+        """Context manager entry - initialize browser (unless pooled)."""
+        if self.pool is not None:
+            return self
         try:
             self.playwright = await async_playwright().start()
             self.browser, self.context = await create_stealth_browser(self.playwright)
@@ -65,6 +100,23 @@ class PlaywrightValidationService:
         except Exception as e:
             logger.error(f"Cleanup error: {e}")
     
+    @asynccontextmanager
+    async def _borrow_page(self):
+        """Yield a page from the shared pool, or from this service's own context."""
+        if self.pool is not None:
+            async with self.pool.page() as page:
+                yield page
+            return
+        
+        page = await self.context.new_page()
+        try:
+            yield page
+        finally:
+            try:
+                await page.close()
+            except Exception as e:
+                logger.warning(f"Error closing page: {e}")
+    
     async def validate_website(
         self,
         url: str,
@@ -102,75 +154,28 @@ class PlaywrightValidationService:
                 "social_links": List[str],
                 "is_placeholder": bool,
                 "quality_score": int,
-                "screenshot_base64": str or None,
+                "screenshot_hash": str or None,
+                "screenshot_url": str or None,
+                "screenshot_thumbnail_url": str or None,
                 "load_time_ms": int,
+                "navigation_profile": str (profile that produced the page),
                 "error": str or None,
                 "validation_timestamp": str,
             }
         """
-        page = None
         start_time = datetime.utcnow()
         
+        # Normalize URL
+        if not url.startswith(('http://', 'https://')):
+            url = f'https://{url}'
+        
         try:
-            # Normalize URL
-            if not url.startswith(('http://', 'https://')):
-                url = f'https://{url}'
-            
             logger.info(f"Validating website: {url}")
             
-            # Create new page
-            page = await self.context.new_page()
-            
-            # Set timeout
-            page.set_default_timeout(timeout)
-            
-            # Navigate with human-like behavior
-            try:
-                await human_like_navigation(page, url)
-            except PlaywrightError as e:
-                if 'timeout' in str(e).lower():
-                    logger.warning(f"Navigation timeout for {url}, attempting with load state")
-                    await human_like_navigation(page, url, wait_until='load')
-                else:
-                    raise
-            
-            # Wait for page to be stable
-            await wait_for_stable_page(page, timeout=5000)
-            
-            # Get final URL (after redirects)
-            final_url = page.url
-            
-            # Extract page information using content analyzer
-            content_info = await self.content_analyzer.analyze_page(page)
-            
-            # Capture screenshot if requested
-            screenshot_base64 = None
-            if capture_screenshot:
-                screenshot_base64 = await self._capture_screenshot(page)
-            
-            # Calculate load time
-            load_time_ms = int((datetime.utcnow() - start_time).total_seconds() * 1000)
-            
-            # Build result
-            result = {
-                "is_valid": True,
-                "url": url,
-                "final_url": final_url,
-                "status_code": 200,  # Playwright doesn't easily expose status code
-                "load_time_ms": load_time_ms,
-                "screenshot_base64": screenshot_base64,
-                "error": None,
-                "validation_timestamp": datetime.utcnow().isoformat(),
-                **content_info  # Merge content analyzer results
-            }
-            
-            logger.info(
-                f"Validation successful for {url}: "
-                f"quality_score={content_info.get('quality_score', 0)}, "
-                f"has_contact={content_info.get('has_contact_info', False)}"
-            )
-            
-            return result
+            async with self._borrow_page() as page:
+                return await self._validate_on_page(
+                    page, url, timeout, capture_screenshot, start_time
+                )
             
         except PlaywrightError as e:
             error_msg = str(e)
@@ -218,44 +223,131 @@ class PlaywrightValidationService:
                 "validation_timestamp": datetime.utcnow().isoformat(),
                 **self._empty_content_result()
             }
-            
-        finally:
-            if page:
-                try:
-                    await page.close()
-                except Exception as e:
-                    logger.warning(f"Error closing page: {e}")
     
-    async def _capture_screenshot(self, page: Page) -> Optional[str]:
+    async def _validate_on_page(
+        self,
+        page: Page,
+        url: str,
+        timeout: int,
+        capture_screenshot: bool,
+        start_time: datetime
+    ) -> Dict[str, Any]:
+        """Navigate ``page`` to ``url`` and build the success result."""
+        page.set_default_timeout(timeout)
+        
+        profile = self.navigation_profile
+        response = await self._navigate(page, url, profile, timeout)
+        
+        # Cheap profiles escalate to full stealth only when bot protection answered
+        if profile != NavigationProfile.STEALTH and await detect_block(page, response):
+            logger.info(f"Block/captcha detected on {url} with {profile.value} profile, retrying with stealth")
+            await stop_blocking_resources(page)
+            profile = NavigationProfile.STEALTH
+            await self._navigate(page, url, profile, timeout)
+        
+        # Get final URL (after redirects)
+        final_url = page.url
+        
+        # Extract page information using content analyzer
+        content_info = await self.content_analyzer.analyze_page(
+            page, text_only=self.text_only_extraction
+        )
+        
+        # Capture screenshot if requested
+        screenshot_info = self._empty_screenshot_result()
+        if capture_screenshot:
+            stored = await self._capture_screenshot(page)
+            if stored is not None:
+                screenshot_info = stored.to_dict()
+        
+        # Calculate load time
+        load_time_ms = int((datetime.utcnow() - start_time).total_seconds() * 1000)
+        
+        # Build result
+        result = {
+            "is_valid": True,
+            "url": url,
+            "final_url": final_url,
+            "status_code": 200,  # Playwright doesn't easily expose status code
+            "load_time_ms": load_time_ms,
+            "navigation_profile": profile.value,
+            **screenshot_info,
+            "error": None,
+            "validation_timestamp": datetime.utcnow().isoformat(),
+            **content_info  # Merge content analyzer results
+        }
+        
+        logger.info(
+            f"Validation successful for {url}: "
+            f"quality_score={content_info.get('quality_score', 0)}, "
+            f"has_contact={content_info.get('has_contact_info', False)}"
+        )
+        
+        return result
+    
+    async def _navigate(
+        self,
+        page: Page,
+        url: str,
+        profile: NavigationProfile,
+        timeout: int
+    ):
+        """Navigate with ``profile``; stealth retries a timed-out load with 'load'."""
+        if profile != NavigationProfile.STEALTH:
+            return await navigate_with_profile(page, url, profile, timeout=timeout)
+        
+        try:
+            response = await human_like_navigation(page, url)
+        except PlaywrightError as e:
+            if 'timeout' in str(e).lower():
+                logger.warning(f"Navigation timeout for {url}, attempting with load state")
+                response = await human_like_navigation(page, url, wait_until='load')
+            else:
+                raise
+        
+        # Wait for page to be stable
+        await wait_for_stable_page(page, timeout=5000)
+        return response
+    
+    async def _capture_screenshot(self, page: Page) -> Optional[StoredScreenshot]:
         """
-        Capture page screenshot and return as base64.
+        Capture a viewport screenshot and write it to the screenshot store.
         
         Args:
             page: Playwright page object
             
         Returns:
-            Base64 encoded screenshot or None if capture fails
+            Reference to the stored screenshot, or None if capture fails
         """
         try:
-            import base64
+            store = self.screenshot_store or get_screenshot_store()
             
-            # Capture full page screenshot
+            # Viewport only: a full-page PNG of a long landing page runs to
+            # several MB and adds nothing for validation review
             screenshot_bytes = await page.screenshot(
-                full_page=True,
-                type='png'
+                full_page=False,
+                type='jpeg',
+                quality=90
             )
             
-            # Convert to base64
-            screenshot_base64 = base64.b64encode(screenshot_bytes).decode('utf-8')
-            
-            logger.debug(f"Screenshot captured: {len(screenshot_bytes)} bytes")
+            stored = await store.save(screenshot_bytes)
+            if stored is not None:
+                logger.debug(f"Screenshot stored: {stored.digest} ({stored.size_bytes} bytes)")
             
-            return screenshot_base64
+            return stored
             
         except Exception as e:
             logger.error(f"Screenshot capture failed: {e}")
             return None
     
+    @staticmethod
+    def _empty_screenshot_result() -> Dict[str, Any]:
+        return {
+            "screenshot_hash": None,
+            "screenshot_url": None,
+            "screenshot_thumbnail_url": None,
+        }
+    
     def _empty_content_result(self) -> Dict[str, Any]:
         """Return empty content result for failed validations."""
         return {
@@ -276,7 +368,7 @@ class PlaywrightValidationService:
             "social_links": [],
             "is_placeholder": True,
             "quality_score": 0,
-            "screenshot_base64": None,
+            **self._empty_screenshot_result(),
         }
     
     async def validate_multiple_websites(
@@ -0,0 +1,281 @@
+"""
+Reachability cache - shared DNS and HTTP check results for website URLs.
+
+The scrape (WebsiteValidator), validation (ValidationOrchestrator,
+WebsiteValidationService) and requeue (_handle_technical_failure) stages all
+look at the same hosts, and a dead domain used to be resolved and fetched
+again in every cycle. Results are kept in Redis so every worker shares them:
+
+- DNS: "does this host resolve?" Positive answers live for
+  REACHABILITY_DNS_TTL_SECONDS, definitive NXDOMAIN / no-address answers for
+  REACHABILITY_DNS_NEGATIVE_TTL_SECONDS. Transient resolver failures
+  (timeouts, SERVFAIL) are never cached.
+- HTTP: the outcome of a quick check per namespace ("hunter",
+  "accessibility") and normalized URL, REACHABILITY_HTTP_TTL_SECONDS for
+  answers and REACHABILITY_HTTP_FAILURE_TTL_SECONDS for timeouts and
+  connection errors.
+- HTML: the page body the hunter's quick check already downloaded, kept for
+  REACHABILITY_HTML_TTL_SECONDS so the validation static tier can decide
+  from it instead of fetching the page again.
+
+Async lookups go through the event loop's resolver (getaddrinfo in the
+default executor) so they no longer block the loop; resolves_sync() serves
+sync Celery task code. Without Redis every check goes to the network.
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import socket
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+
+from core.config import get_settings
+from services.progress.redis_service import RedisService
+
+logger = logging.getLogger(__name__)
+
+DNS_KEY_PREFIX = "reach:dns:"
+HTTP_KEY_PREFIX = "reach:http:"
+STATS_KEY = "reach:stats"
+HTML_NAMESPACE = "html"
+
+# Larger pages are not shared (the static tier fetches them itself)
+MAX_CACHED_HTML_CHARS = 262_144
+
+# getaddrinfo errors that mean "this name has no address" (vs. "try again")
+_DEFINITIVE_DNS_ERRORS = {
+    code for code in (
+        getattr(socket, "EAI_NONAME", None),
+        getattr(socket, "EAI_NODATA", None),
+    ) if code is not None
+}
+
+
+def host_of(url_or_host: Optional[str]) -> str:
+    """Lowercased host of a URL or bare host (no port, no trailing dot)."""
+    if not url_or_host:
+        return ""
+    value = url_or_host.strip()
+    if "://" not in value:
+        value = "http://" + value
+    try:
+        host = urlsplit(value).hostname or ""
+    except ValueError:
+        return ""
+    return host.rstrip(".").lower()
+
+
+def _url_key(namespace: str, url: str) -> str:
+    value = url.strip()
+    if "://" not in value:
+        value = "https://" + value
+    parts = urlsplit(value)
+    material = f"{(parts.hostname or '').lower()}{parts.path.rstrip('/') or '/'}"
+    if parts.query:
+        material += f"?{parts.query}"
+    return f"{HTTP_KEY_PREFIX}{namespace}:{hashlib.sha256(material.encode('utf-8')).hexdigest()}"
+
+
+class ReachabilityCache:
+    """
+    Redis-shared DNS / HTTP reachability results.
+
+    Usage:
+        cache = get_reachability_cache()
+        if await cache.resolves(url) is False:
+            ...  # NXDOMAIN - skip the fetch
+        cached = await cache.get_http("hunter", url)
+        ...
+        await cache.put_http("hunter", url, result, failed=False)
+        html = await cache.get_html(url)
+    """
+
+    def __init__(
+        self,
+        dns_ttl_seconds: int = 3600,
+        dns_negative_ttl_seconds: int = 21600,
+        http_ttl_seconds: int = 3600,
+        http_failure_ttl_seconds: int = 900,
+        html_ttl_seconds: int = 3600
+    ):
+        self.dns_ttl_seconds = dns_ttl_seconds
+        self.dns_negative_ttl_seconds = dns_negative_ttl_seconds
+        self.http_ttl_seconds = http_ttl_seconds
+        self.http_failure_ttl_seconds = http_failure_ttl_seconds
+        self.html_ttl_seconds = html_ttl_seconds
+
+    # ── DNS ─────────────────────────────────────────────────────
+
+    async def resolves(self, url_or_host: Optional[str]) -> Optional[bool]:
+        """
+        Returns:
+            True if the host has an address, False if it definitively does
+            not (NXDOMAIN / no data / unparseable), None if the lookup failed
+            transiently
+        """
+        host = host_of(url_or_host)
+        if not host:
+            return False
+
+        cached = await self._dns_cache_get(host)
+        if cached is not None:
+            return cached
+
+        try:
+            await asyncio.get_running_loop().getaddrinfo(host, 80, proto=socket.IPPROTO_TCP)
+            answer: Optional[bool] = True
+        except socket.gaierror as e:
+            answer = False if e.errno in _DEFINITIVE_DNS_ERRORS else None
+        except OSError:
+            answer = None
+
+        if answer is not None:
+            await self._dns_cache_put(host, answer)
+        return answer
+
+    def resolves_sync(self, url_or_host: Optional[str]) -> Optional[bool]:
+        """Blocking variant of resolves() for sync task code."""
+        host = host_of(url_or_host)
+        if not host:
+            return False
+
+        redis = RedisService.get_client()
+        try:
+            raw = redis.get(DNS_KEY_PREFIX + host)
+        except Exception as e:
+            logger.debug(f"Reachability cache unavailable: {e}")
+            raw = None
+        if raw is not None:
+            self._count_sync("dns_hits")
+            return raw == "1"
+        self._count_sync("dns_misses")
+
+        try:
+            socket.getaddrinfo(host, 80, proto=socket.IPPROTO_TCP)
+            answer: Optional[bool] = True
+        except socket.gaierror as e:
+            answer = False if e.errno in _DEFINITIVE_DNS_ERRORS else None
+        except OSError:
+            answer = None
+
+        if answer is not None and self._dns_ttl(answer) > 0:
+            try:
+                redis.set(DNS_KEY_PREFIX + host, "1" if answer else "0", ex=self._dns_ttl(answer))
+            except Exception as e:
+                logger.debug(f"Reachability cache write skipped: {e}")
+        return answer
+
+    def _dns_ttl(self, resolves: bool) -> int:
+        return self.dns_ttl_seconds if resolves else self.dns_negative_ttl_seconds
+
+    async def _dns_cache_get(self, host: str) -> Optional[bool]:
+        try:
+            redis = RedisService.get_async_client()
+            raw = await redis.get(DNS_KEY_PREFIX + host)
+            await redis.hincrby(STATS_KEY, "dns_hits" if raw is not None else "dns_misses", 1)
+            return None if raw is None else raw == "1"
+        except Exception as e:
+            logger.debug(f"Reachability cache unavailable: {e}")
+            return None
+
+    async def _dns_cache_put(self, host: str, resolves: bool) -> None:
+        ttl = self._dns_ttl(resolves)
+        if ttl <= 0:
+            return
+        try:
+            await RedisService.get_async_client().set(
+                DNS_KEY_PREFIX + host, "1" if resolves else "0", ex=ttl
+            )
+        except Exception as e:
+            logger.debug(f"Reachability cache write skipped: {e}")
+
+    # ── HTTP ────────────────────────────────────────────────────
+
+    async def get_http(self, namespace: str, url: str) -> Optional[Dict[str, Any]]:
+        """Cached HTTP check result for this namespace and URL, if any."""
+        try:
+            redis = RedisService.get_async_client()
+            raw = await redis.get(_url_key(namespace, url))
+            await redis.hincrby(STATS_KEY, "http_hits" if raw else "http_misses", 1)
+            return json.loads(raw) if raw else None
+        except Exception as e:
+            logger.debug(f"Reachability cache unavailable: {e}")
+            return None
+
+    async def put_http(self, namespace: str, url: str, result: Dict[str, Any], failed: bool) -> None:
+        """
+        Store an HTTP check result.
+
+        Args:
+            failed: Timeout / connection error - kept for the shorter failure TTL
+        """
+        ttl = self.http_failure_ttl_seconds if failed else self.http_ttl_seconds
+        if ttl <= 0:
+            return
+        try:
+            await RedisService.get_async_client().set(
+                _url_key(namespace, url), json.dumps(result, default=str), ex=ttl
+            )
+        except Exception as e:
+            logger.debug(f"Reachability cache write skipped: {e}")
+
+    # ── HTML ────────────────────────────────────────────────────
+
+    async def get_html(self, url: str) -> Optional[str]:
+        """HTML fetched for this URL by an earlier check, if still cached."""
+        try:
+            redis = RedisService.get_async_client()
+            html = await redis.get(_url_key(HTML_NAMESPACE, url))
+            await redis.hincrby(STATS_KEY, "html_hits" if html else "html_misses", 1)
+            return html or None
+        except Exception as e:
+            logger.debug(f"Reachability cache unavailable: {e}")
+            return None
+
+    async def put_html(self, url: str, html: str) -> None:
+        """Share a fetched page body with later stages (skipped for large pages)."""
+        if self.html_ttl_seconds <= 0 or not html or len(html) > MAX_CACHED_HTML_CHARS:
+            return
+        try:
+            await RedisService.get_async_client().set(
+                _url_key(HTML_NAMESPACE, url), html, ex=self.html_ttl_seconds
+            )
+        except Exception as e:
+            logger.debug(f"Reachability cache write skipped: {e}")
+
+    # ── Stats ───────────────────────────────────────────────────
+
+    @staticmethod
+    def _count_sync(field: str) -> None:
+        try:
+            RedisService.get_client().hincrby(STATS_KEY, field, 1)
+        except Exception:
+            pass
+
+    async def get_stats(self) -> Dict[str, int]:
+        """DNS / HTTP hit and miss counters aggregated across all processes."""
+        try:
+            raw = await RedisService.get_async_client().hgetall(STATS_KEY) or {}
+            return {field: int(value) for field, value in raw.items()}
+        except Exception as e:
+            logger.debug(f"Reachability stats unavailable: {e}")
+            return {}
+
+
+_cache: Optional[ReachabilityCache] = None
+
+
+def get_reachability_cache() -> ReachabilityCache:
+    """Get the process-wide reachability cache."""
+    global _cache
+    if _cache is None:
+        settings = get_settings()
+        _cache = ReachabilityCache(
+            dns_ttl_seconds=settings.REACHABILITY_DNS_TTL_SECONDS,
+            dns_negative_ttl_seconds=settings.REACHABILITY_DNS_NEGATIVE_TTL_SECONDS,
+            http_ttl_seconds=settings.REACHABILITY_HTTP_TTL_SECONDS,
+            http_failure_ttl_seconds=settings.REACHABILITY_HTTP_FAILURE_TTL_SECONDS,
+            html_ttl_seconds=settings.REACHABILITY_HTML_TTL_SECONDS,
+        )
+    return _cache
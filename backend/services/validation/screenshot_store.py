@@ -0,0 +1,207 @@
+"""
+Content-addressed screenshot store for website validation.
+
+Validation screenshots used to travel as base64 PNG strings inside the
+result dict (and into website_validation_result JSONB). Instead, a
+viewport-clipped image is written once to disk under its SHA-256 digest and
+only the digest / URL is recorded:
+
+    {VALIDATION_SCREENSHOT_DIR}/ab/abcdef....webp
+    {VALIDATION_SCREENSHOT_DIR}/ab/abcdef..._thumb.webp
+
+Identical screenshots (e.g. re-validating an unchanged site) map to the same
+file and are never rewritten. Files are served by
+GET /api/v1/validation/screenshots/{filename}.
+"""
+import asyncio
+import hashlib
+import io
+import logging
+import os
+import re
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# Formats the store writes (Playwright itself only captures png/jpeg)
+_MEDIA_TYPES = {
+    "webp": "image/webp",
+    "jpeg": "image/jpeg",
+}
+_EXTENSIONS = {"webp": "webp", "jpeg": "jpg"}
+_FILENAME_RE = re.compile(r"^[0-9a-f]{64}(_thumb)?\.(webp|jpg)$")
+
+
+@dataclass(frozen=True)
+class StoredScreenshot:
+    """Reference to a stored screenshot (what goes into validation results)."""
+    digest: str
+    url: str
+    thumbnail_url: Optional[str]
+    size_bytes: int
+
+    def to_dict(self) -> dict:
+        return {
+            "screenshot_hash": self.digest,
+            "screenshot_url": self.url,
+            "screenshot_thumbnail_url": self.thumbnail_url,
+            "screenshot_bytes": self.size_bytes,
+        }
+
+
+class ScreenshotStore:
+    """Write-once, content-addressed image store on the local filesystem."""
+
+    def __init__(
+        self,
+        base_dir: str,
+        base_url: str,
+        image_format: str = "webp",
+        quality: int = 70,
+        thumbnail_width: int = 320,
+    ):
+        """
+        Args:
+            base_dir: Root directory for screenshots
+            base_url: Public URL prefix the files are served under
+            image_format: "webp" or "jpeg"
+            quality: Encoder quality (1-100)
+            thumbnail_width: Thumbnail width in px (0 disables thumbnails)
+        """
+        if image_format not in _MEDIA_TYPES:
+            raise ValueError(f"Unsupported screenshot format: {image_format}")
+        self.base_dir = Path(base_dir)
+        self.base_url = base_url.rstrip("/")
+        self.image_format = image_format
+        self.quality = quality
+        self.thumbnail_width = thumbnail_width
+
+    @property
+    def extension(self) -> str:
+        return _EXTENSIONS[self.image_format]
+
+    async def save(self, image_bytes: bytes) -> Optional[StoredScreenshot]:
+        """
+        Encode and store a captured screenshot (PNG or JPEG bytes).
+
+        Encoding and disk I/O run in a thread so the event loop (and the
+        other pages on the browser pool) are not blocked.
+
+        Returns:
+            StoredScreenshot, or None if encoding/writing failed
+        """
+        try:
+            return await asyncio.to_thread(self._save_sync, image_bytes)
+        except Exception as e:
+            logger.error(f"Failed to store screenshot: {e}")
+            return None
+
+    def _save_sync(self, image_bytes: bytes) -> StoredScreenshot:
+        encoded, thumbnail = self._encode(image_bytes)
+        digest = hashlib.sha256(encoded).hexdigest()
+
+        self._write_once(self.path_for(f"{digest}.{self.extension}"), encoded)
+        thumbnail_url = None
+        if thumbnail is not None:
+            thumb_name = f"{digest}_thumb.{self.extension}"
+            self._write_once(self.path_for(thumb_name), thumbnail)
+            thumbnail_url = f"{self.base_url}/{thumb_name}"
+
+        return StoredScreenshot(
+            digest=digest,
+            url=f"{self.base_url}/{digest}.{self.extension}",
+            thumbnail_url=thumbnail_url,
+            size_bytes=len(encoded),
+        )
+
+    def _encode(self, image_bytes: bytes):
+        """Re-encode to the store format and build the thumbnail (needs Pillow)."""
+        try:
+            from PIL import Image
+        except ImportError:
+            # Without Pillow only JPEG captures can be stored as-is
+            if self.image_format != "jpeg":
+                raise
+            return image_bytes, None
+
+        image = Image.open(io.BytesIO(image_bytes)).convert("RGB")
+        pil_format = "WEBP" if self.image_format == "webp" else "JPEG"
+
+        buffer = io.BytesIO()
+        image.save(buffer, format=pil_format, quality=self.quality, optimize=True)
+        encoded = buffer.getvalue()
+
+        thumbnail = None
+        if self.thumbnail_width and image.width > self.thumbnail_width:
+            height = round(image.height * self.thumbnail_width / image.width)
+            thumb_buffer = io.BytesIO()
+            image.resize((self.thumbnail_width, height)).save(
+                thumb_buffer, format=pil_format, quality=self.quality, optimize=True
+            )
+            thumbnail = thumb_buffer.getvalue()
+
+        return encoded, thumbnail
+
+    def path_for(self, filename: str) -> Path:
+        """Location of a stored file (sharded by the first two hex digits)."""
+        return self.base_dir / filename[:2] / filename
+
+    @staticmethod
+    def _write_once(path: Path, data: bytes) -> None:
+        if path.exists():
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temp file and rename so readers never see partial files
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except Exception:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def resolve(self, filename: str) -> Optional[Path]:
+        """
+        Map a public filename back to its path.
+
+        Returns:
+            The path if the filename is a valid store name and the file exists
+        """
+        if not _FILENAME_RE.match(filename):
+            return None
+        path = self.path_for(filename)
+        return path if path.exists() else None
+
+    @staticmethod
+    def media_type(filename: str) -> str:
+        return "image/webp" if filename.endswith(".webp") else "image/jpeg"
+
+
+_store: Optional[ScreenshotStore] = None
+
+
+def get_screenshot_store() -> ScreenshotStore:
+    """Get the process-wide screenshot store."""
+    global _store
+    if _store is None:
+        settings = get_settings()
+        base_url = settings.VALIDATION_SCREENSHOT_BASE_URL or (
+            f"{settings.API_URL}/api/{settings.API_VERSION}/validation/screenshots"
+        )
+        _store = ScreenshotStore(
+            base_dir=settings.VALIDATION_SCREENSHOT_DIR,
+            base_url=base_url,
+            image_format=settings.VALIDATION_SCREENSHOT_FORMAT,
+            quality=settings.VALIDATION_SCREENSHOT_QUALITY,
+            thumbnail_width=settings.VALIDATION_SCREENSHOT_THUMBNAIL_WIDTH,
+        )
+    return _store
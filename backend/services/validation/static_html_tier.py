@@ -0,0 +1,429 @@
+"""
+Static HTML validation tier.
+
+Sits between the URL prescreener and Playwright. A single HTTP GET (or HTML
+the caller already fetched) is parsed with the stdlib HTMLParser for the
+signals the browser stage would extract - title, meta description, visible
+text, tel:/mailto: links, phones, emails and schema.org LocalBusiness JSON-LD.
+
+The tier only decides when static HTML is conclusive:
+- parked / for-sale domain pages -> invalid (no browser needed)
+- business phone and name on the page, plus a first-party signal (a
+  schema.org business node or the <title> naming the business) -> valid
+
+Everything else (ambiguous content, JS-rendered shells, fetch failures,
+non-HTML responses) escalates to Playwright + LLM. So do pages served from a
+directory, aggregator or social host - including redirects to one - since a
+Yelp or Facebook listing carries the same phone and name as the real site.
+"""
+import asyncio
+import json
+import logging
+import re
+from dataclasses import dataclass, field
+from html.parser import HTMLParser
+from typing import Any, Dict, List, Optional
+
+import aiohttp
+
+from core.validation_enums import InvalidURLReason, ValidationRecommendation
+from services.validation.content_analyzer import ContentAnalyzer
+from services.validation.url_prescreener import URLPrescreener
+
+logger = logging.getLogger(__name__)
+
+# Static responses larger than this are truncated before parsing
+MAX_HTML_BYTES = 1_500_000
+
+# Below this many visible words a page is treated as JS-rendered
+MIN_STATIC_WORDS = 80
+
+PARKED_MARKERS = [
+    "domain for sale",
+    "this domain may be for sale",
+    "this domain is for sale",
+    "buy this domain",
+    "parked domain",
+    "domain is parked",
+    "parked free, courtesy of",
+    "hugedomains.com",
+    "sedoparking",
+    "dan.com/buy-domain",
+    "afternic",
+]
+
+# Root containers of client-rendered apps
+SPA_ROOT_IDS = {"root", "app", "__next", "__nuxt", "___gatsby", "svelte"}
+
+SCHEMA_BUSINESS_HINTS = (
+    "LocalBusiness", "Organization", "Store", "Restaurant", "Service",
+    "Contractor", "Dentist", "Physician", "Attorney", "Plumber", "Electrician",
+)
+
+_NAME_STOPWORDS = {
+    "the", "and", "of", "inc", "llc", "co", "corp", "company", "ltd",
+    "services", "service", "group", "&",
+}
+
+_SKIP_TEXT_TAGS = {"script", "style", "noscript", "template", "svg"}
+
+
+@dataclass
+class StaticPageSignals:
+    """Signals extracted from server-rendered HTML."""
+    title: str = ""
+    meta_description: str = ""
+    text: str = ""
+    phones: List[str] = field(default_factory=list)
+    emails: List[str] = field(default_factory=list)
+    schema_names: List[str] = field(default_factory=list)
+    schema_phones: List[str] = field(default_factory=list)
+    has_schema_address: bool = False
+    script_count: int = 0
+    has_spa_root: bool = False
+
+    @property
+    def word_count(self) -> int:
+        return len(self.text.split())
+
+    @property
+    def is_js_heavy(self) -> bool:
+        """Little server-rendered text, or an empty SPA root with bundles."""
+        if self.word_count < MIN_STATIC_WORDS:
+            return True
+        return self.has_spa_root and self.word_count < MIN_STATIC_WORDS * 3
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "title": self.title,
+            "phones": self.phones,
+            "emails": self.emails,
+            "schema_names": self.schema_names,
+            "word_count": self.word_count,
+            "script_count": self.script_count,
+            "has_spa_root": self.has_spa_root,
+            "is_js_heavy": self.is_js_heavy,
+        }
+
+
+class _SignalParser(HTMLParser):
+    """Single-pass collector for the signals in StaticPageSignals."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.title_parts: List[str] = []
+        self.text_parts: List[str] = []
+        self.meta_description = ""
+        self.tel_values: List[str] = []
+        self.mailto_values: List[str] = []
+        self.json_ld_blocks: List[str] = []
+        self.script_count = 0
+        self.has_spa_root = False
+        self._skip_depth = 0
+        self._in_title = False
+        self._in_json_ld = False
+        self._json_ld_parts: List[str] = []
+
+    def handle_starttag(self, tag, attrs):
+        attrs = {k: (v or "") for k, v in attrs}
+
+        if tag == "script":
+            self.script_count += 1
+            if attrs.get("type", "").lower() == "application/ld+json":
+                self._in_json_ld = True
+                self._json_ld_parts = []
+        if tag in _SKIP_TEXT_TAGS:
+            self._skip_depth += 1
+        elif tag == "title":
+            self._in_title = True
+        elif tag == "meta":
+            name = (attrs.get("name") or attrs.get("property") or "").lower()
+            if name in ("description", "og:description") and not self.meta_description:
+                self.meta_description = attrs.get("content", "").strip()
+        elif tag == "a":
+            href = attrs.get("href", "").strip()
+            if href.lower().startswith("tel:"):
+                self.tel_values.append(href[4:])
+            elif href.lower().startswith("mailto:"):
+                self.mailto_values.append(href[7:].split("?", 1)[0])
+        elif tag == "div" and attrs.get("id", "").lower() in SPA_ROOT_IDS:
+            self.has_spa_root = True
+
+    def handle_endtag(self, tag):
+        if tag == "script" and self._in_json_ld:
+            self.json_ld_blocks.append("".join(self._json_ld_parts))
+            self._in_json_ld = False
+        if tag in _SKIP_TEXT_TAGS and self._skip_depth:
+            self._skip_depth -= 1
+        elif tag == "title":
+            self._in_title = False
+
+    def handle_data(self, data):
+        if self._in_json_ld:
+            self._json_ld_parts.append(data)
+        elif self._in_title:
+            self.title_parts.append(data)
+        elif not self._skip_depth:
+            self.text_parts.append(data)
+
+
+class StaticHTMLTier:
+    """
+    Resolves conclusive validations from static HTML.
+
+    Usage:
+        tier = StaticHTMLTier()
+        decision = await tier.evaluate(business, url)
+        if decision["decided"]:
+            ...  # skip Playwright
+    """
+
+    def __init__(self, timeout_seconds: int = 10):
+        self.timeout_seconds = timeout_seconds
+        self.analyzer = ContentAnalyzer()
+        self.prescreener = URLPrescreener()
+
+    async def fetch(self, url: str) -> Dict[str, Any]:
+        """
+        GET the URL without a browser.
+
+        Returns:
+            {"html": str | None, "status_code": int | None, "final_url": str, "error": str | None}
+        """
+        timeout = aiohttp.ClientTimeout(total=self.timeout_seconds)
+        headers = {
+            "User-Agent": (
+                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+                "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+            ),
+            "Accept": "text/html,application/xhtml+xml",
+        }
+        try:
+            async with aiohttp.ClientSession(timeout=timeout, headers=headers) as session:
+                async with session.get(url, allow_redirects=True, ssl=False) as response:
+                    final_url = str(response.url)
+                    content_type = response.headers.get("Content-Type", "").lower()
+                    if response.status != 200 or "html" not in content_type:
+                        return {
+                            "html": None,
+                            "status_code": response.status,
+                            "final_url": final_url,
+                            "error": f"HTTP {response.status} ({content_type or 'no content type'})",
+                        }
+                    body = await response.content.read(MAX_HTML_BYTES)
+                    charset = response.charset or "utf-8"
+                    return {
+                        "html": body.decode(charset, errors="replace"),
+                        "status_code": response.status,
+                        "final_url": final_url,
+                        "error": None,
+                    }
+        except asyncio.TimeoutError:
+            return {"html": None, "status_code": None, "final_url": url, "error": "timeout"}
+        except (aiohttp.ClientError, LookupError) as e:
+            return {"html": None, "status_code": None, "final_url": url, "error": str(e)}
+
+    def extract(self, html: str) -> StaticPageSignals:
+        """Parse HTML into StaticPageSignals."""
+        parser = _SignalParser()
+        try:
+            parser.feed(html[:MAX_HTML_BYTES])
+            parser.close()
+        except Exception as e:
+            # Malformed markup - keep whatever was collected before the error
+            logger.debug(f"Static HTML parse stopped early: {e}")
+
+        text = re.sub(r"\s+", " ", " ".join(parser.text_parts)).strip()
+        signals = StaticPageSignals(
+            title=re.sub(r"\s+", " ", "".join(parser.title_parts)).strip(),
+            meta_description=parser.meta_description,
+            text=text,
+            script_count=parser.script_count,
+            has_spa_root=parser.has_spa_root,
+        )
+
+        for block in parser.json_ld_blocks:
+            self._collect_schema(block, signals)
+
+        phones = self.analyzer._normalize_tel_values(parser.tel_values + signals.schema_phones)
+        phones += self.analyzer._extract_phones(text)
+        signals.phones = list(dict.fromkeys(phones))
+
+        emails = [e.strip() for e in parser.mailto_values if "@" in e]
+        emails += self.analyzer._extract_emails(text)
+        signals.emails = list(dict.fromkeys(emails))[:5]
+        return signals
+
+    async def evaluate(
+        self,
+        business: Dict[str, Any],
+        url: str,
+        html: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Decide from static HTML, or report why the page must escalate.
+
+        Args:
+            business: Business data {name, phone, ...}
+            url: Website URL (the URL that served ``html``, when given)
+            html: Already-fetched HTML (fetched here when None)
+
+        Returns:
+            {
+                "decided": bool,
+                "verdict", "confidence", "reasoning", "recommendation",
+                "invalid_reason" (when decided invalid),
+                "escalation_reason" (when not decided),
+                "fetch": {...}, "signals": {...}
+            }
+        """
+        outcome: Dict[str, Any] = {"decided": False}
+
+        final_url = url
+        if html is None:
+            fetched = await self.fetch(url)
+            html = fetched.pop("html")
+            outcome["fetch"] = fetched
+            final_url = fetched["final_url"]
+            if not html:
+                outcome["escalation_reason"] = f"static fetch unavailable: {fetched['error']}"
+                return outcome
+
+        # Listings repeat the business's phone and name - leave them to the LLM
+        host_check = self.prescreener._check_non_business_domain(final_url)
+        if not host_check["is_valid"]:
+            outcome["escalation_reason"] = f"served by a non-business host: {host_check['reason']}"
+            return outcome
+
+        signals = self.extract(html)
+        outcome["signals"] = signals.summary()
+
+        haystack = f"{signals.title} {signals.meta_description} {signals.text}".lower()
+        parked_marker = next((m for m in PARKED_MARKERS if m in haystack), None)
+        if parked_marker and signals.word_count < 400:
+            outcome.update({
+                "decided": True,
+                "verdict": "invalid",
+                "confidence": 0.9,
+                "reasoning": f"Parked or for-sale domain page ('{parked_marker}')",
+                "recommendation": ValidationRecommendation.TRIGGER_SCRAPINGDOG.value,
+                "invalid_reason": InvalidURLReason.PARKING.value,
+            })
+            return outcome
+
+        phone_match = self._phone_matches(business.get("phone"), signals)
+        name_match = self._name_matches(business.get("name"), signals)
+        first_party = self._first_party_signal(business.get("name"), signals)
+        outcome["signals"].update({
+            "phone_match": phone_match,
+            "name_match": name_match,
+            "first_party": first_party,
+        })
+
+        if phone_match and name_match and first_party:
+            outcome.update({
+                "decided": True,
+                "verdict": "valid",
+                "confidence": 0.95 if first_party == "schema" else 0.9,
+                "reasoning": f"Business phone and name found in server-rendered HTML ({first_party} names the business)",
+                "recommendation": ValidationRecommendation.KEEP_URL.value,
+            })
+            return outcome
+
+        if signals.is_js_heavy:
+            outcome["escalation_reason"] = (
+                f"JS-heavy page ({signals.word_count} words, {signals.script_count} scripts)"
+            )
+        else:
+            outcome["escalation_reason"] = "static HTML inconclusive"
+        return outcome
+
+    @staticmethod
+    def _collect_schema(block: str, signals: StaticPageSignals) -> None:
+        """Pull name/telephone/address from schema.org business nodes."""
+        try:
+            data = json.loads(block)
+        except ValueError:
+            return
+
+        nodes = data if isinstance(data, list) else [data]
+        while nodes:
+            node = nodes.pop()
+            if isinstance(node, list):
+                nodes.extend(node)
+                continue
+            if not isinstance(node, dict):
+                continue
+            if "@graph" in node:
+                nodes.extend(node["@graph"] if isinstance(node["@graph"], list) else [node["@graph"]])
+
+            node_type = node.get("@type", "")
+            types = node_type if isinstance(node_type, list) else [node_type]
+            if not any(
+                isinstance(t, str) and any(hint in t for hint in SCHEMA_BUSINESS_HINTS)
+                for t in types
+            ):
+                continue
+
+            if isinstance(node.get("name"), str):
+                signals.schema_names.append(node["name"].strip())
+            if isinstance(node.get("telephone"), str):
+                signals.schema_phones.append(node["telephone"])
+            if node.get("address"):
+                signals.has_schema_address = True
+
+    @staticmethod
+    def _phone_matches(phone: Optional[str], signals: StaticPageSignals) -> bool:
+        """Compare on the last 10 digits (ignores +1 / formatting)."""
+        target = re.sub(r"\D", "", phone or "")[-10:]
+        if len(target) < 10:
+            return False
+        page_digits = {re.sub(r"\D", "", p)[-10:] for p in signals.phones}
+        return target in page_digits
+
+    @staticmethod
+    def _name_tokens(name: Optional[str]) -> List[str]:
+        """Distinctive lowercase tokens of a business name."""
+        normalized = re.sub(r"[^a-z0-9 ]", " ", (name or "").lower())
+        return [t for t in normalized.split() if t not in _NAME_STOPWORDS and len(t) > 1]
+
+    @staticmethod
+    def _mostly_contains(tokens: List[str], text: str) -> bool:
+        """At least two thirds of ``tokens`` (rounded up) appear in ``text``."""
+        text_tokens = set(re.sub(r"[^a-z0-9 ]", " ", text.lower()).split())
+        hits = sum(1 for t in tokens if t in text_tokens)
+        return hits >= max(1, -(-len(tokens) * 2 // 3))
+
+    @classmethod
+    def _schema_names_business(cls, tokens: List[str], signals: StaticPageSignals) -> bool:
+        for schema_name in signals.schema_names:
+            schema_tokens = set(re.sub(r"[^a-z0-9 ]", " ", schema_name.lower()).split())
+            if all(t in schema_tokens for t in tokens):
+                return True
+        return False
+
+    @classmethod
+    def _name_matches(cls, name: Optional[str], signals: StaticPageSignals) -> bool:
+        """Schema.org name match, or most distinctive name tokens in title/text."""
+        tokens = cls._name_tokens(name)
+        if not tokens:
+            return False
+        if cls._schema_names_business(tokens, signals):
+            return True
+        return cls._mostly_contains(tokens, f"{signals.title} {signals.text[:20000]}")
+
+    @classmethod
+    def _first_party_signal(cls, name: Optional[str], signals: StaticPageSignals) -> Optional[str]:
+        """
+        Evidence the page is the business's own site rather than a page
+        mentioning it: "schema" (a business node with its name), "title"
+        (the name in <title>), or None.
+        """
+        tokens = cls._name_tokens(name)
+        if not tokens:
+            return None
+        if cls._schema_names_business(tokens, signals):
+            return "schema"
+        if signals.title and cls._mostly_contains(tokens, signals.title):
+            return "title"
+        return None
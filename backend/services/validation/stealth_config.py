@@ -4,8 +4,10 @@ Implements anti-bot detection measures.
 """
 import random
 import asyncio
-from typing import Tuple
-from playwright.async_api import async_playwright, Browser, BrowserContext, Page
+from dataclasses import dataclass
+from enum import Enum
+from typing import Optional, Tuple
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page, Response, Route
 import logging
 
 logger = logging.getLogger(__name__)
@@ -34,6 +36,13 @@ async def create_stealth_browser(playwright) -> Tuple[Browser, BrowserContext]:
     Returns:
         Tuple of (Browser, BrowserContext)
     """
+    browser = await launch_stealth_browser(playwright)
+    context = await create_stealth_context(browser)
+    return browser, context
+
+
+async def launch_stealth_browser(playwright) -> Browser:
+    """Launch a headless Chromium with stealth args (no context yet)."""
     # Launch browser with stealth args
     browser = await playwright.chromium.launch(
         headless=True,
@@ -51,6 +60,16 @@ async def create_stealth_browser(playwright) -> Tuple[Browser, BrowserContext]:
         ]
     )
     
+    return browser
+
+
+async def create_stealth_context(browser: Browser) -> BrowserContext:
+    """
+    Open a new isolated context on ``browser`` with stealth settings.
+    
+    Contexts are cheap compared to a browser launch, so pooled browsers hand
+    out a fresh context per validated URL (no cookies leak between sites).
+    """
     # Random user agent from pool
     user_agent = random.choice(USER_AGENTS)
     
@@ -148,12 +167,16 @@ async def create_stealth_browser(playwright) -> Tuple[Browser, BrowserContext]:
         });
     """)
     
-    logger.info(f"Created stealth browser with user agent: {user_agent[:50]}...")
+    logger.debug(f"Created stealth context with user agent: {user_agent[:50]}...")
     
-    return browser, context
+    return context
 
 
-async def human_like_navigation(page: Page, url: str, wait_until: str = 'networkidle'):
+async def human_like_navigation(
+    page: Page,
+    url: str,
+    wait_until: str = 'networkidle'
+) -> Optional[Response]:
     """
     Navigate to URL with human-like behavior.
     
@@ -161,13 +184,16 @@ async def human_like_navigation(page: Page, url: str, wait_until: str = 'network
         page: Playwright page object
         url: URL to navigate to
         wait_until: Load state to wait for ('networkidle', 'domcontentloaded', 'load')
+    
+    Returns:
+        The main document response (None for same-document navigations)
     """
     # Random delay before navigation (simulate thinking time)
     await asyncio.sleep(random.uniform(0.5, 2.0))
     
     try:
         # Try networkidle first
-        await page.goto(
+        response = await page.goto(
             url,
             wait_until=wait_until,
             timeout=30000
@@ -176,7 +202,7 @@ async def human_like_navigation(page: Page, url: str, wait_until: str = 'network
         logger.warning(f"Navigation with {wait_until} failed, falling back to domcontentloaded: {e}")
         try:
             # Fallback to domcontentloaded
-            await page.goto(url, wait_until='domcontentloaded', timeout=30000)
+            response = await page.goto(url, wait_until='domcontentloaded', timeout=30000)
         except Exception as e2:
             logger.error(f"Navigation failed completely: {e2}")
             raise
@@ -192,6 +218,8 @@ async def human_like_navigation(page: Page, url: str, wait_until: str = 'network
     
     # Final wait with jitter
     await asyncio.sleep(random.uniform(1.0, 2.0))
+    
+    return response
 
 
 async def random_scroll(page: Page):
@@ -253,3 +281,187 @@ async def wait_for_stable_page(page: Page, timeout: int = 5000):
         # If networkidle fails, just wait a bit
         await asyncio.sleep(2.0)
 
+
+# ============================================================================
+# NAVIGATION PROFILES
+# ============================================================================
+
+class NavigationProfile(str, Enum):
+    """
+    How much effort to spend looking human while loading a page.
+    
+    STEALTH:  human_like_navigation (delays, networkidle, scroll, mouse) plus
+              a stable-page wait - a fixed 3-8 s per URL
+    BALANCED: wait for 'load', one short scroll, brief settle; no mouse/jitter
+    FAST:     'domcontentloaded', images/fonts/media blocked, no synthetic
+              behavior; escalates to STEALTH when a block/captcha is detected
+    """
+    STEALTH = "stealth"
+    BALANCED = "balanced"
+    FAST = "fast"
+
+    @classmethod
+    def parse(cls, value) -> "NavigationProfile":
+        """Parse a setting value, falling back to STEALTH if unknown."""
+        try:
+            return cls(str(value).lower())
+        except ValueError:
+            logger.warning(f"Unknown navigation profile {value!r}, using stealth")
+            return cls.STEALTH
+
+
+@dataclass(frozen=True)
+class _ProfileSettings:
+    wait_until: str
+    block_resources: bool
+    settle_timeout_ms: int  # networkidle wait after load (0 = none)
+
+
+_PROFILE_SETTINGS = {
+    NavigationProfile.BALANCED: _ProfileSettings(
+        wait_until='load', block_resources=False, settle_timeout_ms=2000
+    ),
+    NavigationProfile.FAST: _ProfileSettings(
+        wait_until='domcontentloaded', block_resources=True, settle_timeout_ms=1500
+    ),
+}
+
+# Resource types that carry no validation signal (text, links, tel: hrefs)
+BLOCKED_RESOURCE_TYPES = frozenset({'image', 'font', 'media'})
+
+# Status codes bot protection answers with
+BLOCK_STATUS_CODES = frozenset({401, 403, 429, 503})
+
+# Titles of bot walls / captcha interstitials
+BLOCK_TITLE_MARKERS = (
+    'captcha',
+    'verify you are human',
+    'are you a robot',
+    'just a moment',
+    'attention required',
+    'access denied',
+    'checking your browser',
+    'request blocked',
+    'ddos protection',
+    'security check',
+)
+
+# Phrases that identify a challenge page only when it has almost no other
+# content (a real site may mention them, e.g. in a form's help text)
+BLOCK_TEXT_MARKERS = (
+    'verify you are human',
+    'are you a robot',
+    'checking your browser',
+    'unusual traffic',
+    'request blocked',
+)
+
+# DOM of known challenge pages (Cloudflare, PerimeterX, DataDome, Akamai)
+BLOCK_SELECTORS = (
+    '#challenge-form, #challenge-running, #cf-challenge-running, '
+    '.cf-browser-verification, #px-captcha, #sec-if-cpt-container, '
+    'iframe[src*="geo.captcha-delivery.com"]'
+)
+
+# Challenge hosts whose iframe is a block only on an otherwise empty page
+# (Turnstile can also sit inside a normal contact form)
+CHALLENGE_FRAME_HOSTS = ('challenges.cloudflare.com', 'captcha-delivery.com')
+
+# Visible text below this length counts as an interstitial, not a site
+CHALLENGE_TEXT_LIMIT = 500
+
+
+async def _abort_heavy_resources(route: Route) -> None:
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def navigate_with_profile(
+    page: Page,
+    url: str,
+    profile: NavigationProfile,
+    timeout: int = 30000
+) -> Optional[Response]:
+    """
+    Navigate ``page`` to ``url`` using a navigation profile.
+    
+    Returns:
+        The main document response (None if unavailable)
+    """
+    if profile == NavigationProfile.STEALTH:
+        response = await human_like_navigation(page, url)
+        await wait_for_stable_page(page, timeout=5000)
+        return response
+    
+    config = _PROFILE_SETTINGS[profile]
+    if config.block_resources:
+        await page.route("**/*", _abort_heavy_resources)
+    
+    response = await page.goto(url, wait_until=config.wait_until, timeout=timeout)
+    
+    if profile == NavigationProfile.BALANCED:
+        await random_scroll(page)
+    
+    if config.settle_timeout_ms:
+        try:
+            await page.wait_for_load_state('networkidle', timeout=config.settle_timeout_ms)
+        except Exception:
+            pass  # busy pages (analytics beacons, chat widgets) never go idle
+    
+    return response
+
+
+async def stop_blocking_resources(page: Page) -> None:
+    """Remove the FAST profile's request interception (before escalating)."""
+    try:
+        await page.unroute("**/*", _abort_heavy_resources)
+    except Exception as e:
+        logger.debug(f"Unroute failed (non-critical): {e}")
+
+
+async def detect_block(page: Page, response: Optional[Response]) -> bool:
+    """
+    Detect a bot wall / captcha instead of the real page.
+    
+    Checks the document status code, then (one evaluate) the title, known
+    challenge-page DOM, and - only on near-empty pages - challenge iframes
+    and phrases. Captcha widgets embedded in a normal page (e.g. reCAPTCHA
+    on a contact form) do not count.
+    """
+    if response is not None and response.status in BLOCK_STATUS_CODES:
+        return True
+    try:
+        page_info = await page.evaluate("""
+            (selectors) => {
+                const text = document.body ? document.body.innerText.trim() : '';
+                return {
+                    title: document.title || '',
+                    text: text.slice(0, 2000),
+                    textLength: text.length,
+                    challengeDom: !!document.querySelector(selectors),
+                    frames: Array.from(document.querySelectorAll('iframe[src]')).map(f => f.src),
+                };
+            }
+        """, BLOCK_SELECTORS)
+    except Exception as e:
+        logger.debug(f"Block detection failed (non-critical): {e}")
+        return False
+    
+    title = (page_info.get('title') or '').lower()
+    if any(marker in title for marker in BLOCK_TITLE_MARKERS):
+        return True
+    if page_info.get('challengeDom'):
+        return True
+    
+    if (page_info.get('textLength') or 0) >= CHALLENGE_TEXT_LIMIT:
+        return False
+    text = (page_info.get('text') or '').lower()
+    if any(marker in text for marker in BLOCK_TEXT_MARKERS):
+        return True
+    return any(
+        host in (frame or '').lower()
+        for frame in page_info.get('frames') or []
+        for host in CHALLENGE_FRAME_HOSTS
+    )
@@ -2,15 +2,18 @@
 Validation Orchestrator - Coordinates multi-stage website validation.
 
 Pipeline stages:
-1. URL Prescreener: Fast checks (file types, domains) - fail fast
+1. URL Prescreener: Fast checks (file types, domains, cached DNS) - fail fast
+1b. Static HTML: One HTTP GET - resolves parked pages and clear matches
 2. Playwright: Browser automation - extract website content
 3. LLM Validator: Intelligent cross-referencing - make final decision
 
+Every result records the stage that decided it in ``decided_by``.
+
 This orchestrator manages the flow, handles errors, and produces
 a final validation result with reasoning.
 """
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, TYPE_CHECKING
 from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -19,6 +22,8 @@ import re
 from services.validation.url_prescreener import URLPrescreener
 from services.validation.playwright_service import PlaywrightValidationService
 from services.validation.llm_validator import LLMWebsiteValidator
+from services.validation.static_html_tier import StaticHTMLTier
+from services.validation.reachability_cache import get_reachability_cache
 from services.system_settings_service import SystemSettingsService
 from core.config import get_settings
 from core.validation_enums import (
@@ -27,6 +32,9 @@ from core.validation_enums import (
     categorize_url_domain
 )
 
+if TYPE_CHECKING:
+    from services.validation.browser_pool import BrowserPool
+
 _SOCIAL_MEDIA_HOSTS = {
     "facebook.com", "instagram.com", "twitter.com", "x.com",
     "linkedin.com", "youtube.com", "tiktok.com", "pinterest.com",
@@ -94,8 +102,9 @@ class ValidationOrchestrator:
     """
     Orchestrates the complete website validation pipeline.
     
-    Three stages:
+    Three stages (plus a static HTML tier between 1 and 2):
     1. Prescreen (cheap, fast) - Filter obvious invalids
+    1b. Static HTML (cheap) - Decide conclusive pages without a browser
     2. Playwright (expensive) - Extract content
     3. LLM (moderate cost) - Intelligent decision
     
@@ -111,7 +120,10 @@ class ValidationOrchestrator:
         db: Optional[AsyncSession] = None,
         playwright_service: Optional[PlaywrightValidationService] = None,
         llm_validator: Optional[LLMWebsiteValidator] = None,
-        model_override: Optional[str] = None
+        model_override: Optional[str] = None,
+        browser_pool: Optional["BrowserPool"] = None,
+        navigation_profile: Optional[str] = None,
+        static_tier_enabled: Optional[bool] = None
     ):
         """
         Initialize orchestrator with services.
@@ -121,9 +133,25 @@ class ValidationOrchestrator:
             playwright_service: Playwright service instance (creates if None)
             llm_validator: LLM validator instance (creates if None)
             model_override: Optional model to override system/config settings
+            browser_pool: Shared warm browser pool; when set, pages are borrowed
+                from it instead of launching a browser per validation
+            navigation_profile: stealth | balanced | fast (defaults to
+                VALIDATION_NAVIGATION_PROFILE)
+            static_tier_enabled: Try static HTML before Playwright (defaults
+                to VALIDATION_STATIC_TIER_ENABLED)
         """
+        settings = get_settings()
         self.prescreener = URLPrescreener()
+        if static_tier_enabled is None:
+            static_tier_enabled = settings.VALIDATION_STATIC_TIER_ENABLED
+        self.static_tier = (
+            StaticHTMLTier(timeout_seconds=settings.VALIDATION_STATIC_FETCH_TIMEOUT_SECONDS)
+            if static_tier_enabled else None
+        )
+        self.reachability = get_reachability_cache()
         self.playwright_service = playwright_service
+        self.browser_pool = browser_pool
+        self.navigation_profile = navigation_profile
         self.llm_validator = llm_validator  # Will be initialized in validate method
         self.db = db
         self.model_override = model_override
@@ -161,7 +189,9 @@ class ValidationOrchestrator:
         business: Dict[str, Any],
         url: str,
         timeout: int = 30000,
-        capture_screenshot: bool = False
+        capture_screenshot: bool = False,
+        static_html: Optional[str] = None,
+        defer_llm: bool = False
     ) -> Dict[str, Any]:
         """
         Run complete validation pipeline for a business website.
@@ -170,7 +200,15 @@ class ValidationOrchestrator:
             business: Business data {name, phone, email, address, city, state, country}
             url: Website URL to validate
             timeout: Playwright timeout in ms
-            capture_screenshot: Whether to capture screenshot
+            capture_screenshot: Whether to capture screenshot (always runs
+                Playwright, since the static tier cannot take one)
+            static_html: HTML already fetched for this URL, if any. Defaults
+                to the page cached by the hunter's WebsiteValidator check; the
+                static tier only fetches it itself when neither is available
+            defer_llm: Stop before the Stage 3 API call (unless the verdict is
+                cached) and return decided_by="llm_deferred" with the prompt
+                inputs under "deferred_llm"; finish with complete_deferred_llm()
+                once the Message Batch result is in
             
         Returns:
             {
@@ -179,8 +217,10 @@ class ValidationOrchestrator:
                 "confidence": 0.0-1.0,
                 "reasoning": str,
                 "recommendation": str,
+                "decided_by": "prescreen" | "dns" | "static_html" | "playwright" | "llm" | "llm_deferred" | "error",
                 "stages": {
                     "prescreen": {...},
+                    "static_html": {...},
                     "playwright": {...},
                     "llm": {...}
                 },
@@ -198,6 +238,7 @@ class ValidationOrchestrator:
             "confidence": 0.0,
             "reasoning": "",
             "recommendation": "mark_invalid_keep_url",
+            "decided_by": "error",
             "stages": {},
             "metadata": {
                 "timestamp": start_time.isoformat(),
@@ -220,18 +261,62 @@ class ValidationOrchestrator:
                 
                 # Categorize the invalid reason
                 result["invalid_reason"] = categorize_url_domain(url) or InvalidURLReason.FILE.value
+                result["decided_by"] = "prescreen"
                 
                 logger.info(f"[Stage 1] Failed: {prescreen_result['skip_reason']}, reason: {result['invalid_reason']}")
                 return self._finalize_result(result, start_time)
             
             logger.info(f"[Stage 1] Passed")
             
+            # Dead domains fail Playwright anyway - skip straight to the
+            # technical-failure path (which clears the URL and re-queues discovery)
+            if await self.reachability.resolves(url) is False:
+                result["verdict"] = "invalid"
+                result["confidence"] = 0.8
+                result["reasoning"] = "Website failed to load: domain does not resolve"
+                result["recommendation"] = ValidationRecommendation.RETRY_VALIDATION.value
+                result["invalid_reason"] = InvalidURLReason.NOT_FOUND.value
+                result["decided_by"] = "dns"
+                
+                logger.warning(f"[Stage 1] Domain does not resolve: {url}")
+                return self._finalize_result(result, start_time)
+            
+            # STAGE 1b: Static HTML - skip the browser when the page is conclusive
+            # (social profiles always go through Playwright + LLM, which decide
+            # whether the profile counts as a website and run the rescue)
+            if self.static_tier is not None and not capture_screenshot and not _is_social_media_url(url):
+                if static_html is None:
+                    # Page the hunter's HTTP check already downloaded, if still cached
+                    static_html = await self.reachability.get_html(url)
+                static_result = await self.static_tier.evaluate(business, url, html=static_html)
+                result["stages"]["static_html"] = static_result
+                
+                if static_result["decided"]:
+                    result["verdict"] = static_result["verdict"]
+                    result["confidence"] = static_result["confidence"]
+                    result["reasoning"] = static_result["reasoning"]
+                    result["recommendation"] = static_result["recommendation"]
+                    if "invalid_reason" in static_result:
+                        result["invalid_reason"] = static_result["invalid_reason"]
+                    result["is_valid"] = static_result["verdict"] == "valid"
+                    result["decided_by"] = "static_html"
+                    
+                    logger.info(
+                        f"[Stage 1b] Decided from static HTML - Verdict: {result['verdict']} "
+                        f"({result['reasoning']})"
+                    )
+                    return self._finalize_result(result, start_time)
+                
+                logger.info(f"[Stage 1b] Escalating to Playwright: {static_result['escalation_reason']}")
+            
             # STAGE 2: Playwright Content Extraction
             logger.info(f"[Stage 2] Playwright extraction: {url}")
             
             # Create Playwright service if not provided (context manager)
             if self.playwright_service is None:
-                async with PlaywrightValidationService() as pw_service:
+                async with PlaywrightValidationService(
+                    pool=self.browser_pool, navigation_profile=self.navigation_profile
+                ) as pw_service:
                     playwright_result = await pw_service.validate_website(
                         url=url,
                         timeout=timeout,
@@ -263,6 +348,7 @@ class ValidationOrchestrator:
                     result["invalid_reason"] = InvalidURLReason.SSL_ERROR.value
                 else:
                     result["invalid_reason"] = InvalidURLReason.SERVER_ERROR.value
+                result["decided_by"] = "playwright"
                 
                 logger.warning(f"[Stage 2] Failed: {result['reasoning']}, reason: {result['invalid_reason']}")
                 return self._finalize_result(result, start_time)
@@ -280,11 +366,20 @@ class ValidationOrchestrator:
             # Prepare website data for LLM
             website_data = self._prepare_website_data_for_llm(url, playwright_result)
             
-            # Call LLM validator
-            llm_result = await self.llm_validator.validate_website_match(
-                business=business,
-                website_data=website_data
-            )
+            if defer_llm:
+                cache_key = self.llm_validator.cache_key(business, website_data)
+                llm_result = await self.llm_validator.get_cached_verdict(cache_key)
+                if llm_result is None:
+                    result["decided_by"] = "llm_deferred"
+                    result["deferred_llm"] = {"website_data": website_data, "cache_key": cache_key}
+                    logger.info("[Stage 3] Deferred to message batch")
+                    return self._finalize_result(result, start_time)
+            else:
+                # Call LLM validator
+                llm_result = await self.llm_validator.validate_website_match(
+                    business=business,
+                    website_data=website_data
+                )
             
             result["stages"]["llm"] = llm_result
 
@@ -325,66 +420,7 @@ class ValidationOrchestrator:
                             f"— proceeding with original social-media rejection"
                         )
 
-            # LLM verdict is final
-            result["verdict"] = llm_result["verdict"]
-            result["confidence"] = llm_result["confidence"]
-            result["reasoning"] = llm_result["reasoning"]
-            
-            # Map LLM recommendation to new system
-            llm_recommendation = llm_result.get("recommendation", "")
-            if llm_recommendation == "clear_url_and_mark_missing":
-                result["recommendation"] = ValidationRecommendation.TRIGGER_SCRAPINGDOG.value
-            elif llm_recommendation == "keep_url":
-                result["recommendation"] = ValidationRecommendation.KEEP_URL.value
-            elif llm_recommendation == "mark_invalid_keep_url":
-                result["recommendation"] = ValidationRecommendation.RETRY_VALIDATION.value
-            else:
-                result["recommendation"] = llm_recommendation  # Use as-is if already new format
-            
-            # Extract invalid reason from LLM signals
-            if result["verdict"] != "valid":
-                match_signals = llm_result.get("match_signals", {})
-                if match_signals.get("is_directory"):
-                    result["invalid_reason"] = InvalidURLReason.DIRECTORY.value
-                elif match_signals.get("is_aggregator"):
-                    result["invalid_reason"] = InvalidURLReason.AGGREGATOR.value
-                elif not match_signals.get("name_match"):
-                    result["invalid_reason"] = InvalidURLReason.WRONG_BUSINESS.value
-                elif not match_signals.get("phone_match") and not match_signals.get("address_match"):
-                    result["invalid_reason"] = InvalidURLReason.NO_CONTACT.value
-                else:
-                    result["invalid_reason"] = categorize_url_domain(url)
-
-            # ----------------------------------------------------------------
-            # DISCOVERY PHONE-MATCH RESCUE
-            # When ScrapingDog already confirmed a phone match in search snippets
-            # (meaning the snippet contained the exact business phone), but the
-            # LLM validator says "no_contact" because the phone is JavaScript-
-            # rendered on the actual page, override the recommendation to
-            # TRIGGER_SCRAPINGDOG → RETRY_VALIDATION so we don't clear the URL.
-            # The business will get routed to human review via quality-score check.
-            # ----------------------------------------------------------------
-            if (
-                result.get("invalid_reason") == InvalidURLReason.NO_CONTACT.value
-                and result.get("recommendation") == ValidationRecommendation.TRIGGER_SCRAPINGDOG.value
-                and business.get("discovery_phone_match", False)
-            ):
-                logger.info(
-                    f"📞 Discovery phone-match rescue: discovery confirmed phone match "
-                    f"via snippet for {url}, but Playwright couldn't extract it "
-                    f"(likely JS-rendered). Keeping URL — routing to human review."
-                )
-                result["recommendation"] = ValidationRecommendation.RETRY_VALIDATION.value
-                result["invalid_reason"] = InvalidURLReason.NO_CONTACT.value
-                result["discovery_phone_match_rescue"] = True
-            
-            # Set is_valid based on verdict
-            result["is_valid"] = (llm_result["verdict"] == "valid")
-            
-            logger.info(
-                f"[Stage 3] Complete - Verdict: {result['verdict']} "
-                f"(confidence={result['confidence']:.2f})"
-            )
+            self._apply_llm_result(result, business, url, llm_result)
             
             return self._finalize_result(result, start_time)
             
@@ -397,6 +433,100 @@ class ValidationOrchestrator:
             
             return self._finalize_result(result, start_time)
     
+    def complete_deferred_llm(
+        self,
+        result: Dict[str, Any],
+        business: Dict[str, Any],
+        url: str,
+        llm_result: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Finish a result returned with decided_by="llm_deferred".
+        
+        The social-media rescue needs a second online validation, so it is not
+        run here; deferred social URLs keep the LLM verdict as-is.
+        
+        Args:
+            result: Deferred result from validate_business_website(defer_llm=True)
+            business: Same business dict that was validated
+            url: Same URL that was validated
+            llm_result: Verdict built from the batch response
+        """
+        result.pop("deferred_llm", None)
+        result["stages"]["llm"] = llm_result
+        self._apply_llm_result(result, business, url, llm_result)
+        return result
+    
+    def _apply_llm_result(
+        self,
+        result: Dict[str, Any],
+        business: Dict[str, Any],
+        url: str,
+        llm_result: Dict[str, Any]
+    ) -> None:
+        """Copy the Stage 3 verdict onto the pipeline result (in place)."""
+        # LLM verdict is final
+        result["verdict"] = llm_result["verdict"]
+        result["confidence"] = llm_result["confidence"]
+        result["reasoning"] = llm_result["reasoning"]
+        
+        # Map LLM recommendation to new system
+        llm_recommendation = llm_result.get("recommendation", "")
+        if llm_recommendation == "clear_url_and_mark_missing":
+            result["recommendation"] = ValidationRecommendation.TRIGGER_SCRAPINGDOG.value
+        elif llm_recommendation == "keep_url":
+            result["recommendation"] = ValidationRecommendation.KEEP_URL.value
+        elif llm_recommendation == "mark_invalid_keep_url":
+            result["recommendation"] = ValidationRecommendation.RETRY_VALIDATION.value
+        else:
+            result["recommendation"] = llm_recommendation  # Use as-is if already new format
+        
+        # Extract invalid reason from LLM signals
+        if result["verdict"] != "valid":
+            match_signals = llm_result.get("match_signals", {})
+            if match_signals.get("is_directory"):
+                result["invalid_reason"] = InvalidURLReason.DIRECTORY.value
+            elif match_signals.get("is_aggregator"):
+                result["invalid_reason"] = InvalidURLReason.AGGREGATOR.value
+            elif not match_signals.get("name_match"):
+                result["invalid_reason"] = InvalidURLReason.WRONG_BUSINESS.value
+            elif not match_signals.get("phone_match") and not match_signals.get("address_match"):
+                result["invalid_reason"] = InvalidURLReason.NO_CONTACT.value
+            else:
+                result["invalid_reason"] = categorize_url_domain(url)
+
+        # ----------------------------------------------------------------
+        # DISCOVERY PHONE-MATCH RESCUE
+        # When ScrapingDog already confirmed a phone match in search snippets
+        # (meaning the snippet contained the exact business phone), but the
+        # LLM validator says "no_contact" because the phone is JavaScript-
+        # rendered on the actual page, override the recommendation to
+        # TRIGGER_SCRAPINGDOG → RETRY_VALIDATION so we don't clear the URL.
+        # The business will get routed to human review via quality-score check.
+        # ----------------------------------------------------------------
+        if (
+            result.get("invalid_reason") == InvalidURLReason.NO_CONTACT.value
+            and result.get("recommendation") == ValidationRecommendation.TRIGGER_SCRAPINGDOG.value
+            and business.get("discovery_phone_match", False)
+        ):
+            logger.info(
+                f"📞 Discovery phone-match rescue: discovery confirmed phone match "
+                f"via snippet for {url}, but Playwright couldn't extract it "
+                f"(likely JS-rendered). Keeping URL — routing to human review."
+            )
+            result["recommendation"] = ValidationRecommendation.RETRY_VALIDATION.value
+            result["invalid_reason"] = InvalidURLReason.NO_CONTACT.value
+            result["discovery_phone_match_rescue"] = True
+        
+        # Set is_valid based on verdict
+        result["is_valid"] = (llm_result["verdict"] == "valid")
+        result["decided_by"] = "llm"
+        
+        logger.info(
+            f"[Stage 3] Complete - Verdict: {result['verdict']} "
+            f"(confidence={result['confidence']:.2f})"
+        )
+    
     def _prepare_website_data_for_llm(
         self,
         url: str,
@@ -443,7 +573,9 @@ class ValidationOrchestrator:
     async def __aenter__(self):
         """Context manager entry - initialize Playwright if needed."""
         if self.playwright_service is None:
-            self.playwright_service = PlaywrightValidationService()
+            self.playwright_service = PlaywrightValidationService(
+                pool=self.browser_pool, navigation_profile=self.navigation_profile
+            )
             await self.playwright_service.__aenter__()
         return self
     
@@ -0,0 +1,417 @@
+"""
+Claim-based work queues on Postgres.
+
+Beat dispatchers used to select "the first N ready rows" on every tick and
+hand them to Celery. Nothing marked a row as taken, so overlapping ticks or
+a manual trigger could dispatch the same row twice, and throughput was
+capped at N per tick no matter how many workers were idle.
+
+A queue here is a predicate over an existing table (e.g. businesses with
+website_status='queued'). Claiming:
+
+1. SELECT ready ids without an active lease, FOR UPDATE SKIP LOCKED, so
+   concurrent claimers split the rows instead of blocking on each other
+2. Upsert a work_leases row per id, only where no unexpired lease exists;
+   RETURNING gives the ids this claimer actually owns
+3. Commit, which releases the row locks - the lease is what keeps the item
+   taken from then on
+
+The dispatcher hands each claimed lease to the Celery task id it enqueues
+the item under, and leases only change hands when they are held by the
+same owner or have expired. A worker therefore picks up the lease its
+dispatcher took (also across Celery retries, which keep the task id), and
+any other run of the same item - a re-dispatch after the lease expired in
+the queue, a manual trigger - is refused while that lease is live.
+
+Workers hold the lease with heartbeats while they run and release it when
+done. A worker that dies stops heartbeating; its lease expires and the item
+becomes claimable again.
+
+The dispatcher keeps each Celery queue saturated: it claims
+(worker slots × WORK_QUEUE_PREFETCH_FACTOR) − items in flight, where worker
+slots come from celery inspect (cached in Redis).
+"""
+import asyncio
+import logging
+import os
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, List, Optional, Sequence, Union
+from uuid import UUID, uuid4
+
+from sqlalchemy import delete, exists, func, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.config import get_settings
+from core.database import CeleryAsyncSessionLocal
+from models.work_lease import WorkLease
+from services.progress.redis_service import RedisService
+
+logger = logging.getLogger(__name__)
+
+CAPACITY_KEY_PREFIX = "workqueue:capacity:"
+
+ItemId = Union[UUID, str]
+
+
+@dataclass
+class QueueSpec:
+    """
+    Definition of one work queue.
+
+    ``ready`` returns the WHERE clauses for rows that need work, given the
+    current time (naive UTC); ``model`` must have a UUID ``id`` column.
+    """
+
+    name: str
+    model: Any
+    ready: Callable[[datetime], Sequence[Any]]
+    order_by: Callable[[], Sequence[Any]] = lambda: ()
+    celery_queue: str = "celery"
+    lease_seconds: int = 600
+    dispatch_lease_seconds: int = 0  # Lease while a dispatched item waits in the Celery queue; 0 = lease_seconds
+    hold_on_error_seconds: int = 0  # Keep a failed item leased this long (Celery retry pending); 0 = lease_seconds
+    max_in_flight: int = 0  # Hard cap on leased items; 0 = capacity-driven only
+
+
+def _as_uuid(item_id: ItemId) -> UUID:
+    return item_id if isinstance(item_id, UUID) else UUID(str(item_id))
+
+
+class WorkQueue:
+    """
+    Postgres-backed claim queue with lease expiry and heartbeats.
+
+    Usage (dispatcher):
+        capacity = worker_capacity("generation")
+        await GENERATION_QUEUE.dispatch(task_sender(task), capacity, owner=...)
+
+    Usage (worker):
+        async with GENERATION_QUEUE.lease(business_id, owner=self.request.id) as leased:
+            if not leased:
+                return  # Another run holds the item
+            ...  # do the work
+    """
+
+    def __init__(self, spec: QueueSpec):
+        self.spec = spec
+
+    # ── Claiming ────────────────────────────────────────────────
+
+    async def claim(
+        self,
+        db: AsyncSession,
+        limit: int,
+        owner: str,
+        lease_seconds: Optional[int] = None
+    ) -> List[UUID]:
+        """
+        Lease up to ``limit`` ready items. Commits the session.
+
+        Returns:
+            Ids now leased to ``owner`` (never leased to anyone else)
+        """
+        if limit <= 0:
+            return []
+        spec = self.spec
+        model = spec.model
+        now = datetime.utcnow()
+
+        leased = exists().where(
+            WorkLease.queue == spec.name,
+            WorkLease.item_id == model.id,
+            WorkLease.leased_until > now,
+        )
+        candidates = (
+            await db.execute(
+                select(model.id)
+                .where(*spec.ready(now), ~leased)
+                .order_by(*spec.order_by())
+                .limit(limit)
+                .with_for_update(of=model, skip_locked=True)
+            )
+        ).scalars().all()
+        if not candidates:
+            await db.rollback()
+            return []
+
+        leased_until = now + timedelta(seconds=lease_seconds or spec.lease_seconds)
+        stmt = pg_insert(WorkLease).values([
+            {
+                "queue": spec.name,
+                "item_id": item_id,
+                "owner": owner,
+                "leased_until": leased_until,
+                "claimed_at": now,
+                "attempts": 1,
+            }
+            for item_id in candidates
+        ])
+        # A claimer whose snapshot predates another's commit can still lock a
+        # row that was just leased; the conditional upsert is the arbiter
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[WorkLease.queue, WorkLease.item_id],
+            set_={
+                "owner": stmt.excluded.owner,
+                "leased_until": stmt.excluded.leased_until,
+                "claimed_at": stmt.excluded.claimed_at,
+                "heartbeat_at": None,
+                "attempts": WorkLease.attempts + 1,
+            },
+            where=WorkLease.leased_until <= now,
+        ).returning(WorkLease.item_id)
+        claimed = list((await db.execute(stmt)).scalars().all())
+        await db.commit()
+
+        if claimed:
+            logger.debug(f"🔒 [{spec.name}] {owner} claimed {len(claimed)} item(s)")
+        return claimed
+
+    async def acquire(
+        self,
+        db: AsyncSession,
+        item_id: ItemId,
+        owner: str,
+        seconds: Optional[int] = None
+    ) -> bool:
+        """
+        Take or extend the lease on one item. Commits the session.
+
+        Returns:
+            False if another owner holds an unexpired lease (nothing changed)
+        """
+        now = datetime.utcnow()
+        leased_until = now + timedelta(seconds=seconds or self.spec.lease_seconds)
+        stmt = pg_insert(WorkLease).values(
+            queue=self.spec.name,
+            item_id=_as_uuid(item_id),
+            owner=owner,
+            leased_until=leased_until,
+            claimed_at=now,
+            heartbeat_at=now,
+            attempts=1,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[WorkLease.queue, WorkLease.item_id],
+            set_={"owner": owner, "leased_until": leased_until, "heartbeat_at": now},
+            where=(WorkLease.owner == owner) | (WorkLease.leased_until <= now),
+        ).returning(WorkLease.item_id)
+        acquired = (await db.execute(stmt)).first() is not None
+        await db.commit()
+        return acquired
+
+    async def release(
+        self,
+        db: AsyncSession,
+        item_ids: Iterable[ItemId],
+        owner: Optional[str] = None
+    ) -> None:
+        """
+        Drop leases so the items can be claimed again. Commits the session.
+
+        With ``owner``, only leases still held by that owner are dropped.
+        """
+        ids = [_as_uuid(item_id) for item_id in item_ids]
+        if not ids:
+            return
+        stmt = delete(WorkLease).where(WorkLease.queue == self.spec.name, WorkLease.item_id.in_(ids))
+        if owner is not None:
+            stmt = stmt.where(WorkLease.owner == owner)
+        await db.execute(stmt)
+        await db.commit()
+
+    async def transfer(self, db: AsyncSession, owners: Dict[UUID, str]) -> None:
+        """Hand leases to new owners (item id -> owner). Commits the session."""
+        if not owners:
+            return
+        await db.execute(
+            update(WorkLease),
+            [
+                {"queue": self.spec.name, "item_id": item_id, "owner": owner}
+                for item_id, owner in owners.items()
+            ],
+        )
+        await db.commit()
+
+    async def in_flight(self, db: AsyncSession) -> int:
+        """Number of items currently leased."""
+        result = await db.execute(
+            select(func.count()).select_from(WorkLease).where(
+                WorkLease.queue == self.spec.name,
+                WorkLease.leased_until > datetime.utcnow(),
+            )
+        )
+        return int(result.scalar() or 0)
+
+    # ── Workers ─────────────────────────────────────────────────
+
+    @asynccontextmanager
+    async def lease(self, item_id: ItemId, owner: Optional[str] = None) -> AsyncIterator[bool]:
+        """
+        Hold the lease on ``item_id`` for the duration of the block.
+
+        Yields False, holding nothing, when another owner has a live lease on
+        the item - the caller must skip the work. Otherwise yields True and
+        heartbeats every lease_seconds / 3. On success the lease is released;
+        on error it is extended by hold_on_error_seconds so a pending Celery
+        retry is not raced by the dispatcher. Lease bookkeeping failures are
+        logged and never fail the work itself.
+        """
+        owner = owner or f"pid:{os.getpid()}"
+        if not await self._safely("acquire", self.acquire, item_id, owner, default=True):
+            logger.info(f"⏭️ [{self.spec.name}] {item_id} is leased by another worker, skipping")
+            yield False
+            return
+
+        stop = asyncio.Event()
+        beat = asyncio.create_task(self._heartbeat_loop(item_id, owner, stop))
+        try:
+            yield True
+        except BaseException:
+            stop.set()
+            await beat
+            await self._safely(
+                "hold", self.acquire, item_id, owner,
+                self.spec.hold_on_error_seconds or self.spec.lease_seconds,
+            )
+            raise
+        stop.set()
+        await beat
+        await self._safely("release", self.release, [item_id], owner)
+
+    async def _heartbeat_loop(self, item_id: ItemId, owner: str, stop: asyncio.Event) -> None:
+        interval = max(1.0, self.spec.lease_seconds / 3)
+        while True:
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=interval)
+                return
+            except asyncio.TimeoutError:
+                if not await self._safely("heartbeat", self.acquire, item_id, owner, default=True):
+                    logger.warning(f"⚠️ [{self.spec.name}] Lost the lease on {item_id} to another worker")
+                    return
+
+    async def _safely(
+        self,
+        action: str,
+        method: Callable[..., Any],
+        *args: Any,
+        default: Any = None
+    ) -> Any:
+        try:
+            async with CeleryAsyncSessionLocal() as db:
+                return await method(db, *args)
+        except Exception as e:
+            logger.warning(f"⚠️ [{self.spec.name}] Lease {action} failed: {e}")
+            return default
+
+    # ── Dispatching ─────────────────────────────────────────────
+
+    async def dispatch(
+        self,
+        send: Callable[[str, str], Any],
+        capacity: int,
+        owner: str
+    ) -> Dict[str, int]:
+        """
+        Top the Celery queue up to capacity × prefetch factor.
+
+        Each claimed lease is handed to a fresh Celery task id before the
+        item is enqueued under it, so only that task can run the item while
+        the lease is live (dispatch_lease_seconds covers the queue wait).
+
+        Args:
+            send: Enqueues one item under a task id, e.g. ``task_sender(task)``
+            capacity: Worker slots consuming spec.celery_queue
+            owner: Recorded on the leases (e.g. the beat task id)
+
+        Returns:
+            {"capacity", "in_flight", "claimed", "dispatched"}
+        """
+        target = capacity * max(1, get_settings().WORK_QUEUE_PREFETCH_FACTOR)
+        if self.spec.max_in_flight:
+            target = min(target, self.spec.max_in_flight)
+
+        async with CeleryAsyncSessionLocal() as db:
+            in_flight = await self.in_flight(db)
+            claimed = await self.claim(
+                db, target - in_flight, owner, self.spec.dispatch_lease_seconds or None
+            )
+            task_ids = {item_id: str(uuid4()) for item_id in claimed}
+            await self.transfer(db, task_ids)
+
+            dispatched = 0
+            try:
+                for item_id in claimed:
+                    send(str(item_id), task_ids[item_id])
+                    dispatched += 1
+            finally:
+                if dispatched < len(claimed):
+                    await self.release(db, claimed[dispatched:])
+
+        stats = {
+            "capacity": capacity,
+            "in_flight": in_flight,
+            "claimed": len(claimed),
+            "dispatched": dispatched,
+        }
+        if dispatched:
+            logger.info(f"📤 [{self.spec.name}] Dispatched {dispatched} item(s) ({stats})")
+        return stats
+
+
+def task_sender(task: Any, **kwargs: Any) -> Callable[[str, str], Any]:
+    """dispatch() sender that runs ``task(item_id, **kwargs)`` under the lease's task id."""
+    def send(item_id: str, task_id: str) -> Any:
+        return task.apply_async(args=[item_id], kwargs=kwargs or None, task_id=task_id)
+    return send
+
+
+def worker_capacity(celery_queue: str) -> int:
+    """
+    Worker slots (pool concurrency) consuming a Celery queue.
+
+    Blocking (celery inspect broadcast) - call from sync task code before
+    entering the event loop. Cached in Redis for
+    WORK_QUEUE_CAPACITY_CACHE_SECONDS; WORK_QUEUE_DEFAULT_CAPACITY when no
+    worker replies.
+    """
+    settings = get_settings()
+    key = CAPACITY_KEY_PREFIX + celery_queue
+    redis = RedisService.get_client()
+    try:
+        cached = redis.get(key)
+        if cached is not None:
+            return int(cached)
+    except Exception as e:
+        logger.debug(f"Worker capacity cache unavailable: {e}")
+
+    capacity = _inspect_capacity(celery_queue)
+    if capacity is None:
+        return settings.WORK_QUEUE_DEFAULT_CAPACITY
+
+    try:
+        redis.set(key, capacity, ex=settings.WORK_QUEUE_CAPACITY_CACHE_SECONDS)
+    except Exception as e:
+        logger.debug(f"Worker capacity cache write skipped: {e}")
+    return capacity
+
+
+def _inspect_capacity(celery_queue: str) -> Optional[int]:
+    from celery_app import celery_app
+
+    try:
+        inspector = celery_app.control.inspect(timeout=1.0)
+        active_queues = inspector.active_queues() or {}
+        stats = inspector.stats() or {}
+    except Exception as e:
+        logger.warning(f"⚠️ Celery inspect failed, using default capacity: {e}")
+        return None
+
+    total = 0
+    for worker, queues in active_queues.items():
+        if any(queue.get("name") == celery_queue for queue in queues or []):
+            pool = (stats.get(worker) or {}).get("pool") or {}
+            total += int(pool.get("max-concurrency") or 1)
+    return total or None
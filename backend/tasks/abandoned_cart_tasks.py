@@ -21,6 +21,7 @@ from sqlalchemy import select, and_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.database import get_async_session
+from core.worker_loop import run_async
 from core.config import get_settings
 from models.checkout_session import CheckoutSession
 from services.emails.email_service import get_email_service
@@ -80,12 +81,8 @@ def check_abandoned_carts():
     
     Then sends recovery emails with 10% discount codes.
     """
-    import asyncio
-    
     try:
-        # Run async function in sync context
-        loop = asyncio.get_event_loop()
-        result = loop.run_until_complete(_process_abandoned_carts())
+        result = run_async(_process_abandoned_carts())
         
         logger.info(
             f"Abandoned cart check completed: {result['processed']} sessions found, "
@@ -184,11 +181,8 @@ def cleanup_old_abandoned_carts():
     Runs daily. Marks sessions abandoned for 30+ days as 'expired'
     to keep the abandoned cart query performant.
     """
-    import asyncio
-    
     try:
-        loop = asyncio.get_event_loop()
-        result = loop.run_until_complete(_cleanup_expired_sessions())
+        result = run_async(_cleanup_expired_sessions())
         
         logger.info(f"Cleaned up {result['cleaned']} expired abandoned cart sessions")
         return result
@@ -16,7 +16,6 @@ Designed to be non-blocking relative to the scrape itself: the scrape
 queues these tasks and moves on; they process independently at a rate
 that respects ScrapingDog's credit budget.
 """
-import asyncio
 import logging
 from datetime import datetime
 from typing import Any, Dict, List, Optional
@@ -25,6 +24,7 @@ from celery import shared_task
 from sqlalchemy import select
 
 from core.database import CeleryAsyncSessionLocal
+from core.worker_loop import run_async
 from models.business import Business
 from services.activity.analyzer import is_business_closed
 from services.activity.facebook_scraper import (
@@ -68,7 +68,7 @@ def fetch_facebook_activity(self, business_id: str) -> Dict[str, Any]:
     Returns:
         Dict with ``status``, ``business_id``, and ``enriched`` field list.
     """
-    return asyncio.run(_fetch_facebook_activity_async(business_id))
+    return run_async(_fetch_facebook_activity_async(business_id))
 
 
 async def _fetch_facebook_activity_async(business_id: str) -> Dict[str, Any]:
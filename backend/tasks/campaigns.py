@@ -2,39 +2,85 @@
 Automated campaign sending tasks.
 Handles email generation and sending for completed sites.
 """
-from celery import Task
 from celery_app import celery_app
-from sqlalchemy import select, update
+from sqlalchemy import exists, select, update
 from datetime import datetime
+from typing import Optional
+import asyncio
 import logging
 
 from core.database import get_db_session
+from core.worker_loop import run_async
 from models.campaign import Campaign
 from models.site import GeneratedSite
 from models.business import Business
 from services.pitcher.campaign_service import CampaignService
 from services.pitcher.email_generator import EmailGenerator
 from services.pitcher.email_sender import EmailSender
+from services.work_queue import QueueSpec, WorkQueue, task_sender, worker_capacity
 
 logger = logging.getLogger(__name__)
 
 
+# Email campaigns that are due. SMS campaigns are sent by
+# tasks.sms_sync.process_scheduled_sms_campaigns, never by send_campaign.
+CAMPAIGN_SEND_QUEUE = WorkQueue(QueueSpec(
+    name="campaign_send",
+    model=Campaign,
+    ready=lambda now: (
+        Campaign.channel == "email",
+        Campaign.status.in_(["draft", "scheduled"]),
+        (Campaign.scheduled_for == None) | (Campaign.scheduled_for <= now),
+    ),
+    order_by=lambda: (Campaign.created_at.asc(),),
+    celery_queue="campaigns",
+    lease_seconds=300,
+    dispatch_lease_seconds=900,
+    hold_on_error_seconds=900,  # send_campaign retries after 5 minutes
+))
+
+# Published sites that don't have a campaign yet
+CAMPAIGN_CREATE_QUEUE = WorkQueue(QueueSpec(
+    name="campaign_create",
+    model=GeneratedSite,
+    ready=lambda now: (
+        GeneratedSite.status == "published",
+        ~exists().where(Campaign.site_id == GeneratedSite.id),
+    ),
+    order_by=lambda: (GeneratedSite.created_at.asc(),),
+    celery_queue="campaigns",
+    lease_seconds=300,
+    dispatch_lease_seconds=900,
+))
+
+
 @celery_app.task(
     bind=True,
     max_retries=3,
     default_retry_delay=300  # 5 minutes
 )
-async def send_campaign(self, campaign_id: str):
+def send_campaign(self, campaign_id: str):
     """
     Send a specific campaign email.
     
     Args:
         campaign_id: Campaign UUID
     """
+    try:
+        return run_async(send_campaign_async(campaign_id, owner=self.request.id))
+    except Exception as e:
+        raise self.retry(exc=e)
+
+
+async def send_campaign_async(campaign_id: str, owner: Optional[str] = None):
+    """Async implementation of send_campaign."""
     logger.info(f"Sending campaign: {campaign_id}")
     
     try:
-        async with get_db_session() as db:
+        async with CAMPAIGN_SEND_QUEUE.lease(campaign_id, owner=owner) as leased, get_db_session() as db:
+            if not leased:
+                return {"status": "skipped", "message": "Campaign is being sent by another worker"}
+            
             # Get campaign
             result = await db.execute(
                 select(Campaign).where(Campaign.id == campaign_id)
@@ -103,22 +149,30 @@ async def send_campaign(self, campaign_id: str):
             )
             await db.commit()
         
-        # Retry
-        raise self.retry(exc=e)
+        # Retried by the task wrapper
+        raise
 
 
 @celery_app.task(bind=True)
-async def create_campaign_for_site(self, site_id: str):
+def create_campaign_for_site(self, site_id: str):
     """
     Create and send a campaign for a published site.
     
     Args:
         site_id: Site UUID
     """
+    return run_async(create_campaign_for_site_async(site_id, owner=self.request.id))
+
+
+async def create_campaign_for_site_async(site_id: str, owner: Optional[str] = None):
+    """Async implementation of create_campaign_for_site."""
     logger.info(f"Creating campaign for site: {site_id}")
     
     try:
-        async with get_db_session() as db:
+        async with CAMPAIGN_CREATE_QUEUE.lease(site_id, owner=owner) as leased, get_db_session() as db:
+            if not leased:
+                return {"status": "skipped", "message": "Campaign is being created by another worker"}
+            
             # Get site and business
             site_result = await db.execute(
                 select(GeneratedSite).where(GeneratedSite.id == site_id)
@@ -183,11 +237,16 @@ async def create_campaign_for_site(self, site_id: str):
 
 
 @celery_app.task(bind=True)
-async def send_pending_campaigns(self):
+def send_pending_campaigns(self):
     """
     Send all pending/scheduled campaigns.
     Scheduled task that runs periodically.
     """
+    return run_async(send_pending_campaigns_async(owner=self.request.id))
+
+
+async def send_pending_campaigns_async(owner: Optional[str] = None):
+    """Async implementation of send_pending_campaigns."""
     from utils.autopilot_guard import check_autopilot_async
     guard = await check_autopilot_async("send_pending_campaigns")
     if guard:
@@ -196,36 +255,21 @@ async def send_pending_campaigns(self):
     logger.info("Starting send_pending_campaigns task")
     
     try:
-        async with get_db_session() as db:
-            # Find pending/scheduled campaigns that are due now
-            # "scheduled" campaigns only fire when scheduled_for <= now (UTC)
-            # "draft" campaigns (no scheduled_for) can fire immediately
-            now = datetime.utcnow()
-            result = await db.execute(
-                select(Campaign)
-                .where(
-                    Campaign.status.in_(["draft", "scheduled"]),
-                    (Campaign.scheduled_for == None) | (Campaign.scheduled_for <= now),
-                )
-                .limit(20)  # Send up to 20 per run to avoid rate limits
-            )
-            campaigns = result.scalars().all()
-            
-            if not campaigns:
-                logger.info("No pending campaigns to send")
-                return {"status": "completed", "campaigns_queued": 0}
-            
-            # Queue sending tasks
-            campaigns_queued = 0
-            for campaign in campaigns:
-                send_campaign.delay(str(campaign.id))
-                campaigns_queued += 1
-            
-            logger.info(f"Queued {campaigns_queued} campaign sending tasks")
-            return {
-                "status": "completed",
-                "campaigns_queued": campaigns_queued
-            }
+        # Claim due campaigns up to what the campaign workers can take
+        # ("scheduled" only once scheduled_for <= now, drafts immediately)
+        capacity = await asyncio.to_thread(worker_capacity, CAMPAIGN_SEND_QUEUE.spec.celery_queue)
+        stats = await CAMPAIGN_SEND_QUEUE.dispatch(
+            task_sender(send_campaign), capacity, owner=owner or "send_pending_campaigns"
+        )
+        
+        if not stats["dispatched"]:
+            logger.info("No pending campaigns to send")
+        else:
+            logger.info(f"Queued {stats['dispatched']} campaign sending tasks")
+        return {
+            "status": "completed",
+            "campaigns_queued": stats["dispatched"]
+        }
             
     except Exception as e:
         logger.error(f"Error in send_pending_campaigns: {str(e)}", exc_info=True)
@@ -233,10 +277,15 @@ async def send_pending_campaigns(self):
 
 
 @celery_app.task(bind=True)
-async def create_campaigns_for_new_sites(self):
+def create_campaigns_for_new_sites(self):
     """
     Create campaigns for newly published sites.
     """
+    return run_async(create_campaigns_for_new_sites_async(owner=self.request.id))
+
+
+async def create_campaigns_for_new_sites_async(owner: Optional[str] = None):
+    """Async implementation of create_campaigns_for_new_sites."""
     from utils.autopilot_guard import check_autopilot_async
     guard = await check_autopilot_async("create_campaigns_for_new_sites")
     if guard:
@@ -245,32 +294,20 @@ async def create_campaigns_for_new_sites(self):
     logger.info("Starting create_campaigns_for_new_sites task")
     
     try:
-        async with get_db_session() as db:
-            # Find published sites without campaigns
-            result = await db.execute(
-                select(GeneratedSite)
-                .where(GeneratedSite.status == "published")
-                .outerjoin(Campaign, GeneratedSite.id == Campaign.site_id)
-                .where(Campaign.id == None)
-                .limit(10)  # Create up to 10 campaigns per run
-            )
-            sites = result.scalars().all()
-            
-            if not sites:
-                logger.info("No new sites needing campaigns")
-                return {"status": "completed", "campaigns_created": 0}
-            
-            # Queue campaign creation
-            campaigns_created = 0
-            for site in sites:
-                create_campaign_for_site.delay(str(site.id))
-                campaigns_created += 1
-            
-            logger.info(f"Queued {campaigns_created} campaign creation tasks")
-            return {
-                "status": "completed",
-                "campaigns_created": campaigns_created
-            }
+        # Claim published sites without campaigns up to worker capacity
+        capacity = await asyncio.to_thread(worker_capacity, CAMPAIGN_CREATE_QUEUE.spec.celery_queue)
+        stats = await CAMPAIGN_CREATE_QUEUE.dispatch(
+            task_sender(create_campaign_for_site), capacity, owner=owner or "create_campaigns_for_new_sites"
+        )
+        
+        if not stats["dispatched"]:
+            logger.info("No new sites needing campaigns")
+        else:
+            logger.info(f"Queued {stats['dispatched']} campaign creation tasks")
+        return {
+            "status": "completed",
+            "campaigns_created": stats["dispatched"]
+        }
             
     except Exception as e:
         logger.error(f"Error in create_campaigns_for_new_sites: {str(e)}", exc_info=True)
@@ -278,10 +315,15 @@ async def create_campaigns_for_new_sites(self):
 
 
 @celery_app.task(bind=True)
-async def retry_failed_campaigns(self):
+def retry_failed_campaigns(self):
     """
     Retry failed campaign sends.
     """
+    return run_async(retry_failed_campaigns_async())
+
+
+async def retry_failed_campaigns_async():
+    """Async implementation of retry_failed_campaigns."""
     logger.info("Starting retry_failed_campaigns task")
     
     try:
@@ -8,13 +8,13 @@ Handles ScrapingDog-based website discovery with:
 
 Follows best practices: Clear Error Handling, Idempotent Operations, Comprehensive Logging.
 """
-import asyncio
 import logging
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 from celery import shared_task
 
 from core.database import get_db_session_sync
+from core.worker_loop import run_async, on_worker_shutdown
 from models.business import Business
 from services.validation.validation_metadata_service import ValidationMetadataService
 from core.validation_enums import (
@@ -23,9 +23,18 @@ from core.validation_enums import (
     ValidationConfig
 )
 from services.activity.analyzer import is_business_closed
+from services.discovery.discovery_engine import close_discovery_engine
+from services.progress.redis_service import RedisService
 
 logger = logging.getLogger(__name__)
 
+# Businesses waiting for ScrapingDog discovery; drained into batch tasks by
+# dispatch_pending_discoveries
+PENDING_DISCOVERY_KEY = "discovery:pending"
+
+# Pooled ScrapingDog session lives on the worker loop; close it with the worker
+on_worker_shutdown(close_discovery_engine)
+
 # Countries we support for SMS outreach. Businesses confirmed outside these
 # countries are marked as geo_mismatch and excluded from generation.
 _SUPPORTED_COUNTRIES = {"US"}
@@ -251,6 +260,198 @@ def discover_missing_websites_v2(self, business_id: str) -> Dict[str, Any]:
             return _handle_discovery_error(business_id, e)
 
 
+@shared_task(
+    name="tasks.discovery.discover_missing_websites_batch",
+    bind=True,
+    max_retries=2,
+    default_retry_delay=60,
+    time_limit=900,
+    soft_time_limit=840
+)
+def discover_missing_websites_batch(
+    self,
+    business_ids: List[str],
+    llm_group_size: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Discover websites for many businesses in one task.
+    
+    Plain cases (no URL, no Outscraper URL to recover, open, never searched)
+    are searched concurrently through LLMDiscoveryService.discover_websites_batch
+    and analyzed ``llm_group_size`` per LLM call. Everything else is handed to
+    discover_missing_websites_v2, which owns the skip / raw_data logic.
+    
+    Args:
+        business_ids: Business UUIDs
+        llm_group_size: Businesses per LLM prompt (defaults to DISCOVERY_LLM_GROUP_SIZE)
+        
+    Returns:
+        {"searched", "found", "not_found", "delegated", "errors"}
+    """
+    from core.config import get_settings
+    from services.discovery.llm_discovery_service import LLMDiscoveryService
+    
+    group_size = llm_group_size or get_settings().DISCOVERY_LLM_GROUP_SIZE
+    summary = {"searched": 0, "found": 0, "not_found": 0, "delegated": 0, "errors": 0}
+    
+    with get_db_session_sync() as db:
+        businesses = db.query(Business).filter(Business.id.in_(business_ids)).all()
+        
+        eligible: List[Business] = []
+        for business in businesses:
+            if _is_plain_discovery_case(business):
+                eligible.append(business)
+            else:
+                discover_missing_websites_v2.delay(str(business.id))
+                summary["delegated"] += 1
+        
+        if not eligible:
+            return summary
+        
+        previous_status = {b.id: b.website_validation_status for b in eligible}
+        for business in eligible:
+            business.website_validation_status = ValidationState.DISCOVERY_IN_PROGRESS.value
+        db.commit()
+        
+        logger.info(f"Batch ScrapingDog discovery for {len(eligible)} businesses (LLM group size {group_size})")
+        try:
+            results = run_async(LLMDiscoveryService().discover_websites_batch(
+                [_discovery_input(b) for b in eligible],
+                llm_group_size=group_size
+            ))
+        except Exception as e:
+            logger.error(f"Batch discovery failed for {len(eligible)} businesses: {e}", exc_info=True)
+            # Not left "in progress", which validation would skip forever
+            db.rollback()
+            for business in eligible:
+                business.website_validation_status = previous_status[business.id]
+            db.commit()
+            try:
+                raise self.retry(exc=e)
+            except self.MaxRetriesExceededError:
+                for business in eligible:
+                    _handle_discovery_error(str(business.id), e)
+                summary["errors"] += len(eligible)
+                return summary
+        summary["searched"] = len(eligible)
+        
+        metadata_service = ValidationMetadataService()
+        for business, discovery_result in zip(eligible, results):
+            summary[_apply_discovery_result(db, business, discovery_result, metadata_service)] += 1
+    
+    logger.info(f"Batch discovery complete: {summary}")
+    return summary
+
+
+def queue_discovery(business_id: str) -> None:
+    """
+    Queue ScrapingDog discovery for a business.
+    
+    The business joins the next discover_missing_websites_batch run (within a
+    minute, see dispatch_pending_discoveries) so its search and LLM analysis
+    are shared with others. Without Redis it gets its own task right away.
+    """
+    redis = RedisService.get_client()
+    if RedisService.is_available():
+        try:
+            redis.sadd(PENDING_DISCOVERY_KEY, str(business_id))
+            return
+        except Exception as e:
+            logger.warning(f"Discovery buffer unavailable, dispatching {business_id} directly: {e}")
+    discover_missing_websites_v2.delay(str(business_id))
+
+
+@shared_task(
+    name="tasks.discovery.dispatch_pending_discoveries",
+    bind=True,
+    max_retries=0,
+    soft_time_limit=50,
+    time_limit=60
+)
+def dispatch_pending_discoveries(self) -> Dict[str, Any]:
+    """
+    Hand businesses queued by queue_discovery() to batch discovery tasks.
+    
+    Returns:
+        {"queued": businesses dispatched, "batches": tasks sent}
+    """
+    from core.config import get_settings
+    
+    settings = get_settings()
+    redis = RedisService.get_client()
+    if not RedisService.is_available():
+        return {"queued": 0, "batches": 0}
+    
+    business_ids = redis.spop(PENDING_DISCOVERY_KEY, settings.DISCOVERY_DISPATCH_LIMIT) or []
+    batch_size = max(1, settings.DISCOVERY_BATCH_SIZE)
+    batches = 0
+    for start in range(0, len(business_ids), batch_size):
+        chunk = business_ids[start:start + batch_size]
+        try:
+            discover_missing_websites_batch.delay(chunk)
+        except Exception:
+            # Broker down - keep the rest for the next run
+            redis.sadd(PENDING_DISCOVERY_KEY, *business_ids[start:])
+            raise
+        batches += 1
+    
+    if business_ids:
+        logger.info(f"Dispatched {len(business_ids)} pending discoveries in {batches} batch task(s)")
+    return {"queued": len(business_ids), "batches": batches}
+
+
+def _is_plain_discovery_case(business: Business) -> bool:
+    """
+    True if a search is all discover_missing_websites_v2 would do for this
+    business (no URL, no Outscraper URL to recover, open, never searched).
+    """
+    return not (
+        business.website_url
+        or _extract_website_from_raw_data(business.raw_data)
+        or is_business_closed(business)
+        or business.has_attempted_scrapingdog()
+    )
+
+
+def _discovery_input(business: Business) -> Dict[str, Any]:
+    """Business dict passed to LLMDiscoveryService batch methods."""
+    return {
+        "name": business.name,
+        "phone": business.phone,
+        "address": business.address,
+        "city": business.city,
+        "state": business.state,
+        "country": business.country or "US",
+    }
+
+
+def _apply_discovery_result(
+    db,
+    business: Business,
+    discovery_result: Dict[str, Any],
+    metadata_service: ValidationMetadataService
+) -> str:
+    """
+    Record a discovery result on the business (batch runs).
+    
+    Returns:
+        "found", "not_found" or "errors" (failures are recorded on the business)
+    """
+    try:
+        if not business.website_metadata:
+            business.website_metadata = metadata_service.create_initial_metadata()
+        if discovery_result.get("url"):
+            _handle_url_found(db, business, discovery_result["url"], discovery_result, metadata_service)
+            return "found"
+        _handle_no_url_found(db, business, discovery_result, metadata_service)
+        return "not_found"
+    except Exception as e:
+        logger.error(f"Batch discovery handling failed for {business.id}: {e}", exc_info=True)
+        db.rollback()
+        _handle_discovery_error(str(business.id), e)
+        return "errors"
+
+
 _RAW_DATA_WEBSITE_FIELDS = ["website", "site", "url", "domain", "website_url", "business_url", "web", "homepage"]
 _SOCIAL_MEDIA_DOMAINS = {
     "facebook.com", "instagram.com", "twitter.com", "x.com", "linkedin.com",
@@ -305,12 +506,8 @@ def _run_scrapingdog_search(business: Business) -> Dict[str, Any]:
     
     discovery_service = LLMDiscoveryService()
     
-    # Proper async event loop management
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    
     try:
-        result = loop.run_until_complete(discovery_service.discover_website(
+        result = run_async(discovery_service.discover_website(
             business_name=business.name,
             phone=business.phone,
             address=business.address,
@@ -327,8 +524,6 @@ def _run_scrapingdog_search(business: Business) -> Dict[str, Any]:
     except Exception as e:
         logger.error(f"ScrapingDog search failed: {e}")
         raise
-    finally:
-        loop.close()
 
 
 def _handle_url_found(
@@ -14,6 +14,7 @@ from datetime import datetime
 
 from celery_app import celery_app
 from core.database import AsyncSession, get_async_db
+from core.worker_loop import run_async
 from services.edit_service import get_edit_service, EditRequestStatus
 from services.creative.agents.editor import get_editor_agent
 from services.site_service import get_site_service
@@ -47,11 +48,9 @@ def process_edit_request_task(self, edit_request_id: str):
     Args:
         edit_request_id: UUID of the edit request
     """
-    import asyncio
-    
     try:
         # Run async processing
-        asyncio.run(process_edit_request_async(
+        run_async(process_edit_request_async(
             edit_request_id=UUID(edit_request_id)
         ))
         
@@ -65,7 +64,7 @@ def process_edit_request_task(self, edit_request_id: str):
         
         # Update status to failed
         try:
-            asyncio.run(mark_request_failed(
+            run_async(mark_request_failed(
                 edit_request_id=UUID(edit_request_id),
                 error_message=str(e)
             ))
@@ -312,10 +311,8 @@ def deploy_approved_edit_task(self, edit_request_id: str):
     Args:
         edit_request_id: UUID of the approved edit request
     """
-    import asyncio
-    
     try:
-        asyncio.run(deploy_approved_edit_async(
+        run_async(deploy_approved_edit_async(
             edit_request_id=UUID(edit_request_id)
         ))
         
@@ -454,8 +451,7 @@ def cleanup_old_previews_task():
     
     This task should be run periodically (e.g., daily).
     """
-    import asyncio
-    asyncio.run(cleanup_old_previews_async())
+    run_async(cleanup_old_previews_async())
 
 
 async def cleanup_old_previews_async():
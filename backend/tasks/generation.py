@@ -8,13 +8,13 @@ Refactored for best practices:
 - Constants instead of magic strings
 - Single responsibility per function
 """
-from celery import Task
 from celery_app import celery_app
 from sqlalchemy import select, update
 from datetime import datetime
 import logging
 
 from core.database import get_db_session
+from core.worker_loop import run_async
 from models.business import Business
 from models.site import GeneratedSite
 from services.creative.orchestrator import CreativeOrchestrator
@@ -172,7 +172,7 @@ async def _mark_site_as_failed(db, business_id: str, error_message: str) -> None
     max_retries=2,
     default_retry_delay=600  # 10 minutes
 )
-async def generate_site_for_business(self, business_id: str):
+def generate_site_for_business(self, business_id: str):
     """
     Generate a website for a specific business.
     
@@ -193,6 +193,14 @@ async def generate_site_for_business(self, business_id: str):
     Raises:
         Retries on failure (max 2 retries with 10min delay)
     """
+    try:
+        return run_async(generate_site_for_business_async(business_id))
+    except Exception as e:
+        raise self.retry(exc=e)
+
+
+async def generate_site_for_business_async(business_id: str):
+    """Async implementation of generate_site_for_business."""
     logger.info(f"Starting site generation for business: {business_id}")
     
     try:
@@ -245,16 +253,21 @@ async def generate_site_for_business(self, business_id: str):
         async with get_db_session() as db:
             await _mark_site_as_failed(db, business_id, str(e))
         
-        # Retry
-        raise self.retry(exc=e)
+        # Retried by the task wrapper
+        raise
 
 
 @celery_app.task(bind=True)
-async def generate_pending_sites(self):
+def generate_pending_sites(self):
     """
     Generate sites for qualified businesses that don't have sites yet.
     Scheduled task that runs periodically.
     """
+    return run_async(generate_pending_sites_async())
+
+
+async def generate_pending_sites_async():
+    """Async implementation of generate_pending_sites."""
     logger.info("Starting generate_pending_sites task")
     
     try:
@@ -291,10 +304,15 @@ async def generate_pending_sites(self):
 
 
 @celery_app.task(bind=True)
-async def publish_completed_sites(self):
+def publish_completed_sites(self):
     """
     Publish completed sites to production.
     """
+    return run_async(publish_completed_sites_async())
+
+
+async def publish_completed_sites_async():
+    """Async implementation of publish_completed_sites."""
     logger.info("Starting publish_completed_sites task")
     
     try:
@@ -337,10 +355,15 @@ async def publish_completed_sites(self):
 
 
 @celery_app.task(bind=True)
-async def retry_failed_generations(self):
+def retry_failed_generations(self):
     """
     Retry site generation for failed sites.
     """
+    return run_async(retry_failed_generations_async())
+
+
+async def retry_failed_generations_async():
+    """Async implementation of retry_failed_generations."""
     logger.info("Starting retry_failed_generations task")
     
     try:
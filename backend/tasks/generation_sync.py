@@ -11,11 +11,11 @@ from celery_app import celery_app
 from sqlalchemy import select, update
 from datetime import datetime
 import logging
-import asyncio
 import re
 import time
 
 from core.database import get_db_session_sync, CeleryAsyncSessionLocal
+from core.worker_loop import run_async
 from core.outreach_enums import OutreachChannel
 from models.business import Business
 from models.site import GeneratedSite
@@ -24,10 +24,28 @@ from services.creative.orchestrator import CreativeOrchestrator
 from services.hunter.scraper import OutscraperClient
 from services.sms.number_lookup import NumberLookupService
 from services.sms.phone_validator import PhoneValidator
+from services.work_queue import QueueSpec, WorkQueue, task_sender, worker_capacity
 
 logger = logging.getLogger(__name__)
 
 
+# Businesses waiting for a site. Leases outlive a failed attempt long enough
+# for generate_site_for_business's own Celery retry to run first.
+GENERATION_QUEUE = WorkQueue(QueueSpec(
+    name="generation",
+    model=Business,
+    ready=lambda now: (
+        Business.website_status == 'queued',
+        Business.generation_started_at.is_(None),
+    ),
+    order_by=lambda: (Business.generation_queued_at.asc().nullslast(),),
+    celery_queue="generation",
+    lease_seconds=600,
+    dispatch_lease_seconds=1800,  # Queue is kept prefilled to capacity × WORK_QUEUE_PREFETCH_FACTOR
+    hold_on_error_seconds=1800,
+))
+
+
 # Minimum HTML size (bytes) — based on observed floor of 40 real generations (~22.4 KB min).
 # Sites below this are almost certainly truncated.
 _MIN_HTML_BYTES = 22_000
@@ -69,20 +87,6 @@ def _is_html_complete(html: str | None) -> bool:
 from utils.error_classifier import classify_error as _classify_error
 
 
-def run_async(coro):
-    """
-    Helper to run async code in sync Celery task context.
-
-    Uses asyncio.run() which always creates a brand-new event loop and
-    closes it cleanly when done.  Combined with CeleryAsyncSessionLocal
-    (NullPool), this prevents:
-        RuntimeError: Task got Future attached to a different loop
-    which occurred because the old pooled asyncpg connections held futures
-    tied to a previous event loop that had already been replaced.
-    """
-    return asyncio.run(coro)
-
-
 @celery_app.task(
     bind=True,
     max_retries=2,
@@ -90,12 +94,14 @@ def run_async(coro):
     autoretry_for=(Exception,),
     retry_backoff=True
 )
-def generate_site_for_business(self, business_id: str):
+def generate_site_for_business(self, business_id: str, dispatched: bool = False):
     """
     Generate a website for a specific business (SYNC wrapper).
     
     Args:
         business_id: Business UUID string
+        dispatched: Sent by generate_pending_sites (only runs while the
+            business is still waiting in the generation queue)
         
     Returns:
         Dict with generation result
@@ -116,6 +122,23 @@ def generate_site_for_business(self, business_id: str):
                     logger.error(f"Business not found: {business_id}")
                     return {"status": "error", "message": "Business not found"}
                 
+                # **IDEMPOTENCY CHECK: a dispatched task can outwait its lease in
+                # the Celery queue and be re-dispatched; whichever copy runs second
+                # finds the business already taken out of the queue**
+                if dispatched and not (
+                    business.website_status == 'queued'
+                    and business.generation_started_at is None
+                ):
+                    logger.info(
+                        f"Business {business_id} is no longer queued "
+                        f"(status={business.website_status}). Skipping generation."
+                    )
+                    return {
+                        "status": "skipped",
+                        "reason": "not_queued",
+                        "business_id": business_id
+                    }
+                
                 # **IDEMPOTENCY CHECK: Verify business still needs a website**
                 if business.website_validation_status == 'valid':
                     logger.warning(
@@ -522,9 +545,15 @@ def generate_site_for_business(self, business_id: str):
                 
                 raise  # Re-raise for Celery auto-retry
     
+    async def _generate_leased():
+        async with GENERATION_QUEUE.lease(business_id, owner=self.request.id) as leased:
+            if not leased:
+                return {"status": "skipped", "reason": "in_progress", "business_id": business_id}
+            return await _generate()
+
     # Run the async function synchronously
     try:
-        return run_async(_generate())
+        return run_async(_generate_leased())
     except Exception as e:
         logger.error(f"Task failed for business {business_id}: {str(e)}")
         raise self.retry(exc=e)
@@ -534,7 +563,8 @@ def generate_site_for_business(self, business_id: str):
 def generate_pending_sites(self):
     """
     Generate sites for qualified businesses that don't have sites yet.
-    Scheduled task that runs periodically.
+    Scheduled task that runs periodically; each run tops the generation
+    queue up to worker capacity instead of a fixed batch.
     """
     from utils.autopilot_guard import check_autopilot
     guard = check_autopilot("generate_pending_sites")
@@ -542,37 +572,26 @@ def generate_pending_sites(self):
         return guard
 
     logger.info("[Celery Task] Starting generate_pending_sites")
-    
-    async def _generate_pending():
-        async with CeleryAsyncSessionLocal() as db:
-            # Find businesses that need websites
-            result = await db.execute(
-                select(Business)
-                .where(
-                    Business.website_status == 'queued',
-                    Business.generation_started_at.is_(None)
-                )
-                .limit(20)  # Generate up to 20 sites per run
-            )
-            businesses = result.scalars().all()
-            
-            if not businesses:
-                logger.info("No pending sites to generate")
-                return {"status": "completed", "sites_queued": 0}
-            
-            # Queue generation tasks
-            tasks_queued = 0
-            for business in businesses:
-                generate_site_for_business.delay(str(business.id))
-                tasks_queued += 1
-            
-            logger.info(f"Queued {tasks_queued} site generation tasks")
-            return {
-                "status": "completed",
-                "sites_queued": tasks_queued
-            }
-    
-    return run_async(_generate_pending())
+
+    # Claim as many queued businesses as the generation workers can take
+    # (leased, so overlapping runs never dispatch the same business twice)
+    capacity = worker_capacity(GENERATION_QUEUE.spec.celery_queue)
+    stats = run_async(GENERATION_QUEUE.dispatch(
+        task_sender(generate_site_for_business, dispatched=True),
+        capacity,
+        owner=self.request.id or "generate_pending_sites",
+    ))
+
+    if not stats["dispatched"]:
+        logger.info("No pending sites to generate")
+    else:
+        logger.info(f"Queued {stats['dispatched']} site generation tasks")
+    return {
+        "status": "completed",
+        "sites_queued": stats["dispatched"],
+        "in_flight": stats["in_flight"],
+        "capacity": stats["capacity"],
+    }
 
 
 @celery_app.task(bind=True)
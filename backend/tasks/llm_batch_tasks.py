@@ -0,0 +1,420 @@
+"""
+Message Batches tasks for offline LLM runs.
+
+Bulk re-validation and discovery backfills don't need answers in seconds.
+These tasks do the browser / search work up front, submit every LLM prompt
+in one Anthropic Message Batch (half the token price, no per-minute rate
+limit), and apply the verdicts when the batch has ended:
+
+    submit_validation_llm_batch / submit_discovery_llm_batch
+        → MessageBatchClient.submit() + save_pending()
+        → apply_llm_batch_results (re-polls every LLM_BATCH_POLL_SECONDS)
+
+Requests the batch could not answer (errored / expired) fall back to the
+regular per-business tasks.
+"""
+import asyncio
+import json
+import logging
+from typing import Dict, Any, List, Optional, Tuple
+
+from celery import shared_task
+
+from core.config import get_settings
+from core.database import get_db_session_sync
+from core.worker_loop import run_async
+from core.validation_enums import ValidationState
+from models.business import Business
+from services.llm.message_batches import MessageBatchClient
+from services.validation.browser_pool import get_browser_pool
+from services.validation.llm_validator import LLMWebsiteValidator
+from services.validation.validation_metadata_service import ValidationMetadataService
+from services.validation.validation_orchestrator import ValidationOrchestrator
+from tasks.validation_tasks_enhanced import (
+    validate_business_website_v2,
+    _precheck_business,
+    _build_business_context,
+    _apply_validation_result,
+    _handle_validation_error,
+)
+from tasks.discovery_tasks import (
+    discover_missing_websites_v2,
+    _is_plain_discovery_case,
+    _discovery_input,
+    _apply_discovery_result,
+)
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# VALIDATION
+# ============================================================================
+
+@shared_task(
+    name="tasks.llm_batch_tasks.submit_validation_llm_batch",
+    time_limit=1800  # 30 minutes
+)
+def submit_validation_llm_batch(business_ids: List[str]) -> Dict[str, Any]:
+    """
+    Validate businesses with the LLM stage deferred to a Message Batch.
+
+    Prescreen, static HTML and Playwright run now on this worker's browser
+    pool; results they decide (and cached LLM verdicts) are applied at once.
+
+    Args:
+        business_ids: List of business UUIDs
+
+    Returns:
+        {"total", "applied", "skipped", "errors", "deferred", "batch_id"}
+    """
+    summary = {
+        "total": len(business_ids), "applied": 0, "skipped": 0, "errors": 0,
+        "deferred": 0, "batch_id": None
+    }
+
+    with get_db_session_sync() as db:
+        businesses = db.query(Business).filter(Business.id.in_(business_ids)).all()
+        metadata_service = ValidationMetadataService()
+
+        runnable: List[Business] = []
+        for business in businesses:
+            try:
+                precheck_result = _precheck_business(db, business, metadata_service)
+            except Exception as e:
+                logger.error(f"Precheck failed for {business.id}: {e}", exc_info=True)
+                precheck_result = _handle_validation_error(str(business.id), e)
+            if precheck_result is None:
+                runnable.append(business)
+            else:
+                summary["skipped"] += 1
+
+        if not runnable:
+            return summary
+
+        deferred, model = run_async(
+            _validate_with_deferred_llm(db, runnable, metadata_service, summary)
+        )
+        if not deferred:
+            return summary
+
+        validator = LLMWebsiteValidator(model=model)
+        requests = []
+        items = {}
+        for business, business_context, result in deferred:
+            custom_id = str(business.id)
+            website_data = result["deferred_llm"]["website_data"]
+            requests.append({
+                "custom_id": custom_id,
+                "params": validator.build_request_params(business_context, website_data),
+            })
+            items[custom_id] = {
+                "business_id": custom_id,
+                "url": business.website_url,
+                "model": model,
+                "business_context": business_context,
+                "result": result,
+            }
+
+        try:
+            client = MessageBatchClient()
+            batch_id = run_async(client.submit(requests))
+            client.save_pending(batch_id, "validation", items)
+        except Exception as e:
+            logger.error(f"Validation message batch submission failed, validating online: {e}")
+            for custom_id in items:
+                validate_business_website_v2.delay(custom_id)
+            summary["resubmitted_online"] = len(items)
+            return summary
+
+        summary["deferred"] = len(items)
+        summary["batch_id"] = batch_id
+        apply_llm_batch_results.apply_async(
+            args=[batch_id], countdown=get_settings().LLM_BATCH_POLL_SECONDS
+        )
+
+    logger.info(f"Validation message batch submitted: {summary}")
+    return summary
+
+
+async def _validate_with_deferred_llm(
+    db,
+    businesses: List[Business],
+    metadata_service: ValidationMetadataService,
+    summary: Dict[str, Any]
+) -> Tuple[List[Tuple[Business, Dict[str, Any], Dict[str, Any]]], Optional[str]]:
+    """
+    Run stages 1-2 on the shared pool and apply every result that needs no LLM call.
+
+    Returns:
+        ([(business, business_context, deferred result), ...], LLM model)
+    """
+    settings = get_settings()
+    pool = await get_browser_pool()
+    orchestrator = ValidationOrchestrator(
+        db=db,
+        browser_pool=pool,
+        navigation_profile=settings.VALIDATION_BULK_NAVIGATION_PROFILE
+    )
+    semaphore = asyncio.Semaphore(pool.capacity)
+    deferred = []
+
+    # Only the results touch the session, applied one at a time after the
+    # gather, so a rollback for one business cannot discard another's updates
+    jobs = [(business, business.website_url, _build_business_context(business)) for business in businesses]
+
+    async def validate_one(url: str, business_context: Dict[str, Any]) -> Any:
+        async with semaphore:
+            try:
+                return await orchestrator.validate_business_website(
+                    business=business_context,
+                    url=url,
+                    defer_llm=True
+                )
+            except Exception as e:
+                return e
+
+    outcomes = await asyncio.gather(*(validate_one(url, context) for _, url, context in jobs))
+
+    for (business, url, business_context), outcome in zip(jobs, outcomes):
+        try:
+            if isinstance(outcome, Exception):
+                raise outcome
+            if outcome["decided_by"] == "llm_deferred":
+                deferred.append((business, business_context, outcome))
+                continue
+            _apply_validation_result(db, business, url, outcome, metadata_service)
+            summary["applied"] += 1
+        except Exception as e:
+            logger.error(f"Deferred validation failed for {business.id}: {e}", exc_info=True)
+            db.rollback()
+            _handle_validation_error(str(business.id), e)
+            summary["errors"] += 1
+    # The validator is created on the first Stage 3, so it exists whenever something was deferred
+    model = orchestrator.llm_validator.model if orchestrator.llm_validator else None
+    return deferred, model
+
+
+async def _apply_validation_batch(
+    client: MessageBatchClient,
+    batch_id: str,
+    items: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Turn each batch answer into a verdict and finish its validation."""
+    summary = {"applied": 0, "stale": 0, "resubmitted_online": 0, "errors": 0}
+    orchestrator = ValidationOrchestrator(static_tier_enabled=False)
+    metadata_service = ValidationMetadataService()
+    validators: Dict[str, LLMWebsiteValidator] = {}
+
+    with get_db_session_sync() as db:
+        async for item in client.iter_results(batch_id):
+            context = items.get(item.custom_id)
+            if context is None:
+                continue
+            business = db.query(Business).filter(Business.id == context["business_id"]).first()
+            if business is None or business.website_url != context["url"]:
+                # Deleted, or the URL changed while the batch was running
+                summary["stale"] += 1
+                continue
+            if not item.succeeded:
+                logger.warning(f"Batch request {item.custom_id} failed ({item.error}) - validating online")
+                validate_business_website_v2.delay(context["business_id"])
+                summary["resubmitted_online"] += 1
+                continue
+
+            model = context["model"]
+            if model not in validators:
+                validators[model] = LLMWebsiteValidator(model=model)
+            validator = validators[model]
+            result = context["result"]
+            try:
+                llm_result = await validator.result_from_response(
+                    result["deferred_llm"]["cache_key"], item.text, item.total_tokens
+                )
+            except (json.JSONDecodeError, ValueError) as e:
+                logger.error(f"Batch LLM response for {item.custom_id} is not a valid verdict: {e}")
+                llm_result = validator.failed_result(f"LLM response parsing error: {str(e)}")
+
+            try:
+                validation_result = orchestrator.complete_deferred_llm(
+                    result, context["business_context"], context["url"], llm_result
+                )
+                _apply_validation_result(db, business, context["url"], validation_result, metadata_service)
+                summary["applied"] += 1
+            except Exception as e:
+                logger.error(f"Applying batch verdict failed for {business.id}: {e}", exc_info=True)
+                db.rollback()
+                _handle_validation_error(str(business.id), e)
+                summary["errors"] += 1
+
+    return summary
+
+
+# ============================================================================
+# DISCOVERY
+# ============================================================================
+
+@shared_task(
+    name="tasks.llm_batch_tasks.submit_discovery_llm_batch",
+    time_limit=1800  # 30 minutes
+)
+def submit_discovery_llm_batch(business_ids: List[str]) -> Dict[str, Any]:
+    """
+    Run ScrapingDog searches now and submit the LLM analyses as a Message Batch.
+
+    Businesses that aren't plain discovery cases are handed to
+    discover_missing_websites_v2, as in discover_missing_websites_batch.
+
+    Args:
+        business_ids: Business UUIDs
+
+    Returns:
+        {"delegated", "found", "not_found", "errors", "deferred", "batch_id"}
+    """
+    from services.discovery.llm_discovery_service import LLMDiscoveryService
+
+    summary = {"delegated": 0, "found": 0, "not_found": 0, "errors": 0, "deferred": 0, "batch_id": None}
+
+    with get_db_session_sync() as db:
+        businesses = db.query(Business).filter(Business.id.in_(business_ids)).all()
+
+        eligible: List[Business] = []
+        for business in businesses:
+            if _is_plain_discovery_case(business):
+                eligible.append(business)
+            else:
+                discover_missing_websites_v2.delay(str(business.id))
+                summary["delegated"] += 1
+
+        if not eligible:
+            return summary
+
+        for business in eligible:
+            business.website_validation_status = ValidationState.DISCOVERY_IN_PROGRESS.value
+        db.commit()
+
+        inputs = [_discovery_input(b) for b in eligible]
+        prepared = run_async(LLMDiscoveryService().prepare_offline_discovery(inputs))
+
+        metadata_service = ValidationMetadataService()
+        requests = []
+        items = {}
+        for business, business_input, entry in zip(eligible, inputs, prepared):
+            if "result" in entry:
+                summary[_apply_discovery_result(db, business, entry["result"], metadata_service)] += 1
+                continue
+            custom_id = str(business.id)
+            requests.append({"custom_id": custom_id, "params": entry["params"]})
+            items[custom_id] = {
+                "business_id": custom_id,
+                "business": business_input,
+                "query": entry["query"],
+                "search_results": entry["search_results"],
+            }
+
+        if not requests:
+            return summary
+
+        try:
+            client = MessageBatchClient()
+            batch_id = run_async(client.submit(requests))
+            client.save_pending(batch_id, "discovery", items)
+        except Exception as e:
+            # Searches are cached, so the online retry doesn't pay for them again
+            logger.error(f"Discovery message batch submission failed, discovering online: {e}")
+            for custom_id in items:
+                discover_missing_websites_v2.delay(custom_id)
+            summary["delegated"] += len(items)
+            return summary
+
+        summary["deferred"] = len(items)
+        summary["batch_id"] = batch_id
+        apply_llm_batch_results.apply_async(
+            args=[batch_id], countdown=get_settings().LLM_BATCH_POLL_SECONDS
+        )
+
+    logger.info(f"Discovery message batch submitted: {summary}")
+    return summary
+
+
+async def _apply_discovery_batch(
+    client: MessageBatchClient,
+    batch_id: str,
+    items: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Build each business's discovery result from its batch answer and record it."""
+    from services.discovery.llm_discovery_service import LLMDiscoveryService
+
+    summary = {"found": 0, "not_found": 0, "errors": 0, "stale": 0, "resubmitted_online": 0}
+    discovery_service = LLMDiscoveryService()
+    metadata_service = ValidationMetadataService()
+
+    with get_db_session_sync() as db:
+        async for item in client.iter_results(batch_id):
+            context = items.get(item.custom_id)
+            if context is None:
+                continue
+            business = db.query(Business).filter(Business.id == context["business_id"]).first()
+            if business is None or business.website_url:
+                summary["stale"] += 1
+                continue
+            if not item.succeeded:
+                logger.warning(f"Batch request {item.custom_id} failed ({item.error}) - discovering online")
+                discover_missing_websites_v2.delay(context["business_id"])
+                summary["resubmitted_online"] += 1
+                continue
+
+            discovery_result = await discovery_service.complete_offline_discovery(
+                context["business"],
+                context["query"],
+                context["search_results"],
+                item.text,
+                item.total_tokens
+            )
+            summary[_apply_discovery_result(db, business, discovery_result, metadata_service)] += 1
+
+    return summary
+
+
+# ============================================================================
+# RESULTS
+# ============================================================================
+
+_BATCH_CONSUMERS = {
+    "validation": _apply_validation_batch,
+    "discovery": _apply_discovery_batch,
+}
+
+
+@shared_task(
+    name="tasks.llm_batch_tasks.apply_llm_batch_results",
+    time_limit=3600  # 1 hour
+)
+def apply_llm_batch_results(batch_id: str) -> Dict[str, Any]:
+    """
+    Apply a Message Batch's results once it has ended (re-queues itself until then).
+
+    Args:
+        batch_id: Message batch ID returned by submit
+
+    Returns:
+        {"batch_id", "status", ...consumer summary}
+    """
+    pending = MessageBatchClient.load_pending(batch_id)
+    if pending is None:
+        logger.warning(f"No pending context for message batch {batch_id} (already applied or expired)")
+        return {"batch_id": batch_id, "status": "unknown"}
+
+    client = MessageBatchClient()
+    if not run_async(client.is_ended(batch_id)):
+        apply_llm_batch_results.apply_async(
+            args=[batch_id], countdown=get_settings().LLM_BATCH_POLL_SECONDS
+        )
+        return {"batch_id": batch_id, "status": "in_progress"}
+
+    consumer = _BATCH_CONSUMERS[pending["kind"]]
+    summary = run_async(consumer(client, batch_id, pending["items"]))
+    MessageBatchClient.clear_pending(batch_id)
+
+    logger.info(f"📦 Applied {pending['kind']} message batch {batch_id}: {summary}")
+    return {"batch_id": batch_id, "status": "applied", **summary}
@@ -8,6 +8,7 @@ from datetime import datetime, timedelta
 import logging
 
 from core.database import get_db_session
+from core.worker_loop import run_async
 from models.business import Business
 from models.site import GeneratedSite
 from models.campaign import Campaign
@@ -18,11 +19,16 @@ logger = logging.getLogger(__name__)
 
 
 @celery_app.task(bind=True)
-async def health_check(self):
+def health_check(self):
     """
     Perform system health check.
     Checks database connectivity and basic metrics.
     """
+    return run_async(health_check_async())
+
+
+async def health_check_async():
+    """Async implementation of health_check."""
     logger.info("Starting health_check task")
     
     try:
@@ -106,10 +112,15 @@ async def health_check(self):
 
 
 @celery_app.task(bind=True)
-async def cleanup_stuck_tasks(self):
+def cleanup_stuck_tasks(self):
     """
     Clean up tasks that have been stuck in processing state too long.
     """
+    return run_async(cleanup_stuck_tasks_async())
+
+
+async def cleanup_stuck_tasks_async():
+    """Async implementation of cleanup_stuck_tasks."""
     logger.info("Starting cleanup_stuck_tasks task")
     
     try:
@@ -192,10 +203,15 @@ async def cleanup_stuck_tasks(self):
 
 
 @celery_app.task(bind=True)
-async def generate_daily_report(self):
+def generate_daily_report(self):
     """
     Generate daily performance report.
     """
+    return run_async(generate_daily_report_async())
+
+
+async def generate_daily_report_async():
+    """Async implementation of generate_daily_report."""
     logger.info("Starting generate_daily_report task")
     
     try:
@@ -259,10 +275,15 @@ async def generate_daily_report(self):
 
 
 @celery_app.task(bind=True)
-async def alert_on_failures(self):
+def alert_on_failures(self):
     """
     Send alerts if failure rates are too high.
     """
+    return run_async(alert_on_failures_async())
+
+
+async def alert_on_failures_async():
+    """Async implementation of alert_on_failures."""
     logger.info("Starting alert_on_failures task")
     
     try:
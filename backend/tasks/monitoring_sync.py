@@ -7,6 +7,9 @@ This module provides sync wrappers for monitoring tasks.
 from celery_app import celery_app
 import logging
 
+from core.database import CeleryAsyncSessionLocal
+from core.worker_loop import run_async
+
 logger = logging.getLogger(__name__)
 
 
@@ -75,3 +78,26 @@ def alert_on_failures(self):
     return {"status": "not_implemented"}
 
 
+@celery_app.task(
+    bind=True,
+    max_retries=0,
+    soft_time_limit=120,
+    time_limit=180
+)
+def refresh_dashboard_stats(self):
+    """
+    Recompute the dashboard stats cards and store them on today's
+    analytics snapshot (served by the /stats endpoints while fresh).
+    """
+    from services.dashboard_stats_snapshot import DashboardStatsSnapshotService
+
+    async def _refresh():
+        async with CeleryAsyncSessionLocal() as db:
+            return await DashboardStatsSnapshotService(db).refresh()
+
+    try:
+        stats = run_async(_refresh())
+        return {"status": "ok", "sections": sorted(stats)}
+    except Exception as e:
+        logger.error(f"[Dashboard Stats] Refresh failed: {e}", exc_info=True)
+        return {"status": "error", "message": str(e)}
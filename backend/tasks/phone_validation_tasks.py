@@ -6,12 +6,12 @@ outreach_channel set, validates phone(s) and sets outreach_channel
 (sms | email | call_later). Orchestration only; lookup logic lives in
 phone_validation_service.
 """
-import asyncio
 import logging
 
 from celery_app import celery_app
 from sqlalchemy import select, and_, or_
-from core.database import AsyncSessionLocal
+from core.database import CeleryAsyncSessionLocal
+from core.worker_loop import run_async
 from core.outreach_enums import OutreachChannel
 from models.business import Business
 from models.site import GeneratedSite
@@ -21,16 +21,6 @@ from services.sms.number_lookup import NumberLookupService
 logger = logging.getLogger(__name__)
 
 
-def _run_async(coro):
-    """Run async code from sync Celery context."""
-    try:
-        loop = asyncio.get_event_loop()
-    except RuntimeError:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-    return loop.run_until_complete(coro)
-
-
 # Statuses that mean "confirmed no website" (triple-validated)
 _TRIPLE_VERIFIED_STATUSES = ("triple_verified", "confirmed_no_website")
 
@@ -49,7 +39,7 @@ def run_phone_validation_job(self, limit: int = 50):
         Dict with processed count and counts by channel.
     """
     async def _run():
-        async with AsyncSessionLocal() as db:
+        async with CeleryAsyncSessionLocal() as db:
             # Select: triple-verified, no site yet, outreach_channel not set
             result = await db.execute(
                 select(Business)
@@ -80,7 +70,7 @@ def run_phone_validation_job(self, limit: int = 50):
 
         for business in businesses:
             try:
-                async with AsyncSessionLocal() as db:
+                async with CeleryAsyncSessionLocal() as db:
                     # Re-load this business in this session
                     r = await db.execute(select(Business).where(Business.id == business.id))
                     b = r.scalar_one_or_none()
@@ -109,4 +99,4 @@ def run_phone_validation_job(self, limit: int = 50):
         )
         return {"processed": processed, "by_channel": by_channel}
 
-    return _run_async(_run())
+    return run_async(_run())
@@ -9,6 +9,7 @@ from datetime import datetime, timedelta
 import logging
 
 from core.database import get_db_session
+from core.worker_loop import run_async
 from models.coverage import CoverageGrid
 from models.business import Business
 from services.hunter.hunter_service import HunterService
@@ -34,13 +35,21 @@ class DatabaseTask(Task):
     max_retries=3,
     default_retry_delay=300  # 5 minutes
 )
-async def scrape_territory(self, grid_id: str):
+def scrape_territory(self, grid_id: str):
     """
     Scrape a specific territory grid.
     
     Args:
         grid_id: Coverage grid UUID
     """
+    try:
+        return run_async(scrape_territory_async(grid_id))
+    except Exception as e:
+        raise self.retry(exc=e)
+
+
+async def scrape_territory_async(grid_id: str):
+    """Async implementation of scrape_territory."""
     logger.info(f"Starting scrape for grid: {grid_id}")
     
     try:
@@ -107,16 +116,21 @@ async def scrape_territory(self, grid_id: str):
             )
             await db.commit()
         
-        # Retry
-        raise self.retry(exc=e)
+        # Retried by the task wrapper
+        raise
 
 
 @celery_app.task(bind=True, base=DatabaseTask)
-async def scrape_pending_territories(self):
+def scrape_pending_territories(self):
     """
     Scrape all pending territories that are not on cooldown.
     Scheduled task that runs periodically.
     """
+    return run_async(scrape_pending_territories_async())
+
+
+async def scrape_pending_territories_async():
+    """Async implementation of scrape_pending_territories."""
     from utils.autopilot_guard import check_autopilot_async
     guard = await check_autopilot_async("scrape_pending_territories", check_target=True)
     if guard:
@@ -160,10 +174,15 @@ async def scrape_pending_territories(self):
 
 
 @celery_app.task(bind=True, base=DatabaseTask)
-async def cleanup_expired_cooldowns(self):
+def cleanup_expired_cooldowns(self):
     """
     Reset cooldowns for territories that are ready to be scraped again.
     """
+    return run_async(cleanup_expired_cooldowns_async())
+
+
+async def cleanup_expired_cooldowns_async():
+    """Async implementation of cleanup_expired_cooldowns."""
     logger.info("Starting cleanup_expired_cooldowns task")
     
     try:
@@ -203,10 +222,15 @@ async def cleanup_expired_cooldowns(self):
 
 
 @celery_app.task(bind=True, base=DatabaseTask)
-async def qualify_new_leads(self):
+def qualify_new_leads(self):
     """
     Qualify recently scraped businesses.
     """
+    return run_async(qualify_new_leads_async())
+
+
+async def qualify_new_leads_async():
+    """Async implementation of qualify_new_leads."""
     logger.info("Starting qualify_new_leads task")
     
     try:
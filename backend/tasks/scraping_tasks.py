@@ -13,16 +13,14 @@ Best Practices:
     - Proper async/sync boundary handling
 """
 
-import asyncio
 import logging
 from datetime import datetime
 from typing import Dict, Any, Optional
 from celery import shared_task
 from sqlalchemy import select
-from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 
-from core.database import get_db_session_sync
-from core.config import get_settings
+from core.database import get_db_session_sync, CeleryAsyncSessionLocal
+from core.worker_loop import run_async
 from models.scrape_session import ScrapeSession
 from models.geo_strategy import GeoStrategy
 from services.hunter.hunter_service import HunterService
@@ -170,20 +168,14 @@ def scrape_zone_async(
         # Log comprehensive analytics
         try:
             async def log_analytics():
-                async for db in get_db():
+                async with CeleryAsyncSessionLocal() as db:
                     analytics_service = ScrapeAnalytics(db)
                     await analytics_service.log_scrape_complete(
                         session_id=session_id,
                         scrape_result=scrape_result
                     )
-                    break
             
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                loop.run_until_complete(log_analytics())
-            finally:
-                loop.close()
+            run_async(log_analytics())
                 
             logger.info(f"✅ Analytics logged for session {session_id}")
         except Exception as e:
@@ -278,39 +270,9 @@ def _run_scraping(
     """
     
     async def _async_scrape():
-        """
-        Inner async function for scraping.
-
-        IMPORTANT: This runs in a *new* event loop created by the Celery worker,
-        completely separate from the FastAPI server's event loop.  We must NOT
-        borrow connections from the shared AsyncSessionLocal pool (which is bound
-        to the server loop) — doing so causes "Future attached to a different loop".
-
-        Instead, we create a fresh AsyncEngine + session factory that lives entirely
-        within this task's event loop, and dispose it when done.
-        """
-        settings = get_settings()
-        # Strip +asyncpg suffix if present so we can add it cleanly
-        db_url = settings.DATABASE_URL
-        if not db_url.startswith("postgresql+asyncpg://"):
-            db_url = db_url.replace("postgresql://", "postgresql+asyncpg://")
-
-        task_engine = create_async_engine(
-            db_url,
-            pool_size=2,
-            max_overflow=0,
-            pool_pre_ping=True,
-        )
-        task_session_factory = async_sessionmaker(
-            task_engine,
-            class_=AsyncSession,
-            expire_on_commit=False,
-            autocommit=False,
-            autoflush=False,
-        )
-
+        """Inner async function for scraping (runs on the worker event loop)."""
         try:
-            async with task_session_factory() as db:
+            async with CeleryAsyncSessionLocal() as db:
                 hunter = HunterService(db=db, progress_publisher=publisher)
 
                 logger.info(
@@ -338,21 +300,9 @@ def _run_scraping(
         except Exception as e:
             logger.error(f"Async scraping failed: {e}", exc_info=True)
             raise
-        finally:
-            await task_engine.dispose()
 
-    # Run in a fresh event loop owned entirely by this Celery task
-    try:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            result = loop.run_until_complete(_async_scrape())
-            return result
-        finally:
-            loop.close()
-    except Exception as e:
-        logger.error(f"Event loop execution failed: {e}", exc_info=True)
-        raise
+    # Run on the worker's persistent event loop (pooled DB connections)
+    return run_async(_async_scrape())
 
 
 # =============================================================================
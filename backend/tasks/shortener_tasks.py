@@ -0,0 +1,30 @@
+"""
+Short link maintenance tasks.
+
+Redirects count clicks in Redis (see services.shortener.redirect_cache);
+this task periodically writes the buffered counts to short_links.
+"""
+from celery_app import celery_app
+import logging
+
+from core.database import get_db_session_sync
+from services.shortener.redirect_cache import flush_click_counts
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task(
+    bind=True,
+    max_retries=0,
+    soft_time_limit=50,
+    time_limit=60
+)
+def flush_short_link_clicks(self):
+    """Apply buffered short-link click counts in one batched UPDATE."""
+    try:
+        with get_db_session_sync() as db:
+            updated = flush_click_counts(db)
+        return {"status": "ok", "links_updated": updated}
+    except Exception as e:
+        logger.error(f"[Shortener] Click flush failed: {e}", exc_info=True)
+        return {"status": "error", "message": str(e)}
@@ -12,11 +12,13 @@ Date: January 21, 2026
 from celery import shared_task
 from sqlalchemy import select
 from uuid import UUID
+import asyncio
 import logging
 from typing import List, Dict, Any
 from datetime import datetime
 
 from core.database import get_db_session
+from core.worker_loop import run_async
 from models.campaign import Campaign
 from services.pitcher.campaign_service import CampaignService
 from core.exceptions import ValidationException, ExternalAPIException
@@ -108,8 +110,7 @@ def send_sms_campaign_task(self, campaign_id: str):
                 }
     
     # Run async function in event loop
-    import asyncio
-    return asyncio.run(_send_campaign())
+    return run_async(_send_campaign())
 
 
 # ============================================================================
@@ -185,7 +186,6 @@ def send_batch_sms_campaigns_task(self, campaign_ids: List[str]):
                 
                 # Rate limiting: Small delay between sends to avoid API throttling
                 # Twilio has rate limits (messaging service-dependent, typically 1000/sec)
-                import asyncio
                 await asyncio.sleep(0.1)  # 100ms delay = max 10 SMS/sec
         
         logger.info(
@@ -196,8 +196,7 @@ def send_batch_sms_campaigns_task(self, campaign_ids: List[str]):
         return results
     
     # Run async function in event loop
-    import asyncio
-    return asyncio.run(_send_batch())
+    return run_async(_send_batch())
 
 
 # ============================================================================
@@ -286,8 +285,7 @@ def process_scheduled_sms_campaigns_task(self):
             return results
     
     # Run async function in event loop
-    import asyncio
-    return asyncio.run(_process_scheduled())
+    return run_async(_process_scheduled())
 
 
 # ============================================================================
@@ -359,6 +357,5 @@ def calculate_sms_campaign_stats_task(self):
             return calculated_stats
     
     # Run async function in event loop
-    import asyncio
-    return asyncio.run(_calculate_stats())
+    return run_async(_calculate_stats())
 
@@ -7,21 +7,43 @@ This module provides sync wrappers for SMS tasks.
 Sending guardrails:
 - Only sends scheduled campaigns whose scheduled_for <= now (UTC)
 - Compliance check (opt-out list + business-hours in recipient local TZ) is
-  handled inside CampaignService._create_sms_campaign / send_campaign
-- Rate limit: max 10 SMS per Celery Beat tick (every 5 min = 120/hr max)
+  handled by SMSSendEngine, once per timezone group
+- Rate limit: max 10 SMS per Celery Beat tick (every 5 min = 120/hr max),
+  sent concurrently under a per-provider/number token bucket
+- Due campaigns are claimed (services/work_queue.py) before sending, so
+  overlapping ticks never send the same campaign twice
 """
 from celery_app import celery_app
 import asyncio
 import logging
+from core.worker_loop import run_async
 from datetime import datetime, timezone
 from uuid import UUID
 
+from models.campaign import Campaign
+from services.work_queue import QueueSpec, WorkQueue
+
 logger = logging.getLogger(__name__)
 
 # Max campaigns to send per scheduled tick to avoid rate-limit spikes
 _MAX_PER_RUN = 10
 
 
+# Scheduled SMS campaigns that are due (claimed per tick, sent in-process)
+SCHEDULED_SMS_QUEUE = WorkQueue(QueueSpec(
+    name="sms_scheduled",
+    model=Campaign,
+    ready=lambda now: (
+        Campaign.channel == "sms",
+        Campaign.status == "scheduled",
+        Campaign.scheduled_for <= now,
+    ),
+    order_by=lambda: (Campaign.scheduled_for.asc(),),
+    celery_queue="campaigns",
+    lease_seconds=300,  # Matches the task's hard time limit
+))
+
+
 @celery_app.task(
     bind=True,
     max_retries=2,
@@ -35,59 +57,49 @@ def process_scheduled_sms_campaigns(self):
 
     Runs every 5 minutes via Celery Beat.
     Picks up campaigns with status='scheduled' where scheduled_for <= now (UTC).
-    The per-business timezone compliance check (TCPA quiet hours) happens inside
-    CampaignService.send_campaign via SMSComplianceService.check_can_send.
+    The batch is sent by SMSSendEngine, which applies the opt-out list and the
+    TCPA quiet hours per recipient timezone.
     """
     async def _run():
         # Runs regardless of autopilot so user-scheduled SMS send when due
         from core.database import get_db_session
         from sqlalchemy import select
-        from models.campaign import Campaign
-        from services.pitcher.campaign_service import CampaignService
-
-        now_utc = datetime.now(timezone.utc).replace(tzinfo=None)  # naive UTC to match DB
+        from services.pitcher.sms_send_engine import SMSSendEngine
 
         results = {"checked": 0, "sent": 0, "skipped": 0, "failed": 0, "errors": []}
 
         async with get_db_session() as db:
-            stmt = (
+            # Claim due campaigns so overlapping ticks or a manual trigger
+            # never send the same campaign twice
+            campaign_ids = await SCHEDULED_SMS_QUEUE.claim(
+                db, _MAX_PER_RUN, owner=self.request.id or "process_scheduled_sms_campaigns"
+            )
+            if not campaign_ids:
+                logger.info("[SMS-Sync] No scheduled SMS campaigns due")
+                return results
+
+            result = await db.execute(
                 select(Campaign)
-                .where(
-                    Campaign.channel == "sms",
-                    Campaign.status == "scheduled",
-                    Campaign.scheduled_for <= now_utc,
-                )
+                .where(Campaign.id.in_(campaign_ids))
                 .order_by(Campaign.scheduled_for.asc())
-                .limit(_MAX_PER_RUN)
             )
-            result = await db.execute(stmt)
             campaigns = result.scalars().all()
 
-            if not campaigns:
-                logger.info("[SMS-Sync] No scheduled SMS campaigns due")
-                return results
-
             logger.info(f"[SMS-Sync] Found {len(campaigns)} scheduled SMS campaigns due")
-            campaign_service = CampaignService(db)
 
-            for campaign in campaigns:
-                results["checked"] += 1
-                try:
-                    # preferred_only=True: autopilot only sends during 1–5 PM,
-                    # 7–9 PM, or 10 AM–12 PM in the business's local timezone.
-                    sent = await campaign_service.send_campaign(campaign.id, preferred_only=True)
-                    if sent:
-                        results["sent"] += 1
-                    else:
-                        results["skipped"] += 1
-                        logger.info(f"[SMS-Sync] Campaign {campaign.id} deferred (outside preferred window)")
-                except Exception as e:
-                    results["failed"] += 1
-                    results["errors"].append({"campaign_id": str(campaign.id), "error": str(e)})
-                    logger.error(f"[SMS-Sync] Campaign {campaign.id} error: {e}", exc_info=True)
+            # preferred_only=True: autopilot only sends during 1–5 PM,
+            # 7–9 PM, or 10 AM–12 PM in the business's local timezone.
+            results = await SMSSendEngine(db).send_batch(campaigns, preferred_only=True)
+            for error in results["errors"]:
+                logger.error(f"[SMS-Sync] Campaign {error['campaign_id']} error: {error['error']}")
 
-                # Small delay between sends — 100 ms → max ~10/sec
-                await asyncio.sleep(0.1)
+        # Deferred / failed campaigns are due again on the next tick (an
+        # unreleased lease simply expires after lease_seconds)
+        try:
+            async with get_db_session() as db:
+                await SCHEDULED_SMS_QUEUE.release(db, campaign_ids)
+        except Exception as e:
+            logger.warning(f"[SMS-Sync] Lease release failed (leases expire on their own): {e}")
 
         logger.info(
             f"[SMS-Sync] Done — sent={results['sent']} skipped={results['skipped']} failed={results['failed']}"
@@ -95,7 +107,7 @@ def process_scheduled_sms_campaigns(self):
         return results
 
     try:
-        return asyncio.run(_run())
+        return run_async(_run())
     except Exception as e:
         logger.error(f"[SMS-Sync] process_scheduled_sms_campaigns error: {e}", exc_info=True)
         return {"status": "error", "message": str(e)}
@@ -144,7 +156,7 @@ def calculate_sms_campaign_stats(self):
             return stats
 
     try:
-        return asyncio.run(_run())
+        return run_async(_run())
     except Exception as e:
         logger.error(f"[SMS-Sync] calculate_sms_campaign_stats error: {e}")
         return {"status": "error", "message": str(e)}
@@ -184,7 +196,7 @@ def send_batch_sms_campaigns(self, campaign_ids: list):
         return results
 
     try:
-        return asyncio.run(_run())
+        return run_async(_run())
     except Exception as e:
         logger.error(f"[SMS-Sync] send_batch_sms_campaigns error: {e}")
         return {"status": "error", "message": str(e)}
@@ -208,7 +220,37 @@ def send_sms_campaign(self, campaign_id: str):
             return {"status": "sent" if sent else "failed", "campaign_id": campaign_id}
 
     try:
-        return asyncio.run(_run())
+        return run_async(_run())
     except Exception as e:
         logger.error(f"[SMS-Sync] send_sms_campaign {campaign_id} error: {e}")
         raise self.retry(exc=e)
+
+
+@celery_app.task(
+    bind=True,
+    max_retries=0,
+    soft_time_limit=50,
+    time_limit=60
+)
+def apply_sms_status_events(self):
+    """
+    Apply buffered Telnyx / LabsMobile delivery callbacks.
+
+    Runs every minute via Celery Beat. The webhooks only append callbacks to
+    a Redis stream; this drains it, coalescing events per message id into
+    batched campaign / sms_messages UPDATEs (services.sms.status_ingest).
+    """
+    async def _run():
+        from core.database import CeleryAsyncSessionLocal
+        from services.sms.status_ingest import get_sms_status_ingest
+
+        return await get_sms_status_ingest().consume(CeleryAsyncSessionLocal)
+
+    try:
+        stats = run_async(_run())
+        if stats["events"]:
+            logger.info(f"[SMS-Sync] Applied status events: {stats}")
+        return stats
+    except Exception as e:
+        logger.error(f"[SMS-Sync] apply_sms_status_events error: {e}", exc_info=True)
+        return {"status": "error", "message": str(e)}
@@ -11,15 +11,15 @@ Flow:
   5. For 'site_edit' tickets: SiteEditProcessor runs the 3-stage edit pipeline
   6. All other tickets: marked in_progress for staff review
 
-IMPORTANT: Celery tasks must be synchronous. async helpers run via asyncio.run().
+IMPORTANT: Celery tasks must be synchronous. async helpers run via run_async().
 """
-import asyncio
 import json
 import logging
 from datetime import datetime, timezone
 from uuid import UUID
 
 from celery_app import celery_app
+from core.worker_loop import run_async
 
 logger = logging.getLogger(__name__)
 
@@ -45,7 +45,7 @@ def process_ticket_with_ai(self, ticket_id: str):
     """
     logger.info(f"[TicketTask] Starting AI processing for ticket {ticket_id}")
     try:
-        asyncio.run(_process_ticket_async(UUID(ticket_id)))
+        run_async(_process_ticket_async(UUID(ticket_id)))
         logger.info(f"[TicketTask] Completed AI processing for ticket {ticket_id}")
     except Exception as exc:
         logger.error(f"[TicketTask] Failed for ticket {ticket_id}: {exc}", exc_info=True)
@@ -58,13 +58,13 @@ def process_ticket_with_ai(self, ticket_id: str):
 
 async def _process_ticket_async(ticket_id: UUID) -> None:
     """Full async pipeline for ticket AI processing."""
-    from core.database import AsyncSessionLocal
+    from core.database import CeleryAsyncSessionLocal
     from models.support_ticket import SupportTicket, TicketMessage
     from models.site_models import CustomerUser
     from sqlalchemy import select
     from sqlalchemy.orm import selectinload
 
-    async with AsyncSessionLocal() as db:
+    async with CeleryAsyncSessionLocal() as db:
         # Load ticket with customer and messages
         stmt = (
             select(SupportTicket)
@@ -164,11 +164,7 @@ async def _process_ticket_async(ticket_id: UUID) -> None:
 
 async def _run_ai_analysis(ticket) -> dict | None:
     """Call Claude to analyse the ticket and return structured JSON."""
-    from anthropic import AsyncAnthropic
-    from core.config import get_settings
-
-    settings = get_settings()
-    client = AsyncAnthropic(api_key=settings.ANTHROPIC_API_KEY)
+    from services.llm.gateway import get_llm_gateway, message_text
 
     prompt = f"""You are a customer support AI assistant. Analyse this support ticket and respond ONLY with valid JSON.
 
@@ -195,14 +191,15 @@ JSON format:
 }}"""
 
     try:
-        async with client.messages.stream(
+        final_message = await get_llm_gateway().stream(
+            "support.ticket_ai",
             model="claude-sonnet-4-5",
             max_tokens=2048,
             temperature=0.3,
             system="You are a helpful customer support assistant. Always respond with valid JSON only.",
             messages=[{"role": "user", "content": prompt}],
-        ) as stream:
-            response_text = await stream.get_final_text()
+        )
+        response_text = message_text(final_message)
 
         # Strip markdown fences if present
         text = response_text.strip()
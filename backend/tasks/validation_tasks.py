@@ -2,13 +2,13 @@
 Celery tasks for website validation.
 Handles asynchronous website validation using LLM-powered orchestrator.
 """
-import asyncio
 from celery import shared_task
 from sqlalchemy.orm import Session
 from datetime import datetime
 import logging
 
 from core.database import get_db_session_sync
+from core.worker_loop import run_async
 from core.config import get_settings
 from services.validation.validation_orchestrator import ValidationOrchestrator
 from utils.error_classifier import classify_error
@@ -82,7 +82,7 @@ def validate_business_website(self, business_id: str):
             }
             
             # Run validation through orchestrator (sync wrapper for async code)
-            result = asyncio.run(_run_validation(
+            result = run_async(_run_validation(
                 business_context=business_context,
                 url=business.website_url
             ))
@@ -97,6 +97,10 @@ def validate_business_website(self, business_id: str):
             business.website_validation_result = result
             business.website_validated_at = datetime.utcnow()
             
+            screenshot_url = result.get("stages", {}).get("playwright", {}).get("screenshot_url")
+            if screenshot_url:
+                business.website_screenshot_url = screenshot_url
+            
             # Clear URL if recommendation says so (directory/aggregator)
             if "clear_url" in recommendation:
                 logger.info(f"Clearing URL for {business_id} (not business's actual website)")
@@ -190,12 +194,12 @@ async def _run_validation(business_context: dict, url: str) -> dict:
     Returns:
         Validation result dictionary with verdict, confidence, reasoning
     """
-    from core.database import AsyncSessionLocal
+    from core.database import CeleryAsyncSessionLocal
     
     settings = get_settings()
     
     # Create async DB session for loading system settings
-    async with AsyncSessionLocal() as db:
+    async with CeleryAsyncSessionLocal() as db:
         async with ValidationOrchestrator(db=db) as orchestrator:
             return await orchestrator.validate_business_website(
                 business=business_context,
@@ -261,11 +265,8 @@ def discover_missing_websites(self, business_id: str):
             
             discovery_service = LLMDiscoveryService()
             
-            # Proper async event loop management to prevent "Event loop is closed" errors
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
             try:
-                result = loop.run_until_complete(discovery_service.discover_website(
+                result = run_async(discovery_service.discover_website(
                     business_name=business.name,
                     phone=business.phone,
                     address=business.address,
@@ -277,8 +278,6 @@ def discover_missing_websites(self, business_id: str):
                 # Handle discovery service errors gracefully
                 logger.error(f"Discovery service error for {business_id}: {discovery_error}")
                 result = None
-            finally:
-                loop.close()  # Ensure proper cleanup
             
             # Safety check: if result is None, mark as error and retry
             if result is None:
@@ -12,12 +12,15 @@ Follows best practices: Single Responsibility, Clear Error Handling, Comprehensi
 import asyncio
 import logging
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 from celery import shared_task
 
+from core.config import get_settings
 from core.database import get_db_session_sync
+from core.worker_loop import run_async, on_worker_shutdown
 from models.business import Business
 from services.validation.validation_orchestrator import ValidationOrchestrator
+from services.validation.browser_pool import get_browser_pool, close_browser_pool
 from services.validation.validation_metadata_service import ValidationMetadataService
 from utils.error_classifier import classify_error
 from core.validation_enums import (
@@ -32,6 +35,10 @@ logger = logging.getLogger(__name__)
 # Countries we support for SMS outreach
 _SUPPORTED_COUNTRIES = {"US"}
 
+# The shared browser pool is bound to the worker's persistent event loop
+# (core.worker_loop); close it there before the loop shuts down.
+on_worker_shutdown(close_browser_pool)
+
 
 def _apply_detected_country_from_validation(
     business: Business,
@@ -110,38 +117,18 @@ def validate_business_website_v2(self, business_id: str) -> Dict[str, Any]:
             # Initialize metadata service
             metadata_service = ValidationMetadataService()
             
-            # Ensure metadata exists
-            if not business.website_metadata:
-                business.website_metadata = metadata_service.create_initial_metadata()
-            
-            # ================================================================
-            # CASE 1: No URL at all - Queue for discovery
-            # ================================================================
-            if not business.website_url:
-                logger.info(f"Business {business_id} has no URL - needs discovery")
-                return _handle_no_url(db, business, metadata_service)
-            
-            # ================================================================
-            # CASE 2: Already in discovery pipeline - Skip validation
-            # ================================================================
-            if business.website_validation_status in [
-                ValidationState.DISCOVERY_QUEUED.value,
-                ValidationState.DISCOVERY_IN_PROGRESS.value
-            ]:
-                logger.info(f"Business {business_id} already in discovery pipeline")
-                return {"status": "skipped", "reason": "discovery_in_progress"}
+            # CASES 1-3: no URL / in discovery / terminal state
+            precheck_result = _precheck_business(db, business, metadata_service)
+            if precheck_result is not None:
+                return precheck_result
             
             # ================================================================
-            # CASE 3: Terminal state - Skip unless forced
+            # CASE 4: Run validation (on the worker's warm browser pool)
             # ================================================================
-            if business.validation_is_terminal:
-                logger.info(f"Business {business_id} in terminal state: {business.website_validation_status}")
-                return {"status": "skipped", "reason": "terminal_state"}
-            
-            # ================================================================
-            # CASE 4: Run validation
-            # ================================================================
-            return asyncio.run(_run_website_validation(db, business, metadata_service))
+            return run_async(_run_website_validation(
+                db, business, metadata_service,
+                capture_screenshot=get_settings().VALIDATION_CAPTURE_SCREENSHOTS
+            ))
             
     except Exception as e:
         logger.error(f"Validation task failed for {business_id}: {e}", exc_info=True)
@@ -153,6 +140,51 @@ def validate_business_website_v2(self, business_id: str) -> Dict[str, Any]:
             return _handle_validation_error(business_id, e)
 
 
+def _precheck_business(
+    db,
+    business: Business,
+    metadata_service: ValidationMetadataService
+) -> Optional[Dict[str, Any]]:
+    """
+    Decide whether a business needs the validation pipeline at all.
+    
+    Returns:
+        Result dictionary if the business was handled here (no URL, already in
+        discovery, terminal state), or None if it should be validated.
+    """
+    business_id = str(business.id)
+    
+    # Ensure metadata exists
+    if not business.website_metadata:
+        business.website_metadata = metadata_service.create_initial_metadata()
+    
+    # ================================================================
+    # CASE 1: No URL at all - Queue for discovery
+    # ================================================================
+    if not business.website_url:
+        logger.info(f"Business {business_id} has no URL - needs discovery")
+        return _handle_no_url(db, business, metadata_service)
+    
+    # ================================================================
+    # CASE 2: Already in discovery pipeline - Skip validation
+    # ================================================================
+    if business.website_validation_status in [
+        ValidationState.DISCOVERY_QUEUED.value,
+        ValidationState.DISCOVERY_IN_PROGRESS.value
+    ]:
+        logger.info(f"Business {business_id} already in discovery pipeline")
+        return {"status": "skipped", "reason": "discovery_in_progress"}
+    
+    # ================================================================
+    # CASE 3: Terminal state - Skip unless forced
+    # ================================================================
+    if business.validation_is_terminal:
+        logger.info(f"Business {business_id} in terminal state: {business.website_validation_status}")
+        return {"status": "skipped", "reason": "terminal_state"}
+    
+    return None
+
+
 _RAW_DATA_WEBSITE_FIELDS = ["website", "site", "url", "domain", "website_url", "business_url", "web", "homepage"]
 _SOCIAL_MEDIA_DOMAINS = {
     "facebook.com", "instagram.com", "twitter.com", "x.com", "linkedin.com",
@@ -242,37 +274,20 @@ def _handle_no_url(
     )
     db.commit()
     
-    # Queue ScrapingDog discovery
-    from tasks.discovery_tasks import discover_missing_websites_v2
-    discovery_task = discover_missing_websites_v2.delay(str(business.id))
+    # Queue ScrapingDog discovery (runs in the next batch)
+    from tasks.discovery_tasks import queue_discovery
+    queue_discovery(str(business.id))
     
-    logger.info(f"Queued ScrapingDog discovery for {business.id} (task: {discovery_task.id})")
+    logger.info(f"Queued ScrapingDog discovery for {business.id}")
     
     return {
         "business_id": str(business.id),
-        "status": "discovery_queued",
-        "discovery_task_id": discovery_task.id
+        "status": "discovery_queued"
     }
 
 
-async def _run_website_validation(
-    db,
-    business: Business,
-    metadata_service: ValidationMetadataService
-) -> Dict[str, Any]:
-    """
-    Run the complete validation pipeline.
-    
-    Args:
-        db: Database session
-        business: Business instance
-        metadata_service: Metadata service instance
-        
-    Returns:
-        Result dictionary
-    """
-    url = business.website_url
-    
+def _build_business_context(business: Business) -> Dict[str, Any]:
+    """Business dict passed to the validation pipeline."""
     # Prepare business context, including discovery match signals when available.
     # The LLM validator can't see JavaScript-rendered phone numbers on a page, so
     # we pass a hint when ScrapingDog already confirmed a phone match in search snippets.
@@ -294,7 +309,7 @@ async def _run_website_validation(
     _gmb_reviews_count = _outscraper.get("reviews")
     _social_urls = raw.get("social_urls", {})
 
-    business_context = {
+    return {
         "name": business.name,
         "phone": business.phone,
         "email": business.email,
@@ -311,16 +326,59 @@ async def _run_website_validation(
         "gmb_reviews_count": _gmb_reviews_count,
         "known_social_urls": _social_urls,
     }
+
+
+async def _run_website_validation(
+    db,
+    business: Business,
+    metadata_service: ValidationMetadataService,
+    orchestrator: Optional[ValidationOrchestrator] = None,
+    capture_screenshot: bool = False
+) -> Dict[str, Any]:
+    """
+    Run the complete validation pipeline.
+    
+    Args:
+        db: Database session
+        business: Business instance
+        metadata_service: Metadata service instance
+        orchestrator: Shared orchestrator (batch runs); built on the worker's
+            browser pool if None
+        capture_screenshot: Store a viewport screenshot and record its URL
+            on the business
+        
+    Returns:
+        Result dictionary
+    """
+    url = business.website_url
+    business_context = _build_business_context(business)
     
     # Run validation
-    async def run_validation():
-        orchestrator = ValidationOrchestrator(db=db)
-        return await orchestrator.validate_business_website(
-            business=business_context,
-            url=url
-        )
+    if orchestrator is None:
+        orchestrator = ValidationOrchestrator(db=db, browser_pool=await get_browser_pool())
+    validation_result = await orchestrator.validate_business_website(
+        business=business_context,
+        url=url,
+        capture_screenshot=capture_screenshot
+    )
+    return _apply_validation_result(db, business, url, validation_result, metadata_service)
+
+
+def _apply_validation_result(
+    db,
+    business: Business,
+    url: str,
+    validation_result: Dict[str, Any],
+    metadata_service: ValidationMetadataService
+) -> Dict[str, Any]:
+    """
+    Record a pipeline result on the business and act on its recommendation.
     
-    validation_result = await run_validation()
+    Shared by the online tasks and the Message Batches consumer.
+    """
+    screenshot_url = validation_result.get("stages", {}).get("playwright", {}).get("screenshot_url")
+    if screenshot_url:
+        business.website_screenshot_url = screenshot_url
     
     # Extract key fields
     verdict = validation_result.get("verdict", "error")
@@ -559,18 +617,17 @@ def _handle_rejected_url(
             "reason": "max_discovery_attempts_reached"
         }
     
-    # Queue ScrapingDog discovery
-    from tasks.discovery_tasks import discover_missing_websites_v2
-    discovery_task = discover_missing_websites_v2.delay(str(business.id))
+    # Queue ScrapingDog discovery (runs in the next batch)
+    from tasks.discovery_tasks import queue_discovery
+    queue_discovery(str(business.id))
     
-    logger.info(f"Queued ScrapingDog discovery (task: {discovery_task.id})")
+    logger.info(f"Queued ScrapingDog discovery for {business.id}")
     
     return {
         "business_id": str(business.id),
         "status": "discovery_queued",
         "rejected_url": rejected_url,
-        "invalid_reason": invalid_reason,
-        "discovery_task_id": discovery_task.id
+        "invalid_reason": invalid_reason
     }
 
 
@@ -580,17 +637,12 @@ def _domain_resolves(url: str) -> bool:
 
     Returns True if the domain has at least one DNS record, False if it's
     unregistered / NXDOMAIN / unreachable at the DNS level.
+
+    Answers come from the shared reachability cache, so a dead domain seen by
+    the scrape or validation stage isn't looked up again here.
     """
-    import socket
-    from urllib.parse import urlparse as _urlparse
-    try:
-        host = _urlparse(url).netloc.split(":")[0].strip()
-        if not host:
-            return False
-        socket.getaddrinfo(host, 80, proto=socket.IPPROTO_TCP)
-        return True
-    except (socket.gaierror, OSError):
-        return False
+    from services.validation.reachability_cache import get_reachability_cache
+    return get_reachability_cache().resolves_sync(url) is True
 
 
 def _handle_technical_failure(
@@ -679,10 +731,10 @@ def _handle_technical_failure(
 
         db.commit()
 
-        # Re-queue ScrapingDog discovery
-        from tasks.discovery_tasks import discover_missing_websites_v2
-        task = discover_missing_websites_v2.delay(str(business.id))
-        logger.info(f"Re-queued ScrapingDog discovery for {business.name} (task: {task.id})")
+        # Re-queue ScrapingDog discovery (runs in the next batch)
+        from tasks.discovery_tasks import queue_discovery
+        queue_discovery(str(business.id))
+        logger.info(f"Re-queued ScrapingDog discovery for {business.name}")
 
         return {
             "business_id": str(business.id),
@@ -690,7 +742,6 @@ def _handle_technical_failure(
             "verdict": "invalid",
             "invalid_reason": "domain_not_found",
             "cleared_url": url,
-            "discovery_task_id": task.id,
         }
 
     # ----------------------------------------------------------------
@@ -781,13 +832,122 @@ def batch_validate_websites_v2(business_ids: list[str]) -> Dict[str, Any]:
         "failed": 0
     }
     
-    for business_id in business_ids:
+    # Chunks are validated together on one worker's warm browser pool
+    chunk_size = max(1, get_settings().VALIDATION_BATCH_SIZE)
+    for offset in range(0, len(business_ids), chunk_size):
+        chunk = business_ids[offset:offset + chunk_size]
         try:
-            validate_business_website_v2.delay(business_id)
-            results["queued"] += 1
+            validate_businesses_pooled_v2.delay(chunk)
+            results["queued"] += len(chunk)
         except Exception as e:
-            logger.error(f"Failed to queue {business_id}: {e}")
-            results["failed"] += 1
+            logger.error(f"Failed to queue validation chunk {chunk}: {e}")
+            results["failed"] += len(chunk)
     
     logger.info(f"Batch validation queued: {results}")
     return results
+
+
+@shared_task(
+    name="tasks.validation.validate_businesses_pooled_v2",
+    time_limit=900  # 15 minutes
+)
+def validate_businesses_pooled_v2(business_ids: list[str]) -> Dict[str, Any]:
+    """
+    Validate many businesses concurrently on this worker's warm browser pool.
+    
+    Loads all businesses in one query, handles the no-URL / skip cases as the
+    single-business task does, then runs the pipeline for the rest with up to
+    pool-capacity validations in flight. A failure for one business is
+    recorded on that business and does not affect the others.
+    
+    Args:
+        business_ids: List of business UUIDs
+        
+    Returns:
+        Summary with per-business results
+    """
+    summary = {"total": len(business_ids), "validated": 0, "skipped": 0, "errors": 0, "results": []}
+    
+    with get_db_session_sync() as db:
+        businesses = db.query(Business).filter(Business.id.in_(business_ids)).all()
+        metadata_service = ValidationMetadataService()
+        
+        runnable: List[Business] = []
+        for business in businesses:
+            try:
+                precheck_result = _precheck_business(db, business, metadata_service)
+            except Exception as e:
+                logger.error(f"Precheck failed for {business.id}: {e}", exc_info=True)
+                precheck_result = _handle_validation_error(str(business.id), e)
+            if precheck_result is None:
+                runnable.append(business)
+            else:
+                summary["skipped"] += 1
+                summary["results"].append(precheck_result)
+        
+        if runnable:
+            validated = run_async(
+                _validate_businesses_on_pool(db, runnable, metadata_service)
+            )
+            for result in validated:
+                if result.get("status") == "error":
+                    summary["errors"] += 1
+                else:
+                    summary["validated"] += 1
+                summary["results"].append(result)
+    
+    summary["not_found"] = len(business_ids) - len(businesses)
+    logger.info(
+        f"Pooled validation complete: {summary['validated']} validated, "
+        f"{summary['skipped']} skipped, {summary['errors']} errors"
+    )
+    return summary
+
+
+async def _validate_businesses_on_pool(
+    db,
+    businesses: List[Business],
+    metadata_service: ValidationMetadataService
+) -> List[Dict[str, Any]]:
+    """Run the validation pipeline for many businesses on the shared pool."""
+    settings = get_settings()
+    capture_screenshot = (
+        settings.VALIDATION_CAPTURE_SCREENSHOTS and not settings.VALIDATION_SKIP_BULK_SCREENSHOTS
+    )
+    pool = await get_browser_pool()
+    orchestrator = ValidationOrchestrator(
+        db=db,
+        browser_pool=pool,
+        navigation_profile=settings.VALIDATION_BULK_NAVIGATION_PROFILE
+    )
+    semaphore = asyncio.Semaphore(pool.capacity)
+    
+    # The pipelines run concurrently but only the results touch the session:
+    # they are applied one at a time afterwards, so a rollback for one
+    # business cannot discard another's pending updates
+    jobs = [(business, business.website_url, _build_business_context(business)) for business in businesses]
+    
+    async def validate_one(url: str, business_context: Dict[str, Any]) -> Any:
+        async with semaphore:
+            try:
+                return await orchestrator.validate_business_website(
+                    business=business_context,
+                    url=url,
+                    capture_screenshot=capture_screenshot
+                )
+            except Exception as e:
+                return e
+    
+    outcomes = await asyncio.gather(*(validate_one(url, context) for _, url, context in jobs))
+    
+    results = []
+    for (business, url, _), outcome in zip(jobs, outcomes):
+        try:
+            if isinstance(outcome, Exception):
+                raise outcome
+            results.append(_apply_validation_result(db, business, url, outcome, metadata_service))
+        except Exception as e:
+            logger.error(f"Pooled validation failed for {business.id}: {e}", exc_info=True)
+            db.rollback()
+            results.append(_handle_validation_error(str(business.id), e))
+    return results
@@ -0,0 +1,140 @@
+"""
+Tests for BusinessService bulk upserts
+
+Covers the set-based scraper write path: inserts, updates of existing rows,
+and isolation of bad rows within a batch.
+
+Author: WebMagic Team
+"""
+import pytest
+from uuid import uuid4
+
+from sqlalchemy import select
+
+from models.business import Business
+from services.hunter.business_service import BusinessService
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+@pytest.fixture
+def business_service(db_session):
+    """Create BusinessService instance."""
+    return BusinessService(db_session)
+
+
+def scraped(name: str, **overrides):
+    """Scraper-format business dict with a unique gmb_id."""
+    data = {
+        "gmb_id": f"gmb-{uuid4().hex[:12]}",
+        "name": name,
+        "city": "Austin",
+        "state": "TX",
+        "phone": "+15125550100",
+        "rating": 4.5,
+        "review_count": 12,
+    }
+    data.update(overrides)
+    return data
+
+
+# ============================================================================
+# BULK UPSERT TESTS
+# ============================================================================
+
+@pytest.mark.asyncio
+class TestBulkUpsertBusinesses:
+    """Tests for bulk_upsert_businesses."""
+
+    async def test_inserts_new_rows(self, business_service, db_session):
+        """New rows are created, flagged new, and aligned with the input."""
+        batch = [scraped("Alpha Plumbing"), scraped("Beta Roofing")]
+
+        results = await business_service.bulk_upsert_businesses(batch, lead_scores=[80, None])
+        await db_session.commit()
+
+        assert [b.gmb_id for b in results] == [d["gmb_id"] for d in batch]
+        assert all(b._is_new for b in results)
+        assert results[0].qualification_score == 80
+        assert results[0].slug != results[1].slug
+
+    async def test_updates_existing_rows_without_clearing_fields(self, business_service, db_session):
+        """An update only overwrites provided fields and keeps the slug."""
+        data = scraped("Gamma Electric")
+        [created] = await business_service.bulk_upsert_businesses([data])
+        await db_session.commit()
+
+        update = {"gmb_id": data["gmb_id"], "name": "Gamma Electric", "rating": 4.9}
+        [updated] = await business_service.bulk_upsert_businesses([update])
+        await db_session.commit()
+
+        assert updated.id == created.id
+        assert updated._is_new is False
+        assert float(updated.rating) == 4.9
+        assert updated.phone == data["phone"]
+        assert updated.slug == created.slug
+
+    async def test_mixed_batch_keeps_stored_json_fields(self, business_service, db_session):
+        """JSON columns another row in the batch provides are not nulled on existing rows."""
+        raw_data = {"place_id": "abc", "reviews_data": []}
+        photos = ["https://example.com/photo.jpg"]
+        data = scraped("Iota Plumbing", raw_data=raw_data, photos_urls=photos)
+        [created] = await business_service.bulk_upsert_businesses([data])
+        await db_session.commit()
+
+        update = {"gmb_id": data["gmb_id"], "name": "Iota Plumbing", "rating": 4.8}
+        newcomer = scraped("Kappa Roofing", raw_data={"place_id": "def"}, photos_urls=photos)
+        [updated, inserted] = await business_service.bulk_upsert_businesses([update, newcomer])
+        await db_session.commit()
+
+        assert updated.id == created.id
+        assert float(updated.rating) == 4.8
+        assert updated.raw_data == raw_data
+        assert updated.photos_urls == photos
+        assert inserted.raw_data == {"place_id": "def"}
+
+    async def test_unchanged_rows_are_not_rewritten(self, business_service, db_session):
+        """Identical data returns the stored row without a write."""
+        data = scraped("Delta HVAC")
+        [created] = await business_service.bulk_upsert_businesses([data])
+        await db_session.commit()
+        updated_at = created.updated_at
+
+        [again] = await business_service.bulk_upsert_businesses([dict(data)])
+
+        assert again.id == created.id
+        assert again._is_new is False
+        assert again.updated_at == updated_at
+
+    async def test_bad_row_does_not_lose_the_batch(self, business_service, db_session):
+        """A row the database rejects only fails itself; the rest are saved."""
+        good_1 = scraped("Epsilon Landscaping")
+        bad = scraped("Zeta Painting", state="X" * 60)  # state is VARCHAR(50)
+        good_2 = scraped("Eta Cleaning")
+
+        results = await business_service.bulk_upsert_businesses([good_1, bad, good_2])
+        await db_session.commit()
+
+        assert results[0] is not None and results[0].gmb_id == good_1["gmb_id"]
+        assert results[1] is None
+        assert results[2] is not None and results[2].gmb_id == good_2["gmb_id"]
+
+        stored = await db_session.execute(
+            select(Business.gmb_id).where(
+                Business.gmb_id.in_([good_1["gmb_id"], bad["gmb_id"], good_2["gmb_id"]])
+            )
+        )
+        assert set(stored.scalars().all()) == {good_1["gmb_id"], good_2["gmb_id"]}
+
+    async def test_duplicate_gmb_id_in_batch_is_merged(self, business_service, db_session):
+        """The same gmb_id twice in one batch resolves to one row."""
+        first = scraped("Theta Locksmith")
+        second = dict(first, rating=3.0)
+
+        results = await business_service.bulk_upsert_businesses([first, second])
+        await db_session.commit()
+
+        assert results[0].id == results[1].id
+        assert float(results[1].rating) == 3.0
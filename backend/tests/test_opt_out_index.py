@@ -0,0 +1,167 @@
+"""
+Tests for the SMS opt-out index
+
+Covers OptOutIndex: misses served from memory while the Redis token is
+unchanged, reloads after another process invalidates, the database
+fallback without Redis, and signal failures.
+
+Author: WebMagic Team
+"""
+import asyncio
+import pytest
+from datetime import datetime
+from uuid import uuid4
+
+from models.sms_opt_out import SMSOptOut
+from services.progress.redis_service import RedisService
+from services.sms.opt_out_index import OptOutIndex
+
+
+class FakeRedis:
+    """Async get/set over a dict; ``down`` makes every call fail."""
+
+    def __init__(self):
+        self.values = {}
+        self.down = False
+        self.sets = 0
+
+    async def get(self, key):
+        if self.down:
+            raise ConnectionError("redis down")
+        return self.values.get(key)
+
+    async def set(self, key, value):
+        self.sets += 1
+        if self.down:
+            raise ConnectionError("redis down")
+        self.values[key] = value
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+@pytest.fixture
+def redis(monkeypatch):
+    fake = FakeRedis()
+    monkeypatch.setattr(RedisService, "get_async_client", staticmethod(lambda: fake))
+    return fake
+
+
+@pytest.fixture
+def query_count(db_session, monkeypatch):
+    """Counts statements run on the test session."""
+    counter = {"n": 0}
+    execute = db_session.execute
+
+    async def counting_execute(*args, **kwargs):
+        counter["n"] += 1
+        return await execute(*args, **kwargs)
+
+    monkeypatch.setattr(db_session, "execute", counting_execute)
+    return counter
+
+
+def random_phone() -> str:
+    return f"+1512{uuid4().int % 10**7:07d}"
+
+
+async def add_opt_out(db_session, phone: str) -> None:
+    db_session.add(SMSOptOut(phone_number=phone, opted_out_at=datetime.utcnow(), source="reply_stop"))
+    await db_session.commit()
+
+
+# ============================================================================
+# LOOKUP TESTS
+# ============================================================================
+
+@pytest.mark.asyncio
+class TestOptOutLookup:
+    """Tests for OptOutIndex.opted_out."""
+
+    async def test_hits_and_misses(self, db_session, redis):
+        """Opted-out numbers are reported, others are not."""
+        opted_out, allowed = random_phone(), random_phone()
+        await add_opt_out(db_session, opted_out)
+
+        index = OptOutIndex()
+        assert await index.opted_out(db_session, [opted_out, allowed]) == {opted_out}
+
+    async def test_misses_are_served_from_memory(self, db_session, redis, query_count):
+        """With an unchanged token, a miss needs no query after the first load."""
+        index = OptOutIndex()
+        await index.opted_out(db_session, [random_phone()])
+        loads = query_count["n"]
+
+        assert await index.opted_out(db_session, [random_phone(), random_phone()]) == set()
+        assert query_count["n"] == loads
+
+    async def test_invalidation_reaches_other_processes(self, db_session, redis):
+        """An opt-out signalled by one index is seen by another's next lookup."""
+        phone = random_phone()
+        writer, reader = OptOutIndex(), OptOutIndex()
+        assert await reader.opted_out(db_session, [phone]) == set()
+
+        await add_opt_out(db_session, phone)
+        await writer.invalidate()
+
+        assert await reader.opted_out(db_session, [phone]) == {phone}
+
+    async def test_stale_index_without_signal_is_bounded_by_max_age(self, db_session, redis):
+        """A missed signal is caught once the snapshot reaches max age."""
+        phone = random_phone()
+        index = OptOutIndex(max_age_seconds=0.01)
+        await index.opted_out(db_session, [phone])
+
+        await add_opt_out(db_session, phone)  # no invalidate()
+        await asyncio.sleep(0.02)
+
+        assert await index.opted_out(db_session, [phone]) == {phone}
+
+    async def test_database_fallback_without_redis(self, db_session, redis):
+        """Without Redis every lookup is answered by the database."""
+        phone = random_phone()
+        index = OptOutIndex()
+        await index.opted_out(db_session, [phone])
+
+        redis.down = True
+        await add_opt_out(db_session, phone)
+
+        assert await index.opted_out(db_session, [phone]) == {phone}
+
+    async def test_removed_opt_out_is_not_reported(self, db_session, redis):
+        """Index hits are confirmed, so a removal elsewhere applies at once."""
+        phone = random_phone()
+        await add_opt_out(db_session, phone)
+        index = OptOutIndex()
+        assert await index.opted_out(db_session, [phone]) == {phone}
+
+        opt_out = (await db_session.execute(
+            SMSOptOut.__table__.select().where(SMSOptOut.phone_number == phone)
+        )).first()
+        await db_session.execute(SMSOptOut.__table__.delete().where(SMSOptOut.id == opt_out.id))
+        await db_session.commit()  # no invalidate()
+
+        assert await index.opted_out(db_session, [phone]) == set()
+
+
+# ============================================================================
+# INVALIDATION TESTS
+# ============================================================================
+
+@pytest.mark.asyncio
+class TestOptOutInvalidate:
+    """Tests for OptOutIndex.invalidate."""
+
+    async def test_required_signal_raises_after_retries(self, redis):
+        redis.down = True
+
+        with pytest.raises(ConnectionError):
+            await OptOutIndex().invalidate()
+        assert redis.sets == 3
+
+    async def test_optional_signal_failure_is_logged(self, redis):
+        redis.down = True
+
+        await OptOutIndex().invalidate(required=False)
+        assert redis.sets == 3
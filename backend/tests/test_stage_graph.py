@@ -0,0 +1,165 @@
+"""
+Tests for the creative pipeline stage scheduler
+
+Covers StageGraph: dependency ordering, concurrency of independent stages,
+optional and required stage failures, and graph validation.
+
+Author: WebMagic Team
+"""
+import asyncio
+import pytest
+
+from services.creative.stage_graph import Stage, StageGraph
+
+
+def recording_stage(name, events, depends_on=(), delay=0.0, output=None, **kwargs):
+    """Stage that logs its start and end in ``events``."""
+    async def run(outputs):
+        events.append(("start", name))
+        await asyncio.sleep(delay)
+        events.append(("end", name))
+        return output if output is not None else name
+    return Stage(name, run, depends_on=depends_on, **kwargs)
+
+
+def failing_stage(name, depends_on=(), **kwargs):
+    async def run(outputs):
+        raise RuntimeError(f"{name} failed")
+    return Stage(name, run, depends_on=depends_on, **kwargs)
+
+
+# ============================================================================
+# ORDERING TESTS
+# ============================================================================
+
+@pytest.mark.asyncio
+class TestStageOrdering:
+    """Tests for running stages in dependency order."""
+
+    async def test_dependents_start_after_dependencies_finish(self):
+        """A stage starts only once every stage it depends on has ended."""
+        events = []
+        graph = StageGraph([
+            recording_stage("build", events, depends_on=("concepts", "images")),
+            recording_stage("concepts", events, depends_on=("analysis",), delay=0.01),
+            recording_stage("images", events, depends_on=("analysis",), delay=0.02),
+            recording_stage("analysis", events, delay=0.01),
+        ])
+
+        await graph.run()
+
+        position = {event: i for i, event in enumerate(events)}
+        assert position[("end", "analysis")] < position[("start", "concepts")]
+        assert position[("end", "analysis")] < position[("start", "images")]
+        assert position[("end", "concepts")] < position[("start", "build")]
+        assert position[("end", "images")] < position[("start", "build")]
+
+    async def test_independent_stages_run_concurrently(self):
+        """Sibling stages overlap instead of running one after another."""
+        both_started = asyncio.Event()
+        started = []
+
+        def sibling(name):
+            async def run(outputs):
+                started.append(name)
+                if len(started) == 2:
+                    both_started.set()
+                # Deadlocks (and times out) if the siblings run sequentially
+                await asyncio.wait_for(both_started.wait(), timeout=1)
+                return name
+            return Stage(name, run)
+
+        outputs = await StageGraph([sibling("images"), sibling("code")]).run()
+
+        assert outputs == {"images": "images", "code": "code"}
+
+    async def test_stage_receives_dependency_outputs(self):
+        """run() sees the outputs of the stages it depends on."""
+        async def concepts(outputs):
+            return f"concepts from {outputs['analysis']}"
+
+        outputs = await StageGraph([
+            Stage("concepts", concepts, depends_on=("analysis",)),
+            recording_stage("analysis", [], output="brief"),
+        ]).run()
+
+        assert outputs["concepts"] == "concepts from brief"
+
+    async def test_every_stage_is_timed(self):
+        """Timings are recorded relative to the start of the run."""
+        graph = StageGraph([
+            recording_stage("analysis", [], delay=0.02),
+            recording_stage("concepts", [], depends_on=("analysis",)),
+        ])
+
+        await graph.run()
+
+        assert set(graph.timings) == {"analysis", "concepts"}
+        assert graph.timings["concepts"]["started_ms"] >= graph.timings["analysis"]["duration_ms"]
+
+
+# ============================================================================
+# FAILURE TESTS
+# ============================================================================
+
+@pytest.mark.asyncio
+class TestStageFailures:
+    """Tests for stage failures."""
+
+    async def test_optional_stage_failure_yields_none(self):
+        """A failing optional stage does not stop its dependents."""
+        events = []
+        outputs = await StageGraph([
+            failing_stage("images", required=False),
+            recording_stage("build", events, depends_on=("images",)),
+        ]).run()
+
+        assert outputs["images"] is None
+        assert outputs["build"] == "build"
+
+    async def test_required_stage_failure_cancels_the_run(self):
+        """A failing required stage raises and cancels stages still running."""
+        events = []
+        graph = StageGraph([
+            failing_stage("analysis"),
+            recording_stage("images", events, delay=1),
+            recording_stage("concepts", events, depends_on=("analysis",)),
+        ])
+
+        with pytest.raises(RuntimeError, match="analysis failed"):
+            await graph.run()
+
+        assert ("end", "images") not in events
+        assert ("start", "concepts") not in events
+
+
+# ============================================================================
+# VALIDATION TESTS
+# ============================================================================
+
+class TestStageGraphValidation:
+    """Tests for rejecting malformed graphs."""
+
+    def test_topological_order(self):
+        graph = StageGraph([
+            recording_stage("build", [], depends_on=("concepts",)),
+            recording_stage("concepts", [], depends_on=("analysis",)),
+            recording_stage("analysis", []),
+        ])
+
+        assert [stage.name for stage in graph.stages] == ["analysis", "concepts", "build"]
+
+    def test_duplicate_stage(self):
+        with pytest.raises(ValueError, match="Duplicate stage"):
+            StageGraph([recording_stage("analysis", []), recording_stage("analysis", [])])
+
+    def test_unknown_dependency(self):
+        with pytest.raises(ValueError, match="unknown stage"):
+            StageGraph([recording_stage("concepts", [], depends_on=("analysis",))])
+
+    def test_cycle(self):
+        with pytest.raises(ValueError, match="cycle"):
+            StageGraph([
+                recording_stage("concepts", [], depends_on=("build",)),
+                recording_stage("build", [], depends_on=("concepts",)),
+            ])
@@ -0,0 +1,108 @@
+"""
+Tests for the static HTML validation tier
+
+Covers deciding first-party business pages from server-rendered HTML and
+escalating listings on directory / social hosts, including redirects to one.
+
+Author: WebMagic Team
+"""
+import pytest
+
+from services.validation.static_html_tier import StaticHTMLTier
+
+
+BUSINESS = {"name": "Lambda Plumbing", "phone": "(512) 555-0100"}
+
+FILLER = " ".join(["Licensed and insured plumbers serving the greater Austin area."] * 15)
+
+
+def page(title: str, body: str = "", schema_name: str = None) -> str:
+    """Server-rendered page carrying the business phone."""
+    schema = ""
+    if schema_name:
+        schema = (
+            '<script type="application/ld+json">'
+            f'{{"@type": "Plumber", "name": "{schema_name}", "telephone": "+1-512-555-0100"}}'
+            "</script>"
+        )
+    return (
+        f"<html><head><title>{title}</title>{schema}</head><body>"
+        f"<h1>Lambda Plumbing</h1><p>{body} {FILLER}</p>"
+        '<a href="tel:+15125550100">Call (512) 555-0100</a>'
+        "</body></html>"
+    )
+
+
+@pytest.fixture
+def tier():
+    return StaticHTMLTier()
+
+
+# ============================================================================
+# FIRST-PARTY PAGE TESTS
+# ============================================================================
+
+@pytest.mark.asyncio
+class TestFirstPartyPages:
+    """Tests for deciding the business's own site from static HTML."""
+
+    async def test_title_naming_the_business_is_valid(self, tier):
+        html = page("Lambda Plumbing | Austin Plumbers")
+
+        decision = await tier.evaluate(BUSINESS, "https://lambdaplumbing.com", html=html)
+
+        assert decision["decided"] is True
+        assert decision["verdict"] == "valid"
+        assert decision["signals"]["first_party"] == "title"
+
+    async def test_schema_business_node_is_valid(self, tier):
+        html = page("Home", schema_name="Lambda Plumbing LLC")
+
+        decision = await tier.evaluate(BUSINESS, "https://lambdaplumbing.com", html=html)
+
+        assert decision["verdict"] == "valid"
+        assert decision["signals"]["first_party"] == "schema"
+
+    async def test_mention_without_first_party_signal_escalates(self, tier):
+        """Phone and name in the body of someone else's page are not enough."""
+        html = page("Best plumbers in Austin 2026")
+
+        decision = await tier.evaluate(BUSINESS, "https://austin-home-guide.com/plumbers", html=html)
+
+        assert decision["decided"] is False
+        assert decision["signals"]["phone_match"] is True
+        assert decision["signals"]["first_party"] is None
+
+
+# ============================================================================
+# DIRECTORY / SOCIAL HOST TESTS
+# ============================================================================
+
+@pytest.mark.asyncio
+class TestNonBusinessHosts:
+    """Tests for escalating listings instead of accepting them."""
+
+    async def test_directory_page_escalates(self, tier):
+        """A Yelp listing names the business in its title and shows its phone."""
+        html = page("Lambda Plumbing - Austin TX - Yelp", schema_name="Lambda Plumbing")
+
+        decision = await tier.evaluate(BUSINESS, "https://www.yelp.com/biz/lambda-plumbing-austin", html=html)
+
+        assert decision["decided"] is False
+        assert "yelp.com" in decision["escalation_reason"]
+
+    async def test_redirect_to_directory_escalates(self, tier, monkeypatch):
+        """The final host decides, not the URL on file."""
+        async def fetch(url):
+            return {
+                "html": page("Lambda Plumbing | Facebook"),
+                "status_code": 200,
+                "final_url": "https://www.facebook.com/lambdaplumbing",
+                "error": None,
+            }
+        monkeypatch.setattr(tier, "fetch", fetch)
+
+        decision = await tier.evaluate(BUSINESS, "https://lambdaplumbing.com")
+
+        assert decision["decided"] is False
+        assert "facebook.com" in decision["escalation_reason"]
@@ -0,0 +1,310 @@
+"""
+Tests for SMS delivery-status ingestion
+
+Covers callback parsing, per-message coalescing, monotonic application of
+status events to campaigns and sms_messages, and ingest deduplication.
+
+Author: WebMagic Team
+"""
+import pytest
+import time
+from uuid import uuid4
+
+from sqlalchemy import select
+
+from models.business import Business
+from models.campaign import Campaign
+from models.sms_message import SMSMessage
+from services.progress.redis_service import RedisService
+from services.sms import status_ingest
+from services.sms.status_ingest import (
+    SMSStatusIngest,
+    StatusEvent,
+    apply_status_events,
+    coalesce,
+    parse_labsmobile_status,
+    parse_telnyx_status,
+)
+
+
+def status_event(message_id: str, status, received_at: float = None, **overrides) -> StatusEvent:
+    """A normalized callback for ``message_id``."""
+    values = dict(
+        provider="telnyx",
+        event_key=uuid4().hex,
+        message_id=message_id,
+        status=status,
+        delivered=status == "delivered",
+        cost=None,
+        error_code=None,
+        error_message=None,
+        received_at=received_at if received_at is not None else time.time(),
+    )
+    values.update(overrides)
+    return StatusEvent(**values)
+
+
+class FakeRedis:
+    """SET NX and XADD over dicts; ``down`` makes every call fail."""
+
+    def __init__(self):
+        self.values = {}
+        self.stream = []
+        self.down = False
+
+    async def set(self, key, value, nx=False, ex=None):
+        if self.down:
+            raise ConnectionError("redis down")
+        if nx and key in self.values:
+            return None
+        self.values[key] = value
+        return True
+
+    async def xadd(self, key, fields, maxlen=None, approximate=True):
+        self.stream.append(fields)
+        return f"{len(self.stream)}-0"
+
+
+class FakeLifecycleService:
+    """Records CRM transitions instead of writing them."""
+
+    calls = []
+
+    def __init__(self, db):
+        pass
+
+    async def mark_campaign_sent(self, business_id, channel):
+        self.calls.append(("sent", business_id))
+
+    async def mark_bounced(self, business_id):
+        self.calls.append(("bounced", business_id))
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+@pytest.fixture
+def crm_calls(monkeypatch):
+    FakeLifecycleService.calls = []
+    monkeypatch.setattr(status_ingest, "BusinessLifecycleService", FakeLifecycleService)
+    return FakeLifecycleService.calls
+
+
+@pytest.fixture
+def redis(monkeypatch):
+    fake = FakeRedis()
+    monkeypatch.setattr(RedisService, "get_async_client", staticmethod(lambda: fake))
+    return fake
+
+
+@pytest.fixture
+async def sent_sms(db_session):
+    """A sent SMS campaign and its outbound sms_messages row, sharing a message id."""
+    business = Business(name="Status Test Plumbing", slug=f"status-test-{uuid4().hex[:10]}", gmb_id=f"gmb-{uuid4().hex}")
+    db_session.add(business)
+    await db_session.flush()
+
+    sid = f"msg-{uuid4().hex}"
+    campaign = Campaign(
+        business_id=business.id,
+        channel="sms",
+        sms_body="Your new website is ready",
+        recipient_phone="+15125550100",
+        status="sent",
+        sms_sid=sid,
+    )
+    db_session.add(campaign)
+    await db_session.flush()
+
+    message = SMSMessage.create_outbound(
+        to_phone="+15125550100",
+        from_phone="+15125550199",
+        body="Your new website is ready",
+        campaign_id=campaign.id,
+        business_id=business.id,
+        telnyx_message_id=sid,
+    )
+    message.status = "sent"
+    db_session.add(message)
+    await db_session.commit()
+    return campaign, message
+
+
+async def reload(db_session, campaign, message):
+    db_session.expire_all()
+    campaign = await db_session.scalar(select(Campaign).where(Campaign.id == campaign.id))
+    message = await db_session.scalar(select(SMSMessage).where(SMSMessage.id == message.id))
+    return campaign, message
+
+
+# ============================================================================
+# PARSING TESTS
+# ============================================================================
+
+class TestParseCallbacks:
+    """Tests for normalizing provider callbacks."""
+
+    def test_telnyx_finalized(self):
+        event = parse_telnyx_status({
+            "data": {
+                "id": "evt-1",
+                "payload": {
+                    "id": "msg-1",
+                    "to": [{"status": "delivered"}],
+                    "cost": {"amount": "0.0040"},
+                },
+            },
+        })
+
+        assert event.event_key == "evt-1"
+        assert event.message_id == "msg-1"
+        assert event.status == "delivered"
+        assert event.delivered is True
+        assert event.cost == 0.004
+
+    def test_telnyx_without_message_id(self):
+        assert parse_telnyx_status({"data": {"payload": {}}}) is None
+
+    def test_labsmobile_failure_reason(self):
+        event = parse_labsmobile_status("sub-1", "handset", "error", "UNDELIV", "2026-01-01 10:00:00")
+
+        assert event.status == "failed"
+        assert event.error_code == "UNDELIV"
+        assert "undeliverable" in event.error_message
+
+    def test_labsmobile_redelivery_has_the_same_key(self):
+        args = ("sub-1", "handset", "ok", "DELIVRD", "2026-01-01 10:00:00")
+
+        assert parse_labsmobile_status(*args).event_key == parse_labsmobile_status(*args).event_key
+
+
+# ============================================================================
+# COALESCING TESTS
+# ============================================================================
+
+class TestCoalesce:
+    """Tests for folding a batch of events per message id."""
+
+    def test_status_never_moves_backwards(self):
+        """A late "sent" receipt does not undo "delivered"."""
+        folded = coalesce([status_event("m1", "delivered"), status_event("m1", "sent")])
+
+        assert folded["m1"].status == "delivered"
+
+    def test_first_delivery_time_is_kept(self):
+        folded = coalesce([
+            status_event("m1", "delivered", received_at=100.0),
+            status_event("m1", "delivered", received_at=200.0),
+        ])
+
+        assert folded["m1"].delivered_at == 100.0
+
+    def test_cost_and_error_come_from_later_events(self):
+        folded = coalesce([
+            status_event("m1", "sent", cost=0.004),
+            status_event("m1", None, error_code="40008", error_message="Telnyx Error 40008: blocked"),
+        ])
+
+        assert folded["m1"].status == "sent"
+        assert folded["m1"].cost == 0.004
+        assert folded["m1"].error_code == "40008"
+
+    def test_messages_are_folded_separately(self):
+        folded = coalesce([status_event("m1", "delivered"), status_event("m2", "failed")])
+
+        assert {key: state.status for key, state in folded.items()} == {"m1": "delivered", "m2": "failed"}
+
+
+# ============================================================================
+# APPLY TESTS
+# ============================================================================
+
+@pytest.mark.asyncio
+class TestApplyStatusEvents:
+    """Tests for apply_status_events."""
+
+    async def test_updates_campaign_and_message(self, db_session, sent_sms, crm_calls):
+        campaign, message = sent_sms
+
+        stats = await apply_status_events(db_session, [status_event(campaign.sms_sid, "delivered", cost=0.004)])
+        campaign, message = await reload(db_session, campaign, message)
+
+        assert stats == {"messages": 1, "campaigns_updated": 1, "sms_messages_updated": 1}
+        assert campaign.status == "delivered"
+        assert campaign.delivered_at is not None
+        assert float(campaign.sms_cost) == 0.004
+        assert message.status == "delivered"
+        assert crm_calls == [("sent", campaign.business_id)]
+
+    async def test_out_of_order_batches_do_not_regress(self, db_session, sent_sms, crm_calls):
+        """A "sent" receipt applied after "delivered" changes nothing."""
+        campaign, message = sent_sms
+        await apply_status_events(db_session, [status_event(campaign.sms_sid, "delivered")])
+
+        stats = await apply_status_events(db_session, [status_event(campaign.sms_sid, "sent")])
+        campaign, message = await reload(db_session, campaign, message)
+
+        assert stats["campaigns_updated"] == 0
+        assert campaign.status == "delivered"
+        assert message.status == "delivered"
+
+    async def test_reapplying_a_batch_is_a_no_op(self, db_session, sent_sms, crm_calls):
+        """A consumer re-reading unacked entries does not re-fire the CRM."""
+        campaign, message = sent_sms
+        events = [status_event(campaign.sms_sid, "failed", error_message="LabsMobile Error (UNDELIV): gone")]
+
+        await apply_status_events(db_session, events)
+        campaign, message = await reload(db_session, campaign, message)
+        delivered_at, error = campaign.delivered_at, campaign.error_message
+        await apply_status_events(db_session, events)
+        campaign, message = await reload(db_session, campaign, message)
+
+        assert campaign.status == "failed"
+        assert campaign.delivered_at == delivered_at
+        assert campaign.error_message == error
+        assert crm_calls == [("bounced", campaign.business_id)]
+
+    async def test_unranked_status_is_not_overwritten(self, db_session, sent_sms, crm_calls):
+        """A campaign that got a reply keeps that status."""
+        campaign, message = sent_sms
+        campaign.status = "replied"
+        await db_session.commit()
+
+        await apply_status_events(db_session, [status_event(campaign.sms_sid, "delivered")])
+        campaign, message = await reload(db_session, campaign, message)
+
+        assert campaign.status == "replied"
+        assert crm_calls == []
+
+    async def test_unmatched_message_ids_are_ignored(self, db_session, crm_calls):
+        stats = await apply_status_events(db_session, [status_event(f"msg-{uuid4().hex}", "delivered")])
+
+        assert stats == {"messages": 1, "campaigns_updated": 0, "sms_messages_updated": 0}
+
+
+# ============================================================================
+# INGEST TESTS
+# ============================================================================
+
+@pytest.mark.asyncio
+class TestIngest:
+    """Tests for SMSStatusIngest.ingest."""
+
+    async def test_redelivered_callback_is_dropped(self, db_session, redis):
+        ingest = SMSStatusIngest()
+        event = status_event("m1", "delivered")
+
+        assert await ingest.ingest(db_session, event) == "queued"
+        assert await ingest.ingest(db_session, event) == "duplicate"
+        assert len(redis.stream) == 1
+
+    async def test_applied_inline_without_redis(self, db_session, sent_sms, redis, crm_calls):
+        campaign, message = sent_sms
+        redis.down = True
+
+        outcome = await SMSStatusIngest().ingest(db_session, status_event(campaign.sms_sid, "delivered"))
+        campaign, message = await reload(db_session, campaign, message)
+
+        assert outcome == "applied"
+        assert campaign.status == "delivered"
@@ -0,0 +1,77 @@
+"""
+Tests for bot-wall detection
+
+Covers detect_block: challenge pages are caught, normal pages that merely
+embed a captcha widget or mention a marker phrase are not.
+
+Author: WebMagic Team
+"""
+import pytest
+
+from services.validation.stealth_config import detect_block
+
+
+class FakeResponse:
+    def __init__(self, status: int):
+        self.status = status
+
+
+class FakePage:
+    """Returns canned page_info for detect_block's single evaluate."""
+
+    def __init__(self, title="", text="", challenge_dom=False, frames=()):
+        self.page_info = {
+            "title": title,
+            "text": text[:2000],
+            "textLength": len(text),
+            "challengeDom": challenge_dom,
+            "frames": list(frames),
+        }
+
+    async def evaluate(self, script, arg=None):
+        return self.page_info
+
+
+LONG_TEXT = "Family-owned plumbing in Austin since 1985. " * 30
+
+
+@pytest.mark.asyncio
+class TestDetectBlock:
+    """Tests for detect_block."""
+
+    async def test_block_status_code(self):
+        assert await detect_block(FakePage(text=LONG_TEXT), FakeResponse(403)) is True
+
+    async def test_challenge_title(self):
+        assert await detect_block(FakePage(title="Just a moment..."), FakeResponse(200)) is True
+
+    async def test_challenge_dom(self):
+        page = FakePage(title="example.com", text="One more step", challenge_dom=True)
+        assert await detect_block(page, FakeResponse(200)) is True
+
+    async def test_challenge_iframe_on_empty_page(self):
+        page = FakePage(frames=["https://challenges.cloudflare.com/cdn-cgi/challenge-platform/h/b"])
+        assert await detect_block(page, FakeResponse(200)) is True
+
+    async def test_recaptcha_contact_form_is_not_a_block(self):
+        page = FakePage(
+            title="Contact Us | Austin Plumbing",
+            text=LONG_TEXT + " Please complete the captcha below.",
+            frames=["https://www.google.com/recaptcha/api2/anchor?k=abc"],
+        )
+        assert await detect_block(page, FakeResponse(200)) is False
+
+    async def test_marker_phrase_in_normal_content_is_not_a_block(self):
+        page = FakePage(
+            title="Austin Plumbing",
+            text=LONG_TEXT + " Access denied to your drains? Just a moment of your time.",
+        )
+        assert await detect_block(page, FakeResponse(200)) is False
+
+    async def test_turnstile_widget_in_normal_page_is_not_a_block(self):
+        page = FakePage(
+            title="Book a Repair",
+            text=LONG_TEXT,
+            frames=["https://challenges.cloudflare.com/turnstile/v0/api.js"],
+        )
+        assert await detect_block(page, FakeResponse(200)) is False
@@ -0,0 +1,190 @@
+"""
+Tests for WorkQueue
+
+Covers claim splitting between concurrent claimers, conditional lease
+acquisition, and the dispatcher's hand-off of leases to Celery task ids.
+
+Author: WebMagic Team
+"""
+import pytest
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+from sqlalchemy import select, update
+
+from models.business import Business
+from models.work_lease import WorkLease
+from services import work_queue
+from services.work_queue import QueueSpec, WorkQueue
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+@pytest.fixture
+async def test_businesses(db_session):
+    """Create a handful of businesses for a test queue to hand out."""
+    businesses = [
+        Business(name=f"Queue Test {i}", slug=f"queue-test-{uuid4().hex[:10]}", gmb_id=f"gmb-{uuid4().hex}")
+        for i in range(5)
+    ]
+    db_session.add_all(businesses)
+    await db_session.commit()
+    return businesses
+
+
+@pytest.fixture
+def queue(test_businesses):
+    """A queue over exactly the test businesses."""
+    ids = [b.id for b in test_businesses]
+    return WorkQueue(QueueSpec(
+        name=f"test-{uuid4().hex[:8]}",
+        model=Business,
+        ready=lambda now: (Business.id.in_(ids),),
+        order_by=lambda: (Business.name.asc(),),
+        lease_seconds=60,
+    ))
+
+
+@pytest.fixture
+def queue_sessions(db_session, monkeypatch):
+    """Route the queue's own sessions (lease, dispatch) to the test session."""
+    @asynccontextmanager
+    async def session_factory():
+        yield db_session
+    monkeypatch.setattr(work_queue, "CeleryAsyncSessionLocal", session_factory)
+
+
+async def expire_lease(db_session, queue, item_id):
+    await db_session.execute(
+        update(WorkLease)
+        .where(WorkLease.queue == queue.spec.name, WorkLease.item_id == item_id)
+        .values(leased_until=datetime.utcnow() - timedelta(seconds=1))
+    )
+    await db_session.commit()
+
+
+# ============================================================================
+# CLAIM TESTS
+# ============================================================================
+
+@pytest.mark.asyncio
+class TestClaim:
+    """Tests for claiming ready items."""
+
+    async def test_claimers_split_the_items(self, queue, db_session):
+        """A second claimer only gets what the first did not lease."""
+        first = await queue.claim(db_session, 3, owner="worker-a")
+        second = await queue.claim(db_session, 10, owner="worker-b")
+
+        assert len(first) == 3
+        assert len(second) == 2
+        assert not set(first) & set(second)
+        assert await queue.in_flight(db_session) == 5
+
+    async def test_nothing_left_to_claim(self, queue, db_session):
+        """Once everything is leased, claims come back empty."""
+        await queue.claim(db_session, 5, owner="worker-a")
+
+        assert await queue.claim(db_session, 5, owner="worker-b") == []
+
+    async def test_expired_lease_is_claimable_again(self, queue, db_session):
+        """An item whose lease expired goes to the next claimer."""
+        [item_id] = await queue.claim(db_session, 1, owner="worker-a")
+        await expire_lease(db_session, queue, item_id)
+
+        claimed = await queue.claim(db_session, 5, owner="worker-b")
+
+        assert item_id in claimed
+        lease = await db_session.scalar(
+            select(WorkLease).where(WorkLease.queue == queue.spec.name, WorkLease.item_id == item_id)
+        )
+        assert lease.owner == "worker-b"
+        assert lease.attempts == 2
+
+
+# ============================================================================
+# LEASE CONTENTION TESTS
+# ============================================================================
+
+@pytest.mark.asyncio
+class TestAcquire:
+    """Tests for conditional lease acquisition."""
+
+    async def test_live_lease_is_not_taken_over(self, queue, db_session):
+        """Another owner cannot take a live lease."""
+        [item_id] = await queue.claim(db_session, 1, owner="worker-a")
+
+        assert await queue.acquire(db_session, item_id, "worker-b") is False
+        assert await queue.acquire(db_session, item_id, "worker-a") is True
+
+    async def test_expired_lease_can_be_taken(self, queue, db_session):
+        """An expired lease goes to whoever asks."""
+        [item_id] = await queue.claim(db_session, 1, owner="worker-a")
+        await expire_lease(db_session, queue, item_id)
+
+        assert await queue.acquire(db_session, item_id, "worker-b") is True
+        assert await queue.acquire(db_session, item_id, "worker-a") is False
+
+    async def test_release_only_drops_own_lease(self, queue, db_session):
+        """A release by a former owner leaves the new owner's lease alone."""
+        [item_id] = await queue.claim(db_session, 1, owner="worker-a")
+        await expire_lease(db_session, queue, item_id)
+        await queue.acquire(db_session, item_id, "worker-b")
+
+        await queue.release(db_session, [item_id], owner="worker-a")
+
+        assert await queue.acquire(db_session, item_id, "worker-c") is False
+
+    async def test_lease_block_skips_when_held(self, queue, db_session, queue_sessions):
+        """lease() yields False while another owner holds the item."""
+        [item_id] = await queue.claim(db_session, 1, owner="worker-a")
+
+        async with queue.lease(item_id, owner="worker-b") as leased:
+            assert leased is False
+
+        async with queue.lease(item_id, owner="worker-a") as leased:
+            assert leased is True
+        assert await queue.in_flight(db_session) == 0
+
+    async def test_lease_is_held_after_error(self, queue, db_session, queue_sessions):
+        """A failed run keeps the item leased for its retry."""
+        item_id = (await queue.claim(db_session, 1, owner="worker-a"))[0]
+
+        with pytest.raises(RuntimeError):
+            async with queue.lease(item_id, owner="worker-a"):
+                raise RuntimeError("boom")
+
+        assert await queue.acquire(db_session, item_id, "worker-b") is False
+
+
+# ============================================================================
+# DISPATCH TESTS
+# ============================================================================
+
+@pytest.mark.asyncio
+class TestDispatch:
+    """Tests for dispatching claimed items."""
+
+    async def test_leases_are_handed_to_task_ids(self, queue, db_session, queue_sessions):
+        """Each item is sent under the task id that now owns its lease."""
+        sent = []
+
+        stats = await queue.dispatch(lambda item_id, task_id: sent.append((item_id, task_id)), 2, owner="beat")
+
+        assert stats["dispatched"] == len(sent) == 4  # capacity 2 × prefetch factor 2
+        item_id, task_id = sent[0]
+        assert await queue.acquire(db_session, item_id, "beat") is False
+        assert await queue.acquire(db_session, item_id, task_id) is True
+
+    async def test_failed_send_releases_the_rest(self, queue, db_session, queue_sessions):
+        """Items that could not be enqueued become claimable again."""
+        def send(item_id, task_id):
+            raise ConnectionError("broker down")
+
+        with pytest.raises(ConnectionError):
+            await queue.dispatch(send, 2, owner="beat")
+
+        assert await queue.in_flight(db_session) == 0
@@ -6,7 +6,6 @@ If autopilot is disabled the task returns immediately without doing any work.
 If a `needs_generation_count` threshold is provided (for the scraper), the
 task also pauses when the pipeline already has enough queued businesses.
 """
-import asyncio
 import logging
 from typing import Optional, Tuple
 
@@ -47,7 +46,8 @@ async def _fetch_autopilot(check_target: bool = False) -> Tuple[bool, int, int]:
 
 def check_autopilot(task_name: str, check_target: bool = False) -> Optional[dict]:
     """
-    Synchronous gate for Celery tasks.
+    Synchronous gate for Celery tasks (not for code already running on the
+    worker loop - await check_autopilot_async there).
 
     Returns a result dict (task should return this immediately) if autopilot is
     disabled OR the target has been reached.  Returns None if the task should proceed.
@@ -57,29 +57,10 @@ def check_autopilot(task_name: str, check_target: bool = False) -> Optional[dict
         check_target: If True, also check the generation queue count vs target
                       (use for the scraping task only).
     """
-    try:
-        enabled, target, queued = asyncio.run(_fetch_autopilot(check_target))
-    except Exception as e:
-        # If the DB check itself fails, let the task run (fail open).
-        logger.warning(f"[Autopilot] Guard DB check failed for {task_name}: {e} — proceeding")
-        return None
-
-    if not enabled:
-        logger.info(f"[Autopilot] {task_name} skipped — autopilot is OFF")
-        return {"status": "skipped", "reason": "autopilot_disabled"}
-
-    if check_target and queued >= target:
-        logger.info(
-            f"[Autopilot] {task_name} paused — pipeline has {queued}/{target} businesses queued"
-        )
-        return {
-            "status": "skipped",
-            "reason": "target_reached",
-            "queued": queued,
-            "target": target,
-        }
-
-    return None  # All clear — proceed
+    # On the worker's persistent loop: the database engine and the shared
+    # Redis client are pooled on that loop and must not be used from another
+    from core.worker_loop import run_async
+    return run_async(check_autopilot_async(task_name, check_target))
 
 
 async def check_autopilot_async(task_name: str, check_target: bool = False) -> Optional[dict]: